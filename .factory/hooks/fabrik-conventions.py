@@ -8,6 +8,18 @@ Validates that code changes follow Fabrik conventions:
 - Health endpoints must test dependencies
 - Config must use os.getenv() not class-level
 
+Each hook call is a fresh process. To keep that cheap, an optional
+long-lived server holds the compiled rules and recent results:
+
+    fabrik-conventions.py --serve [--idle-timeout 1800]
+
+The hook then sends the file to the server over a Unix socket
+(FABRIK_CONVENTIONS_SOCKET, default ~/.factory/fabrik-conventions.sock)
+and falls back to checking in-process when no server answers. With
+FABRIK_CONVENTIONS_DAEMON=auto, a fallback also starts a server in the
+background for the next call. The server exits when this script
+changes, so edited rules are never served stale.
+
 Exit codes:
 - 0: Pass (or not applicable)
 - 2: Block with feedback to Droid
@@ -15,9 +27,16 @@ Exit codes:
 
 import json
 import os
-import re
+import socket
 import sys
 
+# The client path imports nothing else: interpreter startup dominates hook latency
+SOCKET_PATH = os.environ.get(
+    "FABRIK_CONVENTIONS_SOCKET", os.path.expanduser("~/.factory/fabrik-conventions.sock")
+)
+CLIENT_TIMEOUT = 2.0  # Seconds before falling back to in-process checking
+RESULT_CACHE_SIZE = 256
+
 # Patterns that indicate convention violations
 VIOLATIONS = {
     # Hardcoded localhost/127.0.0.1 (detected separately, getenv defaults excluded in check_file)
@@ -27,30 +46,31 @@ VIOLATIONS = {
         "message": "Hardcoded localhost detected. Use os.getenv('DB_HOST', 'localhost') instead.",
         "severity": "error",
     },
-    # Alpine base image
+    # Alpine base image (anchored: one attempt per line)
     "alpine_image": {
-        "pattern": r"FROM\s+.*alpine",
+        "pattern": r"^[ \t]*FROM[ \t]+[^\n]*alpine",
         "file_types": ["Dockerfile", ".dockerfile"],
         "message": "Alpine base image detected. Use python:3.12-slim-bookworm for ARM64 compatibility.",
         "severity": "error",
     },
     # Class-level config with getenv (evaluated at import time)
     "class_config": {
-        "pattern": r"class\s+\w*[Cc]onfig.*:\s*\n(?:[^\n]*\n)*?\s+\w+\s*=\s*.*os\.getenv",
+        "detector": "class_config",
         "file_types": [".py"],
         "message": "Class-level os.getenv() detected. Config loads at import time when env vars may not be set. Use functions instead.",
         "severity": "warning",
     },
     # Health endpoint that just returns ok without testing
     "fake_health": {
-        "pattern": r'@.*(?:get|route).*[\'"]/?health[\'"].*\n(?:[^\n]*\n)*?\s+return\s+\{[\'"]status[\'"]:\s*[\'"]ok[\'"]',
+        "detector": "fake_health",
         "file_types": [".py"],
         "message": "Health endpoint returns ok without testing dependencies. Health checks MUST test actual DB/Redis connections.",
         "severity": "warning",
     },
-    # Hardcoded passwords (exclude getenv/environ patterns)
+    # Hardcoded passwords (unless getenv/environ follows on the same line)
     "hardcoded_password": {
-        "pattern": r'(?:password|passwd|pwd)\s*=\s*[\'"](?!.*getenv|.*environ)[a-zA-Z0-9_@#$%^&*]{4,}[\'"]',
+        "pattern": r'(?:password|passwd|pwd)\s*=\s*[\'"]([a-zA-Z0-9_@#$%^&*]{4,})[\'"]',
+        "unless_later_on_line": ("getenv", "environ"),
         "file_types": [".py", ".yaml", ".yml", ".json"],
         "message": "Hardcoded password detected. Use environment variables for credentials.",
         "severity": "error",
@@ -65,9 +85,153 @@ VIOLATIONS = {
 }
 
 
+# Python rules are detected on the syntax tree, in linear time: as regexes
+# spanning lines they backtracked quadratically (or worse) on large files.
+# Files that do not parse get no findings from these rules.
+_compiled: dict = {}
+
+
+def compiled_rules() -> dict:
+    """VIOLATIONS patterns, compiled on first use (the client never needs them)."""
+    if not _compiled:
+        import re
+
+        for name, rule in VIOLATIONS.items():
+            if "pattern" in rule:
+                _compiled[name] = re.compile(rule["pattern"], re.IGNORECASE | re.MULTILINE)
+    return _compiled
+
+
+def _calls_getenv(node) -> bool:
+    """True if node calls os.getenv() when evaluated (lambdas are deferred)."""
+    import ast
+
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Lambda):
+            continue
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "getenv"
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "os"
+        ):
+            return True
+        stack.extend(ast.iter_child_nodes(node))
+    return False
+
+
+def _is_health_route(func) -> bool:
+    """True if func is decorated with @<app>.get/route/api_route("/health")."""
+    import ast
+
+    for decorator in func.decorator_list:
+        if not (
+            isinstance(decorator, ast.Call)
+            and isinstance(decorator.func, ast.Attribute)
+            and decorator.func.attr in ("get", "route", "api_route")
+        ):
+            continue
+        paths = decorator.args[:1] + [k.value for k in decorator.keywords if k.arg == "path"]
+        if any(isinstance(p, ast.Constant) and p.value in ("health", "/health") for p in paths):
+            return True
+    return False
+
+
+def _probes_dependency(node) -> bool:
+    """True if node awaits something or calls a probe such as db.execute() or redis.ping()."""
+    import ast
+
+    if isinstance(node, ast.Await):
+        return True
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    name = (func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", "")).lower()
+    return (
+        name in ("execute", "query", "ping")
+        or ("check" in name and "connection" in name)
+        or ("test" in name and "db" in name)
+    )
+
+
+def _returns_status_unchecked(func) -> bool:
+    """True if func returns a {"status": ...} dict without awaiting or probing a dependency."""
+    import ast
+
+    returns_status = False
+    stack = list(func.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Return):
+            value = node.value
+            if isinstance(value, ast.Dict) and any(
+                isinstance(k, ast.Constant) and k.value == "status" for k in value.keys
+            ):
+                returns_status = True
+        if _probes_dependency(node):  # Logging or timestamps do not test anything
+            return False
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            stack.extend(ast.iter_child_nodes(node))
+    return returns_status
+
+
+def detect(content: str) -> set[str]:
+    """Names of the syntax-tree rules content violates."""
+    import ast
+    import re
+
+    # Parsing costs about 10ms per 1,000 lines: skip it when no rule can match
+    if "getenv" not in content or "config" not in content.lower():
+        if not (
+            re.search(r"""['"]/?health['"]""", content)
+            and re.search(r"@[\w.]*\.(?:get|route|api_route)\(", content)
+        ):
+            return set()
+
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError, MemoryError, RecursionError):  # Incl. too deeply nested
+        return set()
+
+    found = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef) and "config" in node.name.lower():
+            if any(
+                isinstance(stmt, (ast.Assign, ast.AnnAssign))
+                and stmt.value is not None
+                and _calls_getenv(stmt.value)
+                for stmt in node.body
+            ):
+                found.add("class_config")
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if _is_health_route(node) and _returns_status_unchecked(node):
+                found.add("fake_health")
+    return found
+
+
+def _later_on_line(content: str, offset: int, words: tuple[str, ...], memo: dict) -> bool:
+    """True if any of words occurs on offset's line at or after offset.
+
+    The last occurrence per line is memoized, so many matches on one long
+    line cost one scan of it rather than one each.
+    """
+    end = content.find("\n", offset)
+    end = len(content) if end == -1 else end
+    if end not in memo:
+        start = content.rfind("\n", 0, offset) + 1
+        line = content[start:end].lower()
+        memo[end] = start + max(line.rfind(word) for word in words)
+    return memo[end] >= offset
+
+
 def check_file(file_path: str, content: str) -> list[tuple[str, str, str]]:
     """Check file content for Fabrik convention violations."""
     issues = []
+    patterns = compiled_rules()
+    detected = None
 
     for name, rule in VIOLATIONS.items():
         # Check if file type matches
@@ -80,14 +244,149 @@ def check_file(file_path: str, content: str) -> list[tuple[str, str, str]]:
         if not matches_type:
             continue
 
+        if "detector" in rule:
+            if detected is None:
+                detected = detect(content)
+            if rule["detector"] in detected:
+                issues.append((name, rule["severity"], rule["message"]))
+            continue
+
         # Check for pattern
-        if re.search(rule["pattern"], content, re.IGNORECASE | re.MULTILINE):
+        if "unless_later_on_line" in rule:
+            memo: dict[int, int] = {}
+            found = any(
+                not _later_on_line(content, m.start(1), rule["unless_later_on_line"], memo)
+                for m in patterns[name].finditer(content)
+            )
+        else:
+            found = patterns[name].search(content) is not None
+        if found:
             issues.append((name, rule["severity"], rule["message"]))
 
     return issues
 
 
+def _script_stamp() -> tuple[int, int]:
+    stat = os.stat(__file__)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def request_check(
+    file_path: str, content: str, socket_path: str = SOCKET_PATH
+) -> list[tuple[str, str, str]] | None:
+    """Issues from the validation server, or None if no server answered."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(CLIENT_TIMEOUT)
+            conn.connect(socket_path)
+            conn.sendall(json.dumps({"file_path": file_path, "content": content}).encode())
+            conn.shutdown(socket.SHUT_WR)
+            chunks = []
+            while chunk := conn.recv(65536):
+                chunks.append(chunk)
+        issues = json.loads(b"".join(chunks))["issues"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None  # No server, or it closed the connection because the rules changed
+    return [tuple(issue) for issue in issues]
+
+
+def start_server() -> None:
+    """Start a detached validation server for later hook calls."""
+    import subprocess
+
+    try:
+        subprocess.Popen(
+            [sys.executable, __file__, "--serve"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def serve(socket_path: str = SOCKET_PATH, idle_timeout: float = 1800.0) -> None:
+    """Answer check requests on socket_path until idle or this script changes.
+
+    Rules are compiled once; results for recently seen (path, content) pairs
+    are answered from memory. Requests are handled one at a time.
+    """
+    import hashlib
+    import socketserver
+    from collections import OrderedDict
+
+    # Refuse to replace a live server; clear a stale socket file
+    if os.path.exists(socket_path):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(socket_path)
+            return
+        except OSError:
+            os.unlink(socket_path)
+
+    compiled_rules()
+    stamp = _script_stamp()
+    results: OrderedDict[str, list] = OrderedDict()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            request = json.loads(self.rfile.read())
+            key = hashlib.sha256(
+                f"{request['file_path']}\0{request['content']}".encode()
+            ).hexdigest()
+            issues = results.get(key)
+            if issues is None:
+                issues = check_file(request["file_path"], request["content"])
+                results[key] = issues
+                if len(results) > RESULT_CACHE_SIZE:
+                    results.popitem(last=False)
+            else:
+                results.move_to_end(key)
+            self.wfile.write(json.dumps({"issues": issues}).encode())
+
+    class Server(socketserver.UnixStreamServer):
+        timeout = idle_timeout
+        done = False
+
+        def verify_request(self, request, client_address) -> bool:
+            # Rules changed: close the connection (the hook falls back) and exit
+            if _script_stamp() != stamp:
+                self.done = True
+            return not self.done
+
+        def handle_timeout(self) -> None:
+            self.done = True
+
+    os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+    old_umask = os.umask(0o077)  # Socket usable by this user only
+    try:
+        server = Server(socket_path, Handler)
+    finally:
+        os.umask(old_umask)
+    try:
+        with server:
+            while not server.done:
+                server.handle_request()
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
 def main():
+    if sys.argv[1:2] == ["--serve"]:
+        import argparse
+
+        parser = argparse.ArgumentParser(description="Fabrik conventions validation server")
+        parser.add_argument("--serve", action="store_true", required=True)
+        parser.add_argument("--socket", default=SOCKET_PATH, help="Unix socket path")
+        parser.add_argument(
+            "--idle-timeout", type=float, default=1800.0, help="Exit after this many idle seconds"
+        )
+        args = parser.parse_args()
+        serve(args.socket, args.idle_timeout)
+        sys.exit(0)
+
     try:
         input_data = json.load(sys.stdin)
     except json.JSONDecodeError:
@@ -120,8 +419,12 @@ def main():
         else:
             sys.exit(0)
 
-    # Check for violations
-    issues = check_file(file_path, content)
+    # Check for violations (in-process if no server is running)
+    issues = request_check(file_path, content)
+    if issues is None:
+        issues = check_file(file_path, content)
+        if os.environ.get("FABRIK_CONVENTIONS_DAEMON") == "auto":
+            start_server()
 
     if not issues:
         sys.exit(0)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Docs Link Graph - Validate markdown links and #anchors in memory.
+
+Builds a graph of documents -> outgoing links from the docs manifest
+(scripts/docs_manifest.py), then validates file and anchor targets without
+touching the filesystem for anything inside docs/. The validated graph is
+cached in .droid/docs_link_graph.json keyed by the manifest content key, so
+an unchanged tree is re-checked in a few milliseconds (pre-commit friendly).
+
+Usage:
+    python scripts/docs_updater.py --links            # Links + anchors only
+    python scripts/docs_updater.py --links --orphans  # Also list unlinked docs
+
+    graph = load_link_graph(manifest)
+    for issue in graph.issues:
+        print(issue)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote
+
+# Import docs manifest (handle both module and script execution)
+try:
+    from scripts.docs_manifest import DocsManifest
+except ModuleNotFoundError:
+    from docs_manifest import DocsManifest
+
+GRAPH_CACHE_NAME = Path(".droid") / "docs_link_graph.json"
+
+# Skip these path prefixes (external Factory docs, not our files)
+EXTERNAL_PREFIXES = ("/cli/", "/guides/", "/web/", "/reference/")
+
+# Skip files that are copies of external docs
+EXTERNAL_DOC_COPIES = (
+    "droid-exec-headless.md",
+    "building-interactive-apps-with-droid-exec.md",
+    "factory-hooks.md",
+    "factoryai-power-user-settings.md",
+    "factory-skills.md",
+    "factory-enterprise.md",
+)
+
+# Docs that are entry points by design (never reported as orphans)
+ORPHAN_ROOT_NAMES = ("INDEX.md", "README.md")
+
+
+@dataclass
+class LinkIssue:
+    """A link whose file or #anchor target does not exist."""
+
+    source: str
+    line: int
+    text: str
+    link: str
+    kind: str  # "file" or "anchor"
+
+    def __str__(self) -> str:
+        label = "Broken link" if self.kind == "file" else "Broken anchor"
+        return f"{label} in {self.source}: [{self.text}]({self.link})"
+
+
+@dataclass
+class LinkGraph:
+    """Documents, their resolved outgoing links, and validation results."""
+
+    key: str
+    docs: list[str]
+    edges: dict[str, list[str]] = field(default_factory=dict)
+    issues: list[LinkIssue] = field(default_factory=list)
+    # Paths outside the indexed tree that were resolved on disk -> existed?
+    external: dict[str, bool] = field(default_factory=dict)
+    from_cache: bool = False
+
+    def orphans(self) -> list[str]:
+        """Docs under docs/ that no other (non-archived) doc links to."""
+        linked = {t for src, targets in self.edges.items() for t in targets if t != src}
+        return [
+            doc
+            for doc in self.docs
+            if doc not in linked and doc.rpartition("/")[2] not in ORPHAN_ROOT_NAMES
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.pop("from_cache")
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LinkGraph:
+        issues = [LinkIssue(**i) for i in data.get("issues", [])]
+        return cls(
+            key=data["key"],
+            docs=data.get("docs", []),
+            edges=data.get("edges", {}),
+            issues=issues,
+            external=data.get("external", {}),
+        )
+
+
+def _is_skipped_doc(rel: str) -> bool:
+    """Archived docs and copies of external docs are not validated."""
+    if "/archive" in rel or "/.archive" in rel:
+        return True
+    return rel.rpartition("/")[2] in EXTERNAL_DOC_COPIES
+
+
+def _is_checkable(text: str, link: str) -> bool:
+    """Filter external links, regex-looking text and template placeholders."""
+    # Skip external links, mailto
+    if link.startswith(("http://", "https://", "mailto:")):
+        return False
+    # Skip external Factory doc paths
+    if link.startswith(EXTERNAL_PREFIXES):
+        return False
+    # Skip regex patterns (contain special chars)
+    if any(c in link for c in ["[", "]", "(", ")", "*", "+", "?", "\\"]):
+        return False
+    # Skip template placeholders and code examples
+    if link.startswith("../path") or "[" in text:
+        return False
+    return "{" not in link and "}" not in link
+
+
+def build_link_graph(manifest: DocsManifest, prefix: str = "docs/") -> LinkGraph:
+    """Resolve every link of docs under prefix against the manifest.
+
+    Anchors are checked against the target doc's heading slugs; "#anchor"
+    links are checked against the doc itself. Indexed docs outside prefix
+    (README.md, AGENTS.md, ...) contribute edges for orphan detection only.
+    """
+    graph = LinkGraph(key=manifest.content_key(), docs=[])
+    external: dict[str, bool] = {}
+
+    for rel, entry in manifest.iter_entries():
+        if _is_skipped_doc(rel):
+            continue
+        validate = rel.startswith(prefix)
+        if validate:
+            graph.docs.append(rel)
+        doc_dir = rel.rpartition("/")[0]
+        targets: list[str] = []
+
+        for text, link, line in entry["links"]:
+            if not _is_checkable(text, link):
+                continue
+
+            path_part, _, anchor = link.partition("#")
+            if not path_part:
+                target = rel
+            elif path_part.startswith("/"):
+                # Absolute from repo root
+                target = os.path.normpath(path_part.lstrip("/"))
+            else:
+                target = os.path.normpath(os.path.join(doc_dir, path_part))
+
+            target_entry = manifest.get(target)
+            exists = target_entry is not None or manifest.path_exists(target)
+            if target_entry is None and target not in manifest.known_paths:
+                external[target] = exists
+            if not exists:
+                if validate:
+                    graph.issues.append(LinkIssue(rel, line, text, link, "file"))
+                continue
+
+            targets.append(target)
+            if validate and anchor and target_entry is not None:
+                wanted = unquote(anchor).lower()
+                if wanted not in (a.lower() for a in target_entry["anchors"]):
+                    graph.issues.append(LinkIssue(rel, line, text, link, "anchor"))
+
+        graph.edges[rel] = sorted(set(targets))
+
+    graph.external = external
+    return graph
+
+
+def load_link_graph(manifest: DocsManifest, cache_file: Path | None = None) -> LinkGraph:
+    """Return the link graph, reusing the cached one if nothing relevant changed.
+
+    The cache is valid when the manifest content key matches and every
+    out-of-tree path the cached graph resolved still has the same existence.
+    """
+    cache_file = cache_file or manifest.root / GRAPH_CACHE_NAME
+    key = manifest.content_key()
+
+    try:
+        cached = LinkGraph.from_dict(json.loads(cache_file.read_text()))
+    except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        cached = None
+    if cached is not None and cached.key == key:
+        if all((manifest.root / p).exists() == ok for p, ok in cached.external.items()):
+            cached.from_cache = True
+            return cached
+
+    graph = build_link_graph(manifest)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(graph.to_dict()))
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not save link graph cache: {e}", file=sys.stderr)
+    return graph
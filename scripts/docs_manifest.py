@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Docs Manifest - Incremental content-hash index of markdown docs.
+
+Keeps a persistent record of every indexed markdown file:
+(path, mtime, size, sha256, extracted links, headings, anchors) plus the few facts
+that ``docs_updater --check`` needs (Last Updated date, stub marker, plan
+status). A refresh only stats the tree; files whose mtime/size are unchanged
+are never opened, and files whose content hash is unchanged are not
+re-parsed. Link targets resolve through the in-memory set of known paths.
+Large re-parses (first run, branch switch) fan out over a process pool.
+
+Usage:
+    manifest = DocsManifest(FABRIK_ROOT, stub_markers=STUB_MARKERS)
+    stats = manifest.refresh(["docs"], extra_files=["README.md"])
+    for rel, entry in manifest.iter_entries("docs/"):
+        print(rel, entry["links"])
+    manifest.save()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+# Bump when the entry layout or extraction rules change (forces a full re-parse)
+MANIFEST_VERSION = 2
+
+DEFAULT_MANIFEST_NAME = Path(".droid") / "docs_manifest.json"
+
+# Match markdown links but not code blocks or regex patterns
+LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+HEADING_RE = re.compile(r"^(#{1,6})[ \t]+(.+?)[ \t]*#*[ \t]*$")
+FENCE_RE = re.compile(r"^[ \t]*(```|~~~)")
+HTML_ANCHOR_RE = re.compile(r"<a\s+(?:name|id)=[\"']([^\"']+)[\"']", re.I)
+INLINE_LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+SLUG_STRIP_RE = re.compile(r"[^\w\- ]")
+LAST_UPDATED_RE = re.compile(r"\*\*Last Updated:\*\*\s*(\d{4}-\d{2}-\d{2})")
+PLAN_STATUS_RE = re.compile(r"\*\*Status:\*\*\s*(.+?)(?:\n|$)")
+CHECKED_RE = re.compile(r"- \[[xX]\]")
+UNCHECKED_RE = re.compile(r"- \[ \]")
+
+# Directories never worth walking
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv"}
+
+# Re-parse in a process pool only when at least this many docs changed
+PARALLEL_THRESHOLD = 64
+
+
+def heading_slug(text: str) -> str:
+    """GitHub-style anchor for a heading: lowercase, punctuation dropped, spaces to '-'."""
+    text = INLINE_LINK_RE.sub(r"\1", text)
+    return SLUG_STRIP_RE.sub("", text.strip().lower()).replace(" ", "-")
+
+
+def extract_headings(content: str) -> list[list[Any]]:
+    """Return [level, text] for ATX headings outside fenced code blocks."""
+    headings = []
+    in_fence = False
+    for line in content.splitlines():
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence or not line.startswith("#"):
+            continue
+        match = HEADING_RE.match(line)
+        if match:
+            headings.append([len(match.group(1)), match.group(2)])
+    return headings
+
+
+def heading_anchors(headings: list[list[Any]], content: str = "") -> list[str]:
+    """Anchors a doc exposes: heading slugs (GitHub de-dup suffixes) plus <a id/name>."""
+    anchors = []
+    counts: dict[str, int] = {}
+    for _level, text in headings:
+        slug = heading_slug(text)
+        n = counts.get(slug, 0)
+        counts[slug] = n + 1
+        anchors.append(slug if n == 0 else f"{slug}-{n}")
+    anchors.extend(HTML_ANCHOR_RE.findall(content))
+    return anchors
+
+
+def parse_plan_text(content: str) -> tuple[str, int, int]:
+    """Extract (status, checked, total) from plan markdown.
+
+    Status is normalized: COMPLETE, PARTIAL, NOT_DONE, IN_PROGRESS, or Active
+    """
+    # Extract status line (handles emojis like ✅, ⚠️, ❌)
+    status = "Active"
+    status_match = PLAN_STATUS_RE.search(content)
+    if status_match:
+        raw_status = status_match.group(1).strip()
+        lower = raw_status.lower()
+        if "complete" in lower:
+            status = "COMPLETE"
+        elif "partial" in lower:
+            status = "PARTIAL"
+        elif "not done" in lower or "not_done" in lower:
+            status = "NOT_DONE"
+        elif "in progress" in lower or "in_progress" in lower:
+            status = "IN_PROGRESS"
+        else:
+            status = raw_status[:20]  # Truncate if weird
+
+    # Count checkboxes (handles [x], [X], [ ])
+    checked = len(CHECKED_RE.findall(content))
+    unchecked = len(UNCHECKED_RE.findall(content))
+    return status, checked, checked + unchecked
+
+
+def parse_doc(content: str, stub_markers: Iterable[str] = ()) -> dict[str, Any]:
+    """Extract links, headings and check facts from markdown text."""
+    links = []
+    line, pos = 1, 0
+    for match in LINK_RE.finditer(content):
+        line += content.count("\n", pos, match.start())
+        pos = match.start()
+        links.append([match.group(1), match.group(2), line])
+
+    headings = extract_headings(content)
+
+    last_updated = LAST_UPDATED_RE.search(content)
+    stub_marker = next((m for m in stub_markers if m in content), None)
+
+    return {
+        "links": links,
+        "headings": headings,
+        "anchors": heading_anchors(headings, content),
+        "last_updated": last_updated.group(1) if last_updated else None,
+        "stub_marker": stub_marker,
+        "plan": list(parse_plan_text(content)),
+    }
+
+
+def _load_doc(job: tuple[str, str | None, tuple[str, ...]]) -> tuple[str | None, dict | None]:
+    """Read, hash and parse one doc (process-pool worker).
+
+    Returns (sha256, facts); facts is None when the hash equals the previous
+    one, sha256 is None when the file could not be read.
+    """
+    path, old_digest, stub_markers = job
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return None, None
+    digest = hashlib.sha256(raw).hexdigest()
+    if digest == old_digest:
+        return digest, None
+    return digest, parse_doc(raw.decode("utf-8", errors="replace"), stub_markers)
+
+
+class DocsManifest:
+    """
+    Persistent (path -> entry) index of markdown docs under a root.
+
+    Args:
+        root: Repository root; entry keys are POSIX paths relative to it
+        manifest_file: JSON file to persist to (default: <root>/.droid/docs_manifest.json)
+        stub_markers: Placeholder strings recorded as ``stub_marker`` per doc
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        manifest_file: Path | None = None,
+        stub_markers: Iterable[str] = (),
+    ):
+        self.root = Path(root)
+        self.manifest_file = Path(manifest_file or self.root / DEFAULT_MANIFEST_NAME)
+        self.stub_markers = tuple(stub_markers)
+        self.entries: dict[str, dict[str, Any]] = {}
+        # Every file and directory seen during the last refresh (relative POSIX paths)
+        self.known_paths: set[str] = set()
+        self._indexed_dirs: tuple[str, ...] = ()
+        self._exists_cache: dict[str, bool] = {}
+        self.last_refresh: dict[str, Any] = {}
+        self._dirty = False
+        self.load()
+
+    @property
+    def signature(self) -> str:
+        """Identity of the extraction rules; a mismatch invalidates all entries."""
+        raw = json.dumps([MANIFEST_VERSION, list(self.stub_markers)])
+        return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+    def load(self) -> None:
+        """Load persisted entries (silently starts empty if missing/corrupt)."""
+        try:
+            data = json.loads(self.manifest_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("signature") == self.signature:
+            self.entries = data.get("entries", {})
+
+    def save(self) -> None:
+        """Persist entries if anything changed since load (atomic replace)."""
+        if not self._dirty:
+            return
+        try:
+            self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.manifest_file.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"signature": self.signature, "entries": self.entries}))
+            os.replace(tmp, self.manifest_file)
+            self._dirty = False
+        except OSError as e:
+            print(f"Warning: Could not save docs manifest: {e}", file=sys.stderr)
+
+    def _walk(self, rel_dir: str) -> Iterator[tuple[str, os.stat_result]]:
+        """Yield (relative path, stat) for markdown files below rel_dir."""
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            try:
+                it = os.scandir(self.root / current)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    rel = f"{current}/{entry.name}" if current else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in SKIP_DIRS:
+                            continue
+                        self.known_paths.add(rel)
+                        stack.append(rel)
+                        continue
+                    self.known_paths.add(rel)
+                    if entry.name.endswith(".md") and entry.is_file():
+                        yield rel, entry.stat()
+
+    def refresh(
+        self,
+        dirs: Iterable[str] = ("docs",),
+        extra_files: Iterable[str] = (),
+        workers: int | None = None,
+    ) -> dict[str, Any]:
+        """Re-index dirs (recursive) and extra_files; drop entries that vanished.
+
+        Args:
+            dirs: Repo-relative directories to walk for *.md
+            extra_files: Repo-relative files indexed individually
+            workers: Process pool size for large re-parses (None = CPU count, 0 = inline)
+
+        Returns:
+            Stats dict: docs, reparsed, removed, seconds
+        """
+        start = time.perf_counter()
+        dirs = [d.strip("/") for d in dirs]
+        self.known_paths = set()
+        self._indexed_dirs = tuple(f"{d}/" for d in dirs)
+        self._exists_cache = {}
+        seen: dict[str, os.stat_result] = {}
+
+        # Phase 1: stat only
+        for rel_dir in dirs:
+            self.known_paths.add(rel_dir)
+            for rel, st in self._walk(rel_dir):
+                seen[rel] = st
+
+        for rel in extra_files:
+            if rel in seen:
+                continue
+            try:
+                st = (self.root / rel).stat()
+            except OSError:
+                continue
+            self.known_paths.add(rel)
+            seen[rel] = st
+
+        stale = []
+        for rel, st in seen.items():
+            entry = self.entries.get(rel)
+            if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                continue
+            stale.append((rel, entry["sha256"] if entry else None))
+
+        # Phase 2: read + hash + parse changed docs
+        reparsed = 0
+        for rel, digest, facts in self._parse_stale(stale, workers):
+            self._dirty = True
+            if digest is None:
+                self.entries.pop(rel, None)  # Vanished between stat and read
+                continue
+            st = seen[rel]
+            if facts is None:
+                # Touched but unchanged (checkout, editor save): refresh stat only
+                self.entries[rel]["mtime_ns"] = st.st_mtime_ns
+                self.entries[rel]["size"] = st.st_size
+                continue
+            self.entries[rel] = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "sha256": digest,
+                **facts,
+            }
+            reparsed += 1
+
+        removed = [rel for rel in self.entries if rel not in seen]
+        for rel in removed:
+            del self.entries[rel]
+        if removed:
+            self._dirty = True
+
+        self.last_refresh = {
+            "docs": len(seen),
+            "reparsed": reparsed,
+            "removed": len(removed),
+            "seconds": time.perf_counter() - start,
+        }
+        return self.last_refresh
+
+    def _parse_stale(
+        self, stale: list[tuple[str, str | None]], workers: int | None
+    ) -> Iterator[tuple[str, str | None, dict[str, Any] | None]]:
+        """Run _load_doc over stale docs, in a process pool when worth it."""
+        jobs = [(str(self.root / rel), old, self.stub_markers) for rel, old in stale]
+        if workers == 0 or len(jobs) < PARALLEL_THRESHOLD:
+            results = map(_load_doc, jobs)
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            try:
+                results = list(pool.map(_load_doc, jobs, chunksize=16))
+            finally:
+                pool.shutdown()
+        for (rel, _old), (digest, facts) in zip(stale, results, strict=True):
+            yield rel, digest, facts
+
+    def content_key(self) -> str:
+        """Hash of every indexed (path, sha256) plus the known path set.
+
+        Stable across runs while no doc content and no file in the indexed
+        directories changes; used to key caches derived from the manifest.
+        """
+        h = hashlib.sha256(self.signature.encode())
+        for rel in sorted(self.entries):
+            h.update(f"{rel}\0{self.entries[rel]['sha256']}\n".encode())
+        for rel in sorted(self.known_paths):
+            h.update(f"{rel}\n".encode())
+        return h.hexdigest()
+
+    def get(self, rel: str) -> dict[str, Any] | None:
+        """Return the entry for a repo-relative path, if indexed."""
+        return self.entries.get(rel)
+
+    def iter_entries(self, prefix: str = "") -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (path, entry) for indexed docs whose path starts with prefix."""
+        for rel in sorted(self.entries):
+            if rel.startswith(prefix):
+                yield rel, self.entries[rel]
+
+    def path_exists(self, rel: str) -> bool:
+        """Resolve a normalized repo-relative path against the known path set.
+
+        Paths outside the indexed directories fall back to one memoized
+        filesystem check per run.
+        """
+        rel = rel.strip("/")
+        if rel in self.known_paths or rel in self.entries:
+            return True
+        parts = rel.split("/")
+        if rel.startswith(self._indexed_dirs) and not SKIP_DIRS.intersection(parts):
+            return False
+        if rel not in self._exists_cache:
+            self._exists_cache[rel] = (self.root / rel).exists()
+        return self._exists_cache[rel]
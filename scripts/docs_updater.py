@@ -34,12 +34,15 @@ Usage:
     python scripts/docs_updater.py --check           # Validate docs, fail on drift
     python scripts/docs_updater.py --sync            # Create missing stubs
     python scripts/docs_updater.py --sync --dry-run  # Preview changes
+    python scripts/docs_updater.py --links           # Links + anchors only (pre-commit)
+    python scripts/docs_updater.py --links --orphans # Also list docs nothing links to
 """
 
 from __future__ import annotations
 
 import argparse
 import fcntl
+import hashlib
 import json
 import os
 import re
@@ -54,9 +57,29 @@ from pathlib import Path
 from queue import Empty, Queue
 from typing import Any
 
+# Import docs manifest (handle both module and script execution)
+try:
+    from scripts.docs_links import load_link_graph
+    from scripts.docs_manifest import DocsManifest, parse_plan_text
+except ModuleNotFoundError:
+    from docs_links import load_link_graph
+    from docs_manifest import DocsManifest, parse_plan_text
+
+# Shared models.yaml loader (parsed once per process, re-read when the file changes)
+try:
+    from scripts.droid_models import load_models_config
+except ModuleNotFoundError:
+    from droid_models import load_models_config
+
+# Import metrics exporter (no-op unless FABRIK_METRICS_* is set)
+try:
+    from scripts import droid_metrics
+except ModuleNotFoundError:
+    import droid_metrics
+
 # Import ProcessMonitor for droid exec monitoring
 try:
-    from process_monitor import ProcessMonitor
+    from process_monitor import get_monitor_service
 
     PROCESS_MONITOR_AVAILABLE = True
 except ImportError:
@@ -79,11 +102,15 @@ FABRIK_ROOT = Path(os.getenv("FABRIK_ROOT", "/opt/fabrik"))
 DOCS_QUEUE_DIR = Path(os.getenv("FABRIK_DOCS_QUEUE", FABRIK_ROOT / ".droid" / "docs_queue"))
 DOCS_LOG_DIR = Path(os.getenv("FABRIK_DOCS_LOG", FABRIK_ROOT / ".droid" / "docs_log"))
 CONFIG_FILE = Path(os.getenv("FABRIK_MODELS_CONFIG", FABRIK_ROOT / "config" / "models.yaml"))
+# Default: FABRIK_ROOT/.droid/docs_manifest.json
+DOCS_MANIFEST_FILE = os.getenv("FABRIK_DOCS_MANIFEST")
 PID_FILE = DOCS_QUEUE_DIR / "docs_updater.pid"
 
 # Batch settings
 BATCH_DELAY_SECONDS = 10  # Wait for more changes before processing
-MAX_BATCH_SIZE = 10
+MAX_BATCH_SIZE = 10  # Max files per docs prompt
+MAX_PROMPTS_PER_BATCH = 5  # Remaining clusters stay pending for the next run
+COALESCE_WINDOW_SECONDS = 120  # Merge same-module tasks queued within this window
 
 # Ensure directories exist
 DOCS_QUEUE_DIR.mkdir(parents=True, exist_ok=True)
@@ -94,10 +121,7 @@ def get_docs_model() -> str:
     """Get the model for documentation updates from config."""
     fallback = "gemini-3-flash-preview"  # Low cost (0.2x)
     try:
-        import yaml
-
-        with open(CONFIG_FILE) as f:
-            config = yaml.safe_load(f)
+        config = load_models_config(CONFIG_FILE)
 
         # Check for documentation scenario
         docs_config = config.get("scenarios", {}).get("documentation", {})
@@ -166,6 +190,7 @@ def get_pending_tasks() -> list[dict[str, Any]]:
 
     # Sort by queued time
     tasks.sort(key=lambda t: t.get("queued_at", ""))
+    droid_metrics.set_gauge("fabrik_queue_depth", len(tasks), queue="docs")
     return tasks
 
 
@@ -187,7 +212,7 @@ def mark_task_status(task: dict[str, Any], status: str, result: str = "") -> Non
     # Remove internal field
     save_task = {k: v for k, v in task.items() if not k.startswith("_")}
 
-    if status == "completed":
+    if status in ("completed", "superseded"):
         # Move to log directory - write updated content first, then move
         DOCS_LOG_DIR.mkdir(parents=True, exist_ok=True)
         task_file.write_text(json.dumps(save_task, indent=2))  # Update file first
@@ -206,6 +231,7 @@ def mark_task_status(task: dict[str, Any], status: str, result: str = "") -> Non
             shutil.move(str(task_file), str(dest))
         else:
             # Keep in queue for retry
+            droid_metrics.inc("fabrik_droid_retries_total", source="docs")
             task["status"] = "pending"  # Reset to pending
             save_task["status"] = "pending"
             task_file.write_text(json.dumps(save_task, indent=2))
@@ -255,7 +281,7 @@ def _sanitize_path(path: str) -> str:
     return path.replace("\n", "").replace("\r", "").replace("\x00", "")[:200]
 
 
-def build_docs_prompt(files: list[str], change_types: list[str]) -> str:
+def build_docs_prompt(files: list[str], change_types: list[str], module: str = "") -> str:
     """Build the prompt for the documentation model."""
     files_info = []
     for f, ct in zip(files, change_types, strict=True):
@@ -263,8 +289,9 @@ def build_docs_prompt(files: list[str], change_types: list[str]) -> str:
         files_info.append(f"- {safe_path} ({ct})")
 
     files_str = "\n".join(files_info)
+    scope = f" (all in module `{_sanitize_path(module)}`)" if module else ""
 
-    return f"""You are updating Fabrik documentation. These files were modified:
+    return f"""You are updating Fabrik documentation. These files were modified{scope}:
 
 {files_str}
 
@@ -301,7 +328,7 @@ IMPORTANT:
 Start by reading the changed files, then update CHANGELOG.md first, then other relevant documentation."""
 
 
-def run_docs_update(files: list[str]) -> dict[str, Any]:
+def run_docs_update(files: list[str], module: str = "") -> dict[str, Any]:
     """Run the documentation update using droid exec."""
     if not files:
         return {"success": True, "result": "No files to process"}
@@ -310,7 +337,7 @@ def run_docs_update(files: list[str]) -> dict[str, Any]:
     change_types = [analyze_change_type(f) for f in files]
 
     # Build prompt
-    prompt = build_docs_prompt(files, change_types)
+    prompt = build_docs_prompt(files, change_types, module)
 
     # Get model
     model = get_docs_model()
@@ -331,6 +358,30 @@ def run_docs_update(files: list[str]) -> dict[str, Any]:
         prompt,
     ]
 
+    return _run_droid_exec(args, model, "docs", timeout_seconds, warn_after_seconds)
+
+
+def _run_droid_exec(
+    args: list[str],
+    model: str,
+    task_type: str,
+    timeout_seconds: int,
+    warn_after_seconds: int,
+) -> dict[str, Any]:
+    """Run a droid exec command with ProcessMonitor polling and metrics."""
+    with droid_metrics.track_run(model, task_type) as run:
+        result = _run_monitored(args, model, timeout_seconds, warn_after_seconds)
+        run.status = "success" if result["success"] else "error"
+    return result
+
+
+def _run_monitored(
+    args: list[str],
+    model: str,
+    timeout_seconds: int,
+    warn_after_seconds: int,
+) -> dict[str, Any]:
+    """Popen + stream capture + stuck polling; returns {"success", "result"}."""
     try:
         # Use Popen with threading for proper ProcessMonitor polling
         process = subprocess.Popen(
@@ -342,11 +393,11 @@ def run_docs_update(files: list[str]) -> dict[str, Any]:
             cwd=str(FABRIK_ROOT),
         )
 
-        # Initialize ProcessMonitor if available
+        # Register with the shared MonitorService (one thread for all processes)
         monitor = None
         if PROCESS_MONITOR_AVAILABLE:
             with suppress(Exception):
-                monitor = ProcessMonitor(process, warn_threshold=warn_after_seconds)
+                monitor = get_monitor_service().register(process, warn_threshold=warn_after_seconds)
 
         # Use threading to read stdout/stderr without blocking
         output_queue: Queue = Queue()
@@ -364,6 +415,7 @@ def run_docs_update(files: list[str]) -> dict[str, Any]:
         stderr_lines = []
         start_time = time.time()
         streams_closed = 0
+        stuck_reported = False
 
         while streams_closed < 2:
             # Check timeout
@@ -377,6 +429,9 @@ def run_docs_update(files: list[str]) -> dict[str, Any]:
                 diagnosis = monitor.analyze()
                 if diagnosis["state"] in ("LIKELY_STUCK", "CONFIRMED_STUCK"):
                     print(f"⚠️ ProcessMonitor: {diagnosis['reason']}", file=sys.stderr)
+                    if not stuck_reported:
+                        droid_metrics.inc("fabrik_droid_stuck_total", source="docs")
+                        stuck_reported = True
 
             try:
                 name, line = output_queue.get(timeout=1.0)
@@ -407,6 +462,7 @@ def run_docs_update(files: list[str]) -> dict[str, Any]:
         # Parse output
         try:
             output = json.loads(stdout.strip())
+            droid_metrics.record_tokens(model, output.get("usage"))
             return {
                 "success": not output.get("is_error", False),
                 "result": output.get("result", "")[:2000],
@@ -418,13 +474,160 @@ def run_docs_update(files: list[str]) -> dict[str, Any]:
         return {"success": False, "result": str(e)[:500]}
 
 
+# =============================================================================
+# Task Coalescing (queue bursts during refactors)
+# =============================================================================
+
+
+def _docs_hashes_file() -> Path:
+    """State file: file path -> content hash at last successful docs update."""
+    return DOCS_LOG_DIR / "docs_hashes.json"
+
+
+def _load_docs_hashes() -> dict[str, str]:
+    try:
+        return json.loads(_docs_hashes_file().read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _file_hash(file_path: str) -> str | None:
+    """sha256 of a file (relative paths resolve from FABRIK_ROOT), None if unreadable."""
+    path = Path(file_path)
+    if not path.is_absolute():
+        path = FABRIK_ROOT / path
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def record_docs_hashes(files: list[str]) -> None:
+    """Remember file hashes after a successful docs update."""
+    hashes = _load_docs_hashes()
+    for f in files:
+        digest = _file_hash(f)
+        if digest:
+            hashes[f] = digest
+        else:
+            hashes.pop(f, None)
+    with suppress(OSError):
+        _docs_hashes_file().write_text(json.dumps(hashes, indent=2, sort_keys=True))
+
+
+def _module_of(file_path: str) -> str:
+    """Module key for clustering: the file's parent directory, relative to FABRIK_ROOT."""
+    path = Path(file_path)
+    with suppress(ValueError):
+        path = path.relative_to(FABRIK_ROOT)
+    parent = path.parent.as_posix()
+    return "" if parent == "." else parent
+
+
+def _queued_ts(task: dict[str, Any]) -> float:
+    try:
+        return datetime.fromisoformat(task.get("queued_at", "")).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def coalesce_tasks(
+    tasks: list[dict[str, Any]], window_seconds: float = COALESCE_WINDOW_SECONDS
+) -> tuple[list[dict[str, Any]], list[tuple[dict[str, Any], str]], dict[str, Any]]:
+    """Merge a burst of queued tasks into module clusters.
+
+    - Tasks for the same file collapse into the newest one (older = superseded)
+    - Tasks whose file hash is unchanged since the last successful docs
+      update are dropped
+    - Remaining files are grouped per module; a module's tasks queued within
+      window_seconds of the cluster start share one prompt (max MAX_BATCH_SIZE files)
+
+    Returns:
+        (clusters, dropped, stats) where each cluster is
+        {"module": str, "files": [...], "tasks": [...]} and dropped is a list
+        of (task, reason).
+    """
+    dropped: list[tuple[dict[str, Any], str]] = []
+    ordered = sorted(tasks, key=_queued_ts)
+
+    # Same file: keep newest task only
+    latest: dict[str, dict[str, Any]] = {}
+    for task in ordered:
+        path = _sanitize_path(task["file_path"])
+        if path in latest:
+            dropped.append((latest[path], f"Superseded by newer task for {path}"))
+        latest[path] = task
+
+    # Unchanged since last successful docs update
+    known_hashes = _load_docs_hashes()
+    live: list[tuple[str, dict[str, Any]]] = []
+    unchanged = 0
+    for path, task in sorted(latest.items(), key=lambda kv: _queued_ts(kv[1])):
+        if path in known_hashes and _file_hash(path) == known_hashes[path]:
+            dropped.append((task, f"Unchanged since last docs update: {path}"))
+            unchanged += 1
+            continue
+        live.append((path, task))
+
+    # Cluster per module within the time window
+    clusters: list[dict[str, Any]] = []
+    open_clusters: dict[str, dict[str, Any]] = {}
+    for path, task in live:
+        module = _module_of(path)
+        ts = _queued_ts(task)
+        cluster = open_clusters.get(module)
+        if (
+            cluster is None
+            or ts - cluster["start"] > window_seconds
+            or len(cluster["files"]) >= MAX_BATCH_SIZE
+        ):
+            cluster = {"module": module, "start": ts, "files": [], "tasks": []}
+            open_clusters[module] = cluster
+            clusters.append(cluster)
+        cluster["files"].append(path)
+        cluster["tasks"].append(task)
+
+    for cluster in clusters:
+        cluster.pop("start")
+
+    stats = {
+        "tasks": len(tasks),
+        "prompts": len(clusters),
+        "superseded": len(dropped) - unchanged,
+        "unchanged": unchanged,
+        "ratio": round(len(tasks) / len(clusters), 1) if clusters else float(len(tasks)),
+    }
+    return clusters, dropped, stats
+
+
+def format_coalesce_stats(stats: dict[str, Any]) -> str:
+    """One-line coalescing report."""
+    return (
+        f"Coalesced {stats['tasks']} tasks → {stats['prompts']} prompts "
+        f"({stats['ratio']}x; {stats['superseded']} superseded, {stats['unchanged']} unchanged)"
+    )
+
+
 def process_batch(tasks: list[dict[str, Any]]) -> None:
-    """Process a batch of documentation update tasks."""
+    """Coalesce a batch of documentation update tasks and run one prompt per cluster."""
     if not tasks:
         return
 
-    files = [_sanitize_path(t["file_path"]) for t in tasks]
-    print(f"Processing documentation update for {len(files)} files...")
+    clusters, dropped, stats = coalesce_tasks(tasks)
+    print(format_coalesce_stats(stats))
+    for task, reason in dropped:
+        mark_task_status(task, "superseded", reason)
+
+    for cluster in clusters[:MAX_PROMPTS_PER_BATCH]:
+        _process_cluster(cluster["tasks"], cluster["files"], cluster["module"], stats)
+
+
+def _process_cluster(
+    tasks: list[dict[str, Any]], files: list[str], module: str, stats: dict[str, Any]
+) -> None:
+    """Run one docs update for a module cluster and record the outcome."""
+    label = f" in {module}" if module else ""
+    print(f"Processing documentation update for {len(files)} files{label}...")
 
     # Mark tasks as processing first
     for task in tasks:
@@ -433,12 +636,14 @@ def process_batch(tasks: list[dict[str, Any]]) -> None:
     result = {"success": False, "result": "Unknown error"}  # Default for crash path
     try:
         # Run the update
-        result = run_docs_update(files)
+        result = run_docs_update(files, module)
 
         # Mark all tasks based on result
         status = "completed" if result["success"] else "failed"
         for task in tasks:
             mark_task_status(task, status, result.get("result", ""))
+        if result["success"]:
+            record_docs_hashes(files)
     except Exception as e:
         # On error, mark tasks as failed for retry
         result = {"success": False, "result": str(e)[:500]}
@@ -449,12 +654,14 @@ def process_batch(tasks: list[dict[str, Any]]) -> None:
     log_entry = {
         "timestamp": datetime.now().isoformat(),
         "files": files,
+        "module": module,
         "model": get_docs_model(),
         "success": result["success"],
         "result": result.get("result", "")[:1000],
+        "coalescing": stats,
     }
 
-    log_file = DOCS_LOG_DIR / f"update_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    log_file = DOCS_LOG_DIR / f"update_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.json"
     log_file.write_text(json.dumps(log_entry, indent=2))
 
     if result["success"]:
@@ -522,7 +729,7 @@ def run_once() -> None:
     try:
         tasks = get_pending_tasks()
         if tasks:
-            process_batch(tasks[:MAX_BATCH_SIZE])
+            process_batch(tasks)
         else:
             print("No pending documentation tasks")
     finally:
@@ -546,7 +753,7 @@ def run_daemon() -> None:
                 tasks = get_pending_tasks()
 
                 if tasks:
-                    process_batch(tasks[:MAX_BATCH_SIZE])
+                    process_batch(tasks)
             else:
                 time.sleep(10)
     except KeyboardInterrupt:
@@ -673,30 +880,61 @@ def parse_plan_status(plan_path: Path) -> tuple[str, int, int]:
         content = plan_path.read_text()
     except Exception:
         return "Unknown", 0, 0
+    return parse_plan_text(content)
 
-    # Extract status line (handles emojis like ✅, ⚠️, ❌)
-    status = "Active"
-    status_match = re.search(r"\*\*Status:\*\*\s*(.+?)(?:\n|$)", content)
-    if status_match:
-        raw_status = status_match.group(1).strip()
-        # Normalize status
-        lower = raw_status.lower()
-        if "complete" in lower:
-            status = "COMPLETE"
-        elif "partial" in lower:
-            status = "PARTIAL"
-        elif "not done" in lower or "not_done" in lower:
-            status = "NOT_DONE"
-        elif "in progress" in lower or "in_progress" in lower:
-            status = "IN_PROGRESS"
-        else:
-            status = raw_status[:20]  # Truncate if weird
 
-    # Count checkboxes in DONE WHEN section (handles [x], [X], [ ])
-    checked = len(re.findall(r"- \[[xX]\]", content))
-    unchecked = len(re.findall(r"- \[ \]", content))
-    total = checked + unchecked
+_docs_manifest: DocsManifest | None = None
+
 
+def get_docs_manifest(refresh: bool = False, workers: int | None = None) -> DocsManifest:
+    """Process-wide docs manifest for FABRIK_ROOT, refreshed on first use.
+
+    Indexes docs/**/*.md plus MANUAL_DOCS. Pass refresh=True to re-stat the
+    tree (only changed docs are re-read). workers sizes the parse pool of
+    that refresh (None = CPU count, 0 = inline).
+    """
+    global _docs_manifest
+    if _docs_manifest is None or _docs_manifest.root != FABRIK_ROOT:
+        _docs_manifest = DocsManifest(
+            FABRIK_ROOT,
+            manifest_file=Path(DOCS_MANIFEST_FILE) if DOCS_MANIFEST_FILE else None,
+            stub_markers=STUB_MARKERS,
+        )
+        refresh = True
+    if refresh:
+        _docs_manifest.refresh(["docs"], extra_files=MANUAL_DOCS, workers=workers)
+        _docs_manifest.save()
+    return _docs_manifest
+
+
+def _plan_files() -> list[Path]:
+    """Top-level plan files, listed from the manifest when PLANS_DIR is indexed."""
+    key = _manifest_key(PLANS_DIR)
+    if key is None or not key.startswith("docs/"):
+        return sorted(PLANS_DIR.glob("*.md")) if PLANS_DIR.exists() else []
+    prefix = f"{key}/"
+    return [
+        FABRIK_ROOT / rel
+        for rel, _entry in get_docs_manifest().iter_entries(prefix)
+        if "/" not in rel[len(prefix) :]
+    ]
+
+
+def _manifest_key(path: Path) -> str | None:
+    """Repo-relative manifest key for path, or None if outside FABRIK_ROOT."""
+    try:
+        return path.relative_to(FABRIK_ROOT).as_posix()
+    except ValueError:
+        return None
+
+
+def _plan_status(plan_path: Path) -> tuple[str, int, int]:
+    """parse_plan_status() served from the docs manifest when indexed."""
+    key = _manifest_key(plan_path)
+    entry = get_docs_manifest().get(key) if key else None
+    if entry is None:
+        return parse_plan_status(plan_path)
+    status, checked, total = entry["plan"]
     return status, checked, total
 
 
@@ -746,7 +984,7 @@ def validate_plans_indexed() -> list[str]:
     idx = PLANS_INDEX.read_text()
     errors = []
     if PLANS_DIR.exists():
-        for p in PLANS_DIR.glob("*.md"):
+        for p in _plan_files():
             if p.name not in idx:
                 errors.append(f"Plan not indexed: {p.name}")
     return errors
@@ -764,8 +1002,8 @@ def validate_plan_consistency() -> list[str]:
 
     from datetime import timedelta
 
-    for p in PLANS_DIR.glob("*.md"):
-        status, checked, total = parse_plan_status(p)
+    for p in _plan_files():
+        status, checked, total = _plan_status(p)
 
         # ERROR: COMPLETE with unchecked boxes
         if status == "COMPLETE" and total > 0 and checked < total:
@@ -846,106 +1084,63 @@ def check_stub_completeness() -> list[str]:
     if not ref_dir.exists():
         return issues
 
-    for doc in ref_dir.glob("*.md"):
-        content = doc.read_text()
-        for marker in STUB_MARKERS:
-            if marker in content:
-                issues.append(
-                    f"Incomplete stub: {doc.relative_to(FABRIK_ROOT)} (contains '{marker[:20]}...')"
-                )
-                break
+    prefix = "docs/reference/"
+    for rel, entry in get_docs_manifest().iter_entries(prefix):
+        if "/" in rel[len(prefix) :]:
+            continue  # Top-level reference docs only
+        marker = entry["stub_marker"]
+        if marker:
+            issues.append(f"Incomplete stub: {rel} (contains '{marker[:20]}...')")
     return issues
 
 
 def check_link_integrity() -> list[str]:
-    """Check all internal markdown links are valid."""
-    issues = []
-    docs_dir = FABRIK_ROOT / "docs"
-    if not docs_dir.exists():
-        return issues
-
-    # Match markdown links but not code blocks or regex patterns
-    link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
-
-    # Skip these path prefixes (external Factory docs, not our files)
-    external_prefixes = ("/cli/", "/guides/", "/web/", "/reference/")
-
-    # Skip files that are copies of external docs
-    skip_files = (
-        "droid-exec-headless.md",
-        "building-interactive-apps-with-droid-exec.md",
-        "factory-hooks.md",
-        "factoryai-power-user-settings.md",
-        "factory-skills.md",
-        "factory-enterprise.md",
+    """Check all internal markdown links and #anchors are valid."""
+    if not (FABRIK_ROOT / "docs").exists():
+        return []
+    return [str(issue) for issue in load_link_graph(get_docs_manifest()).issues]
+
+
+def run_link_check(show_orphans: bool = False, workers: int | None = None) -> int:
+    """Validate links/anchors only (pre-commit mode). Returns exit code."""
+    start = time.perf_counter()
+    manifest = get_docs_manifest(workers=workers)
+    graph = load_link_graph(manifest)
+    elapsed = time.perf_counter() - start
+
+    for issue in graph.issues:
+        print(f"  - {issue} (line {issue.line})")
+    if show_orphans:
+        orphans = graph.orphans()
+        print(f"\nOrphaned docs ({len(orphans)}):")
+        for doc in orphans:
+            print(f"  - {doc}")
+
+    source = "cached" if graph.from_cache else "rebuilt"
+    print(
+        f"\n{len(graph.issues)} link issues in {len(graph.docs)} docs "
+        f"({manifest.last_refresh.get('reparsed', 0)} re-parsed, {source} graph) "
+        f"in {elapsed * 1000:.1f}ms"
     )
-
-    for doc in docs_dir.rglob("*.md"):
-        # Skip known external doc copies
-        if doc.name in skip_files:
-            continue
-
-        # Skip archived docs and design archives
-        if "/archive" in str(doc) or "/.archive" in str(doc):
-            continue
-
-        content = doc.read_text()
-        for match in link_pattern.finditer(content):
-            link_text, link_path = match.groups()
-
-            # Skip external links, anchors, mailto
-            if link_path.startswith(("http://", "https://", "#", "mailto:")):
-                continue
-
-            # Skip external Factory doc paths
-            if link_path.startswith(external_prefixes):
-                continue
-
-            # Skip regex patterns (contain special chars)
-            if any(c in link_path for c in ["[", "]", "(", ")", "*", "+", "?", "\\"]):
-                continue
-
-            # Skip template placeholders and code examples
-            if link_path.startswith("../path") or "[" in link_text:
-                continue
-            if "{" in link_path or "}" in link_path:
-                continue
-
-            # Resolve relative path
-            if link_path.startswith("/"):
-                # Absolute from repo root
-                target = FABRIK_ROOT / link_path.lstrip("/")
-            else:
-                # Handle anchor in path
-                path_part = link_path.split("#")[0]
-                if not path_part:
-                    continue
-                target = (doc.parent / path_part).resolve()
-
-            if not target.exists():
-                issues.append(
-                    f"Broken link in {doc.relative_to(FABRIK_ROOT)}: [{link_text}]({link_path})"
-                )
-    return issues
+    return 1 if graph.issues else 0
 
 
 def check_staleness() -> list[str]:
     """Check for docs that haven't been updated recently."""
     issues = []
     today = datetime.now()
-    last_updated_re = re.compile(r"\*\*Last Updated:\*\*\s*(\d{4}-\d{2}-\d{2})")
 
+    manifest = get_docs_manifest()
     for doc_path in MANUAL_DOCS:
-        full_path = FABRIK_ROOT / doc_path
-        if not full_path.exists():
+        entry = manifest.get(doc_path)
+        if entry is None:
             continue
-        content = full_path.read_text()
-        match = last_updated_re.search(content)
-        if not match:
+        last_updated = entry["last_updated"]
+        if not last_updated:
             issues.append(f"Missing 'Last Updated' date: {doc_path}")
             continue
         try:
-            last_date = datetime.strptime(match.group(1), "%Y-%m-%d")
+            last_date = datetime.strptime(last_updated, "%Y-%m-%d")
             days_old = (today - last_date).days
             if days_old > STALENESS_DAYS:
                 issues.append(f"Stale doc ({days_old} days old): {doc_path}")
@@ -954,22 +1149,9 @@ def check_staleness() -> list[str]:
     return issues
 
 
-def validate_docs() -> tuple[bool, list[str]]:
-    """Check for drift. Returns (valid, issues)."""
+def _check_markers() -> list[str]:
+    """Check bounded block markers exist in INDEX.md and PLANS.md."""
     issues = []
-
-    # Check plans are indexed
-    issues.extend(validate_plans_indexed())
-
-    # Check plan status/checkbox consistency
-    issues.extend(validate_plan_consistency())
-
-    # Check for missing module docs
-    missing_modules = detect_new_modules()
-    for m in missing_modules:
-        issues.append(f"Missing reference doc: docs/reference/{m.name}.md")
-
-    # Check bounded blocks exist
     if README_PATH.exists():
         readme = README_PATH.read_text()
         if "<!-- AUTO-GENERATED:STRUCTURE:START -->" not in readme:
@@ -979,19 +1161,55 @@ def validate_docs() -> tuple[bool, list[str]]:
         plans_md = PLANS_INDEX.read_text()
         if "<!-- AUTO-GENERATED:PLANS:START -->" not in plans_md:
             issues.append("docs/development/PLANS.md missing PLANS auto-block markers")
+    return issues
+
 
-    # NEW: Stub completeness check
-    issues.extend(check_stub_completeness())
+def _check_missing_modules() -> list[str]:
+    """Check every public module has a reference doc."""
+    return [f"Missing reference doc: docs/reference/{m.name}.md" for m in detect_new_modules()]
 
-    # NEW: Link integrity check
-    issues.extend(check_link_integrity())
 
-    # NEW: Staleness check
-    issues.extend(check_staleness())
+def validate_docs(timings: dict[str, float] | None = None) -> tuple[bool, list[str]]:
+    """Check for drift. Returns (valid, issues).
+
+    Args:
+        timings: Optional dict filled with seconds spent per check
+    """
+    issues: list[str] = []
+
+    start = time.perf_counter()
+    get_docs_manifest(refresh=True)  # Re-stat once; only changed docs are re-read
+    if timings is not None:
+        timings["manifest"] = time.perf_counter() - start
+
+    checks = [
+        ("plans_indexed", validate_plans_indexed),
+        ("plan_consistency", validate_plan_consistency),
+        ("missing_modules", _check_missing_modules),
+        ("block_markers", _check_markers),
+        ("stub_completeness", check_stub_completeness),
+        ("link_integrity", check_link_integrity),
+        ("staleness", check_staleness),
+    ]
+    for name, check in checks:
+        start = time.perf_counter()
+        issues.extend(check())
+        if timings is not None:
+            timings[name] = time.perf_counter() - start
 
     return len(issues) == 0, issues
 
 
+def _format_timings(timings: dict[str, float]) -> str:
+    """Render per-check timings plus manifest stats as one line."""
+    stats = get_docs_manifest().last_refresh
+    parts = [f"{name} {secs * 1000:.1f}ms" for name, secs in timings.items()]
+    return (
+        f"Timing: {sum(timings.values()) * 1000:.1f}ms total "
+        f"({stats.get('docs', 0)} docs, {stats.get('reparsed', 0)} re-parsed) | " + ", ".join(parts)
+    )
+
+
 def run_sync(dry_run: bool = False) -> None:
     """Create missing stubs + sync structure."""
     print("=== Documentation Sync ===\n")
@@ -1017,16 +1235,19 @@ def run_check() -> int:
     """Validate docs, fail on drift. Returns exit code."""
     print("=== Documentation Check ===\n")
 
-    valid, issues = validate_docs()
+    timings: dict[str, float] = {}
+    valid, issues = validate_docs(timings)
 
     if valid:
         print("✓ All documentation checks passed")
+        print(f"\n{_format_timings(timings)}")
         return 0
     else:
         print("✗ Documentation issues found:\n")
         for issue in issues:
             print(f"  - {issue}")
         print("\nRun 'python scripts/docs_updater.py --sync' to fix.")
+        print(f"\n{_format_timings(timings)}")
         return 1
 
 
@@ -1063,81 +1284,7 @@ def run_custom_prompt(prompt: str, files_to_check: list[str] | None = None) -> d
         prompt,
     ]
 
-    try:
-        process = subprocess.Popen(
-            args,
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            cwd=str(FABRIK_ROOT),
-        )
-
-        monitor = None
-        if PROCESS_MONITOR_AVAILABLE:
-            with suppress(Exception):
-                monitor = ProcessMonitor(process, warn_threshold=warn_after_seconds)
-
-        output_queue: Queue = Queue()
-        stdout_thread = threading.Thread(
-            target=_stream_reader, args=(process.stdout, output_queue, "stdout")
-        )
-        stderr_thread = threading.Thread(
-            target=_stream_reader, args=(process.stderr, output_queue, "stderr")
-        )
-        stdout_thread.start()
-        stderr_thread.start()
-
-        stdout_lines = []
-        stderr_lines = []
-        start_time = time.time()
-        streams_closed = 0
-
-        while streams_closed < 2:
-            if time.time() - start_time > timeout_seconds:
-                process.kill()
-                process.wait()
-                return {"success": False, "result": f"Timeout after {timeout_seconds}s"}
-
-            if monitor and (time.time() - start_time) % 30 < 1:
-                diagnosis = monitor.analyze()
-                if diagnosis["state"] in ("LIKELY_STUCK", "CONFIRMED_STUCK"):
-                    print(f"⚠️ ProcessMonitor: {diagnosis['reason']}", file=sys.stderr)
-
-            try:
-                name, line = output_queue.get(timeout=1.0)
-                if line is None:
-                    streams_closed += 1
-                elif name == "stdout":
-                    stdout_lines.append(line)
-                    if monitor:
-                        monitor.record_activity()
-                else:
-                    stderr_lines.append(line)
-            except Empty:
-                continue
-
-        stdout_thread.join(timeout=5)
-        stderr_thread.join(timeout=5)
-        process.wait()
-
-        stdout = "".join(stdout_lines)
-        stderr = "".join(stderr_lines)
-
-        if process.returncode != 0:
-            return {"success": False, "result": f"Exit code {process.returncode}: {stderr[:500]}"}
-
-        try:
-            output = json.loads(stdout.strip())
-            return {
-                "success": not output.get("is_error", False),
-                "result": output.get("result", "")[:2000],
-            }
-        except json.JSONDecodeError:
-            return {"success": True, "result": stdout[:2000]}
-
-    except Exception as e:
-        return {"success": False, "result": str(e)[:500]}
+    return _run_droid_exec(args, model, "custom", timeout_seconds, warn_after_seconds)
 
 
 def main():
@@ -1154,11 +1301,20 @@ def main():
     parser.add_argument("--check", action="store_true", help="Validate docs, fail on drift")
     parser.add_argument("--sync", action="store_true", help="Create missing stubs + sync structure")
     parser.add_argument("--dry-run", action="store_true", help="Preview changes without writing")
+    parser.add_argument(
+        "--links", action="store_true", help="Validate doc links and anchors only (fast)"
+    )
+    parser.add_argument("--orphans", action="store_true", help="With --links: list unlinked docs")
+    parser.add_argument(
+        "--workers", type=int, help="With --links: parse pool size (0 = no process pool)"
+    )
 
     args = parser.parse_args()
 
     if args.check:
         sys.exit(run_check())
+    elif args.links:
+        sys.exit(run_link_check(show_orphans=args.orphans, workers=args.workers))
     elif args.sync:
         run_sync(dry_run=args.dry_run)
     elif args.task_file:
@@ -0,0 +1,538 @@
+#!/usr/bin/env python3
+"""
+Driver Benchmark - Time fabrik drivers against recorded HTTP responses.
+
+A local HTTP/1.1 server replays the responses in tests/fixtures/http/<service>.json,
+each service under its own prefix (http://127.0.0.1:PORT/coolify/api/v1/...), and
+waits latency +/- jitter before every response. Workflows run the real driver code
+paths against it: deploy_to_coolify, CloudflareClient.ensure_record,
+PageCreator.create_all, and the DNS manager, R2 and Supabase clients.
+
+For each workflow the report shows the requests the server received, wall time,
+and peak memory allocated while it ran (a second, tracemalloc-traced pass). The
+server runs in its own process, so its threads neither compete with the drivers
+for the GIL nor show up in the allocation trace.
+
+Usage:
+    python -m scripts.driver_benchmark                             # All workflows
+    python -m scripts.driver_benchmark --latency 30 --jitter 10    # Closer to a real API
+    python -m scripts.driver_benchmark cloudflare_ensure_record --count 500
+    python -m scripts.driver_benchmark --json > before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = REPO_ROOT / "tests" / "fixtures" / "http"
+
+# Control endpoints; not counted as driver requests
+STATS_PATH = "/_replay/stats"
+RESET_PATH = "/_replay/reset"
+
+COMPOSE = """services:
+  web:
+    image: nginx:1.27-alpine
+    restart: unless-stopped
+    healthcheck:
+      test: ["CMD", "wget", "-qO-", "http://localhost/"]
+"""
+
+
+# =============================================================================
+# Replay server
+# =============================================================================
+
+
+@dataclass
+class Route:
+    """One recorded response, matched by method and path template."""
+
+    method: str
+    pattern: re.Pattern[str]
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+def _compile_path(template: str) -> re.Pattern[str]:
+    """Turn /zones/{zone_id}/dns_records into a regex matching one segment per field."""
+    parts = re.split(r"\{(\w+)\}", template)
+    regex = "".join(
+        f"(?P<{part}>[^/]+)" if i % 2 else re.escape(part) for i, part in enumerate(parts)
+    )
+    return re.compile(regex)
+
+
+def load_fixtures(fixtures_dir: Path = FIXTURES_DIR) -> dict[str, list[Route]]:
+    """Load recorded routes for every service in fixtures_dir, keyed by service name."""
+    services: dict[str, list[Route]] = {}
+    for path in sorted(fixtures_dir.glob("*.json")):
+        data = json.loads(path.read_text())
+        routes = []
+        for entry in data["routes"]:
+            headers = dict(entry.get("headers", {}))
+            body = entry.get("body", "")
+            if isinstance(body, str):
+                raw = body.encode()
+            else:
+                raw = json.dumps(body).encode()
+                headers.setdefault("Content-Type", "application/json")
+            routes.append(
+                Route(
+                    method=entry["method"].upper(),
+                    pattern=_compile_path(entry["path"]),
+                    status=entry["status"],
+                    headers=headers,
+                    body=raw,
+                )
+            )
+        services[data.get("service", path.stem)] = routes
+    return services
+
+
+class _ReplayHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops concurrent connects, adding a 1s SYN retry
+    request_queue_size = 128
+
+    def __init__(self, address, services, latency: float, jitter: float, seed: int):
+        super().__init__(address, _ReplayHandler)
+        self.services = services
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.unmatched: list[str] = []
+
+    def delay(self) -> float:
+        with self.lock:
+            offset = self.rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        return max(0.0, self.latency + offset)
+
+    def find(self, method: str, path: str) -> Route | None:
+        service, _, rest = path.lstrip("/").partition("/")
+        for route in self.services.get(service, []):
+            if route.method == method and route.pattern.fullmatch(f"/{rest}"):
+                return route
+        return None
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _ReplayHTTPServer
+
+    def _replay(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        path = self.path.split("?", 1)[0]
+
+        if path == STATS_PATH:
+            with self.server.lock:
+                stats = {"requests": self.server.requests, "unmatched": self.server.unmatched}
+            self._write(200, {"Content-Type": "application/json"}, json.dumps(stats).encode())
+            return
+        if path == RESET_PATH:
+            with self.server.lock:
+                self.server.requests = 0
+                self.server.unmatched = []
+            self._write(204, {}, b"")
+            return
+
+        route = self.server.find(self.command, path)
+        with self.server.lock:
+            self.server.requests += 1
+            if route is None:
+                self.server.unmatched.append(f"{self.command} {path}")
+        time.sleep(self.server.delay())
+
+        if route is None:
+            body = json.dumps({"message": f"No fixture for {self.command} {path}"}).encode()
+            self._write(404, {"Content-Type": "application/json"}, body)
+        else:
+            self._write(route.status, route.headers, route.body)
+
+    def _write(self, status: int, headers: dict[str, str], body: bytes) -> None:
+        # One write per response: split header/body writes hit delayed ACK on keep-alive
+        lines = [f"{self.protocol_version} {status} {self.responses[status][0]}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        if status != 204:
+            lines.append(f"Content-Length: {len(body)}")
+        self.wfile.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        self._replay()
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        self._replay()
+
+    def do_PUT(self) -> None:  # noqa: N802 - http.server API
+        self._replay()
+
+    def do_PATCH(self) -> None:  # noqa: N802 - http.server API
+        self._replay()
+
+    def do_DELETE(self) -> None:  # noqa: N802 - http.server API
+        self._replay()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _serve(fixtures_dir: str, latency: float, jitter: float, seed: int, conn) -> None:
+    """Process entry point: bind a free port, report it, serve until terminated."""
+    server = _ReplayHTTPServer(
+        ("127.0.0.1", 0), load_fixtures(Path(fixtures_dir)), latency, jitter, seed
+    )
+    conn.send(server.server_address[1])
+    conn.close()
+    server.serve_forever()
+
+
+class ReplayServer:
+    """
+    Replay recorded API responses from a local server in a child process.
+
+    Usage:
+        with ReplayServer(latency=0.02, jitter=0.005) as server:
+            CloudflareClient(api_token="t", base_url=server.url("cloudflare") + "/client/v4")
+            print(server.stats())
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        fixtures_dir: Path = FIXTURES_DIR,
+        seed: int = 0,
+    ):
+        """
+        Configure the server.
+
+        Args:
+            latency: Seconds to wait before every response
+            jitter: Uniform +/- spread around latency, in seconds
+            fixtures_dir: Directory of <service>.json fixture files
+            seed: Seed for the jitter sequence
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.fixtures_dir = fixtures_dir
+        self.seed = seed
+        self.base_url = ""
+        self._process: multiprocessing.process.BaseProcess | None = None
+
+    def start(self) -> ReplayServer:
+        """Start the server process and wait until it is listening."""
+        ctx = multiprocessing.get_context("spawn")
+        parent, child = ctx.Pipe(duplex=False)
+        self._process = ctx.Process(
+            target=_serve,
+            args=(str(self.fixtures_dir), self.latency, self.jitter, self.seed, child),
+            daemon=True,
+        )
+        self._process.start()
+        child.close()
+        if not parent.poll(30):
+            self.stop()
+            raise RuntimeError("Replay server did not start")
+        self.base_url = f"http://127.0.0.1:{parent.recv()}"
+        return self
+
+    def stop(self) -> None:
+        """Terminate the server process."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def url(self, service: str) -> str:
+        """Root URL for a service's fixtures, e.g. http://127.0.0.1:PORT/coolify."""
+        return f"{self.base_url}/{service}"
+
+    def stats(self) -> dict[str, Any]:
+        """Requests received and unmatched routes since the last reset."""
+        return httpx.get(self.base_url + STATS_PATH).json()
+
+    def reset(self) -> None:
+        """Zero the request counters."""
+        httpx.post(self.base_url + RESET_PATH)
+
+    def __enter__(self) -> ReplayServer:
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+
+# =============================================================================
+# Workflows
+# =============================================================================
+
+
+@contextmanager
+def _environ(values: dict[str, str], unset: tuple[str, ...] = ()) -> Iterator[None]:
+    """Temporarily set and remove environment variables."""
+    saved = {name: os.environ.get(name) for name in (*values, *unset)}
+    os.environ.update(values)
+    for name in unset:
+        os.environ.pop(name, None)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _page_tree(count: int) -> list[dict[str, Any]]:
+    """Site spec pages: sections of one parent and up to nine children, count in total."""
+    pages: list[dict[str, Any]] = []
+    for i in range(count):
+        if i % 10 == 0:
+            pages.append({"title": f"Section {i // 10}", "slug": f"section-{i // 10}"})
+            pages[-1]["children"] = []
+        else:
+            pages[-1]["children"].append({"title": f"Page {i}", "slug": f"page-{i}"})
+    return pages
+
+
+def run_coolify_deploy(server: ReplayServer, count: int) -> None:
+    """deploy_to_coolify for count new apps, resolving server and project each time."""
+    from fabrik.deploy import deploy_to_coolify
+
+    env = {"COOLIFY_API_URL": server.url("coolify"), "COOLIFY_API_TOKEN": "bench"}
+    with _environ(env, unset=("COOLIFY_SERVER_UUID", "COOLIFY_PROJECT_UUID")):
+        for i in range(count):
+            deploy_to_coolify(f"bench-app-{i}", COMPOSE)
+
+
+def run_cloudflare_ensure_record(server: ReplayServer, count: int) -> None:
+    """CloudflareClient.ensure_record for count new A records, one after another."""
+    from fabrik.drivers.cloudflare import CloudflareClient
+
+    base_url = server.url("cloudflare") + "/client/v4"
+    with CloudflareClient(api_token="bench", base_url=base_url) as cf:
+        for i in range(count):
+            cf.ensure_record("example.com", "A", f"site{i}", "203.0.113.10")
+
+
+def run_cloudflare_ensure_record_async(server: ReplayServer, count: int) -> None:
+    """AsyncCloudflareClient.ensure_record for count new A records, gathered."""
+    from fabrik.drivers.cloudflare import AsyncCloudflareClient
+
+    base_url = server.url("cloudflare") + "/client/v4"
+
+    async def run() -> None:
+        async with AsyncCloudflareClient(api_token="bench", base_url=base_url) as cf:
+            await asyncio.gather(
+                *(
+                    cf.ensure_record("example.com", "A", f"site{i}", "203.0.113.10")
+                    for i in range(count)
+                )
+            )
+
+    asyncio.run(run())
+
+
+def run_wordpress_create_all(server: ReplayServer, count: int) -> None:
+    """PageCreator.create_all over a site spec of count pages."""
+    from fabrik.drivers.wordpress_api import WordPressAPIClient, WPCredentials
+    from fabrik.wordpress.pages import PageCreator
+
+    credentials = WPCredentials(url=server.url("wordpress"), username="bench", password="bench")
+    creator = PageCreator("bench", api_client=WordPressAPIClient(credentials))
+    creator.create_all(_page_tree(count))
+
+
+def run_dns_add_subdomain(server: ReplayServer, count: int) -> None:
+    """DNSClient.add_subdomain then get_records, count times."""
+    from fabrik.drivers.dns import DNSClient
+
+    with DNSClient(base_url=server.url("dns")) as dns:
+        for i in range(count):
+            dns.add_subdomain("example.com", f"app{i}", "203.0.113.10")
+            dns.get_records("example.com")
+
+
+def run_r2_put_get(server: ReplayServer, count: int) -> None:
+    """R2Client.put_object of 4 KiB then get_object, count times (signing included)."""
+    from fabrik.drivers.r2 import R2Client
+
+    data = os.urandom(4096)
+    with R2Client(
+        account_id="bench",
+        access_key_id="bench",
+        secret_access_key="bench",
+        bucket="bench",
+        endpoint=server.url("r2"),
+    ) as r2:
+        for i in range(count):
+            r2.put_object(f"object-{i}.bin", data)
+            r2.get_object(f"object-{i}.bin")
+
+
+def run_supabase_insert_query(server: ReplayServer, count: int) -> None:
+    """SupabaseClient.insert then query on a files table, count times."""
+    from fabrik.drivers.supabase import SupabaseClient
+
+    with SupabaseClient(url=server.url("supabase"), anon_key="bench") as supabase:
+        for i in range(count):
+            supabase.insert("files", {"tenant_id": "tenant-1", "filename": f"f{i}.bin"})
+            supabase.query("files", filters={"tenant_id": "tenant-1"}, limit=10)
+
+
+@dataclass(frozen=True)
+class Workflow:
+    """A named driver workflow and how many items it handles by default."""
+
+    name: str
+    count: int
+    run: Callable[[ReplayServer, int], None]
+
+
+WORKFLOWS: dict[str, Workflow] = {
+    w.name: w
+    for w in (
+        Workflow("coolify_deploy", 50, run_coolify_deploy),
+        Workflow("cloudflare_ensure_record", 500, run_cloudflare_ensure_record),
+        Workflow("cloudflare_ensure_record_async", 500, run_cloudflare_ensure_record_async),
+        Workflow("wordpress_create_all", 200, run_wordpress_create_all),
+        Workflow("dns_add_subdomain", 100, run_dns_add_subdomain),
+        Workflow("r2_put_get", 100, run_r2_put_get),
+        Workflow("supabase_insert_query", 100, run_supabase_insert_query),
+    )
+}
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+@dataclass
+class Result:
+    """Measurements for one workflow run."""
+
+    workflow: str
+    items: int
+    requests: int
+    wall_s: float
+    peak_kib: float | None
+    unmatched: list[str]
+
+    @property
+    def ms_per_item(self) -> float:
+        return self.wall_s * 1000 / self.items if self.items else 0.0
+
+
+def measure(
+    workflow: Workflow, server: ReplayServer, count: int | None = None, trace: bool = True
+) -> Result:
+    """
+    Run a workflow against the server and measure it.
+
+    Wall time and request count come from an untraced pass; with trace, a second
+    pass under tracemalloc reports the peak memory allocated while it ran.
+    """
+    items = workflow.count if count is None else count
+
+    server.reset()
+    started = time.perf_counter()
+    workflow.run(server, items)
+    wall = time.perf_counter() - started
+    stats = server.stats()
+
+    peak_kib = None
+    if trace:
+        tracemalloc.start()
+        try:
+            workflow.run(server, items)
+            peak_kib = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+
+    return Result(
+        workflow=workflow.name,
+        items=items,
+        requests=stats["requests"],
+        wall_s=round(wall, 4),
+        peak_kib=None if peak_kib is None else round(peak_kib, 1),
+        unmatched=sorted(set(stats["unmatched"])),
+    )
+
+
+def print_report(results: list[Result], latency_ms: float, jitter_ms: float) -> None:
+    """Print results as a table."""
+    print(f"Replay latency {latency_ms:g} ms +/- {jitter_ms:g} ms\n")
+    print(
+        f"{'workflow':<32} {'items':>6} {'requests':>9} {'wall s':>8} "
+        f"{'ms/item':>8} {'peak KiB':>9}"
+    )
+    for r in results:
+        peak = "-" if r.peak_kib is None else f"{r.peak_kib:.0f}"
+        print(
+            f"{r.workflow:<32} {r.items:>6} {r.requests:>9} {r.wall_s:>8.3f} "
+            f"{r.ms_per_item:>8.2f} {peak:>9}"
+        )
+    for r in results:
+        for route in r.unmatched:
+            print(f"  {r.workflow}: no fixture for {route}", file=sys.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark drivers against recorded responses")
+    parser.add_argument("workflows", nargs="*", help=f"Any of: {', '.join(WORKFLOWS)}")
+    parser.add_argument("--count", type=int, help="Items per workflow (default: per workflow)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Response latency in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Latency +/- spread in ms")
+    parser.add_argument("--seed", type=int, default=0, help="Jitter seed")
+    parser.add_argument("--no-trace", action="store_true", help="Skip the allocation pass")
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+    args = parser.parse_args()
+    unknown = sorted(set(args.workflows) - set(WORKFLOWS))
+    if unknown:
+        parser.error(f"unknown workflow(s): {', '.join(unknown)}")
+
+    selected = [WORKFLOWS[name] for name in args.workflows or WORKFLOWS]
+    with ReplayServer(args.latency / 1000, args.jitter / 1000, seed=args.seed) as server:
+        results = [measure(w, server, args.count, trace=not args.no_trace) for w in selected]
+
+    if args.json:
+        report = {
+            "latency_ms": args.latency,
+            "jitter_ms": args.jitter,
+            "results": [{**asdict(r), "ms_per_item": round(r.ms_per_item, 3)} for r in results],
+        }
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(results, args.latency, args.jitter)
+
+    return 1 if any(r.unmatched for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -53,7 +53,6 @@ import time
 import uuid
 from collections import deque
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from enum import Enum
@@ -65,42 +64,62 @@ try:
         DEFAULT_MODEL,
         TaskCategory,
         check_model_change_warning,
+        get_cached_models,
         recommend_model,
-        refresh_models_from_docs,
     )
 except ModuleNotFoundError:
     from droid_models import (
         DEFAULT_MODEL,
         TaskCategory,
         check_model_change_warning,
+        get_cached_models,
         recommend_model,
-        refresh_models_from_docs,
     )
 
-# Import ProcessMonitor if available
+# Import metrics exporter (no-op unless FABRIK_METRICS_* is set)
 try:
-    from process_monitor import ProcessMonitor
+    from scripts import droid_metrics
+except ModuleNotFoundError:
+    import droid_metrics
 
-    PROCESS_MONITOR_AVAILABLE = True
-except ImportError:
-    PROCESS_MONITOR_AVAILABLE = False
+# process_monitor (psutil), droid_model_updater and concurrent.futures are
+# imported where they are used: hooks such as the pre-commit review only need
+# run_droid_exec, and every hook invocation pays for module-level imports.
+# tests/test_droid_core.py::TestStartup guards this.
+
+
+def _monitor_service():
+    """Shared MonitorService, or None if process_monitor is unavailable."""
+    try:
+        from process_monitor import get_monitor_service
+    except ImportError:
+        return None
+    return get_monitor_service()
 
-# Import model updater
-try:
-    from droid_model_updater import check_deprecations, ensure_models_fresh, is_model_available
 
-    MODEL_UPDATER_AVAILABLE = True
-except ImportError:
-    MODEL_UPDATER_AVAILABLE = False
+_models_refresh_started = False
 
-    def ensure_models_fresh(force=False):
-        return {"status": "unavailable", "available_models": [], "deprecations": []}
 
-    def is_model_available(model_name):
-        return True  # Assume available if updater not loaded
+def refresh_models_in_background() -> None:
+    """Refresh the docs model list at most once per process, off the hot path.
+
+    Unless the cached result (see droid_models.get_cached_models) is still
+    fresh, starts droid_model_updater's detached refresher. Unlike a thread,
+    it outlives short-lived hooks and CLIs, and tasks never wait on the
+    network.
+    """
+    global _models_refresh_started
+    if _models_refresh_started:
+        return
+    _models_refresh_started = True
+
+    if get_cached_models() is not None:
+        return
+    with contextlib.suppress(Exception):
+        from droid_model_updater import refresh_in_background
+
+        refresh_in_background()
 
-    def check_deprecations():
-        return []
 
 # =============================================================================
 # Data Directories (from droid_runner.py)
@@ -156,6 +175,15 @@ class TaskResult:
     error: str | None = None
     duration_ms: int | None = None
     session_id: str | None = None
+    model: str = ""
+    tokens_used: int = 0  # input + output tokens from droid exec usage (0 if unknown)
+
+
+def usage_tokens(usage: dict | None) -> int:
+    """Input + output tokens from a droid exec `usage` dict."""
+    if not usage:
+        return 0
+    return int(usage.get("input_tokens", 0)) + int(usage.get("output_tokens", 0))
 
 
 class TaskStatus(str, Enum):
@@ -624,6 +652,7 @@ def _run_streaming(
     timeout_seconds: int = 1800,  # 30 min default timeout
     stuck_threshold_seconds: int = 600,  # 10 min before considering stuck
     max_retries: int | None = None,  # None = auto-detect based on task type
+    model: str = "",
 ) -> TaskResult:
     """
     Run droid exec in streaming mode, reading events until completion.
@@ -633,6 +662,7 @@ def _run_streaming(
     - Auto-retry on stuck state (kills and reinitiates) - DISABLED for write-heavy tasks
     - Timeout enforcement
     - Completion event detection
+    - Token usage of completion events recorded under model (droid_metrics)
 
     The completion event (type="completion") contains finalText and signals done.
     Note: prompt is already in args as CLI argument.
@@ -681,11 +711,12 @@ def _run_streaming(
         )
         stderr_thread.start()
 
-        # Initialize ProcessMonitor if available
+        # Register with the shared MonitorService (one thread for all processes)
         monitor = None
-        if PROCESS_MONITOR_AVAILABLE:
-            with contextlib.suppress(Exception):
-                monitor = ProcessMonitor(process, warn_threshold=300)
+        with contextlib.suppress(Exception):
+            service = _monitor_service()
+            if service is not None:
+                monitor = service.register(process, warn_threshold=300)
 
         final_text = ""
         session_id = None
@@ -731,6 +762,7 @@ def _run_streaming(
                 diagnosis = monitor.analyze()
                 if diagnosis["state"] == "CONFIRMED_STUCK":
                     print(f"⚠️ Stuck detected: {diagnosis['reason']}", file=sys.stderr)
+                    droid_metrics.inc("fabrik_droid_stuck_total", source="droid_core")
                     stuck_detected = True
                     break
                 elif (
@@ -738,6 +770,7 @@ def _run_streaming(
                     and (current_time - start_time) > stuck_threshold_seconds
                 ):
                     print(f"⚠️ Likely stuck: {diagnosis['reason']}", file=sys.stderr)
+                    droid_metrics.inc("fabrik_droid_stuck_total", source="droid_core")
                     stuck_detected = True
                     break
 
@@ -770,6 +803,7 @@ def _run_streaming(
                         final_text = event.get("finalText", "")
                         session_id = event.get("session_id")
                         got_completion = True
+                        droid_metrics.record_tokens(model, event.get("usage"))
                         if event.get("is_error"):
                             process.wait()
                             return TaskResult(
@@ -786,6 +820,7 @@ def _run_streaming(
                         final_text = event.get("result", "")
                         session_id = event.get("session_id")
                         got_completion = True
+                        droid_metrics.record_tokens(model, event.get("usage"))
                         if event.get("is_error"):
                             process.wait()
                             return TaskResult(
@@ -825,6 +860,7 @@ def _run_streaming(
                     final_text = event.get("finalText", "")
                     session_id = event.get("session_id")
                     got_completion = True
+                    droid_metrics.record_tokens(model, event.get("usage"))
                     # P0 FIX: Check is_error in final buffer completion events
                     if event.get("is_error"):
                         got_error = True
@@ -832,6 +868,7 @@ def _run_streaming(
                     final_text = event.get("result", "")
                     session_id = event.get("session_id")
                     got_completion = True
+                    droid_metrics.record_tokens(model, event.get("usage"))
                     # P0 FIX: Check is_error in final buffer result events
                     if event.get("is_error"):
                         got_error = True
@@ -853,6 +890,7 @@ def _run_streaming(
                     f"🔄 Retrying task (attempt {retry_count + 1}/{max_retries + 1})...",
                     file=sys.stderr,
                 )
+                droid_metrics.inc("fabrik_droid_retries_total", source="droid_core")
                 time.sleep(2)
                 continue
             return TaskResult(
@@ -958,11 +996,29 @@ def run_droid_exec(
     Returns:
         TaskResult with success status and output
     """
-    # Ensure model names are up-to-date from config
-    try:
-        refresh_models_from_docs()
-    except Exception as e:
-        print(f"⚠️ Failed to refresh models from docs: {e}", file=sys.stderr)
+    with droid_metrics.track_run(model, task_type.value) as run:
+        result = _run_droid_exec(
+            prompt, task_type, autonomy, model, cwd, session_id, streaming, verbose, on_stream
+        )
+        run.status = "success" if result.success else "error"
+    result.model = result.model or model
+    return result
+
+
+def _run_droid_exec(
+    prompt: str,
+    task_type: TaskType,
+    autonomy: Autonomy,
+    model: str,
+    cwd: str | None,
+    session_id: str | None,
+    streaming: bool,
+    verbose: bool,
+    on_stream: Callable | None,
+) -> TaskResult:
+    """Body of run_droid_exec (wrapped for metrics)."""
+    # Keep model names up-to-date without blocking the task on the network
+    refresh_models_in_background()
 
     # Build command
     args = ["droid", "exec"]
@@ -1023,7 +1079,9 @@ def run_droid_exec(
             # Streaming mode: read events as they come, wait for completion event
             # Pass callback for verbose output even if not explicitly streaming
             callback = on_stream if on_stream else (print_event if verbose else None)
-            return _run_streaming(args, full_prompt, task_type, prompt, start_time, callback)
+            return _run_streaming(
+                args, full_prompt, task_type, prompt, start_time, callback, model=model
+            )
 
         # Non-streaming: wait for process with timeout (default 30 min for complex tasks)
         timeout_seconds = int(os.getenv("DROID_EXEC_TIMEOUT", "1800"))
@@ -1078,6 +1136,7 @@ def run_droid_exec(
                         parsed = json.loads(line)
                         # Look for result-type JSON (has 'result' or 'is_error' key)
                         if "result" in parsed or "is_error" in parsed:
+                            droid_metrics.record_tokens(model, parsed.get("usage"))
                             return TaskResult(
                                 success=not parsed.get("is_error", False),
                                 task_type=task_type,
@@ -1085,6 +1144,7 @@ def run_droid_exec(
                                 result=parsed.get("result", ""),
                                 duration_ms=parsed.get("duration_ms", duration_ms),
                                 session_id=parsed.get("session_id"),
+                                tokens_used=usage_tokens(parsed.get("usage")),
                             )
                     except json.JSONDecodeError:
                         continue
@@ -1095,6 +1155,7 @@ def run_droid_exec(
             if first_brace >= 0 and last_brace > first_brace:
                 json_text = output[first_brace : last_brace + 1]
                 parsed = json.loads(json_text)
+                droid_metrics.record_tokens(model, parsed.get("usage"))
 
                 return TaskResult(
                     success=not parsed.get("is_error", False),
@@ -1103,6 +1164,7 @@ def run_droid_exec(
                     result=parsed.get("result", ""),
                     duration_ms=parsed.get("duration_ms", duration_ms),
                     session_id=parsed.get("session_id"),
+                    tokens_used=usage_tokens(parsed.get("usage")),
                 )
         except json.JSONDecodeError:
             # JSON parsing failed - check for error indicators in raw output
@@ -1200,6 +1262,8 @@ def run_parallel_models(
         )
         return model, result
 
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     with ThreadPoolExecutor(max_workers=min(max_workers, len(models))) as executor:
         futures = {executor.submit(_run_single, model): model for model in models}
         for future in as_completed(futures):
@@ -1481,6 +1545,8 @@ def run_multi_module_parallel(
         file=sys.stderr,
     )
 
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     with ThreadPoolExecutor(max_workers=min(4, len(work_items))) as executor:
         futures = {executor.submit(_run_module, item): item[0] for item in work_items}
         for future in as_completed(futures):
@@ -1510,6 +1576,7 @@ def run_with_preflight_gates(
     run_lint: bool = True,
     run_typecheck: bool = True,
     run_tests: bool = False,
+    paths: list[str] | None = None,
 ) -> tuple[bool, str]:
     """
     Run pre-flight gates before expensive AI verification.
@@ -1519,17 +1586,22 @@ def run_with_preflight_gates(
     2. mypy (typecheck)
     3. pytest (optional, slower)
 
+    Args:
+        paths: Files or directories (relative to cwd) that ruff and mypy
+            check. Defaults to the whole cwd.
+
     Returns:
         (passed: bool, report: str)
     """
     working_dir = cwd or str(Path.cwd())
+    targets = paths or ["."]
     reports: list[str] = []
     all_passed = True
 
     if run_lint:
         try:
             result = subprocess.run(
-                ["ruff", "check", "."],
+                ["ruff", "check", *targets],
                 cwd=working_dir,
                 capture_output=True,
                 text=True,
@@ -1550,7 +1622,7 @@ def run_with_preflight_gates(
     if run_typecheck:
         try:
             result = subprocess.run(
-                ["mypy", "."],
+                ["mypy", *targets],
                 cwd=working_dir,
                 capture_output=True,
                 text=True,
@@ -1638,13 +1710,14 @@ def run_droid_exec_monitored(
 
     Uses stream-json format to monitor progress. Does NOT auto-kill.
     """
-    # Ensure model list is fresh (uses 24h cache, ~0ms if cached)
-    if MODEL_UPDATER_AVAILABLE:
-        with contextlib.suppress(Exception):
-            ensure_models_fresh()
-            # Warn if model is deprecated
-            if not is_model_available(model):
-                print(f"⚠️  WARNING: Model '{model}' may not be available", file=sys.stderr)
+    # Cached model list, refreshed in the background when stale (never blocks)
+    with contextlib.suppress(Exception):
+        from droid_model_updater import ensure_models_fresh, is_model_available
+
+        models = ensure_models_fresh()
+        # Warn if model is deprecated (unknown until the first refresh completes)
+        if models["available_models"] and not is_model_available(model):
+            print(f"⚠️  WARNING: Model '{model}' may not be available", file=sys.stderr)
 
     ensure_dirs()
 
@@ -1688,6 +1761,7 @@ def run_droid_exec_monitored(
     )
 
     start_time = time.time()
+    run = droid_metrics.track_run(model, "monitored").begin()
     final_text = ""
     captured_session_id = None
     events = []
@@ -1705,12 +1779,13 @@ def run_droid_exec_monitored(
     stderr_thread.start()
 
     monitor = None
-    if PROCESS_MONITOR_AVAILABLE:
+    service = _monitor_service()
+    if service is not None:
         try:
-            monitor = ProcessMonitor(process, warn_threshold=warn_after_seconds)
-            print(f"[{task_id}] ProcessMonitor active", file=sys.stderr)
+            monitor = service.register(process, warn_threshold=warn_after_seconds)
+            print(f"[{task_id}] MonitorService tracking pid {process.pid}", file=sys.stderr)
         except Exception as e:
-            print(f"[{task_id}] ProcessMonitor init failed: {e}", file=sys.stderr)
+            print(f"[{task_id}] MonitorService register failed: {e}", file=sys.stderr)
 
     try:
         for line in process.stdout:
@@ -1736,6 +1811,7 @@ def run_droid_exec_monitored(
                 if event.get("type") == "completion":
                     final_text = event.get("finalText", "")
                     captured_session_id = event.get("session_id", captured_session_id)
+                    droid_metrics.record_tokens(model, event.get("usage"))
                     record.completed_at = datetime.now(UTC).isoformat()
                     record.session_id = captured_session_id
                     record.duration_ms = event.get("durationMs")
@@ -1798,6 +1874,7 @@ def run_droid_exec_monitored(
 
         if record.duration_ms is None:
             record.duration_ms = int((time.time() - start_time) * 1000)
+        run.end(record.status.value)
 
         save_task_record(record)
         save_response(
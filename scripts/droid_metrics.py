@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Droid Metrics - Optional Prometheus/OpenMetrics exporter for droid runs.
+
+Exposes throughput of droid exec runs, the review/docs daemons and batch runs
+on shared hosts. Disabled unless one of these is set:
+
+    FABRIK_METRICS_PORT=9464
+        Serve /metrics over HTTP from a daemon thread (bind address:
+        FABRIK_METRICS_HOST, default 127.0.0.1; set 0.0.0.0 to expose it).
+    FABRIK_METRICS_TEXTFILE=/var/lib/node_exporter/textfile/fabrik_review.prom
+        Write a node_exporter textfile-collector file every
+        FABRIK_METRICS_INTERVAL seconds (default 15) and on exit.
+
+When disabled, every recording call returns after a single flag check and
+track_run() hands back a shared no-op context manager.
+
+Metrics:
+    fabrik_droid_active_processes                 gauge
+    fabrik_droid_inflight{model}                  gauge
+    fabrik_queue_depth{queue}                     gauge      review | docs
+    fabrik_droid_task_duration_seconds{task_type,status}  histogram
+    fabrik_droid_retries_total{source}            counter
+    fabrik_droid_stuck_total{source}              counter
+    fabrik_droid_tokens_total{model,kind}         counter    burn rate: rate(...[5m])
+
+Usage:
+    import droid_metrics
+
+    with droid_metrics.track_run(model, "review") as run:
+        result = ...
+        run.status = "success" if result.success else "error"
+
+    droid_metrics.inc("fabrik_droid_retries_total", source="review")
+    droid_metrics.set_gauge("fabrik_queue_depth", len(tasks), queue="docs")
+    droid_metrics.record_tokens(model, output.get("usage"))
+
+    python scripts/droid_metrics.py   # Print current exposition (debugging)
+"""
+
+from __future__ import annotations
+
+import atexit
+import math
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# Local only unless FABRIK_METRICS_HOST says otherwise
+DEFAULT_HOST = "127.0.0.1"
+
+# Task latency buckets (seconds): droid runs take seconds to tens of minutes
+DURATION_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800)
+
+# name -> (type, help, label names)
+METRICS: dict[str, tuple[str, str, tuple[str, ...]]] = {
+    "fabrik_droid_active_processes": ("gauge", "Running droid exec processes", ()),
+    "fabrik_droid_inflight": ("gauge", "In-flight droid exec runs per model", ("model",)),
+    "fabrik_queue_depth": ("gauge", "Pending tasks per queue", ("queue",)),
+    "fabrik_droid_task_duration_seconds": (
+        "histogram",
+        "Duration of droid exec runs",
+        ("task_type", "status"),
+    ),
+    "fabrik_droid_retries_total": ("counter", "Task retries", ("source",)),
+    "fabrik_droid_stuck_total": ("counter", "Stuck process detections", ("source",)),
+    "fabrik_droid_tokens_total": ("counter", "Tokens used", ("model", "kind")),
+}
+
+# usage key in droid exec JSON output -> kind label
+TOKEN_KINDS = {
+    "input_tokens": "input",
+    "output_tokens": "output",
+    "cache_read_input_tokens": "cache_read",
+    "cache_creation_input_tokens": "cache_creation",
+}
+
+_enabled = False
+_lock = threading.Lock()
+# (name, label values) -> value (counters and gauges)
+_values: dict[tuple[str, tuple[str, ...]], float] = {}
+# (name, label values) -> [bucket counts..., +Inf count, sum]
+_histograms: dict[tuple[str, tuple[str, ...]], list[float]] = {}
+_textfile: Path | None = None
+_server: ThreadingHTTPServer | None = None
+
+
+def enabled() -> bool:
+    """Whether metrics are being recorded."""
+    return _enabled
+
+
+def _key(name: str, labels: dict[str, Any]) -> tuple[str, tuple[str, ...]]:
+    return name, tuple(str(labels.get(label, "")) for label in METRICS[name][2])
+
+
+def inc(name: str, value: float = 1, **labels: Any) -> None:
+    """Increment a counter or gauge."""
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _values[key] = _values.get(key, 0) + value
+
+
+def set_gauge(name: str, value: float, **labels: Any) -> None:
+    """Set a gauge to an absolute value."""
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _values[key] = value
+
+
+def observe(name: str, value: float, **labels: Any) -> None:
+    """Record one observation in a histogram."""
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        counts = _histograms.get(key)
+        if counts is None:
+            counts = _histograms[key] = [0.0] * (len(DURATION_BUCKETS) + 2)
+        for i, bound in enumerate(DURATION_BUCKETS):
+            if value <= bound:
+                counts[i] += 1
+        counts[-2] += 1  # +Inf (= count)
+        counts[-1] += value
+
+
+def record_tokens(model: str, usage: dict[str, Any] | None) -> None:
+    """Add token counts from a droid exec `usage` dict."""
+    if not _enabled or not usage:
+        return
+    for field, kind in TOKEN_KINDS.items():
+        count = usage.get(field)
+        if count:
+            inc("fabrik_droid_tokens_total", count, model=model, kind=kind)
+
+
+class _Run:
+    """Context manager tracking one droid exec run (see track_run)."""
+
+    __slots__ = ("active", "model", "task_type", "status", "start")
+
+    def __init__(self, model: str, task_type: str, active: bool = True):
+        self.active = active
+        self.model = model
+        self.task_type = task_type
+        self.status = ""
+        self.start = 0.0
+
+    def begin(self) -> _Run:
+        """Mark the run as started (for code that cannot use `with`)."""
+        if self.active:
+            self.start = time.monotonic()
+            inc("fabrik_droid_active_processes")
+            inc("fabrik_droid_inflight", model=self.model)
+        return self
+
+    def end(self, status: str = "") -> None:
+        """Mark the run as finished and record its duration."""
+        if not self.active:
+            return
+        inc("fabrik_droid_active_processes", -1)
+        inc("fabrik_droid_inflight", -1, model=self.model)
+        observe(
+            "fabrik_droid_task_duration_seconds",
+            time.monotonic() - self.start,
+            task_type=self.task_type,
+            status=status or self.status or "unknown",
+        )
+
+    def __enter__(self) -> _Run:
+        return self.begin()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end("" if exc_type is None else self.status or "exception")
+
+
+_NOOP_RUN = _Run("", "", active=False)
+
+
+def track_run(model: str, task_type: str) -> _Run:
+    """Track a droid exec run: active/in-flight gauges and duration histogram.
+
+    Set `run.status` inside the block ("success", "error", "timeout", ...),
+    or call begin() / end(status) explicitly.
+    """
+    if not _enabled:
+        return _NOOP_RUN
+    return _Run(model, task_type)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def render() -> str:
+    """Render all metrics in the Prometheus text exposition format."""
+    with _lock:
+        values = dict(_values)
+        histograms = {k: list(v) for k, v in _histograms.items()}
+
+    lines: list[str] = []
+    for name, (kind, help_text, label_names) in METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        if kind == "histogram":
+            for (metric, label_values), counts in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for bound, count in zip(DURATION_BUCKETS, counts, strict=False):
+                    labels = _labels(label_names, label_values, f'le="{bound}"')
+                    lines.append(f"{name}_bucket{labels} {_format_value(count)}")
+                labels = _labels(label_names, label_values, 'le="+Inf"')
+                lines.append(f"{name}_bucket{labels} {_format_value(counts[-2])}")
+                labels = _labels(label_names, label_values)
+                lines.append(f"{name}_sum{labels} {_format_value(counts[-1])}")
+                lines.append(f"{name}_count{labels} {_format_value(counts[-2])}")
+            continue
+        samples = sorted((lv, v) for (metric, lv), v in values.items() if metric == name)
+        if not samples and not label_names:
+            samples = [((), 0)]
+        for label_values, value in samples:
+            lines.append(f"{name}{_labels(label_names, label_values)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path: Path | None = None) -> None:
+    """Atomically write the exposition to path (textfile-collector format)."""
+    path = path or _textfile
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(render())
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"Warning: Could not write metrics textfile {path}: {e}", file=sys.stderr)
+
+
+def _make_server(host: str, port: int) -> ThreadingHTTPServer:
+    """HTTP server for /metrics (http.server is only imported when serving)."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            if self.path.split("?")[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return  # Keep daemon logs clean
+
+    return ThreadingHTTPServer((host, port), _MetricsHandler)
+
+
+def _textfile_loop(interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        write_textfile()
+
+
+def configure(
+    port: int | None = None,
+    textfile: Path | str | None = None,
+    interval: float = 15.0,
+    host: str = DEFAULT_HOST,
+) -> None:
+    """Enable recording and start the requested exporters.
+
+    With neither port nor textfile, metrics are only recorded in memory
+    (render() still works).
+    """
+    global _enabled, _server, _textfile
+    _enabled = True
+
+    if port is not None and _server is None:
+        try:
+            _server = _make_server(host, port)
+        except OSError as e:
+            print(f"Warning: Metrics endpoint on port {port} unavailable: {e}", file=sys.stderr)
+        else:
+            threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
+
+    if textfile is not None and _textfile is None:
+        _textfile = Path(textfile)
+        threading.Thread(
+            target=_textfile_loop, args=(interval,), name="metrics-textfile", daemon=True
+        ).start()
+        atexit.register(write_textfile)
+
+
+def reset() -> None:
+    """Drop all recorded values (tests)."""
+    with _lock:
+        _values.clear()
+        _histograms.clear()
+
+
+def _configure_from_env() -> None:
+    port = os.getenv("FABRIK_METRICS_PORT")
+    textfile = os.getenv("FABRIK_METRICS_TEXTFILE")
+    if not port and not textfile:
+        return
+    # Runs at import: bad values disable that exporter instead of breaking importers
+    try:
+        port_number = int(port) if port else None
+    except ValueError:
+        print(
+            f"Warning: Invalid FABRIK_METRICS_PORT {port!r}, metrics endpoint disabled",
+            file=sys.stderr,
+        )
+        port_number = None
+    try:
+        interval = float(os.getenv("FABRIK_METRICS_INTERVAL", "15"))
+        if not 0 < interval < math.inf:  # Also rejects NaN
+            raise ValueError(interval)
+    except ValueError:
+        print("Warning: Invalid FABRIK_METRICS_INTERVAL, using 15 seconds", file=sys.stderr)
+        interval = 15.0
+    if port_number is None and not textfile:
+        return
+    configure(
+        port=port_number,
+        textfile=textfile or None,
+        interval=interval,
+        host=os.getenv("FABRIK_METRICS_HOST", DEFAULT_HOST),
+    )
+
+
+_configure_from_env()
+
+
+if __name__ == "__main__":
+    print(render(), end="")
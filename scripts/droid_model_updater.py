@@ -10,22 +10,27 @@ Usage:
   python3 scripts/droid_model_updater.py --force  # Force update even if cached
   python3 scripts/droid_model_updater.py --dry-run # Show what would change
   python3 scripts/droid_model_updater.py --check-deprecations  # Check for deprecated models in use
+  python3 scripts/droid_model_updater.py --refresh-cache  # Refresh model cache (background job)
 
 In-Code Usage:
   from droid_model_updater import ensure_models_fresh, check_deprecations
-  ensure_models_fresh()  # Called before droid exec, uses 24h cache
+  ensure_models_fresh()  # Called before droid exec, returns the cache instantly
   warnings = check_deprecations()  # Returns list of deprecated model warnings
 
-Caching Strategy:
-  - First droid exec of day: refresh cache (4-5s)
-  - Subsequent calls: use cache (0ms overhead)
-  - Model not found: refresh and retry
-  - Deprecation: warn when configured model no longer available
+Caching Strategy (stale-while-revalidate):
+  - Every call returns the cached model list immediately, even when stale
+  - Stale or missing cache: a detached refresher updates it in the background
+  - One refresher per host at a time (flock on .model_update_cache.lock)
+  - --force / wait=True: refresh in the foreground (CLI use)
+  - Deprecation: checked against the cached list on every call
 """
 
+import fcntl
 import json
+import os
 import re
 import sys
+import time
 import urllib.error
 import urllib.request
 from datetime import datetime, timedelta
@@ -43,6 +48,7 @@ SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 CONFIG_FILE = PROJECT_ROOT / "config" / "models.yaml"
 CACHE_FILE = SCRIPT_DIR / ".model_update_cache.json"
+REFRESH_LOCK_FILE = SCRIPT_DIR / ".model_update_cache.lock"
 DEPRECATION_FILE = SCRIPT_DIR / ".model_deprecations.json"
 CACHE_TTL_HOURS = 24
 
@@ -57,6 +63,9 @@ MODEL_NAME_MAP: dict[str, str] = {}
 # Cache for available models from droid exec
 _AVAILABLE_MODELS_CACHE: list[str] | None = None
 
+# Set once this process has started a background refresher
+_refresh_started = False
+
 
 def fetch_models_from_droid_cli() -> list[str]:
     """
@@ -136,8 +145,13 @@ def get_models_in_use() -> list[str]:
         return []
 
     try:
-        with open(CONFIG_FILE) as f:
-            config = yaml.safe_load(f)
+        from scripts.droid_models import load_models_config
+    except ModuleNotFoundError:
+        from droid_models import load_models_config
+
+    try:
+        # Shared with droid_models: parsed once, re-read when the file changes
+        config = load_models_config(CONFIG_FILE)
 
         # Get default model
         if "default_model" in config:
@@ -178,11 +192,8 @@ def check_deprecations(available_models: list[str] | None = None) -> list[dict]:
         List of deprecation warnings: [{"model": "...", "message": "..."}]
     """
     if available_models is None:
-        cache = load_cache()
-        if cache and "available_models" in cache:
-            available_models = cache["available_models"]
-        else:
-            available_models = fetch_models_from_droid_cli()
+        cache = read_cache()
+        available_models = cache.get("available_models", []) if cache else []
 
     if not available_models:
         return []  # Can't check without available models list
@@ -253,89 +264,176 @@ def fetch_model_prices() -> dict[str, float]:
         return {}
 
 
-def ensure_models_fresh(force: bool = False) -> dict:
+def refresh_models(force: bool = False, block: bool = False) -> dict | None:
+    """
+    Refresh the model cache from droid CLI and Factory docs.
+
+    Runs under an exclusive lock on REFRESH_LOCK_FILE so that only one
+    process per host hits the CLI and network at a time.
+
+    Args:
+        force: Refresh even if another process just refreshed the cache
+        block: Wait for a running refresher instead of giving up
+
+    Returns:
+        The new cache contents, the fresh cache written by the refresher we
+        waited for, or None if the lock is held (block=False) or fetching failed
+    """
+    global _AVAILABLE_MODELS_CACHE
+
+    fd = os.open(str(REFRESH_LOCK_FILE), os.O_CREAT | os.O_RDWR, 0o600)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if block else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return None  # Another process is refreshing
+
+        if not force:
+            cache = read_cache()
+            if cache and _is_fresh(cache):
+                return cache  # Refreshed while we waited for the lock
+
+        print("Refreshing model list from droid CLI...", file=sys.stderr)
+        available_models = fetch_models_from_droid_cli()
+        if not available_models:
+            return None
+
+        # Fetch model prices from Factory docs
+        print("Fetching model prices from Factory docs...", file=sys.stderr)
+        model_prices = fetch_model_prices()
+        if model_prices:
+            print(f"   Found prices for {len(model_prices)} models", file=sys.stderr)
+
+        deprecations = check_deprecations(available_models)
+        for dep in deprecations:
+            print(f"⚠️  DEPRECATED: {dep['message']}", file=sys.stderr)
+
+        data = {
+            "status": "up_to_date",
+            "available_models": available_models,
+            "models_count": len(available_models),
+            "model_prices": model_prices,
+            "deprecations": deprecations,
+        }
+        save_cache(data)
+        _AVAILABLE_MODELS_CACHE = available_models
+        return data
+    finally:
+        os.close(fd)  # Releases the lock
+
+
+def refresh_docs_models() -> None:
+    """
+    Refresh droid_models' docs model list unless its cache is still fresh.
+
+    Runs under REFRESH_LOCK_FILE like refresh_models(), and gives up if
+    another refresher holds it.
+    """
+    try:
+        from scripts.droid_models import get_cached_models, refresh_models_from_docs
+    except ModuleNotFoundError:
+        from droid_models import get_cached_models, refresh_models_from_docs
+
+    fd = os.open(str(REFRESH_LOCK_FILE), os.O_CREAT | os.O_RDWR, 0o600)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return  # Another process is refreshing
+        if get_cached_models() is None:
+            refresh_models_from_docs()
+    finally:
+        os.close(fd)  # Releases the lock
+
+
+def refresh_in_background() -> bool:
+    """
+    Start a detached refresher process, at most once per process.
+
+    The refresher outlives short-lived callers (hooks, one-shot CLIs) and
+    exits at once if another refresher holds the lock.
+
+    Returns:
+        True if a refresher was started
+    """
+    import subprocess
+
+    global _refresh_started
+
+    if _refresh_started:
+        return False
+    _refresh_started = True
+
+    try:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--refresh-cache"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as e:
+        print(f"WARNING: Could not start model refresher: {e}", file=sys.stderr)
+        return False
+    return True
+
+
+def ensure_models_fresh(force: bool = False, wait: bool = False) -> dict:
     """
-    Ensure model list is fresh. Called before droid exec.
+    Return the cached model list, refreshing it when stale. Called before droid exec.
 
-    Uses 24-hour cache to avoid delay on every call.
-    Fetches both model names (from droid CLI) and prices (from Factory docs).
+    Stale-while-revalidate: the cache is returned immediately, even when it
+    is older than CACHE_TTL_HOURS, and a stale or missing cache starts a
+    background refresher. Task start never waits on the CLI or network.
 
     Args:
-        force: Force refresh even if cache is valid
+        force: Refresh in the foreground even if cache is valid
+        wait: Refresh in the foreground if the cache is stale or missing
 
     Returns:
-        dict with status, available_models, model_prices, and deprecation warnings
+        dict with status, available_models, model_prices, and deprecation warnings.
+        status is "ok", "using_stale_cache", "refreshing" (no cache yet, refresh
+        started) or "error" (foreground refresh failed and no cache available)
     """
     global _AVAILABLE_MODELS_CACHE
 
     result = {
         "status": "ok",
-        "from_cache": False,
+        "from_cache": True,
         "available_models": [],
         "model_prices": {},
         "deprecations": [],
     }
 
-    # Check cache first (unless forced)
-    if not force:
-        cache = load_cache()
-        if cache and cache.get("status") in ("up_to_date", "updated"):
-            cache_time = datetime.fromisoformat(cache.get("timestamp", "2000-01-01"))
-            if datetime.now() - cache_time < timedelta(hours=CACHE_TTL_HOURS):
-                result["from_cache"] = True
-                result["available_models"] = cache.get("available_models", [])
-                result["model_prices"] = cache.get("model_prices", {})
-                _AVAILABLE_MODELS_CACHE = result["available_models"]
-
-                # Check deprecations using cached models
-                result["deprecations"] = check_deprecations(result["available_models"])
-                return result
-
-    # Cache stale or forced - fetch fresh data
-    print("Refreshing model list from droid CLI...", file=sys.stderr)
-    available_models = fetch_models_from_droid_cli()
+    cache = read_cache()
+    fresh = cache is not None and _is_fresh(cache)
 
-    if not available_models:
-        # Fallback: try to use existing cache even if stale
-        cache = load_cache()
-        if cache and "available_models" in cache:
-            result["available_models"] = cache["available_models"]
-            result["status"] = "using_stale_cache"
+    if force or (wait and not fresh):
+        refreshed = refresh_models(force=force, block=True)
+        if refreshed is not None:
+            cache, fresh = refreshed, True
+            result["from_cache"] = False
+        elif cache is not None:
             print("WARNING: Using stale model cache (refresh failed)", file=sys.stderr)
-        else:
+    elif not fresh:
+        refresh_in_background()
+
+    if cache is None:
+        if force or wait:
             result["status"] = "error"
             result["error"] = "Failed to fetch models and no cache available"
+        else:
+            result["status"] = "refreshing"
         return result
 
-    # Update cache
-    _AVAILABLE_MODELS_CACHE = available_models
-    result["available_models"] = available_models
-
-    # Fetch model prices from Factory docs
-    print("Fetching model prices from Factory docs...", file=sys.stderr)
-    model_prices = fetch_model_prices()
-    result["model_prices"] = model_prices
-    if model_prices:
-        print(f"   Found prices for {len(model_prices)} models", file=sys.stderr)
-
-    # Check for deprecations
-    result["deprecations"] = check_deprecations(available_models)
-
-    # Print deprecation warnings
-    for dep in result["deprecations"]:
-        print(f"⚠️  DEPRECATED: {dep['message']}", file=sys.stderr)
-
-    # Save to cache (including prices)
-    save_cache(
-        {
-            "status": "up_to_date",
-            "available_models": available_models,
-            "models_count": len(available_models),
-            "model_prices": model_prices,
-            "deprecations": result["deprecations"],
-        }
-    )
+    result["status"] = "ok" if fresh else "using_stale_cache"
+    result["available_models"] = cache.get("available_models", [])
+    result["model_prices"] = cache.get("model_prices", {})
+    if result["available_models"]:
+        _AVAILABLE_MODELS_CACHE = result["available_models"]
 
+    # Re-checked against the cached list: config/models.yaml may have changed
+    result["deprecations"] = check_deprecations(result["available_models"])
     return result
 
 
@@ -368,7 +466,7 @@ def is_model_available(model_name: str) -> bool:
     """
     Check if a model is available.
 
-    Uses cache if available, otherwise fetches fresh list.
+    Uses the cached list (possibly stale); never waits for a refresh.
 
     Args:
         model_name: Model ID to check
@@ -376,13 +474,7 @@ def is_model_available(model_name: str) -> bool:
     Returns:
         True if model is available
     """
-    global _AVAILABLE_MODELS_CACHE
-
-    if _AVAILABLE_MODELS_CACHE is None:
-        result = ensure_models_fresh()
-        _AVAILABLE_MODELS_CACHE = result.get("available_models", [])
-
-    return model_name.lower() in {m.lower() for m in _AVAILABLE_MODELS_CACHE}
+    return model_name.lower() in {m.lower() for m in get_available_models()}
 
 
 def is_model_safe_for_auto(model_name: str) -> tuple[bool, str]:
@@ -434,16 +526,16 @@ def get_available_models() -> list[str]:
     """
     Get list of available models.
 
-    Uses cache if available, otherwise fetches fresh list.
+    Uses the cached list (possibly stale); never waits for a refresh.
+    Empty until the first refresh completes.
 
     Returns:
         List of available model IDs
     """
-    global _AVAILABLE_MODELS_CACHE
-
     if _AVAILABLE_MODELS_CACHE is None:
-        result = ensure_models_fresh()
-        _AVAILABLE_MODELS_CACHE = result.get("available_models", [])
+        # Only non-empty lists are memoized, so a cold cache is re-read
+        # once the background refresher has filled it
+        return ensure_models_fresh()["available_models"]
 
     return _AVAILABLE_MODELS_CACHE
 
@@ -594,13 +686,32 @@ def get_last_update_date(content: str) -> str | None:
     return None
 
 
+def read_cache() -> dict | None:
+    """Load cached update info regardless of age."""
+    try:
+        return json.loads(CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _is_fresh(cache: dict) -> bool:
+    """True if the cache holds a model list younger than CACHE_TTL_HOURS."""
+    if "available_models" not in cache:
+        return False  # Written by the docs sync, which has no model list
+    try:
+        cached_time = datetime.fromisoformat(cache.get("timestamp", ""))
+    except ValueError:
+        return False
+    return datetime.now() - cached_time < timedelta(hours=CACHE_TTL_HOURS)
+
+
 def load_cache() -> dict | None:
-    """Load cached update info."""
-    if not CACHE_FILE.exists():
+    """Load cached update info if younger than CACHE_TTL_HOURS."""
+    data = read_cache()
+    if data is None:
         return None
 
     try:
-        data = json.loads(CACHE_FILE.read_text())
         cached_time = datetime.fromisoformat(data.get("timestamp", ""))
         if datetime.now() - cached_time < timedelta(hours=CACHE_TTL_HOURS):
             return data
@@ -611,9 +722,11 @@ def load_cache() -> dict | None:
 
 
 def save_cache(data: dict):
-    """Save update cache."""
+    """Save update cache atomically, so concurrent readers never see a partial file."""
     data["timestamp"] = datetime.now().isoformat()
-    CACHE_FILE.write_text(json.dumps(data, indent=2))
+    tmp = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2))
+    tmp.replace(CACHE_FILE)
 
 
 def update_yaml_config(rankings: list[dict], scenarios: dict, doc_date: str) -> bool:
@@ -692,10 +805,12 @@ def update_yaml_config(rankings: list[dict], scenarios: dict, doc_date: str) ->
 def sync_all_files():
     """Sync model names to all Fabrik files."""
     try:
-        from droid_models import sync_all_models
+        from droid_models import format_sync_summary, sync_all_models
 
         print("\nSyncing to all Fabrik files...")
+        started = time.perf_counter()
         results = sync_all_models()
+        elapsed = time.perf_counter() - started
         for file, result in results.items():
             status = result.get("status", "unknown")
             if status == "updated":
@@ -704,6 +819,7 @@ def sync_all_files():
                 print(f"  • {file}: No changes")
             else:
                 print(f"  ✗ {file}: {result.get('errors', 'unknown error')}")
+        print(f"  {format_sync_summary(results, elapsed)}")
     except ImportError:
         print("  (Skipping sync - run manually: python3 scripts/droid_models.py sync)")
 
@@ -744,6 +860,12 @@ def main():
     global MODEL_NAME_MAP
 
     args = sys.argv[1:]
+    if "--refresh-cache" in args:
+        # Background refresher started by ensure_models_fresh() and droid_core
+        refresh_models()
+        refresh_docs_models()
+        return 0
+
     force = "--force" in args
     dry_run = "--dry-run" in args
     check_deps = "--check-deprecations" in args
@@ -757,7 +879,7 @@ def main():
     # Handle --check-deprecations
     if check_deps:
         print("\nChecking for deprecated models...")
-        result = ensure_models_fresh(force=force)
+        result = ensure_models_fresh(force=force, wait=True)
         deprecations = result.get("deprecations", [])
         if deprecations:
             print(f"\n⚠️  Found {len(deprecations)} deprecated model(s):")
@@ -771,7 +893,7 @@ def main():
     # Use droid CLI as primary source (faster, more accurate)
     if use_cli or force:
         print("\n1. Fetching models from droid CLI...")
-        result = ensure_models_fresh(force=force)
+        result = ensure_models_fresh(force=force, wait=True)
         if result["status"] == "ok":
             print(f"   Found {len(result['available_models'])} models")
             if result.get("from_cache"):
@@ -18,27 +18,28 @@ CLI Commands:
   python droid_models.py sync           # Sync model names across files
 """
 
+import importlib.util
 import json
+import os
 import re
-import urllib.error
-import urllib.request
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 
-try:
-    import yaml
-
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+# yaml is imported only when models.yaml is parsed: while the serialised
+# routing table is current (see routing_table()), importing this module
+# does not need it
+YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
 
 
 # Cache file for model registry
 CACHE_FILE = Path(__file__).parent / ".droid_models_cache.json"
 CACHE_TTL_HOURS = 24  # Refresh cache daily
 
+# Compiled routing table, rebuilt when models.yaml changes
+ROUTING_FILE = Path(__file__).parent / ".droid_routing_table.json"
+
 # Config file for model rankings and scenarios
 CONFIG_FILE = Path(__file__).parent.parent / "config" / "models.yaml"
 
@@ -67,21 +68,47 @@ class ModelInfo:
 # =============================================================================
 
 
-def load_models_config() -> dict:
+# Parsed configs: path -> ((mtime_ns, size), config)
+_config_cache: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def load_models_config(config_file: Path | str | None = None) -> dict:
     """
-    Load model configuration from config/models.yaml.
+    Load model configuration from config/models.yaml (or config_file).
+
+    The file is parsed once per process and re-parsed only when its mtime
+    or size changes. The returned dict is shared between callers: treat it
+    as read-only.
 
     Returns default config if file doesn't exist or YAML not available.
     """
+    path = Path(config_file) if config_file else CONFIG_FILE
     if not YAML_AVAILABLE:
         return {"version": "builtin", "error": "PyYAML not installed"}
 
-    if not CONFIG_FILE.exists():
-        return {"version": "builtin", "error": f"Config not found: {CONFIG_FILE}"}
+    try:
+        stat = path.stat()
+    except OSError:
+        return {"version": "builtin", "error": f"Config not found: {path}"}
+
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _config_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    config = _parse_models_config(path)
+    _config_cache[path] = (stamp, config)
+    return config
 
+
+def _parse_models_config(path: Path) -> dict:
     try:
-        with open(CONFIG_FILE) as f:
-            config = yaml.safe_load(f)
+        import yaml
+
+        # libyaml-backed loader is ~10x faster; fall back to the pure-Python one
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(path) as f:
+            config = yaml.load(f, Loader=loader)
 
         # Basic schema validation
         if not isinstance(config, dict):
@@ -100,7 +127,10 @@ def load_models_config() -> dict:
 
 def get_models_from_yaml() -> dict[str, ModelInfo]:
     """Load models from YAML config."""
-    config = load_models_config()
+    return _models_from_config(load_models_config())
+
+
+def _models_from_config(config: dict) -> dict[str, ModelInfo]:
     models_data = config.get("models", {})
 
     loaded_models = {}
@@ -501,26 +531,7 @@ def print_windsurf_models(category: str = None):
         print(f"{m.name:<35} {m.credits:<10} {m.category}")
 
 
-# Current models from Factory docs (December 2025)
-# Source: https://docs.factory.ai/pricing
-MODELS = get_models_from_yaml()
-
-if not MODELS:
-    # Fallback if config fails
-    MODELS = {
-        "gpt-5.1-codex-max": ModelInfo(
-            name="gpt-5.1-codex-max",
-            provider="openai",
-            reasoning_levels=["low", "medium", "high", "extra_high"],
-            default_reasoning="medium",
-            best_for=["complex_coding"],
-            cost_tier="high",
-            cost_multiplier=0.5,
-            notes="Fallback model",
-        )
-    }
-
-# Task type to model recommendations
+# Task type to model recommendations (ranked, best first)
 TASK_MODEL_MAP: dict[TaskCategory, list[str]] = {
     TaskCategory.FAST_SIMPLE: [
         "claude-haiku-4-5-20251001",
@@ -549,8 +560,198 @@ TASK_MODEL_MAP: dict[TaskCategory, list[str]] = {
     ],
 }
 
+
+# =============================================================================
+# ROUTING TABLE - models.yaml compiled once for O(1) dispatch lookups
+# =============================================================================
+
+# Bump when the table layout or build_routing_table() changes
+ROUTING_TABLE_VERSION = 2
+
+_routing_table: dict | None = None
+
+
+def _session_pairings(compatibility: dict, providers: list[str]) -> dict[str, list[str]]:
+    """
+    Apply the models.yaml compatibility rules to every provider.
+
+    Keys are the current model's provider, with "+reasoning" appended when
+    reasoning is on; values are the providers whose models can continue
+    that session. A pairing is allowed only if both providers' rules allow
+    it, so openai_only_pairs_with_openai also stops a Gemini session being
+    continued by an OpenAI model.
+    """
+
+    def allowed_by(provider: str, reasoning: bool) -> list[str]:
+        if provider == "openai" and compatibility.get("openai_only_pairs_with_openai"):
+            return ["openai"]
+        if provider == "anthropic" and reasoning:
+            if compatibility.get("anthropic_reasoning_on_pairs_with_anthropic"):
+                return ["anthropic"]
+        elif provider == "anthropic":
+            if compatibility.get("anthropic_reasoning_off_pairs_with_non_openai"):
+                return [p for p in providers if p != "openai"]
+        return providers
+
+    pairings = {}
+    for provider in providers:
+        for reasoning in (False, True):
+            pairings[provider + ("+reasoning" if reasoning else "")] = [
+                other
+                for other in allowed_by(provider, reasoning)
+                if provider in allowed_by(other, reasoning)
+            ]
+    return pairings
+
+
+def _fabrik_task_models(scenarios: dict) -> dict[str, str]:
+    """Map Fabrik task types to models from the models.yaml scenarios."""
+    # Map scenarios to task types
+    # Default fallback mapping
+    mapping = {
+        "ANALYZE": scenarios.get("explore", {}).get("primary", "gemini-3-flash-preview"),
+        "CODE": scenarios.get("full_feature_dev", {}).get("alternatives", ["gpt-5.1-codex-max"])[0],
+        "REFACTOR": scenarios.get("full_feature_dev", {}).get(
+            "alternatives", ["gpt-5.1-codex-max"]
+        )[0],
+        "TEST": scenarios.get("verify", {}).get("primary", "gpt-5.1-codex-max"),
+        "REVIEW": scenarios.get("code_review", {}).get("models", ["claude-haiku-4-5-20251001"])[
+            0
+        ],  # review uses list
+        "SPEC": scenarios.get("design", {}).get("primary", "claude-sonnet-4-5-20250929"),
+        "SCAFFOLD": scenarios.get("full_feature_dev", {}).get(
+            "alternatives", ["gpt-5.1-codex-max"]
+        )[0],
+        "DEPLOY": scenarios.get("ship", {}).get("primary", "gemini-3-flash-preview"),
+        "MIGRATE": scenarios.get("full_feature_dev", {}).get("alternatives", ["gpt-5.1-codex-max"])[
+            0
+        ],
+        "HEALTH": scenarios.get("verify", {}).get(
+            "primary", "gemini-3-flash-preview"
+        ),  # verify primary is codex-max but health is usually cheaper
+        "PREFLIGHT": scenarios.get("ship", {}).get("primary", "gemini-3-flash-preview"),
+    }
+
+    # Override with specific lookups where logic is more complex
+    # Health/Preflight/Deploy -> Ship scenario
+    ship_model = scenarios.get("ship", {}).get("primary", "gemini-3-flash-preview")
+    mapping["HEALTH"] = ship_model
+    mapping["PREFLIGHT"] = ship_model
+    mapping["DEPLOY"] = ship_model
+
+    return mapping
+
+
+def build_routing_table(config: dict) -> dict:
+    """
+    Compile a models.yaml config and TASK_MODEL_MAP into a routing table.
+
+    Returns a JSON-serialisable dict:
+      default_model  - config default_model
+      models         - model -> ModelInfo fields
+      providers      - model -> provider
+      tasks          - task category -> {"candidates": [...], "by_provider": {provider: model}}
+      fabrik_tasks   - Fabrik task type -> model (see get_fabrik_task_models)
+      pairings       - provider[+reasoning] -> providers that can continue its session
+    """
+    models = _models_from_config(config)
+    if not models:
+        # Fallback if config fails
+        models = {
+            "gpt-5.1-codex-max": ModelInfo(
+                name="gpt-5.1-codex-max",
+                provider="openai",
+                reasoning_levels=["low", "medium", "high", "extra_high"],
+                default_reasoning="medium",
+                best_for=["complex_coding"],
+                cost_tier="high",
+                cost_multiplier=0.5,
+                notes="Fallback model",
+            )
+        }
+    providers = {name: info.provider for name, info in models.items()}
+    default_model = config.get("default_model", "claude-sonnet-4-5-20250929")
+
+    tasks = {}
+    for category, candidates in TASK_MODEL_MAP.items():
+        by_provider: dict[str, str] = {}
+        for name in candidates:
+            if name in providers:
+                by_provider.setdefault(providers[name], name)
+        tasks[category.value] = {
+            "candidates": candidates or [default_model],
+            "by_provider": by_provider,
+        }
+
+    return {
+        "default_model": default_model,
+        "models": {name: asdict(info) for name, info in models.items()},
+        "providers": providers,
+        "tasks": tasks,
+        "fabrik_tasks": _fabrik_task_models(config.get("scenarios", {})),
+        "pairings": _session_pairings(
+            config.get("compatibility", {}), sorted(set(providers.values()))
+        ),
+    }
+
+
+def _routing_source() -> dict:
+    """What a routing table was built from; a table is current while this matches."""
+    try:
+        stat = CONFIG_FILE.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+    except OSError:
+        stamp = None
+    return {
+        "version": ROUTING_TABLE_VERSION,
+        "config": str(CONFIG_FILE),
+        "stamp": stamp,
+        "yaml": YAML_AVAILABLE,
+        "task_map": {category.value: models for category, models in TASK_MODEL_MAP.items()},
+    }
+
+
+def routing_table() -> dict:
+    """
+    Get the routing table for the current models.yaml.
+
+    Looked up in this process's copy, then ROUTING_FILE (written by an
+    earlier process), and only then built from models.yaml and written
+    back to ROUTING_FILE. Like load_models_config(), a change to the file's
+    mtime or size invalidates it. Treat the result as read-only.
+    """
+    global _routing_table
+    source = _routing_source()
+    if _routing_table is not None and _routing_table["source"] == source:
+        return _routing_table
+
+    table = None
+    try:
+        table = json.loads(ROUTING_FILE.read_text())
+    except (OSError, ValueError):
+        pass
+    if not isinstance(table, dict) or table.get("source") != source:
+        config = load_models_config()
+        table = build_routing_table(config)
+        table["source"] = source
+        if "error" not in config:  # Re-report broken configs in every process
+            tmp = ROUTING_FILE.with_name(f"{ROUTING_FILE.name}.{os.getpid()}.tmp")
+            try:
+                tmp.write_text(json.dumps(table, indent=2))
+                tmp.replace(ROUTING_FILE)
+            except OSError:
+                pass  # Read-only checkout: rebuild per process
+
+    _routing_table = table
+    return table
+
+
+# Current models from Factory docs (December 2025)
+# Source: https://docs.factory.ai/pricing
+MODELS = {name: ModelInfo(**info) for name, info in routing_table()["models"].items()}
+
 # Default model for general use
-DEFAULT_MODEL = get_default_model()
+DEFAULT_MODEL = routing_table()["default_model"]
 
 
 def get_model_info(model_name: str) -> ModelInfo | None:
@@ -577,15 +778,35 @@ def recommend_model(
     Returns:
         Recommended model name
     """
-    candidates = TASK_MODEL_MAP.get(task_category, [DEFAULT_MODEL])
+    table = routing_table()
+    route = table["tasks"].get(getattr(task_category, "value", task_category))
+    if route is None:
+        return table["default_model"]
+
+    if prefer_provider and prefer_provider in route["by_provider"]:
+        return route["by_provider"][prefer_provider]
+
+    return route["candidates"][0]
 
-    if prefer_provider:
-        for model_name in candidates:
-            model = MODELS.get(model_name)
-            if model and model.provider == prefer_provider:
-                return model_name
 
-    return candidates[0] if candidates else DEFAULT_MODEL
+def can_continue_session(current_model: str, new_model: str, reasoning: bool = False) -> bool:
+    """
+    Check the models.yaml compatibility rules for switching mid-session.
+
+    Args:
+        current_model: Model that owns the session
+        new_model: Model that would continue it
+        reasoning: Whether the session has reasoning enabled
+
+    Returns:
+        True if new_model can continue the session (unknown models: False)
+    """
+    table = routing_table()
+    current = table["providers"].get(current_model)
+    new = table["providers"].get(new_model)
+    if current is None or new is None:
+        return False
+    return new in table["pairings"][current + ("+reasoning" if reasoning else "")]
 
 
 def check_model_change_warning(current_model: str, new_model: str) -> str | None:
@@ -597,16 +818,23 @@ def check_model_change_warning(current_model: str, new_model: str) -> str | None
     if current_model == new_model:
         return None
 
-    current = MODELS.get(current_model)
-    new = MODELS.get(new_model)
+    providers = routing_table()["providers"]
+    current = providers.get(current_model)
+    new = providers.get(new_model)
 
     if not current or not new:
         return f"WARNING: Changing model from {current_model} to {new_model} will start a new session (context lost)"
 
     # Provider change is more significant
-    if current.provider != new.provider:
+    if current != new:
+        if not can_continue_session(current_model, new_model):
+            return (
+                f"WARNING: Changing provider from {current} to {new} "
+                f"({current_model} → {new_model}) will start a new session. "
+                f"{current} sessions cannot be continued by {new} models (context lost)."
+            )
         return (
-            f"WARNING: Changing provider from {current.provider} to {new.provider} "
+            f"WARNING: Changing provider from {current} to {new} "
             f"({current_model} → {new_model}) will start a new session. "
             "Context is converted but some metadata may be lost."
         )
@@ -651,6 +879,8 @@ def refresh_models_from_docs() -> dict[str, any]:
 
     all_models = set()
 
+    import urllib.request  # Deferred: costs ~25ms at import and is only needed here
+
     for url in urls:
         try:
             req = urllib.request.Request(url, headers={"User-Agent": "Fabrik/1.0 (model refresh)"})
@@ -729,43 +959,7 @@ def get_fabrik_task_models() -> dict[str, str]:
     Get task models from config/models.yaml (single source of truth).
     Falls back to hardcoded defaults if config is missing.
     """
-    config = load_models_config()
-    scenarios = config.get("scenarios", {})
-
-    # Map scenarios to task types
-    # Default fallback mapping
-    mapping = {
-        "ANALYZE": scenarios.get("explore", {}).get("primary", "gemini-3-flash-preview"),
-        "CODE": scenarios.get("full_feature_dev", {}).get("alternatives", ["gpt-5.1-codex-max"])[0],
-        "REFACTOR": scenarios.get("full_feature_dev", {}).get(
-            "alternatives", ["gpt-5.1-codex-max"]
-        )[0],
-        "TEST": scenarios.get("verify", {}).get("primary", "gpt-5.1-codex-max"),
-        "REVIEW": scenarios.get("code_review", {}).get("models", ["claude-haiku-4-5-20251001"])[
-            0
-        ],  # review uses list
-        "SPEC": scenarios.get("design", {}).get("primary", "claude-sonnet-4-5-20250929"),
-        "SCAFFOLD": scenarios.get("full_feature_dev", {}).get(
-            "alternatives", ["gpt-5.1-codex-max"]
-        )[0],
-        "DEPLOY": scenarios.get("ship", {}).get("primary", "gemini-3-flash-preview"),
-        "MIGRATE": scenarios.get("full_feature_dev", {}).get("alternatives", ["gpt-5.1-codex-max"])[
-            0
-        ],
-        "HEALTH": scenarios.get("verify", {}).get(
-            "primary", "gemini-3-flash-preview"
-        ),  # verify primary is codex-max but health is usually cheaper
-        "PREFLIGHT": scenarios.get("ship", {}).get("primary", "gemini-3-flash-preview"),
-    }
-
-    # Override with specific lookups where logic is more complex
-    # Health/Preflight/Deploy -> Ship scenario
-    ship_model = scenarios.get("ship", {}).get("primary", "gemini-3-flash-preview")
-    mapping["HEALTH"] = ship_model
-    mapping["PREFLIGHT"] = ship_model
-    mapping["DEPLOY"] = ship_model
-
-    return mapping
+    return dict(routing_table()["fabrik_tasks"])
 
 
 # Canonical model assignments for Fabrik task types
@@ -807,28 +1001,13 @@ FABRIK_EXECUTION_MODES = {
 }
 
 
-def sync_droid_tasks() -> dict:
-    """
-    Update model names in droid_tasks.py TOOL_CONFIGS from FABRIK_TASK_MODELS.
-
-    Returns dict with status and changes made.
-    """
-    import re
-
-    tasks_file = Path(__file__).parent / "droid_tasks.py"
-    result = {"status": "ok", "changes": [], "errors": []}
-
-    if not tasks_file.exists():
-        result["status"] = "error"
-        result["errors"].append(f"File not found: {tasks_file}")
-        return result
-
-    content = tasks_file.read_text()
-    original = content
+def _render_droid_tasks(content: str, task_models: dict[str, str]) -> tuple[str, list[str]]:
+    """Rewrite TOOL_CONFIGS model assignments in droid_tasks.py."""
+    changes = []
 
     # Pattern to match TaskType.XXX model assignments
     # Matches: TaskType.ANALYZE: {\n        "default_auto": "...",\n        "model": "...",
-    for task_type, model in FABRIK_TASK_MODELS.items():
+    for task_type, model in task_models.items():
         # Match the model line within a TaskType block
         pattern = rf'(TaskType\.{task_type}:\s*\{{\s*[^}}]*?"model":\s*")[^"]+(")'
 
@@ -838,37 +1017,14 @@ def sync_droid_tasks() -> dict:
             old_model_name = re.search(r'"model":\s*"([^"]+)"', old_model)
             if old_model_name and old_model_name.group(1) != model:
                 content = re.sub(pattern, rf"\g<1>{model}\g<2>", content, count=1)
-                result["changes"].append(
-                    f"TaskType.{task_type}: {old_model_name.group(1)} → {model}"
-                )
+                changes.append(f"TaskType.{task_type}: {old_model_name.group(1)} → {model}")
 
-    if content != original:
-        tasks_file.write_text(content)
-        result["status"] = "updated"
-    else:
-        result["status"] = "no_changes"
+    return content, changes
 
-    return result
 
-
-def sync_agents_md() -> dict:
-    """
-    Update model names in AGENTS.md execution modes table from FABRIK_EXECUTION_MODES.
-
-    Returns dict with status and changes made.
-    """
-    import re
-
-    agents_file = Path(__file__).parent.parent / "AGENTS.md"
-    result = {"status": "ok", "changes": [], "errors": []}
-
-    if not agents_file.exists():
-        result["status"] = "error"
-        result["errors"].append(f"File not found: {agents_file}")
-        return result
-
-    content = agents_file.read_text()
-    original = content
+def _render_agents_md(content: str, task_models: dict[str, str]) -> tuple[str, list[str]]:
+    """Rewrite the AGENTS.md execution modes table from FABRIK_EXECUTION_MODES."""
+    changes = []
 
     # Build the new table
     new_table_lines = [
@@ -890,38 +1046,19 @@ def sync_agents_md() -> dict:
         old_table = match.group(0).strip()
         if old_table != new_table:
             content = content[: match.start()] + new_table + "\n" + content[match.end() :]
-            result["changes"].append("Updated Execution Modes table")
-
-    if content != original:
-        agents_file.write_text(content)
-        result["status"] = "updated"
-    else:
-        result["status"] = "no_changes"
+            changes.append("Updated Execution Modes table")
 
-    return result
+    return content, changes
 
 
-def sync_droid_exec_usage() -> dict:
+def _render_droid_exec_usage(content: str, task_models: dict[str, str]) -> tuple[str, list[str]]:
     """
-    Update model names in droid-exec-usage.md from FABRIK_EXECUTION_MODES and MODELS.
+    Rewrite droid-exec-usage.md tables.
 
     Updates:
     - Mode Overview table (section 12)
     - Model pricing table (section 13)
-
-    Returns dict with status and changes made.
     """
-    import re
-
-    docs_file = Path(__file__).parent.parent / "docs" / "reference" / "droid-exec-usage.md"
-    result = {"status": "ok", "changes": [], "errors": []}
-
-    if not docs_file.exists():
-        result["status"] = "error"
-        result["errors"].append(f"File not found: {docs_file}")
-        return result
-
-    content = docs_file.read_text()
     original = content
 
     # Update Mode Overview table (section 12)
@@ -960,16 +1097,89 @@ def sync_droid_exec_usage() -> dict:
                 lines[i] = re.sub(pattern, replacement + " ", line)
         content = "\n".join(lines)
 
+    changes = ["Updated Mode Overview table with full model names"] if content != original else []
+    return content, changes
+
+
+# Sync targets: result key -> (file, renderer). Renderers are pure functions
+# of (content, task models) so sync_all_models() can run them concurrently.
+SYNC_TARGETS = {
+    "droid_tasks.py": (Path(__file__).parent / "droid_tasks.py", _render_droid_tasks),
+    "AGENTS.md": (Path(__file__).parent.parent / "AGENTS.md", _render_agents_md),
+    "droid-exec-usage.md": (
+        Path(__file__).parent.parent / "docs" / "reference" / "droid-exec-usage.md",
+        _render_droid_exec_usage,
+    ),
+}
+
+
+def _render_target(path: Path, render, task_models: dict[str, str]) -> tuple[dict, str | None]:
+    """Read and render one sync target. Returns (result, content to write or None)."""
+    result = {"status": "ok", "changes": [], "errors": []}
+
+    if not path.exists():
+        result["status"] = "error"
+        result["errors"].append(f"File not found: {path}")
+        return result, None
+
+    original = path.read_text()
+    content, result["changes"] = render(original, task_models)
+
     if content != original:
-        docs_file.write_text(content)
         result["status"] = "updated"
-        result["changes"].append("Updated Mode Overview table with full model names")
-    else:
-        result["status"] = "no_changes"
+        return result, content
+
+    result["status"] = "no_changes"
+    return result, None
+
 
+def _write_atomic(path: Path, content: str) -> None:
+    """Replace path with content in one rename, keeping its permissions."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(content)
+    os.chmod(tmp, path.stat().st_mode & 0o7777)
+    os.replace(tmp, path)
+
+
+def _sync_target(name: str) -> dict:
+    path, render = SYNC_TARGETS[name]
+    result, content = _render_target(path, render, FABRIK_TASK_MODELS)
+    if content is not None:
+        _write_atomic(path, content)
     return result
 
 
+def sync_droid_tasks() -> dict:
+    """
+    Update model names in droid_tasks.py TOOL_CONFIGS from FABRIK_TASK_MODELS.
+
+    Returns dict with status and changes made.
+    """
+    return _sync_target("droid_tasks.py")
+
+
+def sync_agents_md() -> dict:
+    """
+    Update model names in AGENTS.md execution modes table from FABRIK_EXECUTION_MODES.
+
+    Returns dict with status and changes made.
+    """
+    return _sync_target("AGENTS.md")
+
+
+def sync_droid_exec_usage() -> dict:
+    """
+    Update model names in droid-exec-usage.md from FABRIK_EXECUTION_MODES and MODELS.
+
+    Updates:
+    - Mode Overview table (section 12)
+    - Model pricing table (section 13)
+
+    Returns dict with status and changes made.
+    """
+    return _sync_target("droid-exec-usage.md")
+
+
 def sync_windsurfrules() -> dict:
     """
     Update skill triggers in windsurfrules to match AGENTS.md.
@@ -986,18 +1196,42 @@ def sync_all_models() -> dict:
     Sync model names across all Fabrik files from the canonical FABRIK_TASK_MODELS.
 
     This is the main entry point - run: python droid_models.py sync
+
+    Single pass: task models are read from the routing table once, every
+    target is read and rendered concurrently, and only files whose content
+    changed are rewritten (atomic replace). Nothing is written if any
+    renderer raises.
     """
-    results = {
-        "droid_tasks.py": sync_droid_tasks(),
-        "AGENTS.md": sync_agents_md(),
-        "droid-exec-usage.md": sync_droid_exec_usage(),
-    }
+    from concurrent.futures import ThreadPoolExecutor
+
+    task_models = get_fabrik_task_models()
+
+    with ThreadPoolExecutor(max_workers=len(SYNC_TARGETS)) as executor:
+        futures = {
+            name: executor.submit(_render_target, path, render, task_models)
+            for name, (path, render) in SYNC_TARGETS.items()
+        }
+        rendered = {name: future.result() for name, future in futures.items()}
+
+    results = {}
+    for name, (result, content) in rendered.items():
+        if content is not None:
+            _write_atomic(SYNC_TARGETS[name][0], content)
+        results[name] = result
 
     return results
 
 
+def format_sync_summary(results: dict, seconds: float) -> str:
+    """One-line summary of sync_all_models() results."""
+    changed = [name for name, result in results.items() if result["status"] == "updated"]
+    summary = f"Checked {len(results)} files in {seconds * 1000:.0f}ms: {len(changed)} changed"
+    return summary + (f" ({', '.join(changed)})" if changed else "")
+
+
 if __name__ == "__main__":
     import sys
+    import time
 
     cmd = sys.argv[1] if len(sys.argv) > 1 else "droid"
 
@@ -1050,7 +1284,9 @@ if __name__ == "__main__":
         print(f"Source of truth: FABRIK_TASK_MODELS in {Path(__file__).name}")
         print()
 
+        started = time.perf_counter()
         results = sync_all_models()
+        elapsed = time.perf_counter() - started
 
         for file, result in results.items():
             status = result["status"]
@@ -1063,6 +1299,7 @@ if __name__ == "__main__":
             else:
                 print(f"✗ {file}: {result['errors']}")
 
+        print(f"\n{format_sync_summary(results, elapsed)}")
         print("\nTo change model assignments, edit FABRIK_TASK_MODELS in droid_models.py")
         print("then run: python scripts/droid_models.py sync")
 
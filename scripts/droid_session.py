@@ -21,6 +21,12 @@ import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# Import metrics exporter (no-op unless FABRIK_METRICS_* is set)
+try:
+    from scripts import droid_metrics
+except ModuleNotFoundError:
+    import droid_metrics
+
 # Session cache location
 SESSION_CACHE_FILE = Path(__file__).parent / ".droid_sessions.json"
 TOKEN_LOG_FILE = Path(__file__).parent / ".droid_token_usage.jsonl"
@@ -174,6 +180,8 @@ def log_token_usage(
     with open(TOKEN_LOG_FILE, "a") as f:
         f.write(json.dumps(entry) + "\n")
 
+    droid_metrics.record_tokens(model or "unknown", usage)
+
 
 def get_token_usage_summary(
     since: datetime | None = None,
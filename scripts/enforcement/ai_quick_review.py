@@ -4,6 +4,15 @@
 Performs a focused review of staged code files for critical issues only.
 Uses droid_core.py with ProcessMonitor for intelligent stuck detection.
 
+Commit-time latency is bounded:
+- Hunks that already passed a review are not sent again (cached by a hash
+  of their content, so hunks that merely moved are not re-reviewed).
+- Invocations starting within BATCH_WINDOW_SECONDS of each other (e.g.
+  pre-commit's parallel file chunks) share one model request.
+- A review that outlasts LATENCY_BUDGET_SECONDS, and hunks beyond the
+  request size limit, are queued for review_processor.py instead of
+  blocking the commit.
+
 Usage:
     python3 scripts/enforcement/ai_quick_review.py [files...]
 
@@ -15,17 +24,26 @@ Exit codes:
 
 from __future__ import annotations
 
+import contextlib
+import fcntl
+import hashlib
 import json
+import math
+import multiprocessing
 import os
+import signal
 import subprocess
 import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
 from pathlib import Path
 
 # Add scripts directory to path for droid_core import
 SCRIPTS_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(SCRIPTS_DIR))
 
-from droid_core import TaskType, run_droid_exec  # noqa: E402
+REPO_ROOT = Path(__file__).parent.parent.parent
 
 # Code file extensions to review
 CODE_EXTENSIONS = {
@@ -40,6 +58,47 @@ CODE_EXTENSIONS = {
     ".yml",  # Config files
 }
 
+# Limit diff size per request to avoid token overflow; the rest is reviewed later
+MAX_DIFF_CHARS = 8000
+
+
+def _env_seconds(name: str, default: float, allow_zero: bool = False) -> float:
+    """Seconds from env var name; bad values warn and fall back instead of breaking the hook."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        seconds = float(value)
+        if not math.isfinite(seconds) or seconds < 0 or (seconds == 0 and not allow_zero):
+            raise ValueError(value)
+    except ValueError:
+        print(f"Warning: Invalid {name} {value!r}, using {default:g} seconds", file=sys.stderr)
+        return default
+    return seconds
+
+
+# Batching, cache and fallback settings - configurable via env vars (Fabrik convention)
+BATCH_WINDOW_SECONDS = _env_seconds("FABRIK_QUICK_REVIEW_WINDOW", 0.5, allow_zero=True)
+LATENCY_BUDGET_SECONDS = _env_seconds("FABRIK_QUICK_REVIEW_BUDGET", 20)
+STATE_DIR = REPO_ROOT / ".factory" / "cache" / "quick_review"
+CACHE_MAX_ENTRIES = 5000
+FABRIK_ROOT = Path(os.getenv("FABRIK_ROOT", "/opt/fabrik"))
+QUEUE_DIR = Path(os.getenv("FABRIK_REVIEW_QUEUE", str(FABRIK_ROOT / ".droid/review_queue")))
+
+
+@dataclass(frozen=True)
+class Hunk:
+    """One hunk of the staged diff."""
+
+    file: str
+    header: str  # The "@@ -a,b +c,d @@" line
+    body: str
+
+    @property
+    def digest(self) -> str:
+        """Hash of the file and hunk content; unaffected by line-number shifts."""
+        return hashlib.sha256(f"{self.file}\0{self.body}".encode()).hexdigest()
+
 
 def get_staged_code_files() -> list[str]:
     """Get list of staged code files (all languages)."""
@@ -47,7 +106,7 @@ def get_staged_code_files() -> list[str]:
         ["git", "diff", "--cached", "--name-only", "--diff-filter=ACMR"],
         capture_output=True,
         text=True,
-        cwd=Path(__file__).parent.parent.parent,
+        cwd=REPO_ROOT,
     )
     if result.returncode != 0:
         print(f"Warning: git diff failed: {result.stderr}", file=sys.stderr)
@@ -57,52 +116,107 @@ def get_staged_code_files() -> list[str]:
     return [f for f in files if f and any(f.endswith(ext) for ext in CODE_EXTENSIONS)]
 
 
-def get_staged_diff(files: list[str]) -> str:
-    """Get the staged diff content for specified files."""
+def parse_hunks(diff: str) -> list[Hunk]:
+    """Split unified diff output into hunks."""
+    hunks: list[Hunk] = []
+    file = header = ""
+    body: list[str] = []
+
+    def flush() -> None:
+        if header:
+            hunks.append(Hunk(file, header, "".join(body)))
+
+    for line in diff.splitlines(keepends=True):
+        if line.startswith("diff --git "):
+            flush()
+            file, header, body = line.rstrip("\n").split(" b/", 1)[-1], "", []
+        elif line.startswith("+++ b/") and not header:
+            file = line[6:].rstrip("\n")
+        elif line.startswith("@@"):
+            flush()
+            header, body = line.rstrip("\n"), []
+        elif header:
+            body.append(line)
+    flush()
+    return hunks
+
+
+def get_staged_hunks(files: list[str]) -> list[Hunk]:
+    """Get the staged diff hunks of the specified files."""
     if not files:
-        return ""
+        return []
 
     result = subprocess.run(
         ["git", "diff", "--cached", "--"] + files,
         capture_output=True,
         text=True,
-        cwd=Path(__file__).parent.parent.parent,
+        cwd=REPO_ROOT,
     )
     if result.returncode != 0:
-        return ""
-
-    # Limit diff size to avoid token overflow (max 8KB)
-    diff = result.stdout
-    if len(diff) > 8000:
-        diff = diff[:8000] + "\n... [truncated for size]"
-    return diff
+        return []
+    return parse_hunks(result.stdout)
 
 
-def run_quick_review(files: list[str]) -> tuple[bool | None, str]:
-    """Run quick AI review on files using droid_core.py.
+def load_reviewed() -> dict[str, float]:
+    """Digests of hunks that passed a review, with when they did."""
+    try:
+        return json.loads((STATE_DIR / "reviewed.json").read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
 
-    Returns:
-        (passed, output) - True=passed, False=failed, None=skipped
-    """
-    if not files:
-        return None, "No code files to review"  # None = skip
 
-    # Check if AI review is disabled
-    if os.getenv("SKIP_AI_REVIEW", "").lower() in ("1", "true", "yes"):
-        return None, "Skipped: SKIP_AI_REVIEW=1"  # None = skip
+def record_reviewed(hunks: list[Hunk]) -> None:
+    """Remember hunks that passed, keeping the newest CACHE_MAX_ENTRIES."""
+    reviewed = load_reviewed()
+    now = time.time()
+    reviewed.update((h.digest, now) for h in hunks)
+    newest = sorted(reviewed.items(), key=lambda item: item[1])[-CACHE_MAX_ENTRIES:]
+    try:
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = STATE_DIR / f".reviewed.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(dict(newest)))
+        os.replace(tmp, STATE_DIR / "reviewed.json")
+    except OSError as e:
+        print(f"Warning: Could not save review cache: {e}", file=sys.stderr)
 
-    # Limit to 5 files max for speed
-    review_files = files[:5]
-    if len(files) > 5:
-        print(f"Warning: Reviewing first 5 of {len(files)} files", file=sys.stderr)
 
-    # Get actual diff content
-    diff_content = get_staged_diff(review_files)
-    if not diff_content:
-        return None, "No diff content to review"  # None = skip
-
-    # Build prompt for precommit review
-    prompt = f"""Quick pre-commit review. Check ONLY for:
+def enqueue_for_later(files: list[str], reason: str) -> None:
+    """Queue files for the asynchronous review processor."""
+    try:
+        QUEUE_DIR.mkdir(parents=True, exist_ok=True)
+        for file in sorted(set(files)):
+            file_path = str(REPO_ROOT / file)
+            # One task per file: re-queueing an already pending file overwrites it
+            name = hashlib.sha256(file_path.encode()).hexdigest()[:16]
+            task = {
+                "file_path": file_path,
+                "status": "pending",
+                "queued_at": datetime.now().isoformat(),
+                "source": "ai_quick_review",
+                "reason": reason,
+            }
+            (QUEUE_DIR / f"quick-review-{name}.json").write_text(json.dumps(task, indent=2))
+    except OSError as e:
+        print(f"Warning: Could not queue files for later review: {e}", file=sys.stderr)
+
+
+def diff_text(hunks: list[Hunk]) -> str:
+    """The hunks as one unified diff, with a file header before each file's hunks."""
+    diff_parts = []
+    file = None
+    for hunk in hunks:
+        if hunk.file != file:
+            file = hunk.file
+            diff_parts.append(f"--- a/{file}\n+++ b/{file}\n")
+        diff_parts.append(f"{hunk.header}\n{hunk.body}")
+    return "".join(diff_parts)
+
+
+def build_prompt(hunks: list[Hunk]) -> str:
+    """Review prompt for a batch of hunks; review_batch keeps it within MAX_DIFF_CHARS."""
+    diff_content = diff_text(hunks)
+
+    return f"""Quick pre-commit review. Check ONLY for:
 1. Security issues (hardcoded secrets, SQL injection)
 2. Obvious bugs (undefined variables, wrong return types)
 3. Hardcoded localhost/ports (Fabrik rule violation)
@@ -117,21 +231,183 @@ Output JSON only:
 
 Be brief. Skip style issues. Only report if critical=true."""
 
+
+def _review_child(prompt: str, conn) -> None:
+    """Run the model review and send (passed, message) back through conn."""
+    # Own process group, so a review over budget is killed with its droid process
+    os.setpgrp()
     try:
+        from droid_core import TaskType, run_droid_exec
+
         # Use droid_core.py with PRECOMMIT task type
         # This leverages ProcessMonitor for stuck detection
-        result = run_droid_exec(
-            prompt=prompt,
-            task_type=TaskType.PRECOMMIT,
-            cwd=Path(__file__).parent.parent.parent,
-        )
+        result = run_droid_exec(prompt=prompt, task_type=TaskType.PRECOMMIT, cwd=REPO_ROOT)
 
         if not result.success:
-            return None, f"Skipped: {result.error}"  # None = skip
+            conn.send((None, f"Skipped: {result.error}"))  # None = skip
+        else:
+            conn.send(_parse_review_result(result.result))
+    except Exception as e:
+        conn.send((None, f"Skipped: {e}"))  # None = skip
+
+
+def review_within(hunks: list[Hunk], timeout: float) -> tuple[bool | None, str] | None:
+    """Review hunks in one request, or None if it took longer than timeout seconds."""
+    if timeout <= 0:
+        return None  # Budget already used up, e.g. by waiting for the lock
+    ctx = multiprocessing.get_context("fork")
+    receiver, sender = ctx.Pipe(duplex=False)
+    child = ctx.Process(target=_review_child, args=(build_prompt(hunks), sender))
+    child.start()
+    # Set the group here too: the child may not have reached setpgrp() when killed
+    with contextlib.suppress(OSError):
+        os.setpgid(child.pid, child.pid)
+    sender.close()
+    try:
+        if receiver.poll(timeout):
+            verdict = receiver.recv()
+            child.join(1)
+            return verdict
+        return None
+    except EOFError:
+        return None, "Skipped: review process exited"  # None = skip
+    finally:
+        if child.is_alive():
+            try:
+                os.killpg(child.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                child.kill()
+        child.join()
+        receiver.close()
+
+
+def review_batch(hunks: list[Hunk], deadline: float) -> tuple[bool | None, str]:
+    """Review the hunks not reviewed before, deferring what does not fit the budget."""
+    reviewed = load_reviewed()
+    pending = list({h.digest: h for h in hunks if h.digest not in reviewed}.values())
+    if not pending:
+        return True, "Quick review passed (all hunks reviewed before)"
+
+    # The model must see every hunk it passes in full: a hunk over the limit on
+    # its own is queued whole, and hunks that do not fit this request are queued
+    batch: list[Hunk] = []
+    oversized: list[Hunk] = []
+    overflow: list[Hunk] = []
+    for hunk in pending:
+        if len(diff_text([hunk])) > MAX_DIFF_CHARS:
+            oversized.append(hunk)
+        elif len(diff_text([*batch, hunk])) <= MAX_DIFF_CHARS:
+            batch.append(hunk)
+        else:
+            overflow.append(hunk)
+    if oversized or overflow:
+        enqueue_for_later(
+            [h.file for h in oversized + overflow], "diff over the quick review size limit"
+        )
+        print(
+            f"Warning: Reviewing {len(batch)} of {len(pending)} hunks; the rest is queued",
+            file=sys.stderr,
+        )
+    if not batch:
+        return None, "Deferred: hunks over the quick review size limit, queued"
 
-        return _parse_review_result(result.result)
+    verdict = review_within(batch, deadline - time.monotonic())
+    if verdict is None:
+        enqueue_for_later([h.file for h in batch], "quick review over its latency budget")
+        return None, f"Deferred: review took over {LATENCY_BUDGET_SECONDS:g}s, queued"
+    if verdict[0] is True:
+        record_reviewed(batch)
+    return verdict
 
-    except Exception as e:
+
+def _lead(deadline: float) -> None:
+    """Review every spooled invocation's hunks in one request and answer each.
+
+    All invocations in the batch get its verdict.
+    """
+    participants: dict[str, list[Hunk]] = {}
+    stale_before = time.time() - LATENCY_BUDGET_SECONDS  # Left by crashed invocations
+    for spooled in sorted((STATE_DIR / "spool").glob("*.json")):
+        try:
+            if spooled.stat().st_mtime >= stale_before:
+                participants[spooled.stem] = [Hunk(**h) for h in json.loads(spooled.read_text())]
+        except (OSError, json.JSONDecodeError, TypeError):
+            pass
+        spooled.unlink(missing_ok=True)
+
+    passed, message = review_batch([h for hunks in participants.values() for h in hunks], deadline)
+    results_dir = STATE_DIR / "results"
+    results_dir.mkdir(parents=True, exist_ok=True)
+    for name in participants:
+        (results_dir / f"{name}.json").write_text(json.dumps([passed, message]))
+
+
+def review_coalesced(hunks: list[Hunk]) -> tuple[bool | None, str]:
+    """Review hunks together with other invocations arriving within the batch window.
+
+    Each invocation spools its hunks. Whichever holds the lock waits out the
+    window, reviews all spooled hunks in one request and writes a result
+    per invocation; the others wait for theirs.
+    """
+    deadline = time.monotonic() + LATENCY_BUDGET_SECONDS
+    name = str(os.getpid())
+    spool = STATE_DIR / "spool" / f"{name}.json"
+    result = STATE_DIR / "results" / f"{name}.json"
+    spool.parent.mkdir(parents=True, exist_ok=True)
+    result.unlink(missing_ok=True)
+    spool.write_text(json.dumps([asdict(h) for h in hunks]))
+
+    with open(STATE_DIR / "lock", "a") as lock:
+        while time.monotonic() < deadline:
+            if result.exists():
+                passed, message = json.loads(result.read_text())
+                result.unlink(missing_ok=True)
+                return passed, message
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                time.sleep(0.05)
+                continue
+            try:
+                if spool.exists():
+                    time.sleep(BATCH_WINDOW_SECONDS)  # Let other invocations join
+                    _lead(deadline)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    # No answer in time: queue this invocation's files unless a leader has them
+    if spool.exists():
+        spool.unlink(missing_ok=True)
+        enqueue_for_later([h.file for h in hunks], "quick review over its latency budget")
+    return None, f"Deferred: review took over {LATENCY_BUDGET_SECONDS:g}s, queued"
+
+
+def run_quick_review(files: list[str]) -> tuple[bool | None, str]:
+    """Run quick AI review on files using droid_core.py.
+
+    Returns:
+        (passed, output) - True=passed, False=failed, None=skipped
+    """
+    if not files:
+        return None, "No code files to review"  # None = skip
+
+    # Check if AI review is disabled
+    if os.getenv("SKIP_AI_REVIEW", "").lower() in ("1", "true", "yes"):
+        return None, "Skipped: SKIP_AI_REVIEW=1"  # None = skip
+
+    # Get actual diff content
+    hunks = get_staged_hunks(files)
+    if not hunks:
+        return None, "No diff content to review"  # None = skip
+
+    # Nothing new: answer without joining a batch
+    reviewed = load_reviewed()
+    if all(h.digest in reviewed for h in hunks):
+        return True, "Quick review passed (all hunks reviewed before)"
+
+    try:
+        return review_coalesced(hunks)
+    except OSError as e:
         return None, f"Skipped: {e}"  # None = skip
 
 
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""Benchmark run_all_checks() over every tracked file in a repository.
+
+Each implementation is measured in a fresh subprocess: the current tree,
+and optionally the enforcement package as it was at a git revision, so
+the per-file cost before and after a change can be compared on the same
+files. Findings are compared too, and a speedup that changes them is
+reported as such.
+
+--adversarial times the checks and the conventions hook on inputs that
+made earlier versions of their patterns backtrack super-linearly (1 MiB
+each by default). Every input runs in its own subprocess with a time
+limit, so a catastrophic baseline shows up as a timeout instead of a hang.
+
+Usage:
+    python -m scripts.enforcement.benchmark                      # Current tree
+    python -m scripts.enforcement.benchmark --baseline HEAD~1    # Before vs after
+    python -m scripts.enforcement.benchmark --repeat 5 --json
+    python -m scripts.enforcement.benchmark --adversarial --baseline HEAD~1
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import io
+import json
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+
+PACKAGE_DIR = "scripts/enforcement"
+HOOK_FILE = ".factory/hooks/fabrik-conventions.py"
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Inputs that used to make a convention pattern backtrack super-linearly:
+# name -> (file name, prefix, unit repeated up to the input size, suffix)
+ADVERSARIAL_INPUTS: dict[str, tuple[str, str, str, str]] = {
+    "config_classes": ("settings.py", "", "class AConfig:\n    a = 1\n", ""),
+    "health_routes": ("api.py", "", '@app.get("/health")\ndef h():\n    x = 1\n', ""),
+    "health_return_window": ("api.py", "", '@app.get("/health")\nreturn {"status" check\n', ""),
+    "health_decorator_words": ("api.py", "", '@app.get "/health" ', ""),
+    "decorator_at_get": ("api.py", "", "@get", ""),
+    "password_assignments": ("db.py", "", 'password = "abcd" ', ""),
+    "password_then_getenv": ("db.py", "", 'password = "abcd" ', "getenv"),
+    "localhost_comment": ("db.py", 'url = "http://localhost:80/"', "#", ""),
+    "localhost_getenv": ("db.py", 'h = "localhost:80" ', "os.getenv(,", ""),
+    "dockerfile_from": ("Dockerfile", "", "FROM x ", ""),
+    "aws_secret": ("keys.py", "", "aws_secret", ""),
+    "postgres_url": ("db.py", "", "postgresql://a:b", ""),
+    "mongodb_url": ("db.py", "", "mongodb://a:b", ""),
+    "tmp_paths": ("paths.py", "", "'/tmp", ""),
+    "host_words": ("db.py", "", "host ", ""),
+}
+
+
+def tracked_files(root: Path) -> list[str]:
+    """Absolute paths of files tracked by git under root."""
+    out = subprocess.run(
+        ["git", "ls-files", "-z"], cwd=root, capture_output=True, check=True
+    ).stdout.decode()
+    return [str(root / name) for name in out.split("\0") if name and (root / name).is_file()]
+
+
+def measure(files: list[str], repeat: int) -> dict:
+    """Time run_all_checks() per file (best of repeat) in this process."""
+    from scripts.enforcement.validate_conventions import run_all_checks
+
+    per_file_us = []
+    findings = []
+    for name in files:
+        path = Path(name)
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            results = run_all_checks(path)
+            best = min(best, time.perf_counter() - started)
+        per_file_us.append(best * 1e6)
+        findings.extend(
+            f"{r.check_name}|{r.file_path}|{r.line_number}|{r.message}" for r in results
+        )
+
+    per_file_us.sort()
+    findings.sort()
+    return {
+        "files": len(files),
+        "total_ms": round(sum(per_file_us) / 1000, 2),
+        "mean_us": round(sum(per_file_us) / len(per_file_us), 1) if per_file_us else 0.0,
+        "p50_us": round(per_file_us[len(per_file_us) // 2], 1) if per_file_us else 0.0,
+        "p95_us": round(per_file_us[int(len(per_file_us) * 0.95)], 1) if per_file_us else 0.0,
+        "max_us": round(per_file_us[-1], 1) if per_file_us else 0.0,
+        "findings": len(findings),
+        "findings_digest": hashlib.sha256("\n".join(findings).encode()).hexdigest()[:16],
+    }
+
+
+def adversarial_input(name: str, size: int) -> tuple[str, str]:
+    """File name and content (about size characters) of an adversarial input."""
+    file_name, prefix, unit, suffix = ADVERSARIAL_INPUTS[name]
+    return file_name, prefix + unit * (size // len(unit)) + suffix
+
+
+def load_hook(path: Path):
+    """The conventions hook script loaded as a module."""
+    spec = importlib.util.spec_from_file_location("fabrik_conventions_hook", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def time_input(path: Path, hook: Path | None) -> float:
+    """Milliseconds run_all_checks() (or the hook's check_file(), if hook is given) takes."""
+    if hook is not None:
+        check_file = load_hook(hook).check_file
+        content = path.read_text()
+        started = time.perf_counter()
+        check_file(str(path), content)
+    else:
+        from scripts.enforcement.validate_conventions import run_all_checks
+
+        started = time.perf_counter()
+        run_all_checks(path)
+    return (time.perf_counter() - started) * 1000
+
+
+def _worker(import_root: Path, args: list[str], stdin: str = "", timeout: float | None = None):
+    """Run this script's worker mode in a fresh interpreter; returns its stdout."""
+    return subprocess.run(
+        [sys.executable, __file__, "--worker", *args],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=timeout,
+        env={"PYTHONPATH": str(import_root), "PATH": "", "PYTHONDONTWRITEBYTECODE": "1"},
+    ).stdout
+
+
+def _run_worker(import_root: Path, files: list[str], repeat: int) -> dict:
+    """measure() in a fresh interpreter importing scripts.enforcement from import_root."""
+    return json.loads(_worker(import_root, ["--repeat", str(repeat)], json.dumps(files)))
+
+
+def measure_adversarial(import_root: Path, size: int, timeout: float) -> dict[str, dict]:
+    """Milliseconds per adversarial input for the checks and the hook (None on timeout)."""
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ADVERSARIAL_INPUTS:
+            file_name, content = adversarial_input(name, size)
+            path = Path(tmp) / name / file_name
+            path.parent.mkdir()
+            path.write_text(content)
+            results[name] = {}
+            for target, args in (
+                ("checks", []),
+                ("hook", ["--hook", str(import_root / HOOK_FILE)]),
+            ):
+                try:
+                    out = _worker(import_root, ["--input", str(path), *args], timeout=timeout)
+                    results[name][target] = round(float(out), 1)
+                except subprocess.TimeoutExpired:
+                    results[name][target] = None
+    return results
+
+
+def _extract_baseline(rev: str, dest: Path) -> None:
+    """Write scripts/enforcement and the conventions hook as of rev under dest."""
+    archive = subprocess.run(
+        ["git", "archive", rev, PACKAGE_DIR, HOOK_FILE],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        check=True,
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(dest, filter="data")
+
+
+def format_report(reports: dict[str, dict]) -> str:
+    """Table of per-file cost per implementation."""
+    lines = [
+        f"{'':<24}{'total ms':>10}{'mean µs':>10}{'p50 µs':>10}{'p95 µs':>10}"
+        f"{'max µs':>10}{'findings':>10}"
+    ]
+    for label, r in reports.items():
+        lines.append(
+            f"{label:<24}{r['total_ms']:>10.1f}{r['mean_us']:>10.1f}{r['p50_us']:>10.1f}"
+            f"{r['p95_us']:>10.1f}{r['max_us']:>10.1f}{r['findings']:>10}"
+        )
+    if len(reports) == 2:
+        before, after = reports.values()
+        speedup = before["total_ms"] / after["total_ms"] if after["total_ms"] else 0.0
+        same = before["findings_digest"] == after["findings_digest"]
+        lines.append(f"\nSpeedup: {speedup:.2f}x; findings identical: {'yes' if same else 'NO'}")
+    return "\n".join(lines)
+
+
+def format_adversarial_report(reports: dict[str, dict[str, dict]], timeout: float) -> str:
+    """Table of milliseconds per adversarial input, target and implementation."""
+    columns = [(label, target) for target in ("checks", "hook") for label in reports]
+    lines = [f"{'':<24}" + "".join(f"{f'{target} ({label})':>24}" for label, target in columns)]
+    for name in ADVERSARIAL_INPUTS:
+        cells = []
+        for label, target in columns:
+            ms = reports[label][name][target]
+            cells.append(f"{f'> {timeout:g}s' if ms is None else f'{ms:.1f} ms':>24}")
+        lines.append(f"{name:<24}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the convention checks")
+    parser.add_argument("--root", type=Path, default=REPO_ROOT, help="Repository to scan")
+    parser.add_argument("--baseline", metavar="REV", help="Also measure the checks at REV")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per file (best is kept)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--adversarial", action="store_true", help="Time adversarial inputs instead of the repo"
+    )
+    parser.add_argument("--size", type=int, default=1 << 20, help="Adversarial input size")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Seconds per input")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--input", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--hook", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker and args.input:
+        print(time_input(args.input, args.hook))
+        return 0
+    if args.worker:
+        print(json.dumps(measure(json.load(sys.stdin), args.repeat)))
+        return 0
+
+    if args.adversarial:
+        reports = {}
+        if args.baseline:
+            with tempfile.TemporaryDirectory() as tmp:
+                _extract_baseline(args.baseline, Path(tmp))
+                reports[args.baseline] = measure_adversarial(Path(tmp), args.size, args.timeout)
+        reports["current"] = measure_adversarial(REPO_ROOT, args.size, args.timeout)
+        if args.json:
+            print(json.dumps(reports, indent=2))
+        else:
+            print(f"Adversarial inputs of {args.size} characters\n")
+            print(format_adversarial_report(reports, args.timeout))
+        return 0
+
+    files = tracked_files(args.root.resolve())
+    reports: dict[str, dict] = {}
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as tmp:
+            _extract_baseline(args.baseline, Path(tmp))
+            reports[f"baseline ({args.baseline})"] = _run_worker(Path(tmp), files, args.repeat)
+    reports["current"] = _run_worker(REPO_ROOT, files, args.repeat)
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print(f"Convention checks over {len(files)} files in {args.root} (best of {args.repeat})\n")
+        print(format_report(reports))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -58,35 +58,32 @@ CODE_EXTENSIONS = {".py", ".ts", ".tsx", ".js", ".jsx", ".sh"}
 SIGNIFICANT_FILES = {"Dockerfile", "compose.yaml", "compose.yml"}
 
 
-def get_staged_files() -> list[str]:
-    """Get list of staged files."""
-    result = subprocess.run(
-        ["git", "diff", "--cached", "--name-only"],
-        capture_output=True,
-        text=True,
-    )
-    return result.stdout.strip().split("\n") if result.stdout.strip() else []
-
+def get_staged_changes() -> tuple[dict[str, str], int]:
+    """Get staged files with their status letter (A, M, D, R...) and total lines changed.
 
-def get_staged_diff_stats() -> int:
-    """Get total lines added/removed in staged changes."""
+    One `git diff --cached --raw --numstat` answers both, so the cost does
+    not grow with the number of staged files.
+    """
     result = subprocess.run(
-        ["git", "diff", "--cached", "--numstat"],
+        ["git", "diff", "--cached", "--raw", "--numstat"],
         capture_output=True,
         text=True,
     )
+    statuses: dict[str, str] = {}
     total_lines = 0
-    for line in result.stdout.strip().split("\n"):
-        if line and not line.startswith("-"):
+    for line in result.stdout.splitlines():
+        if line.startswith(":"):
+            # ":<modes> <shas> <status>\t<path>[\t<new path>]"
+            meta, *paths = line.split("\t")
+            statuses[paths[-1]] = meta.split()[-1][0]
+        elif line and not line.startswith("-"):
             parts = line.split("\t")
             if len(parts) >= 2:
                 try:
-                    added = int(parts[0]) if parts[0] != "-" else 0
-                    removed = int(parts[1]) if parts[1] != "-" else 0
-                    total_lines += added + removed
+                    total_lines += int(parts[0]) + int(parts[1])
                 except ValueError:
                     pass
-    return total_lines
+    return statuses, total_lines
 
 
 def should_skip(filepath: str) -> bool:
@@ -113,16 +110,6 @@ def is_significant_code(filepath: str) -> bool:
     return (in_significant_dir and is_code) or is_significant_file
 
 
-def is_new_file(filepath: str) -> bool:
-    """Check if file is newly added (not modified)."""
-    result = subprocess.run(
-        ["git", "diff", "--cached", "--diff-filter=A", "--name-only"],
-        capture_output=True,
-        text=True,
-    )
-    return filepath in result.stdout.strip().split("\n")
-
-
 def check_changelog_quality() -> bool:
     """Check that CHANGELOG.md has a real entry, not just placeholder."""
     changelog_path = Path("CHANGELOG.md")
@@ -161,9 +148,10 @@ def check_changelog_quality() -> bool:
 
 def main() -> int:
     """Smart CHANGELOG.md check for meaningful changes."""
-    staged_files = get_staged_files()
+    statuses, total_lines = get_staged_changes()
+    staged_files = list(statuses)
 
-    if not staged_files or staged_files == [""]:
+    if not staged_files:
         return 0
 
     # Filter to significant code files
@@ -174,10 +162,7 @@ def main() -> int:
         return 0
 
     # Check if any are new files (always require CHANGELOG for new files)
-    new_files = [f for f in significant_files if is_new_file(f)]
-
-    # Check total diff size
-    total_lines = get_staged_diff_stats()
+    new_files = [f for f in significant_files if statuses[f] == "A"]
 
     # Skip if small change AND no new files
     if total_lines < MIN_LINES_THRESHOLD and not new_files:
@@ -4,7 +4,10 @@
 import re
 from pathlib import Path
 
-ALPINE_PATTERN = re.compile(r"FROM\s+.*alpine", re.IGNORECASE)
+from .scanner import SourceFile
+
+# Anchored to line starts, so each line is tried once (linear in file size)
+ALPINE_PATTERN = re.compile(r"^[ \t]*FROM[ \t]+[^\n]*alpine", re.IGNORECASE | re.MULTILINE)
 HEALTHCHECK_PATTERN = re.compile(r"HEALTHCHECK", re.IGNORECASE)
 
 APPROVED_BASES = [
@@ -19,8 +22,14 @@ APPROVED_BASES = [
 
 def check_file(file_path: Path) -> list:
     """Check Docker files for convention violations."""
+    return check_source(SourceFile(file_path))
+
+
+def check_source(source: SourceFile) -> list:
+    """Check an already-opened Docker file for convention violations."""
     from .validate_conventions import CheckResult, Severity
 
+    file_path = source.path
     results = []
     name = file_path.name.lower()
 
@@ -28,18 +37,14 @@ def check_file(file_path: Path) -> list:
     if name != "dockerfile" and not name.endswith(".dockerfile"):
         return results
 
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    content = source.text
+    if content is None:
         return results
 
     # Check for Alpine base image
-    if ALPINE_PATTERN.search(content):
-        line_num = 1
-        for i, line in enumerate(content.splitlines(), 1):
-            if ALPINE_PATTERN.search(line):
-                line_num = i
-                break
+    alpine = ALPINE_PATTERN.search(content)
+    if alpine:
+        line_num = source.line_of(alpine.start())
         results.append(
             CheckResult(
                 check_name="docker",
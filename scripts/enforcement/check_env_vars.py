@@ -7,6 +7,8 @@ Detects environment variable violations that break Docker/VPS deployments.
 import re
 from pathlib import Path
 
+from .scanner import MultiPattern, SourceFile, any_of
+
 # Patterns that indicate hardcoded localhost
 HARDCODED_PATTERNS = [
     (
@@ -20,24 +22,37 @@ HARDCODED_PATTERNS = [
 ]
 
 # Patterns that indicate proper usage (allowlist) - must be specific
+# Argument scans stop at "(" as well as ")" and the comment pattern is anchored,
+# so no two attempts rescan the same text (linear even on adversarial lines)
 ALLOWED_CONTEXTS = [
-    r"os\.getenv\s*\([^)]*,\s*['\"]localhost",  # os.getenv('VAR', 'localhost') default
-    r"os\.environ\.get\s*\([^)]*,\s*['\"]localhost",  # os.environ.get default
-    r"#\s*.*localhost",  # Comments with localhost
+    r"os\.getenv\s*\([^()]*,\s*['\"]localhost",  # os.getenv('VAR', 'localhost') default
+    r"os\.environ\.get\s*\([^()]*,\s*['\"]localhost",  # os.environ.get default
+    r"^[^#]*#.*localhost",  # Comments with localhost
     r"^\s*#",  # Line starting with comment
     r"\.env\.example",  # Example env files
     r"#\s*noqa",  # noqa comments
 ]
 
+# Every hardcoded pattern matches one of these
+HARDCODED_LITERALS = ("localhost", "127.0.0.1")
+HARDCODED = MultiPattern(((p, d, HARDCODED_LITERALS) for p, d in HARDCODED_PATTERNS), re.IGNORECASE)
+ALLOWED_RE = any_of(ALLOWED_CONTEXTS, re.IGNORECASE)
+
 
 def check_file(file_path: Path) -> list:
     """Check a file for hardcoded localhost patterns.
 
     Returns list of CheckResult objects.
     """
+    return check_source(SourceFile(file_path))
+
+
+def check_source(source: SourceFile) -> list:
+    """Check an already-opened file for hardcoded localhost patterns."""
     # Import here to avoid circular imports
     from .validate_conventions import CheckResult, Severity
 
+    file_path = source.path
     results: list[CheckResult] = []
 
     # Check Python, TypeScript, JavaScript files
@@ -48,21 +63,21 @@ def check_file(file_path: Path) -> list:
     if "test" in file_path.name.lower() or "spec" in file_path.name.lower():
         return results
 
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    patterns = HARDCODED.candidates(source)
+    if not patterns:
         return results
 
-    lines = content.splitlines()
+    for line_num, line in enumerate(source.lines, 1):
+        if not HARDCODED.occurs_in(line.lower()):
+            continue
 
-    for line_num, line in enumerate(lines, 1):
         # Skip if line contains allowed pattern
-        if any(re.search(pattern, line, re.IGNORECASE) for pattern in ALLOWED_CONTEXTS):
+        if ALLOWED_RE.search(line):
             continue
 
         # Check for violations
-        for pattern, description in HARDCODED_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
+        for pattern, description in patterns:
+            if pattern.search(line):
                 results.append(
                     CheckResult(
                         check_name="env_vars",
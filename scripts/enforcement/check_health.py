@@ -1,56 +1,119 @@
 #!/usr/bin/env python3
-"""Check that health endpoints test actual dependencies."""
+"""Check that health endpoints test actual dependencies.
 
+Health routes are found on the syntax tree rather than with multi-line
+regexes, which backtracked quadratically on large generated files. A
+route is flagged when it returns a {"status": ...} dict without awaiting
+anything or calling a probe (execute/query/ping). Files that do not parse
+are skipped.
+"""
+
+import ast
 import re
 from pathlib import Path
 
-FAKE_HEALTH_PATTERN = re.compile(
-    r'@(?:app|router)\.(?:get|route)\s*\(\s*[\'"]/?health[\'"]', re.IGNORECASE
-)
+from .scanner import SourceFile
+
+ROUTE_DECORATORS = ("get", "route", "api_route")
+HEALTH_PATHS = ("health", "/health")
+# Calls that test a dependency, as in db.execute("SELECT 1") or redis.ping()
+PROBE_CALLS = ("execute", "query", "ping")
+# Only files with both a route decorator and a health path literal are parsed
+ROUTE_DECORATOR_HINT = re.compile(r"@[\w.]*\.(?:get|route|api_route)\(")
+HEALTH_PATH_HINT = re.compile(r"""['"]/?health['"]""")
+
+
+def is_health_route(func: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
+    """True if func is decorated with @<app>.get/route/api_route("/health")."""
+    for decorator in func.decorator_list:
+        if not (
+            isinstance(decorator, ast.Call)
+            and isinstance(decorator.func, ast.Attribute)
+            and decorator.func.attr in ROUTE_DECORATORS
+        ):
+            continue
+        paths = decorator.args[:1] + [k.value for k in decorator.keywords if k.arg == "path"]
+        if any(isinstance(p, ast.Constant) and p.value in HEALTH_PATHS for p in paths):
+            return True
+    return False
+
+
+def probes_dependency(node: ast.AST) -> bool:
+    """True if node awaits something or calls a probe such as db.execute() or redis.ping()."""
+    if isinstance(node, ast.Await):
+        return True
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    name = (func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", "")).lower()
+    return (
+        name in PROBE_CALLS
+        or ("check" in name and "connection" in name)
+        or ("test" in name and "db" in name)
+    )
+
+
+def returns_status_unchecked(func: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
+    """True if func returns a {"status": ...} dict without probing a dependency.
 
-GOOD_PATTERNS = [
-    r"await\s+.*(?:execute|query|ping)",
-    r"SELECT\s+1",
-    r"\.ping\(",
-    r"check.*connection",
-    r"test.*db",
-]
+    Awaits and probe calls count anywhere, including inside the returned value.
+    Other calls (logging, timestamps) do not.
+    """
+    returns_status = False
+    stack: list[ast.AST] = list(func.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Return):
+            value = node.value
+            if isinstance(value, ast.Dict) and any(
+                isinstance(k, ast.Constant) and k.value == "status" for k in value.keys
+            ):
+                returns_status = True
+        if probes_dependency(node):
+            return False
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            stack.extend(ast.iter_child_nodes(node))
+    return returns_status
 
 
 def check_file(file_path: Path) -> list:
     """Check health endpoints test dependencies."""
+    return check_source(SourceFile(file_path))
+
+
+def check_source(source: SourceFile) -> list:
+    """Check health endpoints in an already-opened file."""
     from .validate_conventions import CheckResult, Severity
 
+    file_path = source.path
     results = []
     if file_path.suffix.lower() != ".py":
         return results
     if "test" in file_path.name.lower():
         return results
 
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    content = source.text
+    if content is None or not HEALTH_PATH_HINT.search(content):
+        return results
+    if not ROUTE_DECORATOR_HINT.search(content):
         return results
 
-    # Find health endpoint definitions
-    for match in FAKE_HEALTH_PATTERN.finditer(content):
-        start = match.start()
-        # Get the function body (next 20 lines or until next decorator)
-        end_search = content[start : start + 1000]
-
-        # Check if any good pattern exists in this section
-        has_dep_check = any(re.search(p, end_search, re.I) for p in GOOD_PATTERNS)
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError, MemoryError, RecursionError):  # Incl. too deeply nested
+        return results
 
-        # Check for simple return {"status": "ok"} without dependency check
-        if not has_dep_check and re.search(r'return\s+\{[\'"]status[\'"]', end_search):
-            line_num = content[:start].count("\n") + 1
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if is_health_route(node) and returns_status_unchecked(node):
             results.append(
                 CheckResult(
                     check_name="health",
                     severity=Severity.WARN,
                     message="Health endpoint may not test dependencies",
                     file_path=str(file_path),
-                    line_number=line_num,
+                    line_number=node.decorator_list[0].lineno,
                     fix_hint="Add DB/Redis ping: await db.execute('SELECT 1')",
                 )
             )
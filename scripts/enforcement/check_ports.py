@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
-"""Check port registration in PORTS.md and validate port ranges."""
+"""Check port registration in PORTS.md and validate port ranges.
+
+PORTS.md is parsed once per process (see port_registry.load_registry()).
+"""
 
 import re
 from pathlib import Path
 
+from .port_registry import load_registry
+from .scanner import SourceFile
+
 # Patterns for SERVICE ports (not client connection ports)
 # Matches: PORT=8000, port: 8000, EXPOSE 8000
 # Excludes: DB_PORT, REDIS_PORT, etc. (client connections)
@@ -20,10 +26,24 @@ PORT_RANGES = {
 }
 
 
+def registry_path(file_path: Path) -> Path:
+    """PORTS.md that file_path's ports are checked against."""
+    ports_md = file_path.parent / "PORTS.md"
+    if not ports_md.exists():
+        ports_md = Path("/opt/fabrik/PORTS.md")
+    return ports_md
+
+
 def check_file(file_path: Path) -> list:
     """Check if ports are registered in PORTS.md."""
+    return check_source(SourceFile(file_path))
+
+
+def check_source(source: SourceFile) -> list:
+    """Check if ports in an already-opened file are registered in PORTS.md."""
     from .validate_conventions import CheckResult, Severity
 
+    file_path = source.path
     results = []
     suffix = file_path.suffix.lower()
     name = file_path.name.lower()
@@ -32,9 +52,8 @@ def check_file(file_path: Path) -> list:
     if suffix not in (".py", ".yaml", ".yml", ".ts", ".tsx", ".js") and name != "dockerfile":
         return results
 
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    content = source.text
+    if content is None:
         return results
 
     # Find ports in file (service ports only, not client connections)
@@ -49,18 +68,10 @@ def check_file(file_path: Path) -> list:
         return results
 
     # Check if PORTS.md exists and contains these ports
-    ports_md = file_path.parent / "PORTS.md"
-    if not ports_md.exists():
-        ports_md = Path("/opt/fabrik/PORTS.md")
+    ports_md = registry_path(file_path)
 
-    registered_ports = set()
-    if ports_md.exists():
-        try:
-            ports_content = ports_md.read_text()
-            for match in re.finditer(r"\b(\d{4,5})\b", ports_content):
-                registered_ports.add(int(match.group(1)))
-        except (OSError, UnicodeDecodeError):
-            pass
+    registry = load_registry(ports_md)
+    registered_ports = registry.mentioned if registry else frozenset()
 
     # Report unregistered ports
     for port in ports_found - registered_ports:
@@ -4,9 +4,13 @@
 import re
 from pathlib import Path
 
+from .scanner import MultiPattern, SourceFile, any_of
+
+# Runs before a required character are bounded ({0,64}, {1,256}): unbounded,
+# they were rescanned from every candidate start (quadratic on long lines)
 SECRET_PATTERNS = [
     (r"AKIA[0-9A-Z]{16}", "AWS Access Key ID"),
-    (r"(?:aws_secret|AWS_SECRET)[^=]*=\s*['\"][A-Za-z0-9/+=]{40}['\"]", "AWS Secret Key"),
+    (r"(?:aws_secret|AWS_SECRET)[^=\n]{0,64}=\s*['\"][A-Za-z0-9/+=]{40}['\"]", "AWS Secret Key"),
     (r"AIza[0-9A-Za-z\-_]{35}", "Google API Key"),
     (r"sk-[a-zA-Z0-9]{32,}", "OpenAI API Key"),
     (r"sk-ant-[a-zA-Z0-9\-]{32,}", "Anthropic API Key"),
@@ -14,8 +18,8 @@ SECRET_PATTERNS = [
     (r"gho_[a-zA-Z0-9]{36}", "GitHub OAuth Token"),
     (r"sk_live_[a-zA-Z0-9]{24,}", "Stripe Live Key"),
     (r"rk_live_[a-zA-Z0-9]{24,}", "Stripe Restricted Key"),
-    (r"postgresql://[^:]+:[^@\s]+@", "DB URL with password"),
-    (r"mongodb(\+srv)?://[^:]+:[^@\s]+@", "MongoDB URL with password"),
+    (r"postgresql://[^:]{1,256}:[^@\s]{1,256}@", "DB URL with password"),
+    (r"mongodb(\+srv)?://[^:]{1,256}:[^@\s]{1,256}@", "MongoDB URL with password"),
     (r"-----BEGIN (?:RSA |DSA |EC |OPENSSH )?PRIVATE KEY-----", "Private Key"),
     (r"Bearer\s+[a-zA-Z0-9\-_\.]{20,}", "Bearer Token"),
     (r'(?:password|secret|api_key|token)\s*[:=]\s*[\'"][^\'"]{8,}[\'"]', "Hardcoded credential"),
@@ -29,26 +33,48 @@ SKIP_PATTERNS = [
     r"check_secrets\.py$",  # Skip self to avoid false positives on patterns
 ]
 
+# Literals (lower-case) at least one of which occurs in every match
+SECRET_LITERALS = {
+    "AWS Access Key ID": ("akia",),
+    "AWS Secret Key": ("aws_secret",),
+    "Google API Key": ("aiza",),
+    "OpenAI API Key": ("sk-",),
+    "Anthropic API Key": ("sk-ant-",),
+    "GitHub PAT": ("ghp_",),
+    "GitHub OAuth Token": ("gho_",),
+    "Stripe Live Key": ("sk_live_",),
+    "Stripe Restricted Key": ("rk_live_",),
+    "DB URL with password": ("postgresql://",),
+    "MongoDB URL with password": ("mongodb",),
+    "Private Key": ("private key-----",),
+    "Bearer Token": ("bearer",),
+    "Hardcoded credential": ("password", "secret", "api_key", "token"),
+}
+SECRETS = MultiPattern(((p, d, SECRET_LITERALS[d]) for p, d in SECRET_PATTERNS), re.I)
+SKIP_RE = any_of(SKIP_PATTERNS, re.I)
+
 
 def check_file(file_path: Path) -> list:
     """Check a file for hardcoded secrets."""
+    return check_source(SourceFile(file_path))
+
+
+def check_source(source: SourceFile) -> list:
+    """Check an already-opened file for hardcoded secrets."""
     from .validate_conventions import CheckResult, Severity
 
+    file_path = source.path
     results = []
-    if any(re.search(p, str(file_path), re.I) for p in SKIP_PATTERNS):
+    if SKIP_RE.search(str(file_path)):
         return results
     if file_path.suffix.lower() in (".jpg", ".png", ".gif", ".pdf", ".zip"):
         return results
 
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
-        return results
-
-    lines = content.splitlines()
-    for pattern, desc in SECRET_PATTERNS:
-        for match in re.finditer(pattern, content, re.I):
-            line_num = content[: match.start()].count("\n") + 1
+    content = source.text
+    lines = source.lines
+    for pattern, desc in SECRETS.candidates(source):
+        for match in pattern.finditer(content):
+            line_num = source.line_of(match.start())
             # Skip lines with noqa comments
             if line_num <= len(lines) and "noqa" in lines[line_num - 1]:
                 continue
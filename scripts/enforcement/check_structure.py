@@ -2,11 +2,22 @@
 """Enforce project documentation structure.
 
 Ensures documents are placed in the correct locations per Fabrik conventions.
+
+Without file arguments the whole project is checked incrementally: the
+results for the last validated commit are kept in a snapshot
+(.factory/cache/structure.json), and only .md files added or removed
+since then (per `git diff --name-status` and `git status`) are
+re-evaluated.
 """
 
+import hashlib
+import json
+import subprocess
 import sys
 from pathlib import Path
 
+SNAPSHOT_FILE = Path(".factory") / "cache" / "structure.json"
+
 # Allowed .md files in project root
 ALLOWED_ROOT_MD = {
     "README.md",
@@ -50,24 +61,240 @@ LEGACY_DIRS = {
 }
 
 
-def check_structure(project_root: Path, files: list[str] | None = None) -> list[dict]:
+def check_path(rel_path: Path) -> dict | None:
+    """Violation for a .md file at rel_path (relative to the project root), if any.
+
+    Depends on the path alone, so a file's result only changes when it is
+    added, removed or renamed.
+    """
+    # Skip hidden directories (except .windsurf, .droid)
+    parts = rel_path.parts
+    if any(p.startswith(".") and p not in {".windsurf", ".droid"} for p in parts):
+        return None
+    if "node_modules" in parts or "__pycache__" in parts:
+        return None
+
+    # Flag forbidden directories as errors (not skip!)
+    forbidden_dir = next((p for p in parts if p in NO_MD_DIRS), None)
+    if forbidden_dir:
+        return {
+            "file": str(rel_path),
+            "severity": "error",
+            "message": f"Markdown file forbidden in '{forbidden_dir}/' directory",
+            "fix_hint": "Move to docs/reference/ or docs/guides/",
+        }
+
+    # Check root-level .md files
+    if len(parts) == 1:
+        filename = parts[0]
+        if filename not in ALLOWED_ROOT_MD:
+            return {
+                "file": str(rel_path),
+                "severity": "error",
+                "message": f"Markdown file '{filename}' not allowed in project root",
+                "fix_hint": f"Move to docs/reference/{filename} or docs/guides/{filename}",
+            }
+
+    # Check docs/ structure
+    elif parts[0] == "docs":
+        if len(parts) == 2:
+            # File directly in docs/ - only INDEX.md allowed
+            filename = parts[1]
+            if filename not in {
+                "INDEX.md",
+                "QUICKSTART.md",
+                "CONFIGURATION.md",
+                "TROUBLESHOOTING.md",
+                "BUSINESS_MODEL.md",
+                "SERVICES.md",
+                "FABRIK_OVERVIEW.md",
+                "ENVIRONMENT_VARIABLES.md",
+            }:
+                return {
+                    "file": str(rel_path),
+                    "severity": "warning",
+                    "message": f"'{filename}' should be in a docs/ subdirectory",
+                    "fix_hint": f"Move to docs/reference/{filename} or docs/guides/{filename}",
+                }
+        elif len(parts) >= 3:
+            subdir = parts[1]
+            if subdir not in VALID_DOCS_SUBDIRS:
+                return {
+                    "file": str(rel_path),
+                    "severity": "warning",
+                    "message": f"Non-standard docs subdirectory: docs/{subdir}/",
+                    "fix_hint": f"Use one of: {', '.join(sorted(VALID_DOCS_SUBDIRS))}",
+                }
+
+    # Check legacy directories
+    elif parts[0] in LEGACY_DIRS:
+        return {
+            "file": str(rel_path),
+            "severity": "warning",
+            "message": f"Legacy directory '{parts[0]}/' should be migrated",
+            "fix_hint": "Move to docs/development/plans/ or docs/archive/",
+        }
+
+    # Check templates (allowed)
+    elif parts[0] == "templates":
+        pass  # Templates are allowed anywhere
+
+    # Check .droid (allowed for task files)
+    elif parts[0] == ".droid":
+        pass  # Droid task files allowed
+
+    # Check .windsurf (allowed for rule files)
+    elif parts[0] == ".windsurf":
+        pass  # Windsurf rule files allowed
+
+    # Other locations
+    else:
+        return {
+            "file": str(rel_path),
+            "severity": "error",
+            "message": f"Markdown file in unexpected location: {rel_path}",
+            "fix_hint": "Move to docs/ subdirectory or project root (if allowed)",
+        }
+
+    return None
+
+
+def _git(project_root: Path, *args: str) -> str | None:
+    """Output of a git command in project_root, or None if it fails."""
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=project_root, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout
+
+
+def _rules_version() -> str:
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+def _committed_violations(project_root: Path, head: str, use_snapshot: bool) -> dict[str, dict]:
+    """Violations of the .md files committed at head, by path.
+
+    The snapshot records them for the last validated commit; moving to
+    another commit re-checks only the .md files the two commits' diff adds
+    or removes.
+    """
+    snapshot_path = project_root / SNAPSHOT_FILE
+    version = _rules_version()
+    snapshot = {}
+    if use_snapshot:
+        try:
+            snapshot = json.loads(snapshot_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            pass
+    if snapshot.get("version") == version and snapshot.get("head") == head:
+        return snapshot["violations"]
+
+    violations: dict[str, dict] | None = None
+    if snapshot.get("version") == version and snapshot.get("head"):
+        diff = _git(
+            project_root,
+            "diff",
+            "--name-status",
+            "--no-renames",
+            "--relative",
+            "-z",
+            snapshot["head"],
+            head,
+            "--",
+            "*.md",
+        )
+        if diff is not None:
+            violations = dict(snapshot["violations"])
+            fields = diff.split("\0")
+            for status, name in zip(fields[::2], fields[1::2], strict=False):
+                violations.pop(name, None)
+                if status != "D" and (violation := check_path(Path(name))):
+                    violations[name] = violation
+
+    if violations is None:
+        listing = _git(project_root, "ls-tree", "-r", "-z", "--name-only", head) or ""
+        violations = {
+            name: violation
+            for name in listing.split("\0")
+            if name.endswith(".md") and (violation := check_path(Path(name)))
+        }
+
+    if use_snapshot:
+        try:
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            snapshot_path.write_text(
+                json.dumps({"version": version, "head": head, "violations": violations})
+            )
+        except OSError:
+            pass
+    return violations
+
+
+def check_tree(project_root: Path, use_snapshot: bool = True) -> list[dict] | None:
+    """Violations of every .md file git does not ignore, or None outside a git repo.
+
+    Starts from the committed files' violations (see _committed_violations)
+    and re-checks only the .md files `git status` reports as changed or
+    untracked, so a run costs time proportional to the diff.
+    """
+    # Prints the project's path within the repository, then the HEAD commit
+    revision = _git(project_root, "rev-parse", "--show-prefix", "HEAD")
+    if revision is None:
+        return None
+    prefix, head = revision.split("\n")[:2]
+
+    violations = dict(_committed_violations(project_root, head, use_snapshot))
+    status = _git(
+        project_root,
+        "status",
+        "--porcelain",
+        "-z",
+        "--untracked-files=all",
+        "--no-renames",
+        "--",
+        "*.md",
+    )
+    for entry in (status or "").split("\0"):
+        if not entry:
+            continue
+        name = entry[3:].removeprefix(prefix)  # Status paths are repository-relative
+        violations.pop(name, None)
+        if (project_root / name).is_file() and (violation := check_path(Path(name))):
+            violations[name] = violation
+    return [violations[name] for name in sorted(violations)]
+
+
+def check_structure(
+    project_root: Path, files: list[str] | None = None, use_snapshot: bool = True
+) -> list[dict]:
     """Check project structure for violations.
 
     Args:
         project_root: Root directory of the project
         files: Optional list of files to check (for pre-commit).
                If None, checks entire project.
+        use_snapshot: Reuse the last validated commit's results (whole-project
+               checks in a git repo only)
 
     Returns:
         List of violation dicts with keys: file, severity, message, fix_hint
     """
+    if not files:
+        # Whole project: every .md file git does not ignore, incrementally
+        violations = check_tree(project_root, use_snapshot)
+        if violations is not None:
+            return violations
+
     violations = []
 
     if files:
         # Check only specified files
         paths_to_check = [Path(f) for f in files if f.endswith(".md")]
     else:
-        # Check all .md files in project
+        # Not a git repository: check all .md files in project
         paths_to_check = list(project_root.rglob("*.md"))
 
     for path in paths_to_check:
@@ -80,107 +307,9 @@ def check_structure(project_root: Path, files: list[str] | None = None) -> list[
         else:
             rel_path = path
 
-        # Skip hidden directories (except .windsurf, .droid)
-        parts = rel_path.parts
-        if any(p.startswith(".") and p not in {".windsurf", ".droid"} for p in parts):
-            continue
-        if "node_modules" in parts or "__pycache__" in parts:
-            continue
-
-        # Flag forbidden directories as errors (not skip!)
-        forbidden_dir = next((p for p in parts if p in NO_MD_DIRS), None)
-        if forbidden_dir:
-            violations.append(
-                {
-                    "file": str(rel_path),
-                    "severity": "error",
-                    "message": f"Markdown file forbidden in '{forbidden_dir}/' directory",
-                    "fix_hint": "Move to docs/reference/ or docs/guides/",
-                }
-            )
-            continue
-
-        # Check root-level .md files
-        if len(parts) == 1:
-            filename = parts[0]
-            if filename not in ALLOWED_ROOT_MD:
-                violations.append(
-                    {
-                        "file": str(rel_path),
-                        "severity": "error",
-                        "message": f"Markdown file '{filename}' not allowed in project root",
-                        "fix_hint": f"Move to docs/reference/{filename} or docs/guides/{filename}",
-                    }
-                )
-
-        # Check docs/ structure
-        elif parts[0] == "docs":
-            if len(parts) == 2:
-                # File directly in docs/ - only INDEX.md allowed
-                filename = parts[1]
-                if filename not in {
-                    "INDEX.md",
-                    "QUICKSTART.md",
-                    "CONFIGURATION.md",
-                    "TROUBLESHOOTING.md",
-                    "BUSINESS_MODEL.md",
-                    "SERVICES.md",
-                    "FABRIK_OVERVIEW.md",
-                    "ENVIRONMENT_VARIABLES.md",
-                }:
-                    violations.append(
-                        {
-                            "file": str(rel_path),
-                            "severity": "warning",
-                            "message": f"'{filename}' should be in a docs/ subdirectory",
-                            "fix_hint": f"Move to docs/reference/{filename} or docs/guides/{filename}",
-                        }
-                    )
-            elif len(parts) >= 3:
-                subdir = parts[1]
-                if subdir not in VALID_DOCS_SUBDIRS:
-                    violations.append(
-                        {
-                            "file": str(rel_path),
-                            "severity": "warning",
-                            "message": f"Non-standard docs subdirectory: docs/{subdir}/",
-                            "fix_hint": f"Use one of: {', '.join(sorted(VALID_DOCS_SUBDIRS))}",
-                        }
-                    )
-
-        # Check legacy directories
-        elif parts[0] in LEGACY_DIRS:
-            violations.append(
-                {
-                    "file": str(rel_path),
-                    "severity": "warning",
-                    "message": f"Legacy directory '{parts[0]}/' should be migrated",
-                    "fix_hint": "Move to docs/development/plans/ or docs/archive/",
-                }
-            )
-
-        # Check templates (allowed)
-        elif parts[0] == "templates":
-            pass  # Templates are allowed anywhere
-
-        # Check .droid (allowed for task files)
-        elif parts[0] == ".droid":
-            pass  # Droid task files allowed
-
-        # Check .windsurf (allowed for rule files)
-        elif parts[0] == ".windsurf":
-            pass  # Windsurf rule files allowed
-
-        # Other locations
-        else:
-            violations.append(
-                {
-                    "file": str(rel_path),
-                    "severity": "error",
-                    "message": f"Markdown file in unexpected location: {rel_path}",
-                    "fix_hint": "Move to docs/ subdirectory or project root (if allowed)",
-                }
-            )
+        violation = check_path(rel_path)
+        if violation:
+            violations.append(violation)
 
     return violations
 
@@ -195,13 +324,18 @@ def main() -> int:
         "--project-root", type=Path, default=Path.cwd(), help="Project root directory"
     )
     parser.add_argument("--strict", action="store_true", help="Treat warnings as errors")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Re-check every file, ignoring the snapshot"
+    )
     args = parser.parse_args()
 
     project_root = args.project_root
     if not project_root.is_absolute():
         project_root = Path.cwd() / project_root
 
-    violations = check_structure(project_root, args.files if args.files else None)
+    violations = check_structure(
+        project_root, args.files if args.files else None, use_snapshot=not args.no_cache
+    )
 
     if not violations:
         print("✓ Project structure OK")
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""Parsed PORTS.md registry and repo-wide port collision report.
+
+load_registry() parses a PORTS.md once per process into port ranges and
+allocations (port -> service, project, environment) and re-parses it only
+when its mtime or size changes, so check_ports can consult it for every
+file of a diff.
+
+The collision report cross-checks the registry with the host ports
+published by every compose file in the repository (apps, templates and
+the root project). Services sharing a registered port only collide when a
+compose file publishes it on the host; otherwise they are internal
+container ports routed by Traefik and are listed for information:
+
+    python -m scripts.enforcement.port_registry            # Text report
+    python -m scripts.enforcement.port_registry --json
+
+Exit codes: 0 = no collisions, 1 = collisions found.
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+# Any 4-5 digit number in PORTS.md counts as registered (check_ports semantics)
+MENTION_PATTERN = re.compile(r"\b(\d{4,5})\b")
+RANGE_PATTERN = re.compile(r"^(\d{2,5})(?:\s*-\s*(\d{2,5}))?$")
+ENVIRONMENT_PATTERN = re.compile(r"\(([^)]*?)(?:\s+only)?\)", re.IGNORECASE)
+
+# Published host ports in compose files: "8080:80", "127.0.0.1:8080:80/tcp",
+# "${PORT:-8080}:80" and the long form "published: 8080"
+PUBLISHED_PATTERN = re.compile(
+    r"""^\s*-\s*["']?(?:[\d.]+:)?(?:(\d{2,5})|\$\{\w+:-(\d{2,5})\}):\d{2,5}(?:/\w+)?["']?\s*$"""
+    r"""|^\s*published:\s*["']?(\d{2,5})""",
+    re.MULTILINE,
+)
+COMPOSE_NAME_PATTERN = re.compile(r"^(?:docker-)?compose[\w.-]*\.ya?ml(?:\.j2|\.template)?$")
+
+
+@dataclass(frozen=True)
+class PortRange:
+    """A row of the Port Ranges table."""
+
+    start: int
+    end: int
+    purpose: str
+    environment: str
+
+
+@dataclass(frozen=True)
+class PortAllocation:
+    """A row of an allocation table."""
+
+    port: int
+    service: str
+    owner: str  # Project column (or Notes when there is none)
+    environment: str  # From the section heading, e.g. "VPS" or "WSL"
+    line: int
+
+
+@dataclass
+class PortRegistry:
+    """Ranges and allocations of one PORTS.md."""
+
+    path: Path
+    ranges: list[PortRange] = field(default_factory=list)
+    allocations: dict[int, list[PortAllocation]] = field(default_factory=dict)
+    mentioned: frozenset[int] = frozenset()
+
+    def is_registered(self, port: int) -> bool:
+        """True if PORTS.md mentions port anywhere."""
+        return port in self.mentioned
+
+    def range_for(self, port: int) -> PortRange | None:
+        """The first declared range containing port."""
+        return next((r for r in self.ranges if r.start <= port <= r.end), None)
+
+    def conflicts(self) -> dict[int, list[PortAllocation]]:
+        """Ports allocated to more than one service in the same environment."""
+        conflicts: dict[int, list[PortAllocation]] = {}
+        for port, allocations in self.allocations.items():
+            by_environment: dict[str, list[PortAllocation]] = {}
+            for allocation in allocations:
+                by_environment.setdefault(allocation.environment, []).append(allocation)
+            for group in by_environment.values():
+                if len({a.service for a in group}) > 1:
+                    conflicts.setdefault(port, []).extend(group)
+        return conflicts
+
+
+def _cells(line: str) -> list[str]:
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def parse_registry(path: Path, content: str) -> PortRegistry:
+    """Parse the markdown tables of a PORTS.md."""
+    registry = PortRegistry(path, mentioned=frozenset(map(int, MENTION_PATTERN.findall(content))))
+    environment = ""
+    header: list[str] | None = None
+    for line_number, line in enumerate(content.splitlines(), 1):
+        if line.startswith("#"):
+            match = ENVIRONMENT_PATTERN.search(line)
+            environment = match.group(1) if match else ""
+            header = None
+            continue
+        if not line.startswith("|"):
+            header = None
+            continue
+        cells = _cells(line)
+        if header is None:
+            header = [cell.lower() for cell in cells]
+            continue
+        if set("".join(cells)) <= set("-: "):
+            continue  # Separator row
+        row = dict(zip(header, cells, strict=False))
+
+        if "range" in row and (match := RANGE_PATTERN.match(row["range"])):
+            start = int(match.group(1))
+            registry.ranges.append(
+                PortRange(
+                    start,
+                    int(match.group(2) or start),
+                    row.get("purpose", ""),
+                    row.get("environment", environment),
+                )
+            )
+        elif row.get("port", "").isdigit():
+            port = int(row["port"])
+            registry.allocations.setdefault(port, []).append(
+                PortAllocation(
+                    port,
+                    row.get("service", ""),
+                    row.get("project") or row.get("notes", ""),
+                    environment,
+                    line_number,
+                )
+            )
+    return registry
+
+
+_registry_cache: dict[Path, tuple[tuple[int, int], PortRegistry]] = {}
+
+
+def load_registry(path: Path) -> PortRegistry | None:
+    """The parsed registry at path, or None if it cannot be read.
+
+    Parsed once per process; re-parsed when the file's mtime or size changes.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _registry_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    try:
+        registry = parse_registry(path, path.read_text())
+    except (OSError, UnicodeDecodeError):
+        return None
+    _registry_cache[path] = (stamp, registry)
+    return registry
+
+
+def published_ports(content: str) -> set[int]:
+    """Host ports a compose file publishes."""
+    return {int(next(g for g in m.groups() if g)) for m in PUBLISHED_PATTERN.finditer(content)}
+
+
+def compose_files(root: Path) -> list[Path]:
+    """Compose files (and compose templates) git does not ignore under root."""
+    try:
+        names = subprocess.run(
+            ["git", "ls-files", "--cached", "--others", "--exclude-standard", "-z"],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split("\0")
+    except (OSError, subprocess.CalledProcessError):
+        names = [str(p.relative_to(root)) for p in root.rglob("*compose*.y*ml*")]
+    return [
+        root / name
+        for name in names
+        if COMPOSE_NAME_PATTERN.match(Path(name).name) and (root / name).is_file()
+    ]
+
+
+def collision_report(root: Path, registry_file: Path | None = None) -> dict:
+    """Registry conflicts on published ports and host ports published by more than one project."""
+    started = time.perf_counter()
+    root = root.resolve()
+    registry = load_registry(registry_file or root / "PORTS.md")
+
+    publishers: dict[int, set[str]] = {}
+    files = compose_files(root)
+    for path in files:
+        try:
+            ports = published_ports(path.read_text())
+        except (OSError, UnicodeDecodeError):
+            continue
+        project = str(path.parent.relative_to(root)) if path.parent != root else "."
+        for port in ports:
+            publishers.setdefault(port, set()).add(project)
+
+    published = {
+        port: {
+            "projects": sorted(projects),
+            "registered_to": [
+                a.service for a in (registry.allocations.get(port, []) if registry else [])
+            ],
+        }
+        for port, projects in sorted(publishers.items())
+    }
+    conflicts = {
+        port: [asdict(a) for a in allocations]
+        for port, allocations in sorted(registry.conflicts().items() if registry else [])
+    }
+    return {
+        "registry": str(registry.path) if registry else None,
+        "compose_files": len(files),
+        "registry_conflicts": {
+            port: allocations for port, allocations in conflicts.items() if port in publishers
+        },
+        # Same-environment duplicates no compose file publishes: internal ports
+        "registry_shared": {
+            port: allocations for port, allocations in conflicts.items() if port not in publishers
+        },
+        "published_collisions": {
+            port: entry for port, entry in published.items() if len(entry["projects"]) > 1
+        },
+        "unregistered_published": [
+            port for port in published if registry is None or not registry.is_registered(port)
+        ],
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+def format_report(report: dict) -> str:
+    """Human-readable collision report."""
+    lines = [
+        f"Port collision report: {report['compose_files']} compose files, "
+        f"registry {report['registry'] or '(none)'} ({report['elapsed_ms']}ms)",
+    ]
+    sections = (
+        ("registry_conflicts", "PORTS.md allocations sharing a published host port:"),
+        ("registry_shared", "PORTS.md allocations sharing an unpublished (internal) port:"),
+    )
+    for key, title in sections:
+        if report[key]:
+            lines.append(f"\n{title}")
+        for port, allocations in report[key].items():
+            services = ", ".join(f"{a['service']} ({a['owner']})" for a in allocations)
+            lines.append(f"  {port} [{allocations[0]['environment'] or '-'}]: {services}")
+    if report["published_collisions"]:
+        lines.append("\nHost ports published by more than one project:")
+        for port, entry in report["published_collisions"].items():
+            lines.append(f"  {port}: {', '.join(entry['projects'])}")
+    if report["unregistered_published"]:
+        ports = ", ".join(map(str, report["unregistered_published"]))
+        lines.append(f"\nPublished ports missing from PORTS.md: {ports}")
+    if not report["registry_conflicts"] and not report["published_collisions"]:
+        lines.append("\nNo collisions.")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Report port collisions across the repository")
+    parser.add_argument("--root", type=Path, default=Path.cwd(), help="Repository root")
+    parser.add_argument("--registry", type=Path, help="PORTS.md to use (default: <root>/PORTS.md)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    report = collision_report(args.root, args.registry)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 1 if report["registry_conflicts"] or report["published_collisions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
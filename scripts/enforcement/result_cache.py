@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Per-file convention results, cached by content hash and rule-set version.
+
+A cache entry holds the findings run_all_checks() produced for one file.
+Its key hashes the file path, the file's content and whatever else the
+checks read for that file (see validate_conventions.cache_context()).
+The rule-set version hashes the enforcement package source, so editing
+any check invalidates every entry. Entries live in one JSON file per
+rule-set version under .factory/cache/conventions/.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+CACHE_DIR = Path(".factory") / "cache" / "conventions"
+
+
+def rule_set_version() -> str:
+    """Hash of the check implementations and the settings they read."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    digest.update(os.getenv("FABRIK_ROOT", "").encode())
+    return digest.hexdigest()[:16]
+
+
+class ResultCache:
+    """Findings per cache key, loaded once and written back by save()."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, version: str | None = None) -> None:
+        self.cache_dir = cache_dir
+        self.version = version or rule_set_version()
+        self.path = cache_dir / f"{self.version}.json"
+        try:
+            self._entries: dict[str, list[dict]] = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError):
+            self._entries = {}
+        # Entries used by this run; save() keeps only these
+        self._used: dict[str, list[dict]] = {}
+        self.hits = 0
+
+    @staticmethod
+    def key(file_path: Path, context: str) -> str | None:
+        """Cache key of file_path's current content, or None if unreadable."""
+        try:
+            content = file_path.read_bytes()
+        except OSError:
+            return None
+        digest = hashlib.sha256(f"{file_path}\0{context}\0".encode())
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> list[dict] | None:
+        """Cached findings for key, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._used[key] = entry
+            self.hits += 1
+        return entry
+
+    def put(self, key: str, results: list[dict]) -> None:
+        """Record the findings for key."""
+        self._entries[key] = self._used[key] = results
+
+    def save(self) -> None:
+        """Write this run's entries and drop those of other rule-set versions."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self._used, separators=(",", ":")))
+            os.replace(tmp, self.path)
+            for stale in self.cache_dir.glob("*.json"):
+                if stale != self.path:
+                    stale.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"Warning: Could not save convention cache: {e}", file=sys.stderr)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Single-read file access and multi-pattern matching for the convention checks.
+
+run_all_checks() wraps each file in one SourceFile and hands it to every
+applicable check, so a file is read at most once however many checks
+apply. Checks run precompiled patterns: a MultiPattern skips every pattern
+whose required literals do not occur in the file, and match offsets map to
+line numbers through one newline index.
+"""
+
+import mmap
+import re
+from bisect import bisect_right
+from collections.abc import Iterable
+from functools import cached_property
+from pathlib import Path
+
+# Larger files are memory-mapped and decoded in place rather than read
+# into an intermediate bytes buffer first
+MMAP_THRESHOLD = 1 << 20
+
+_NEWLINE = re.compile("\n")
+
+
+def any_of(patterns: Iterable[str], flags: int = 0) -> re.Pattern[str]:
+    """Compile patterns into one alternation that matches wherever any of them does."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+class MultiPattern:
+    """Precompiled patterns behind a literal prefilter.
+
+    Each entry is (pattern, label, literals), where every match of pattern
+    contains at least one of literals (lower-case). candidates() lower-cases
+    the text once and keeps only the entries whose literals occur, so a file
+    without candidates costs a few substring searches rather than one regex
+    pass per pattern. A combined alternation cannot do this: with IGNORECASE
+    the regex engine tries every branch at every offset.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, str, tuple[str, ...]]], flags: int = 0) -> None:
+        self.entries = [(re.compile(p, flags), label, literals) for p, label, literals in entries]
+        self.literals = frozenset(lit for _, _, literals in self.entries for lit in literals)
+
+    def present(self, text: str) -> frozenset[str]:
+        """Literals that occur in text, which must already be lower-case."""
+        return frozenset(lit for lit in self.literals if lit in text)
+
+    def occurs_in(self, text: str) -> bool:
+        """True if any literal occurs in text, which must already be lower-case."""
+        return any(lit in text for lit in self.literals)
+
+    def candidates(self, source: "SourceFile") -> list[tuple[re.Pattern[str], str]]:
+        """(pattern, label) for each entry that can match source, in entry order."""
+        if source.lower is None:
+            return []
+        present = self.present(source.lower)
+        return [(p, label) for p, label, literals in self.entries if present.intersection(literals)]
+
+
+class SourceFile:
+    """A file's text, lines and newline index, each computed on first use."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @cached_property
+    def text(self) -> str | None:
+        """UTF-8 content with universal newlines, or None if unreadable."""
+        try:
+            if self.path.stat().st_size < MMAP_THRESHOLD:
+                return self.path.read_text(encoding="utf-8")
+            with (
+                open(self.path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            ):
+                text = str(mapped, "utf-8")
+            return text.replace("\r\n", "\n").replace("\r", "\n")
+        except (OSError, UnicodeDecodeError, ValueError):
+            return None
+
+    @cached_property
+    def lower(self) -> str | None:
+        """Lower-cased text for literal prefilters (offsets may differ from text)."""
+        return self.text.lower() if self.text is not None else None
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Content split into lines (empty if unreadable)."""
+        return self.text.splitlines() if self.text else []
+
+    @cached_property
+    def _line_starts(self) -> list[int]:
+        starts = [0]
+        starts.extend(match.end() for match in _NEWLINE.finditer(self.text or ""))
+        return starts
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number of a character offset into text."""
+        return bisect_right(self._line_starts, offset)
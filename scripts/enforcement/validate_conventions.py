@@ -6,6 +6,16 @@ Called by:
     - droid exec PostToolUse hooks
     - CI/CD pipelines
 
+Usage:
+    python -m scripts.enforcement.validate_conventions --strict <files>
+    python -m scripts.enforcement.validate_conventions --git-diff --json
+    python -m scripts.enforcement.validate_conventions --all --json   # Whole repo
+
+--all checks every file git does not ignore, fanned out over a process
+pool, and caches each file's findings in .factory/cache/conventions/ so
+files unchanged since the last --all run are not checked again. Findings
+are printed as they arrive, in JSON too.
+
 Exit codes:
     0 = pass
     1 = warn (non-blocking)
@@ -14,12 +24,27 @@ Exit codes:
 
 import argparse
 import json
+import os
 import subprocess
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import asdict, dataclass
 from enum import Enum
 from pathlib import Path
 
+from .result_cache import ResultCache
+from .scanner import SourceFile
+
+COMPOSE_FILES = ("compose.yaml", "compose.yml", "docker-compose.yaml", "docker-compose.yml")
+PORT_SUFFIXES = (".py", ".ts", ".tsx", ".js", ".yaml", ".yml")
+# Every suffix run_all_checks() has a check for (besides files named Dockerfile)
+CHECKED_SUFFIXES = frozenset(PORT_SUFFIXES) | {".jsx", ".dockerfile", ".md"}
+
+# Fewer files than this are checked in-process: pool startup would cost more
+PARALLEL_MIN_FILES = 32
+BATCH_SIZE = 16
+
 
 class Severity(Enum):
     PASS = "pass"
@@ -43,6 +68,10 @@ class CheckResult:
         result["severity"] = self.severity.value
         return result
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "CheckResult":
+        return cls(**{**data, "severity": Severity(data["severity"])})
+
 
 def run_check_env_vars(file_path: Path) -> list[CheckResult]:
     """Check for hardcoded localhost/127.0.0.1."""
@@ -94,17 +123,23 @@ def run_check_plans(file_path: Path) -> list[CheckResult]:
 
 
 def run_all_checks(file_path: Path) -> list[CheckResult]:
-    """Run all applicable checks for a file."""
+    """Run all applicable checks for a file.
+
+    Content checks share one SourceFile, so the file is read at most once.
+    """
+    from . import check_docker, check_env_vars, check_health, check_ports, check_secrets
+
     results: list[CheckResult] = []
+    source = SourceFile(file_path)
 
     suffix = file_path.suffix.lower()
     name = file_path.name.lower()
 
     # Python files
     if suffix == ".py":
-        results.extend(run_check_env_vars(file_path))
-        results.extend(run_check_secrets(file_path))
-        results.extend(run_check_health(file_path))
+        results.extend(check_env_vars.check_source(source))
+        results.extend(check_secrets.check_source(source))
+        results.extend(check_health.check_source(source))
         # Check for docs on new modules
         if name == "__init__.py":
             from .check_docs import check_file as check_docs
@@ -113,22 +148,22 @@ def run_all_checks(file_path: Path) -> list[CheckResult]:
 
     # TypeScript/JavaScript files
     if suffix in (".ts", ".tsx", ".js", ".jsx"):
-        results.extend(run_check_env_vars(file_path))
-        results.extend(run_check_secrets(file_path))
+        results.extend(check_env_vars.check_source(source))
+        results.extend(check_secrets.check_source(source))
 
     # Docker files
     if name == "dockerfile" or suffix == ".dockerfile":
-        results.extend(run_check_docker(file_path))
-        results.extend(run_check_ports(file_path))  # Check EXPOSE ports
+        results.extend(check_docker.check_source(source))
+        results.extend(check_ports.check_source(source))  # Check EXPOSE ports
 
     # Compose files
-    if name in ("compose.yaml", "compose.yml", "docker-compose.yaml", "docker-compose.yml"):
-        results.extend(run_check_docker(file_path))
+    if name in COMPOSE_FILES:
+        results.extend(check_docker.check_source(source))
         results.extend(run_check_watchdog(file_path))
 
     # All files get port check if they contain port definitions
-    if suffix in (".py", ".ts", ".tsx", ".js", ".yaml", ".yml"):
-        results.extend(run_check_ports(file_path))
+    if suffix in PORT_SUFFIXES:
+        results.extend(check_ports.check_source(source))
 
     # Markdown files - check plan conventions
     if suffix == ".md":
@@ -142,6 +177,99 @@ def run_all_checks(file_path: Path) -> list[CheckResult]:
     return results
 
 
+def is_checked(file_path: Path) -> bool:
+    """True if run_all_checks() has any check for file_path."""
+    name = file_path.name.lower()
+    return file_path.suffix.lower() in CHECKED_SUFFIXES or name == "dockerfile"
+
+
+def cache_context(file_path: Path) -> str | None:
+    """What run_all_checks() reads for file_path besides its content.
+
+    Returns None when the findings depend on state that cannot be stamped
+    cheaply (neighbouring files, other files' mtimes), so are not cached.
+    """
+    name = file_path.name.lower()
+    if name in COMPOSE_FILES:
+        return None  # check_watchdog looks for scripts/watchdog*
+    if name == "__init__.py" and "src/fabrik/" in str(file_path):
+        return None  # check_docs looks for module docs
+    if file_path.suffix.lower() == ".md" and "phase" in name:
+        return None  # check_tasks_updated compares mtimes with tasks.md
+
+    if file_path.suffix.lower() not in PORT_SUFFIXES and name != "dockerfile":
+        return ""
+    from .check_ports import registry_path
+
+    registry = registry_path(file_path)
+    try:
+        stat = registry.stat()
+    except OSError:
+        return ""
+    return f"{registry}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _check_batch(names: list[str]) -> list[tuple[str, list[CheckResult]]]:
+    """run_all_checks() over a batch of files (process pool worker)."""
+    return [(name, run_all_checks(Path(name))) for name in names]
+
+
+def scan(
+    files: Iterable[str], jobs: int = 1, cache: ResultCache | None = None
+) -> Iterator[CheckResult]:
+    """Yield the findings for files as they become available.
+
+    Files no check applies to are skipped without being read. Cached
+    findings are yielded first. The remaining files are checked in a pool of
+    jobs processes when there are at least PARALLEL_MIN_FILES of them, in
+    this process otherwise, and their findings are cached.
+    """
+    keys: dict[str, str | None] = {}
+    for name in files:
+        if not is_checked(Path(name)):
+            continue
+        key = None
+        if cache is not None:
+            context = cache_context(Path(name))
+            if context is not None:
+                key = cache.key(Path(name), context)
+        cached = cache.get(key) if cache is not None and key is not None else None
+        if cached is not None:
+            yield from (CheckResult.from_dict(r) for r in cached)
+        else:
+            keys[name] = key
+
+    def checked() -> Iterator[tuple[str, list[CheckResult]]]:
+        pending = list(keys)
+        if jobs <= 1 or len(pending) < PARALLEL_MIN_FILES:
+            yield from _check_batch(pending)
+            return
+        batches = [pending[i : i + BATCH_SIZE] for i in range(0, len(pending), BATCH_SIZE)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for future in as_completed([pool.submit(_check_batch, b) for b in batches]):
+                yield from future.result()
+
+    for name, results in checked():
+        key = keys[name]
+        if cache is not None and key is not None:
+            cache.put(key, [r.to_dict() for r in results])
+        yield from results
+
+
+def get_all_files() -> list[str]:
+    """Get files under the current directory that git does not ignore."""
+    try:
+        names = subprocess.run(
+            ["git", "ls-files", "--cached", "--others", "--exclude-standard", "-z"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split("\0")
+    except (OSError, subprocess.CalledProcessError):
+        return []
+    return [name for name in names if name and os.path.isfile(name)]
+
+
 def get_git_diff_files() -> list[str]:
     """Get list of files changed in git (staged, unstaged, AND untracked)."""
     files: set[str] = set()
@@ -172,6 +300,16 @@ def get_git_diff_files() -> list[str]:
         return []
 
 
+def _print_result(result: CheckResult) -> None:
+    icon = {"pass": "✓", "warn": "⚠", "error": "✗"}[result.severity.value]
+    location = (
+        f"{result.file_path}:{result.line_number}" if result.line_number else result.file_path
+    )
+    print(f"{icon} [{result.check_name}] {location}: {result.message}")
+    if result.fix_hint:
+        print(f"  → Fix: {result.fix_hint}")
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Fabrik Convention Validator")
@@ -179,10 +317,20 @@ def main() -> int:
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--strict", action="store_true", help="Treat warnings as errors")
     parser.add_argument("--git-diff", action="store_true", help="Check files changed in git")
+    parser.add_argument(
+        "--all", action="store_true", help="Check every file git does not ignore (cached)"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPUs)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached --all results")
     args = parser.parse_args()
 
     files_to_check = args.files
 
+    if args.all:
+        files_to_check.extend(get_all_files())
+
     if args.git_diff:
         git_files = get_git_diff_files()
         if git_files:
@@ -193,45 +341,40 @@ def main() -> int:
             return 0
 
     # Deduplicate
-    files_to_check = list(set(files_to_check))
+    files_to_check = [f for f in dict.fromkeys(files_to_check) if Path(f).is_file()]
 
-    all_results: list[CheckResult] = []
+    cache = ResultCache() if args.all and not args.no_cache else None
+    # Keyed by value: under `python -m` the checks' Severity is not this module's
+    counts = {severity.value: 0 for severity in Severity}
 
-    for file_arg in files_to_check:
-        file_path = Path(file_arg)
-        if file_path.exists() and file_path.is_file():
-            all_results.extend(run_all_checks(file_path))
+    # Output results as they arrive; the JSON document is written incrementally
+    if args.json:
+        print('{\n  "results": [', end="")
+    for result in scan(files_to_check, jobs=args.jobs, cache=cache):
+        if args.json:
+            separator = "," if sum(counts.values()) else ""
+            print(f"{separator}\n    {json.dumps(result.to_dict())}", end="", flush=True)
+        else:
+            _print_result(result)
+        counts[result.severity.value] += 1
+    if cache is not None:
+        cache.save()
+
+    if args.json:
+        summary = {
+            "total": sum(counts.values()),
+            "errors": counts["error"],
+            "warnings": counts["warn"],
+        }
+        print(f'\n  ],\n  "summary": {json.dumps(summary)}\n}}')
 
     # Determine exit code
-    has_errors = any(r.severity == Severity.ERROR for r in all_results)
-    has_warnings = any(r.severity == Severity.WARN for r in all_results)
+    has_errors = counts["error"] > 0
+    has_warnings = counts["warn"] > 0
 
     if args.strict and has_warnings:
         has_errors = True
 
-    # Output results
-    if args.json:
-        output = {
-            "results": [r.to_dict() for r in all_results],
-            "summary": {
-                "total": len(all_results),
-                "errors": sum(1 for r in all_results if r.severity == Severity.ERROR),
-                "warnings": sum(1 for r in all_results if r.severity == Severity.WARN),
-            },
-        }
-        print(json.dumps(output, indent=2))
-    else:
-        for result in all_results:
-            icon = {"pass": "✓", "warn": "⚠", "error": "✗"}[result.severity.value]
-            location = (
-                f"{result.file_path}:{result.line_number}"
-                if result.line_number
-                else result.file_path
-            )
-            print(f"{icon} [{result.check_name}] {location}: {result.message}")
-            if result.fix_hint:
-                print(f"  → Fix: {result.fix_hint}")
-
     if has_errors:
         return 2
     elif has_warnings:
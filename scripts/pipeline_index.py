@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Pipeline Report Index - Append-only SQLite index of pipeline reports.
+
+save_report() writes one .factory/reports/<run_id>/report.json per run. To
+answer trend questions without opening every report, each saved report is
+also appended to .factory/reports/index.sqlite (one row per run, one row
+per stage step). `pipeline_runner.py stats` aggregates over the index.
+
+Usage:
+    python scripts/pipeline_runner.py stats                  # Last 30 days
+    python scripts/pipeline_runner.py stats --days 7 --stage planning
+    python scripts/pipeline_runner.py stats --rebuild --json # Re-index report.json files
+
+    index_report(reports_dir, report)
+    print(format_stats(compute_stats(reports_dir, days=30)))
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+INDEX_NAME = "index.sqlite"
+PERCENTILES = (50, 90, 99)
+STAGE_ORDER = ("discovery", "planning", "execution", "verification", "ship")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    task TEXT NOT NULL,
+    risk_level TEXT NOT NULL,
+    status TEXT NOT NULL,
+    exit_code INTEGER NOT NULL,
+    duration_seconds REAL NOT NULL,
+    total_tokens INTEGER NOT NULL,
+    verification_iterations INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stages (
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    run_started_at TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    step TEXT NOT NULL,
+    status TEXT NOT NULL,
+    model TEXT NOT NULL,
+    iteration INTEGER NOT NULL,
+    started_at TEXT NOT NULL,
+    ended_at TEXT NOT NULL,
+    duration_seconds REAL NOT NULL,
+    tokens_used INTEGER NOT NULL,
+    cached INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_started ON runs(started_at);
+CREATE INDEX IF NOT EXISTS stages_stage_started ON stages(stage, run_started_at);
+"""
+
+
+def connect(reports_dir: Path) -> sqlite3.Connection:
+    """Open (and create if needed) the index in reports_dir."""
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(reports_dir / INDEX_NAME, timeout=10)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _insert(conn: sqlite3.Connection, report: dict[str, Any]) -> None:
+    run_id = report["run_id"]
+    started_at = report.get("timestamps", {}).get("started_at", "")
+    metrics = report.get("metrics", {})
+    # A run_id is indexed once; re-saving a report replaces its rows
+    conn.execute("DELETE FROM stages WHERE run_id = ?", (run_id,))
+    conn.execute(
+        "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            run_id,
+            started_at,
+            report.get("task", ""),
+            report.get("risk_level", ""),
+            report.get("status", ""),
+            report.get("exit_code", 0),
+            report.get("timestamps", {}).get("duration_seconds", 0.0),
+            metrics.get("total_tokens", 0),
+            metrics.get("verification_iterations", 0),
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO stages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                run_id,
+                started_at,
+                s.get("stage", ""),
+                s.get("step", ""),
+                s.get("status", ""),
+                s.get("model", ""),
+                s.get("iteration", 1),
+                s.get("started_at", ""),
+                s.get("ended_at", ""),
+                s.get("duration_seconds", 0.0),
+                s.get("tokens_used", 0),
+                int(bool(s.get("cached", False))),
+            )
+            for s in report.get("stages", [])
+        ],
+    )
+
+
+def index_report(reports_dir: Path, report: dict[str, Any]) -> None:
+    """Append one report to the index. Dry runs are not indexed."""
+    if report.get("dry_run"):
+        return
+    try:
+        conn = connect(reports_dir)
+        with conn:
+            _insert(conn, report)
+        conn.close()
+    except sqlite3.Error as e:
+        print(f"Warning: Could not index report {report.get('run_id')}: {e}", file=sys.stderr)
+
+
+def rebuild_index(reports_dir: Path) -> int:
+    """Re-index every <run_id>/report.json under reports_dir. Returns run count."""
+    count = 0
+    conn = connect(reports_dir)
+    with conn:
+        conn.execute("DELETE FROM stages")
+        conn.execute("DELETE FROM runs")
+        for path in sorted(reports_dir.glob("*/report.json")):
+            if path.parent.is_symlink():
+                continue  # latest -> <run_id>
+            try:
+                report = json.loads(path.read_text())
+            except (OSError, json.JSONDecodeError):
+                continue
+            if not report.get("dry_run") and report.get("run_id"):
+                _insert(conn, report)
+                count += 1
+    conn.close()
+    return count
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))  # ceil
+    return sorted_values[int(rank) - 1]
+
+
+def compute_stats(
+    reports_dir: Path, days: int | None = 30, stage: str | None = None
+) -> dict[str, Any]:
+    """Aggregate runs and stages in the index.
+
+    Counts, sums and pass rates are computed in SQL; latency percentiles
+    come from one ordered scan of per-run stage latencies. Cached steps
+    count towards hit rates but not towards latency or tokens.
+    """
+    since = (datetime.now(UTC) - timedelta(days=days)).isoformat() if days else ""
+    conn = connect(reports_dir)
+    try:
+        row = conn.execute(
+            """SELECT COUNT(*), COALESCE(SUM(status = 'success'), 0),
+                      COALESCE(SUM(status = 'escalated'), 0), COALESCE(SUM(total_tokens), 0),
+                      COALESCE(AVG(verification_iterations), 0),
+                      COALESCE(MAX(verification_iterations), 0)
+               FROM runs WHERE started_at >= ?""",
+            (since,),
+        ).fetchone()
+        runs = {
+            "count": row[0],
+            "success_rate": round(row[1] / row[0], 3) if row[0] else 0.0,
+            "escalated": row[2],
+            "total_tokens": row[3],
+            "avg_verification_iterations": round(row[4], 2),
+            "max_verification_iterations": row[5],
+        }
+
+        stage_filter = "AND stage = ?" if stage else ""
+        params: tuple[Any, ...] = (since, stage) if stage else (since,)
+        stages: dict[str, dict[str, Any]] = {}
+        for name, steps, runs_with, passed, cached, tokens in conn.execute(
+            f"""SELECT stage, COUNT(*), COUNT(DISTINCT run_id), SUM(status = 'pass'),
+                       SUM(cached), SUM(CASE WHEN cached THEN 0 ELSE tokens_used END)
+                FROM stages WHERE run_started_at >= ? {stage_filter}
+                GROUP BY stage""",
+            params,
+        ):
+            stages[name] = {
+                "steps": steps,
+                "runs": runs_with,
+                "pass_rate": round(passed / steps, 3),
+                "cache_hit_rate": round(cached / steps, 3),
+                "tokens": tokens,
+                "avg_tokens_per_run": round(tokens / runs_with, 1),
+            }
+
+        # Stage latency per run: wall clock from its first executed step to its
+        # last (parallel steps overlap, so summing durations would overstate it)
+        durations: dict[str, list[float]] = {}
+        for name, latency in conn.execute(
+            f"""SELECT stage,
+                       (julianday(MAX(ended_at)) - julianday(MIN(started_at))) * 86400 AS latency
+                FROM stages
+                WHERE run_started_at >= ? AND cached = 0 AND started_at != '' {stage_filter}
+                GROUP BY run_id, stage
+                ORDER BY stage, latency""",
+            params,
+        ):
+            durations.setdefault(name, []).append(latency)
+    finally:
+        conn.close()
+
+    for name, values in durations.items():
+        latency = {f"p{p}": round(percentile(values, p), 3) for p in PERCENTILES}
+        stages[name]["latency_seconds"] = latency
+    for entry in stages.values():
+        entry.setdefault("latency_seconds", {f"p{p}": 0.0 for p in PERCENTILES})
+
+    return {"since": since or None, "runs": runs, "stages": stages}
+
+
+def format_stats(stats: dict[str, Any]) -> str:
+    """Human-readable table of compute_stats() output."""
+    runs = stats["runs"]
+    lines = [
+        f"Runs: {runs['count']} since {stats['since'] or 'the beginning'}",
+        f"  success rate {runs['success_rate']:.1%}, escalated {runs['escalated']}, "
+        f"tokens {runs['total_tokens']:,}",
+        f"  verification iterations avg {runs['avg_verification_iterations']}, "
+        f"max {runs['max_verification_iterations']}",
+        "",
+        f"{'Stage':<14}{'Runs':>6}{'Pass':>8}{'Cached':>8}{'p50 s':>9}{'p90 s':>9}"
+        f"{'p99 s':>9}{'Tokens':>11}",
+    ]
+    order = {name: i for i, name in enumerate(STAGE_ORDER)}
+    for name, s in sorted(stats["stages"].items(), key=lambda kv: (order.get(kv[0], 9), kv[0])):
+        lat = s["latency_seconds"]
+        lines.append(
+            f"{name:<14}{s['runs']:>6}{s['pass_rate']:>8.0%}{s['cache_hit_rate']:>8.0%}"
+            f"{lat['p50']:>9.1f}{lat['p90']:>9.1f}{lat['p99']:>9.1f}{s['tokens']:>11,}"
+        )
+    return "\n".join(lines)
@@ -9,19 +9,44 @@ Stages:
     4. Verification - Independent review
     5. Ship - Documentation updates
 
+Stages run as a DAG of steps: independent steps (parallel planning models,
+per-module execution and verification) run concurrently. Every step result
+is written to .factory/reports/<run_id>/stages/ with a key derived from its
+inputs, so `--resume` re-runs only from the first invalidated step.
+
+In a git repository, step results are also stored in .factory/reports/cache/
+keyed by task, step, model, upstream outputs and the git tree hash of the
+step's paths (committed tree for discovery/planning, working tree for the
+rest). Re-running a task on the same commit reuses discovery and planning;
+a verification-only run after a small fix re-runs just verification.
+
 Usage:
     python scripts/pipeline_runner.py run "Task description" --dry-run
     python scripts/pipeline_runner.py run "Fix typo" --risk low
+    python scripts/pipeline_runner.py run "Add auth" --module src/auth --module src/api
+    python scripts/pipeline_runner.py run "Add auth" --resume latest
+    python scripts/pipeline_runner.py run "Add auth" --stage verification
+    python scripts/pipeline_runner.py run "Add auth" --no-cache
     python scripts/pipeline_runner.py stage discovery "Analyze auth flow"
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
+import re
+import shutil
+import subprocess
 import sys
+import tempfile
+import threading
+import time
 import uuid
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field, fields
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
@@ -30,6 +55,14 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     pass
 
+# Import report index (handle both module and script execution)
+try:
+    from scripts.pipeline_index import compute_stats, format_stats, index_report, rebuild_index
+except ModuleNotFoundError:
+    from pipeline_index import compute_stats, format_stats, index_report, rebuild_index
+
+STAGE_NAMES = ["discovery", "planning", "execution", "verification", "ship"]
+
 
 class RiskLevel(Enum):
     """Risk levels for task routing."""
@@ -63,6 +96,16 @@ class StageResult:
     output: str  # Full output; truncated only in report mapping
     iteration: int = 1
     tokens_used: int = 0
+    step: str = ""  # Sub-step within the stage (module, "plan", "edge_cases", ...)
+    duration_seconds: float = 0.0
+    cache_key: str = ""
+    cached: bool = False  # Reused from a previous run instead of executed
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StageResult:
+        """Build from a saved stage file, ignoring unknown keys."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
 
 
 def stage_result_to_report_stage(sr: StageResult) -> dict[str, Any]:
@@ -72,17 +115,181 @@ def stage_result_to_report_stage(sr: StageResult) -> dict[str, Any]:
     """
     return {
         "stage": sr.stage,
+        "step": sr.step,
         "status": sr.status,
         "started_at": sr.started_at,
         "ended_at": sr.ended_at,
+        "duration_seconds": sr.duration_seconds,
         "session_id": sr.session_id,
         "model": sr.model,
         "output_summary": sr.output[:500] if sr.output else "",
         "iteration": sr.iteration,
         "tokens_used": sr.tokens_used,
+        "cached": sr.cached,
     }
 
 
+@dataclass
+class StageNode:
+    """One step of the pipeline DAG.
+
+    `run` receives the results of `deps` (by node name) and returns the
+    step's StageResult. Steps whose dependencies did not pass are skipped.
+    """
+
+    name: str
+    stage: str
+    run: Callable[[dict[str, StageResult]], StageResult]
+    deps: tuple[str, ...] = ()
+    step: str = ""
+    model: str = ""
+    iteration: int = 1
+    # Paths whose git tree hash is part of the cache key ("" = working directory)
+    paths: tuple[str, ...] = ("",)
+    committed: bool = False  # Key on the HEAD tree instead of the working tree
+
+
+def node_key(
+    task: str, node: StageNode, dep_results: dict[str, StageResult], state: str = ""
+) -> str:
+    """Content key of a step: task, step identity, model, repo state and dependency outputs.
+
+    A changed upstream output changes every downstream key, so resuming
+    re-runs from the first invalidated step.
+    """
+    h = hashlib.sha256()
+    for part in (task, node.name, node.model, str(node.iteration), state):
+        h.update(part.encode())
+        h.update(b"\0")
+    for dep in sorted(dep_results):
+        h.update(dep.encode())
+        h.update(b"\0")
+        h.update(dep_results[dep].output.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def run_dag(
+    nodes: list[StageNode],
+    execute: Callable[[StageNode, dict[str, StageResult]], StageResult],
+    max_workers: int = 4,
+    done: dict[str, StageResult] | None = None,
+) -> tuple[dict[str, StageResult], list[str]]:
+    """Run nodes in dependency order, independent nodes concurrently.
+
+    `done` holds results of nodes from an earlier graph that `nodes` may
+    depend on; they are not run again or returned.
+
+    Returns ({name: StageResult} in completion order, skipped node names).
+    Raises ValueError for unknown dependencies or cycles.
+    """
+    done = done or {}
+    by_name = {n.name: n for n in nodes}
+    for node in nodes:
+        unknown = [d for d in node.deps if d not in by_name and d not in done]
+        if unknown:
+            raise ValueError(f"{node.name}: unknown dependencies {unknown}")
+
+    results: dict[str, StageResult] = {}
+    finished = dict(done)
+    skipped: list[str] = []
+    pending = dict(by_name)
+    running: dict[Future[StageResult], str] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        while pending or running:
+            for name, node in list(pending.items()):
+                if any(d in pending or d in running.values() for d in node.deps):
+                    continue
+                del pending[name]
+                if any(d in skipped or finished[d].status != "pass" for d in node.deps):
+                    skipped.append(name)
+                    continue
+                deps = {d: finished[d] for d in node.deps}
+                running[pool.submit(execute, node, deps)] = name
+
+            if not running:
+                if pending:
+                    raise ValueError(f"Dependency cycle between {sorted(pending)}")
+                break
+            completed, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in completed:
+                name = running.pop(future)
+                results[name] = finished[name] = future.result()
+
+    return results, skipped
+
+
+def _git(cwd: str, *args: str, env: dict[str, str] | None = None) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, timeout=60, env=env, check=True
+    )
+    return result.stdout.strip()
+
+
+def git_tree_state(cwd: str, paths: tuple[str, ...], committed: bool = False) -> str | None:
+    """Git tree hashes of paths (relative to cwd) as one string, or None outside git.
+
+    The working tree (including untracked, non-ignored files) is hashed by
+    staging it into a throwaway copy of the index, so the real index is never
+    touched. .factory/ is excluded: step results must not change the key.
+    """
+    try:
+        if committed:
+            tree = _git(cwd, "rev-parse", "HEAD^{tree}")
+        else:
+            git_dir = Path(_git(cwd, "rev-parse", "--absolute-git-dir"))
+            with tempfile.TemporaryDirectory() as tmp:
+                index = Path(tmp) / "index"
+                if (git_dir / "index").exists():
+                    # copy2 keeps the mtime git relies on to detect racily-clean entries
+                    shutil.copy2(git_dir / "index", index)
+                env = {**os.environ, "GIT_INDEX_FILE": str(index)}
+                _git(cwd, "add", "-A", "--", ".", ":(exclude).factory", env=env)
+                tree = _git(cwd, "write-tree", env=env)
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    hashes = []
+    for path in paths:
+        try:
+            hashes.append(_git(cwd, "rev-parse", f"{tree}:./{path}"))
+        except subprocess.CalledProcessError:
+            hashes.append("missing")
+    return ",".join(hashes)
+
+
+def changed_python_files(cwd: str, path: str = "") -> list[str] | None:
+    """Python files under path (relative to cwd) that differ from HEAD, or None outside git.
+
+    Untracked, non-ignored files count as changed; deleted files are left out.
+    """
+    scope = path or "."
+    try:
+        changed = _git(
+            cwd, "diff", "--name-only", "--relative", "--diff-filter=d", "HEAD", "--", scope
+        )
+        untracked = _git(cwd, "ls-files", "--others", "--exclude-standard", "--", scope)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    files = {*changed.splitlines(), *untracked.splitlines()}
+    return sorted(f for f in files if f.endswith((".py", ".pyi")))
+
+
+def _step_name(stage: str, module: str) -> str:
+    return f"{stage}:{module}" if module else stage
+
+
+def _safe_name(name: str) -> str:
+    """File name for a step (module paths contain slashes)."""
+    return re.sub(r"[^\w.#-]", "_", name)
+
+
+def _is_approved(output: str) -> bool:
+    """Whether a verification response approves the changes."""
+    return re.search(r'"approved"\s*:\s*true', output) is not None
+
+
 @dataclass
 class PipelineConfig:
     """Configuration for pipeline execution."""
@@ -94,6 +301,10 @@ class PipelineConfig:
     session_ids: dict[str, str] = field(default_factory=dict)
     max_verify_iterations: int = 2
     cwd: str = "."
+    # Independent modules executed and verified in parallel (empty = whole task)
+    modules: list[str] = field(default_factory=list)
+    max_parallel: int = 4
+    use_cache: bool = True  # Reuse step results from .factory/reports/cache/
 
 
 @dataclass
@@ -132,6 +343,8 @@ class PipelineRunner:
         self.config = config or PipelineConfig()
         self.run_id = str(uuid.uuid4())
         self.stage_results: list[StageResult] = []
+        # cache_key -> StageResult of the run being resumed
+        self._resume_cache: dict[str, StageResult] = {}
 
     def assess_risk(self, task: str) -> RiskLevel:
         """
@@ -183,13 +396,13 @@ class PipelineRunner:
             # Extract data from primary result
             primary = result.primary_result
             session_id = primary.session_id or f"session-{self.run_id}-discovery"
-            # MultiModelResult doesn't expose model id; use "unknown" until wired
-            model = "unknown"
+            model = getattr(primary, "model", "") or "unknown"
             output = result.merged_result or primary.result or ""
             success = primary.success
 
-            # tokens_used=0 until real token accounting from droid_core/logs
-            tokens_used = 0
+            # Tokens from every model that took part (0 when droid reported no usage)
+            runs = [primary, *getattr(result, "secondary_results", [])]
+            tokens_used = sum(getattr(r, "tokens_used", 0) for r in runs)
 
             # Store session_id for continuity
             self.config.session_ids["discovery"] = session_id
@@ -220,6 +433,378 @@ class PipelineRunner:
                 tokens_used=0,
             )
 
+    def _model_for(self, stage: str, task_type: Any, key: str = "model") -> str:
+        """Model for a step: PipelineConfig.models override, else TOOL_CONFIGS."""
+        from scripts.droid_core import DEFAULT_MODEL, TOOL_CONFIGS
+
+        configured = self.config.models.get(stage if key == "model" else f"{stage}:{key}")
+        if configured:
+            return configured
+        task_config = TOOL_CONFIGS.get(task_type, {})
+        return task_config.get(key) or task_config.get("model", DEFAULT_MODEL)
+
+    def _droid_step(
+        self,
+        stage: str,
+        step: str,
+        prompt: str,
+        task_type: Any,
+        model: str,
+        autonomy: str = "low",
+        session_id: str | None = None,
+    ) -> StageResult:
+        """Run one droid exec call and map it to a StageResult."""
+        from scripts.droid_core import Autonomy, run_droid_exec
+
+        started_at = datetime.now(UTC).isoformat()
+        try:
+            result = run_droid_exec(
+                prompt=prompt,
+                task_type=task_type,
+                autonomy=Autonomy(autonomy),
+                model=model,
+                cwd=self.config.cwd,
+                session_id=session_id,
+            )
+            status = "pass" if result.success else "fail"
+            output = result.result or result.error or ""
+            session = result.session_id or f"session-{self.run_id}-{stage}"
+            tokens_used = getattr(result, "tokens_used", 0)
+        except Exception as e:
+            status, output, session, tokens_used = "fail", f"Error: {e}", "", 0
+
+        return StageResult(
+            stage=stage,
+            status=status,
+            started_at=started_at,
+            ended_at=datetime.now(UTC).isoformat(),
+            session_id=session,
+            model=model,
+            output=output,
+            tokens_used=tokens_used,
+            step=step,
+        )
+
+    def _preflight_step(self, module: str) -> StageResult:
+        """Deterministic gates (ruff, mypy) before AI verification of a module.
+
+        In a git repository only the module's changed Python files are
+        checked, so findings that predate the run do not fail it.
+        """
+        from scripts.droid_core import TaskType, run_with_preflight_gates
+
+        started_at = datetime.now(UTC).isoformat()
+        paths = changed_python_files(self.config.cwd, module)
+        try:
+            if paths == []:
+                passed, report = True, "No changed Python files to check"
+            else:
+                passed, report = run_with_preflight_gates(
+                    prompt=module or ".",
+                    task_type=TaskType.REVIEW,
+                    cwd=self.config.cwd,
+                    paths=paths or [module or "."],
+                )
+        except Exception as e:
+            passed, report = False, f"Error: {e}"
+        return StageResult(
+            stage="verification",
+            status="pass" if passed else "fail",
+            started_at=started_at,
+            ended_at=datetime.now(UTC).isoformat(),
+            session_id="",
+            model="preflight",
+            output=report,
+            step=_step_name("preflight", module),
+        )
+
+    def build_stage_graph(
+        self,
+        task: str,
+        starting_stage: int,
+        modules: list[str] | None = None,
+        iteration: int = 1,
+        feedback: dict[str, str] | None = None,
+    ) -> list[StageNode]:
+        """Build the DAG for stages starting_stage..verification.
+
+        Planning runs the planner and the edge-case model concurrently, then
+        a reviewer over both. Each module gets its own execution -> preflight
+        -> verification chain. Later iterations (modules rejected by
+        verification) only rebuild those chains, with the reviewer feedback
+        in the execution prompt; their execution still depends on the plan
+        from the first iteration.
+        """
+        from scripts.droid_core import TaskType
+
+        modules = modules if modules is not None else (self.config.modules or [""])
+        feedback = feedback or {}
+        suffix = f"#{iteration}" if iteration > 1 else ""
+        nodes: list[StageNode] = []
+        plan_deps: tuple[str, ...] = ()
+
+        if starting_stage <= 1 and iteration == 1:
+            nodes.append(
+                StageNode(
+                    "discovery",
+                    "discovery",
+                    lambda deps: self.run_stage_1_discovery(task),
+                    model=self._model_for("discovery", TaskType.SPEC),
+                )
+            )
+            plan_deps = ("discovery",)
+
+        exec_deps = ("planning:review",) if starting_stage <= 2 else ()
+        if starting_stage <= 2 and iteration == 1:
+            spec_model = self._model_for("planning", TaskType.SPEC)
+            edge_model = self._model_for("planning", TaskType.SPEC, "parallel_model")
+            review_model = self._model_for("planning", TaskType.SPEC, "review_model")
+
+            def plan(deps: dict[str, StageResult]) -> StageResult:
+                spec = deps["discovery"].output if "discovery" in deps else ""
+                prompt = f"Create a detailed implementation plan for: {task}"
+                if spec:
+                    prompt += f"\n\nDiscovery spec:\n{spec}"
+                session = deps["discovery"].session_id if "discovery" in deps else None
+                return self._droid_step(
+                    "planning", "plan", prompt, TaskType.SPEC, spec_model, session_id=session
+                )
+
+            def edge_cases(deps: dict[str, StageResult]) -> StageResult:
+                spec = deps["discovery"].output if "discovery" in deps else ""
+                prompt = f"List edge cases, risks and failure modes for: {task}"
+                if spec:
+                    prompt += f"\n\nDiscovery spec:\n{spec}"
+                return self._droid_step("planning", "edge_cases", prompt, TaskType.SPEC, edge_model)
+
+            def review(deps: dict[str, StageResult]) -> StageResult:
+                plan_text = deps["planning:plan"].output
+                edges = deps["planning:edge_cases"].output
+                prompt = (
+                    f"Review this implementation plan for: {task}\n\n"
+                    f"## Plan\n{plan_text}\n\n## Edge cases\n{edges}\n\n"
+                    "Return the final plan with the edge cases addressed."
+                )
+                sr = self._droid_step("planning", "review", prompt, TaskType.SPEC, review_model)
+                if sr.status == "pass":
+                    sr.output = f"{plan_text}\n\n## Edge Cases\n{edges}\n\n## Review\n{sr.output}"
+                return sr
+
+            nodes += [
+                StageNode("planning:plan", "planning", plan, plan_deps, "plan", spec_model),
+                StageNode(
+                    "planning:edge_cases",
+                    "planning",
+                    edge_cases,
+                    plan_deps,
+                    "edge_cases",
+                    edge_model,
+                ),
+                StageNode(
+                    "planning:review",
+                    "planning",
+                    review,
+                    ("planning:plan", "planning:edge_cases"),
+                    "review",
+                    review_model,
+                ),
+            ]
+
+        code_model = self._model_for("execution", TaskType.CODE)
+        verify_model = self._model_for("verification", TaskType.REVIEW)
+
+        for module in modules:
+            exec_name = _step_name("execution", module) + suffix
+            preflight_name = _step_name("preflight", module) + suffix
+            verify_name = _step_name("verification", module) + suffix
+            scope = f" (only the {module} module)" if module else ""
+            preflight_deps: tuple[str, ...] = ()
+
+            def execute(deps: dict[str, StageResult], module=module, scope=scope) -> StageResult:
+                prompt = f"Implement this task{scope}: {task}"
+                if "planning:review" in deps:
+                    prompt += f"\n\nPlan:\n{deps['planning:review'].output}"
+                if module in feedback:
+                    prompt += f"\n\nVerification feedback to address:\n{feedback[module]}"
+                return self._droid_step(
+                    "execution", module, prompt, TaskType.CODE, code_model, autonomy="high"
+                )
+
+            def verify(
+                deps: dict[str, StageResult],
+                module=module,
+                scope=scope,
+                preflight_name=preflight_name,
+            ) -> StageResult:
+                prompt = (
+                    f"Review the changes made{scope} for: {task}\n\n"
+                    f"Pre-flight gates:\n{deps[preflight_name].output}\n\n"
+                    'Respond with JSON: {"approved": true|false, "issues": [...]}'
+                )
+                sr = self._droid_step("verification", module, prompt, TaskType.REVIEW, verify_model)
+                if sr.status == "pass" and not _is_approved(sr.output):
+                    sr.status = "rejected"
+                return sr
+
+            if starting_stage <= 3 or iteration > 1:
+                nodes.append(
+                    StageNode(
+                        exec_name,
+                        "execution",
+                        execute,
+                        exec_deps,
+                        module,
+                        code_model,
+                        iteration,
+                        paths=(module,),
+                    )
+                )
+                preflight_deps = (exec_name,)
+            if starting_stage <= 4:
+                nodes += [
+                    StageNode(
+                        preflight_name,
+                        "verification",
+                        lambda deps, module=module: self._preflight_step(module),
+                        preflight_deps,
+                        _step_name("preflight", module),
+                        "preflight",
+                        iteration,
+                        paths=(module,),
+                    ),
+                    StageNode(
+                        verify_name,
+                        "verification",
+                        verify,
+                        (preflight_name,),
+                        module,
+                        verify_model,
+                        iteration,
+                        paths=(module,),
+                    ),
+                ]
+
+        # Discovery and planning only depend on the committed code they analyze
+        relevant = tuple(self.config.modules) or ("",)
+        for node in nodes:
+            if node.stage in ("discovery", "planning"):
+                node.paths, node.committed = relevant, True
+        return nodes
+
+    def _ship_node(self, task: str) -> StageNode:
+        """Final step once every module passed verification: documentation updates."""
+        from scripts.droid_core import TaskType
+
+        model = self._model_for("ship", TaskType.CODE)
+
+        def ship(deps: dict[str, StageResult]) -> StageResult:
+            prompt = (
+                f"Update the documentation for these verified changes: {task}\n"
+                "Add a CHANGELOG.md entry, and update README.md or docs/ where the change "
+                "affects documented behavior, APIs or configuration. Edit documentation "
+                "only, not code. If nothing needs documenting, change nothing and say so."
+            )
+            return self._droid_step("ship", "", prompt, TaskType.CODE, model, autonomy="medium")
+
+        return StageNode("ship", "ship", ship, model=model)
+
+    def _execute_node(
+        self, task: str, node: StageNode, deps: dict[str, StageResult]
+    ) -> StageResult:
+        """Run a node, or reuse a passing result whose key matches.
+
+        Results come from the resumed run or, in a git repository, from the
+        persistent step cache. Steps that change the working tree (execution)
+        are also cached under the resulting tree, so re-running after a
+        completed execution reuses it instead of implementing the task again.
+        """
+        state = None
+        if self.config.use_cache or self._resume_cache:
+            state = git_tree_state(self.config.cwd, node.paths, node.committed)
+        key = node_key(task, node, deps, state or "")
+        previous = self._resume_cache.get(key)
+        if previous is None and state is not None and self.config.use_cache:
+            previous = self._load_cached(key)
+
+        if previous is not None and previous.status == "pass":
+            result = StageResult.from_dict(asdict(previous))
+            result.cached = True
+        else:
+            start = time.monotonic()
+            result = node.run(deps)
+            result.duration_seconds = round(time.monotonic() - start, 3)
+            result.cached = False
+        result.step = result.step or node.step
+        result.iteration = node.iteration
+        result.cache_key = key
+        self._save_stage(node.name, result)
+
+        if state is not None and self.config.use_cache and result.status == "pass":
+            if not result.cached:
+                self._store_cached(key, result)
+            if not node.committed:
+                after = git_tree_state(self.config.cwd, node.paths)
+                if after is not None and after != state:
+                    self._store_cached(node_key(task, node, deps, after), result)
+        return result
+
+    def _stages_dir(self, run_id: str) -> Path:
+        return Path(self.config.cwd) / ".factory" / "reports" / run_id / "stages"
+
+    def _cache_path(self, key: str) -> Path:
+        return Path(self.config.cwd) / ".factory" / "reports" / "cache" / key[:2] / f"{key}.json"
+
+    def _load_cached(self, key: str) -> StageResult | None:
+        try:
+            return StageResult.from_dict(json.loads(self._cache_path(key).read_text()))
+        except (OSError, json.JSONDecodeError, TypeError):
+            return None
+
+    def _store_cached(self, key: str, result: StageResult) -> None:
+        path = self._cache_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(asdict(result), indent=2))
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Warning: Could not cache stage {result.stage}: {e}", file=sys.stderr)
+
+    def _save_stage(self, name: str, result: StageResult) -> None:
+        stages_dir = self._stages_dir(self.run_id)
+        try:
+            stages_dir.mkdir(parents=True, exist_ok=True)
+            path = stages_dir / f"{_safe_name(name)}.json"
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(asdict(result), indent=2))
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Warning: Could not save stage {name}: {e}", file=sys.stderr)
+
+    def load_resume_cache(self, resume: str) -> dict[str, StageResult]:
+        """Load step results of a previous run ("latest" or a run_id), keyed by cache key."""
+        reports_dir = Path(self.config.cwd) / ".factory" / "reports"
+        run_id = resume
+        if resume == "latest":
+            latest_link = reports_dir / "latest"
+            latest_txt = reports_dir / "latest.txt"
+            if latest_link.is_symlink():
+                run_id = os.readlink(latest_link)
+            elif latest_txt.exists():
+                run_id = latest_txt.read_text().strip()
+            else:
+                return {}
+
+        cache: dict[str, StageResult] = {}
+        for path in sorted(self._stages_dir(Path(run_id).name).glob("*.json")):
+            try:
+                result = StageResult.from_dict(json.loads(path.read_text()))
+            except (OSError, json.JSONDecodeError, TypeError):
+                continue
+            if result.cache_key:
+                cache[result.cache_key] = result
+        return cache
+
     def run_pipeline(
         self,
         task: str,
@@ -227,9 +812,17 @@ class PipelineRunner:
         risk_override: RiskLevel | None = None,
         start_stage: int | None = None,
         quiet: bool = False,
+        resume: str | None = None,
     ) -> PipelineResult:
-        """Execute the full pipeline for a task."""
+        """Execute the full pipeline for a task.
+
+        With resume ("latest" or a run_id), steps whose inputs are unchanged
+        since that run are reused instead of executed. In a git repository,
+        unchanged steps of any earlier run are reused unless config.use_cache
+        is False.
+        """
         started_at = datetime.now(UTC).isoformat()
+        start = time.monotonic()
 
         risk = risk_override or self.assess_risk(task)
         starting_stage = start_stage or self.route_by_risk(risk)
@@ -241,6 +834,9 @@ class PipelineRunner:
                 print(f"[DRY-RUN] Starting stage: {starting_stage}")
                 print(f"[DRY-RUN] Run ID: {self.run_id}")
                 print("[DRY-RUN] Would execute stages:", self.config.stages[starting_stage - 1 :])
+                for node in self.build_stage_graph(task, starting_stage):
+                    after = f" (after {', '.join(node.deps)})" if node.deps else ""
+                    print(f"[DRY-RUN]   {node.name} [{node.model}]{after}")
 
             return PipelineResult(
                 run_id=self.run_id,
@@ -263,30 +859,98 @@ class PipelineRunner:
                 exit_code=ExitCode.SUCCESS.value,
             )
 
-        ended_at = datetime.now(UTC).isoformat()
+        self.stage_results = []
+        self._resume_cache = self.load_resume_cache(resume) if resume else {}
+        errors: list[dict[str, Any]] = []
+        status, exit_code = "success", ExitCode.SUCCESS
+        iterations = 0
+
+        finished: dict[str, StageResult] = {}
+
+        def run_graph(nodes: list[StageNode]) -> tuple[dict[str, StageResult], list[str]]:
+            # Retry graphs depend on the plan produced by the first one
+            results, skipped = run_dag(
+                nodes,
+                lambda node, deps: self._execute_node(task, node, deps),
+                self.config.max_parallel,
+                finished,
+            )
+            finished.update(results)
+            self.stage_results.extend(results.values())
+            return results, skipped
+
+        nodes = self.build_stage_graph(task, starting_stage)
+        results, _ = run_graph(nodes)
+        modules = self.config.modules or [""]
+        iterations = 1 if starting_stage <= 4 else 0
+
+        max_iterations = min(self.config.max_verify_iterations, self.MAX_VERIFY_ITERATIONS)
+        while True:
+            failed = [
+                (name, r) for name, r in results.items() if r.status not in ("pass", "rejected")
+            ]
+            if failed:
+                name, failure = failed[0]
+                errors += [{"stage": n, "step": r.step, "error": r.output[:500]} for n, r in failed]
+                status = "failed"
+                exit_code = (
+                    ExitCode.PREFLIGHT_GATE_FAILED
+                    if name.startswith("preflight")
+                    else ExitCode.STAGE_EXECUTION_FAILED
+                )
+                break
+
+            rejected = {
+                r.step: r.output
+                for r in results.values()
+                if r.stage == "verification" and r.status == "rejected"
+            }
+            if not rejected:
+                break
+            if iterations >= max_iterations:
+                errors += [
+                    {"stage": "verification", "step": module, "error": output[:500]}
+                    for module, output in rejected.items()
+                ]
+                status, exit_code = "escalated", ExitCode.VERIFICATION_REJECTED_TWICE
+                break
+
+            iterations += 1
+            retry = [m for m in modules if m in rejected]
+            results, _ = run_graph(
+                self.build_stage_graph(task, starting_stage, retry, iterations, feedback=rejected)
+            )
+
+        if status == "success":
+            ship, _ = run_graph([self._ship_node(task)])
+            if ship["ship"].status != "pass":
+                errors.append({"stage": "ship", "step": "", "error": ship["ship"].output[:500]})
+                status, exit_code = "failed", ExitCode.STAGE_EXECUTION_FAILED
 
         return PipelineResult(
             run_id=self.run_id,
             task=task,
             risk_level=risk.value,
-            status="success",
-            stages=[],
+            status=status,
+            stages=[stage_result_to_report_stage(sr) for sr in self.stage_results],
             timestamps={
                 "started_at": started_at,
-                "ended_at": ended_at,
-                "duration_seconds": 0.0,
+                "ended_at": datetime.now(UTC).isoformat(),
+                "duration_seconds": round(time.monotonic() - start, 3),
             },
             metrics={
-                "total_tokens": 0,
-                "verification_iterations": 0,
-                "stages_executed": 0,
+                "total_tokens": sum(sr.tokens_used for sr in self.stage_results if not sr.cached),
+                "verification_iterations": iterations,
+                "stages_executed": sum(not sr.cached for sr in self.stage_results),
                 "stages_skipped": starting_stage - 1,
+                "stages_cached": sum(sr.cached for sr in self.stage_results),
             },
-            exit_code=ExitCode.SUCCESS.value,
+            errors=errors,
+            exit_code=exit_code.value,
         )
 
     def save_report(self, result: PipelineResult) -> Path:
-        """Save pipeline result to report.json and update latest pointer.
+        """Save pipeline result to report.json, index it and update latest pointer.
 
         Creates symlink on Linux/macOS. Falls back to latest.txt on Windows
         or if symlink creation fails.
@@ -299,6 +963,7 @@ class PipelineRunner:
         with open(report_path, "w") as f:
             json.dump(result.to_report(), f, indent=2)
 
+        index_report(reports_dir, result.to_report())
         self._update_latest_pointer(reports_dir, result.run_id)
         return report_path
 
@@ -329,7 +994,10 @@ def create_parser() -> argparse.ArgumentParser:
 Examples:
   %(prog)s run "Fix typo in README.md" --dry-run
   %(prog)s run "Add JWT authentication" --risk high
+  %(prog)s run "Add JWT authentication" --module src/auth --module src/api
+  %(prog)s run "Add JWT authentication" --resume latest
   %(prog)s stage discovery "Analyze security flow"
+  %(prog)s stats --days 30 --stage planning
         """,
     )
 
@@ -350,6 +1018,34 @@ Examples:
     )
     run_parser.add_argument("--cwd", default=".", help="Working directory")
     run_parser.add_argument("--json", action="store_true", help="Output result as JSON")
+    run_parser.add_argument(
+        "--module",
+        action="append",
+        default=[],
+        help="Independent module to execute/verify in parallel (repeatable)",
+    )
+    run_parser.add_argument(
+        "--max-parallel", type=int, default=4, help="Maximum concurrent steps (default: 4)"
+    )
+    run_parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Reuse unchanged step outputs of a previous run (run_id or 'latest')",
+    )
+    run_parser.add_argument(
+        "--no-cache", action="store_true", help="Execute every step (ignore the step cache)"
+    )
+
+    stats_parser = subparsers.add_parser("stats", help="Trends across indexed pipeline runs")
+    stats_parser.add_argument(
+        "--days", type=int, default=30, help="Only runs from the last N days (0 = all)"
+    )
+    stats_parser.add_argument("--stage", choices=STAGE_NAMES, help="Only this stage")
+    stats_parser.add_argument(
+        "--rebuild", action="store_true", help="Re-index all report.json files first"
+    )
+    stats_parser.add_argument("--cwd", default=".", help="Working directory")
+    stats_parser.add_argument("--json", action="store_true", help="Output result as JSON")
 
     stage_parser = subparsers.add_parser("stage", help="Execute single stage")
     stage_parser.add_argument(
@@ -372,7 +1068,12 @@ def main() -> int:
         parser.print_help()
         return 0
 
-    config = PipelineConfig(cwd=getattr(args, "cwd", "."))
+    config = PipelineConfig(
+        cwd=getattr(args, "cwd", "."),
+        modules=getattr(args, "module", []),
+        max_parallel=getattr(args, "max_parallel", 4),
+        use_cache=not getattr(args, "no_cache", False),
+    )
     runner = PipelineRunner(config)
 
     if args.command == "run":
@@ -395,17 +1096,30 @@ def main() -> int:
             risk_override=risk_override,
             start_stage=start_stage,
             quiet=args.json,
+            resume=args.resume,
         )
 
         if args.json:
             print(json.dumps(result.to_report(), indent=2))
         elif not args.dry_run:
             report_path = runner.save_report(result)
-            print(f"Pipeline completed: {result.status}")
+            cached = result.metrics.get("stages_cached", 0)
+            hits = f" ({cached} cached steps)" if cached else ""
+            print(f"Pipeline completed: {result.status}{hits}")
             print(f"Report saved: {report_path}")
 
         return result.exit_code
 
+    elif args.command == "stats":
+        reports_dir = Path(args.cwd) / ".factory" / "reports"
+        if args.rebuild:
+            count = rebuild_index(reports_dir)
+            if not args.json:
+                print(f"Indexed {count} reports")
+        stats = compute_stats(reports_dir, days=args.days or None, stage=args.stage)
+        print(json.dumps(stats, indent=2) if args.json else format_stats(stats))
+        return 0
+
     elif args.command == "stage":
         print(f"[STAGE] Executing {args.stage_name} for: {args.task}")
         return 0
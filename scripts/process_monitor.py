@@ -9,6 +9,17 @@ Monitors subprocess for stuck detection using multi-signal approach:
 - Process state (sleeping, running, zombie, etc.)
 - Time since last activity
 
+Two sampling backends:
+- "proc":   reads /proc/<pid>/{stat,io,fd} directly in one pass per process
+            tree, caches child PIDs between samples and only inspects sockets
+            when CPU/I/O are idle (Linux, default when /proc is available)
+- "psutil": portable fallback
+
+Many concurrent processes: MonitorService runs ONE background thread that
+samples every registered process at a shared cadence, keeps history in
+fixed-size array-backed ring buffers, and publishes state changes through
+callbacks (see get_monitor_service()).
+
 Usage:
     monitor = ProcessMonitor(subprocess_obj)
 
@@ -19,11 +30,24 @@ Usage:
     diagnosis = monitor.analyze()
     if diagnosis['state'] != 'HEALTHY':
         print(f"Warning: {diagnosis['reason']}")
+
+    # Shared service (one thread for all processes)
+    handle = get_monitor_service().register(subprocess_obj, on_state_change=callback)
+    handle.record_activity()
+    diagnosis = handle.analyze()  # Latest diagnosis, no sampling on caller thread
 """
 
+import contextlib
+import os
+import platform
 import subprocess
+import sys
+import threading
 import time
+import tracemalloc
+from array import array
 from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass
 
 try:
@@ -33,7 +57,7 @@ except ImportError:
     raise
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessMetrics:
     """Snapshot of process metrics at a point in time."""
 
@@ -49,6 +73,376 @@ class ProcessMetrics:
     memory_mb: float
 
 
+# Status names stored as small ints in MetricsRing
+STATUS_NAMES = (
+    "unknown",
+    "running",
+    "sleeping",
+    "disk-sleep",
+    "zombie",
+    "stopped",
+    "tracing-stop",
+    "dead",
+    "idle",
+    "wake-kill",
+    "waking",
+    "parked",
+    "locked",
+    "waiting",
+)
+STATUS_CODES = {name: i for i, name in enumerate(STATUS_NAMES)}
+
+
+class MetricsRing:
+    """
+    Fixed-size ring of ProcessMetrics stored column-wise in typed arrays.
+
+    append() is O(1) and overwrites the oldest sample once full. Indexing and
+    iteration materialize ProcessMetrics oldest-first (like a bounded deque).
+
+    Window aggregates (avg_cpu, any_network, io_delta, max_gap) are kept up
+    to date on append, so reading them never rescans the history.
+
+    Args:
+        maxlen: Number of samples kept
+    """
+
+    __slots__ = (
+        "maxlen",
+        "_cols",
+        "_start",
+        "_len",
+        "_seq",
+        "_cpu_sum",
+        "_network_count",
+        "_gaps",
+    )
+
+    # (field, array typecode)
+    COLUMNS = (
+        ("timestamp", "d"),
+        ("cpu_percent", "d"),
+        ("io_read_bytes", "q"),
+        ("io_write_bytes", "q"),
+        ("has_active_network", "b"),
+        ("num_network_connections", "i"),
+        ("process_status", "b"),
+        ("num_threads", "i"),
+        ("num_fds", "i"),
+        ("memory_mb", "d"),
+    )
+
+    def __init__(self, maxlen: int):
+        self.maxlen = max(1, maxlen)
+        self._cols = {name: array(code, [0]) * self.maxlen for name, code in self.COLUMNS}
+        self._start = 0
+        self._len = 0
+        self._seq = 0  # Samples appended so far (sequence number of next sample)
+        self._cpu_sum = 0.0
+        self._network_count = 0
+        # Sliding-window max of timestamp gaps: (seq, gap), gaps decreasing
+        self._gaps: deque[tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, m: ProcessMetrics) -> None:
+        """Store a sample, evicting the oldest when full."""
+        cols = self._cols
+        if self._len:
+            gap = m.timestamp - cols["timestamp"][(self._start + self._len - 1) % self.maxlen]
+            while self._gaps and self._gaps[-1][1] <= gap:
+                self._gaps.pop()
+            self._gaps.append((self._seq, gap))
+
+        if self._len < self.maxlen:
+            slot = (self._start + self._len) % self.maxlen
+            self._len += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self.maxlen
+            self._cpu_sum -= cols["cpu_percent"][slot]
+            self._network_count -= cols["has_active_network"][slot]
+        self._seq += 1
+
+        # Gap at seq N is between samples N-1 and N; only gaps after the oldest count
+        oldest_seq = self._seq - self._len
+        while self._gaps and self._gaps[0][0] <= oldest_seq:
+            self._gaps.popleft()
+
+        cols["timestamp"][slot] = m.timestamp
+        cols["cpu_percent"][slot] = m.cpu_percent
+        cols["io_read_bytes"][slot] = m.io_read_bytes
+        cols["io_write_bytes"][slot] = m.io_write_bytes
+        cols["has_active_network"][slot] = 1 if m.has_active_network else 0
+        cols["num_network_connections"][slot] = m.num_network_connections
+        cols["process_status"][slot] = STATUS_CODES.get(m.process_status, 0)
+        cols["num_threads"][slot] = m.num_threads
+        cols["num_fds"][slot] = m.num_fds
+        cols["memory_mb"][slot] = m.memory_mb
+
+        self._network_count += 1 if m.has_active_network else 0
+        if slot == 0 and self._len == self.maxlen:
+            # Re-sum once per lap so float error never accumulates
+            self._cpu_sum = sum(cols["cpu_percent"])
+        else:
+            self._cpu_sum += m.cpu_percent
+
+    def _slot(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("MetricsRing index out of range")
+        return (self._start + index) % self.maxlen
+
+    def __getitem__(self, index: int) -> ProcessMetrics:
+        slot = self._slot(index)
+        cols = self._cols
+        return ProcessMetrics(
+            timestamp=cols["timestamp"][slot],
+            cpu_percent=cols["cpu_percent"][slot],
+            io_read_bytes=cols["io_read_bytes"][slot],
+            io_write_bytes=cols["io_write_bytes"][slot],
+            has_active_network=bool(cols["has_active_network"][slot]),
+            num_network_connections=cols["num_network_connections"][slot],
+            process_status=STATUS_NAMES[cols["process_status"][slot]],
+            num_threads=cols["num_threads"][slot],
+            num_fds=cols["num_fds"][slot],
+            memory_mb=cols["memory_mb"][slot],
+        )
+
+    def __iter__(self):
+        for i in range(self._len):
+            yield self[i]
+
+    def column(self, name: str) -> list:
+        """Values of one field, oldest first."""
+        col = self._cols[name]
+        return [col[(self._start + i) % self.maxlen] for i in range(self._len)]
+
+    def last(self, name: str):
+        """Newest value of one field (without materializing ProcessMetrics)."""
+        return self._cols[name][self._slot(-1)]
+
+    @property
+    def avg_cpu(self) -> float:
+        """Mean cpu_percent over the window."""
+        return self._cpu_sum / self._len if self._len else 0.0
+
+    @property
+    def any_network(self) -> bool:
+        """Whether any sample in the window saw active network connections."""
+        return self._network_count > 0
+
+    @property
+    def io_delta(self) -> int:
+        """Read + write bytes between the oldest and newest sample."""
+        if self._len < 2:
+            return 0
+        cols, first, last = self._cols, self._slot(0), self._slot(-1)
+        return (cols["io_read_bytes"][last] - cols["io_read_bytes"][first]) + (
+            cols["io_write_bytes"][last] - cols["io_write_bytes"][first]
+        )
+
+    @property
+    def max_gap(self) -> float:
+        """Largest interval between consecutive samples in the window (seconds)."""
+        return self._gaps[0][1] if self._gaps else 0.0
+
+
+# /proc/<pid>/stat state codes -> psutil status names
+PROC_STATES = {
+    "R": "running",
+    "S": "sleeping",
+    "D": "disk-sleep",
+    "Z": "zombie",
+    "T": "stopped",
+    "t": "tracing-stop",
+    "X": "dead",
+    "x": "dead",
+    "I": "idle",
+    "K": "wake-kill",
+    "W": "waking",
+    "P": "parked",
+}
+
+# /proc/net/tcp* state codes counted as active (ESTABLISHED, SYN_SENT, SYN_RECV)
+ACTIVE_TCP_STATES = {"01", "02", "03"}
+
+PROC_ROOT = "/proc"
+CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def proc_available(pid: int) -> bool:
+    """True if /proc/<pid>/stat is readable (Linux)."""
+    return os.access(f"{PROC_ROOT}/{pid}/stat", os.R_OK)
+
+
+class ProcSampler:
+    """
+    One-pass /proc sampler for a process tree.
+
+    Reads stat/io/fd for the root and its descendants per sample. Child PIDs
+    are cached and only re-discovered every children_refresh samples (or when
+    a cached child disappears). Socket state is read only when asked for.
+
+    Args:
+        pid: Root process ID
+        children_refresh: Samples between child PID re-discovery (default: 5)
+    """
+
+    def __init__(self, pid: int, children_refresh: int = 5):
+        self.pid = pid
+        self.children_refresh = children_refresh
+        self._children: list[int] = []
+        self._samples = 0
+        self._prev_ticks: dict[int, int] = {}
+        self._prev_time: float | None = None
+
+    @staticmethod
+    def _read_stat(pid: int) -> list[str] | None:
+        """Fields of /proc/<pid>/stat after the comm field (state is index 0)."""
+        try:
+            with open(f"{PROC_ROOT}/{pid}/stat", "rb") as f:
+                raw = f.read().decode(errors="replace")
+        except OSError:
+            return None
+        # comm may contain spaces/parens: split after the last ')'
+        return raw[raw.rfind(")") + 2 :].split()
+
+    @staticmethod
+    def _read_io(pid: int) -> tuple[int, int]:
+        try:
+            with open(f"{PROC_ROOT}/{pid}/io", "rb") as f:
+                data = f.read().split()
+        except OSError:
+            return 0, 0
+        fields = dict(zip(data[::2], data[1::2], strict=False))
+        return int(fields.get(b"read_bytes:", 0)), int(fields.get(b"write_bytes:", 0))
+
+    def _discover_children(self) -> list[int]:
+        """All descendant PIDs of the root (task/*/children, else a /proc scan)."""
+        found: list[int] = []
+        stack = [self.pid]
+        use_children_file = os.path.exists(f"{PROC_ROOT}/{self.pid}/task/{self.pid}/children")
+
+        if use_children_file:
+            while stack:
+                pid = stack.pop()
+                try:
+                    tids = os.listdir(f"{PROC_ROOT}/{pid}/task")
+                except OSError:
+                    continue
+                for tid in tids:
+                    try:
+                        with open(f"{PROC_ROOT}/{pid}/task/{tid}/children") as f:
+                            kids = [int(k) for k in f.read().split()]
+                    except OSError:
+                        continue
+                    found.extend(kids)
+                    stack.extend(kids)
+            return found
+
+        # Fallback: one scan of /proc building a ppid -> children map
+        by_parent: dict[int, list[int]] = {}
+        for name in os.listdir(PROC_ROOT):
+            if not name.isdigit():
+                continue
+            fields = self._read_stat(int(name))
+            if fields:
+                by_parent.setdefault(int(fields[1]), []).append(int(name))
+        while stack:
+            kids = by_parent.get(stack.pop(), [])
+            found.extend(kids)
+            stack.extend(kids)
+        return found
+
+    def sample(self) -> dict[str, any] | None:
+        """Read one sample for the tree. Returns None if the root is gone.
+
+        Keys: cpu_percent (tree), io_read_bytes, io_write_bytes (root),
+        process_status, num_threads, num_fds, memory_mb (root).
+        """
+        now = time.monotonic()
+        root = self._read_stat(self.pid)
+        if root is None:
+            return None
+
+        if self._samples % self.children_refresh == 0:
+            self._children = self._discover_children()
+        self._samples += 1
+
+        # utime + stime are fields 14/15 of stat (index 11/12 after comm)
+        ticks = {self.pid: int(root[11]) + int(root[12])}
+        alive_children = []
+        for child in self._children:
+            fields = self._read_stat(child)
+            if fields is None:
+                continue
+            ticks[child] = int(fields[11]) + int(fields[12])
+            alive_children.append(child)
+        if len(alive_children) != len(self._children):
+            self._children = alive_children
+
+        cpu = 0.0
+        if self._prev_time is not None and now > self._prev_time:
+            delta = sum(t - self._prev_ticks.get(pid, t) for pid, t in ticks.items())
+            cpu = delta / CLK_TCK / (now - self._prev_time) * 100
+        self._prev_ticks = ticks
+        self._prev_time = now
+
+        io_read, io_write = self._read_io(self.pid)
+        try:
+            num_fds = len(os.listdir(f"{PROC_ROOT}/{self.pid}/fd"))
+        except OSError:
+            num_fds = 0
+
+        return {
+            "cpu_percent": cpu,
+            "io_read_bytes": io_read,
+            "io_write_bytes": io_write,
+            "process_status": PROC_STATES.get(root[0], "unknown"),
+            "num_threads": int(root[17]),
+            "num_fds": num_fds,
+            "memory_mb": int(root[21]) * PAGE_SIZE / 1024 / 1024,
+        }
+
+    def network_connections(self) -> int:
+        """Count active TCP connections owned by the root process (on demand).
+
+        Maps socket inodes from /proc/<pid>/fd to /proc/<pid>/net/tcp{,6}.
+        """
+        inodes = set()
+        fd_dir = f"{PROC_ROOT}/{self.pid}/fd"
+        try:
+            fds = os.listdir(fd_dir)
+        except OSError:
+            return 0
+        for fd in fds:
+            try:
+                link = os.readlink(f"{fd_dir}/{fd}")
+            except OSError:
+                continue
+            if link.startswith("socket:["):
+                inodes.add(link[8:-1])
+        if not inodes:
+            return 0
+
+        active = 0
+        for table in ("tcp", "tcp6"):
+            try:
+                with open(f"{PROC_ROOT}/{self.pid}/net/{table}") as f:
+                    next(f, None)  # header
+                    for line in f:
+                        parts = line.split()
+                        if len(parts) > 9 and parts[9] in inodes and parts[3] in ACTIVE_TCP_STATES:
+                            active += 1
+            except OSError:
+                continue
+        return active
+
+
 class ProcessMonitor:
     """
     Monitor subprocess for stuck/hung detection.
@@ -64,6 +458,7 @@ class ProcessMonitor:
         warn_threshold: Seconds of inactivity before warning (default: 300)
         check_interval: Seconds between metric collection (default: 5)
         history_window: Seconds of history to keep (default: 60)
+        backend: "auto" (proc if available), "proc" or "psutil"
     """
 
     def __init__(
@@ -72,11 +467,19 @@ class ProcessMonitor:
         warn_threshold: int = 300,
         check_interval: int = 5,
         history_window: int = 60,
+        backend: str = "auto",
     ):
         self.proc = proc
         self.check_interval = check_interval
         self.warn_threshold = warn_threshold
 
+        if backend == "auto":
+            backend = "proc" if proc_available(proc.pid) else "psutil"
+        if backend not in ("proc", "psutil"):
+            raise ValueError(f"Unknown backend: {backend}")
+        self.backend = backend
+        self._sampler = ProcSampler(proc.pid) if backend == "proc" else None
+
         # Convert to psutil.Process for rich monitoring
         try:
             self.psutil_proc = psutil.Process(proc.pid)
@@ -89,9 +492,9 @@ class ProcessMonitor:
         self.suspicious_since: float | None = None
         self.likely_stuck_since: float | None = None
 
-        # Metrics history (ring buffers)
+        # Metrics history (array-backed ring buffer)
         history_size = history_window // check_interval
-        self.metrics_history: deque[ProcessMetrics] = deque(maxlen=history_size)
+        self.metrics_history = MetricsRing(history_size)
 
         # Previous I/O counters for delta calculation
         self._prev_io_counters = None
@@ -146,12 +549,13 @@ class ProcessMonitor:
     def _get_process_status(self) -> dict[str, any]:
         """Get detailed process status."""
         try:
-            return {
-                "status": self.psutil_proc.status(),
-                "num_threads": self.psutil_proc.num_threads(),
-                "num_fds": self.psutil_proc.num_fds(),
-                "memory_mb": self.psutil_proc.memory_info().rss / 1024 / 1024,
-            }
+            with self.psutil_proc.oneshot():
+                return {
+                    "status": self.psutil_proc.status(),
+                    "num_threads": self.psutil_proc.num_threads(),
+                    "num_fds": self.psutil_proc.num_fds(),
+                    "memory_mb": self.psutil_proc.memory_info().rss / 1024 / 1024,
+                }
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return {
                 "status": "unknown",
@@ -160,10 +564,40 @@ class ProcessMonitor:
                 "memory_mb": 0,
             }
 
+    def _collect_from_proc(self, now: float) -> ProcessMetrics | None:
+        """Collect a snapshot via ProcSampler; None if the process is gone."""
+        sample = self._sampler.sample()
+        if sample is None:
+            return None
+
+        # Sockets are only inspected when CPU/I/O show no activity
+        num_net = 0
+        history = self.metrics_history
+        io_moved = len(history) > 0 and (
+            sample["io_read_bytes"] != history.last("io_read_bytes")
+            or sample["io_write_bytes"] != history.last("io_write_bytes")
+        )
+        if sample["cpu_percent"] <= 0.5 and not io_moved:
+            num_net = self._sampler.network_connections()
+
+        return ProcessMetrics(
+            timestamp=now,
+            has_active_network=num_net > 0,
+            num_network_connections=num_net,
+            **sample,
+        )
+
     def collect_metrics(self) -> ProcessMetrics:
         """Collect current process metrics snapshot."""
         now = time.time()
 
+        if self._sampler is not None:
+            metrics = self._collect_from_proc(now)
+            if metrics is not None:
+                self.metrics_history.append(metrics)
+                return metrics
+            # Process gone (or /proc vanished): fall through to psutil defaults
+
         # Get all metrics
         cpu = self._get_cpu_usage()
         io_read, io_write = self._get_io_counters()
@@ -196,30 +630,24 @@ class ProcessMonitor:
             - avg_cpu: Average CPU % over history
             - total_io_bytes: Total I/O bytes over history
             - any_network: Whether any network activity seen
+            - max_gap: Longest interval between samples (seconds)
             - has_activity: Overall activity boolean
+
+        All values are O(1) reads of MetricsRing's incremental aggregates.
         """
-        if len(self.metrics_history) < 2:
+        history = self.metrics_history
+        if len(history) < 2:
             return {
                 "avg_cpu": 0.0,
                 "total_io_bytes": 0,
                 "any_network": False,
+                "max_gap": 0.0,
                 "has_activity": False,
             }
 
-        # Calculate deltas
-        oldest = self.metrics_history[0]
-        newest = self.metrics_history[-1]
-
-        # Average CPU
-        avg_cpu = sum(m.cpu_percent for m in self.metrics_history) / len(self.metrics_history)
-
-        # Total I/O delta
-        io_delta = (newest.io_read_bytes - oldest.io_read_bytes) + (
-            newest.io_write_bytes - oldest.io_write_bytes
-        )
-
-        # Any network activity
-        any_network = any(m.has_active_network for m in self.metrics_history)
+        avg_cpu = history.avg_cpu
+        io_delta = history.io_delta
+        any_network = history.any_network
 
         # Activity thresholds
         has_activity = (
@@ -232,6 +660,7 @@ class ProcessMonitor:
             "avg_cpu": avg_cpu,
             "total_io_bytes": io_delta,
             "any_network": any_network,
+            "max_gap": history.max_gap,
             "has_activity": has_activity,
         }
 
@@ -396,15 +825,358 @@ class ProcessMonitor:
         return self.proc.poll() is None
 
 
+# =============================================================================
+# Shared monitoring service (one thread for many processes)
+# =============================================================================
+
+# Syscall number of read(2) per architecture (for stdin-wait detection)
+READ_SYSCALL_NR = {"x86_64": "0", "amd64": "0", "aarch64": "63", "arm64": "63"}
+
+
+def read_proc_text(pid: int, name: str) -> str | None:
+    """Read /proc/<pid>/<name> (e.g. syscall, wchan); None if unavailable."""
+    try:
+        with open(f"{PROC_ROOT}/{pid}/{name}") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def is_waiting_for_stdin(pid: int) -> bool:
+    """True if the process is blocked in read(2) on fd 0 (/proc/<pid>/syscall)."""
+    syscall = read_proc_text(pid, "syscall")
+    if not syscall:
+        return False
+    parts = syscall.split()
+    if len(parts) < 2 or parts[0] != READ_SYSCALL_NR.get(platform.machine().lower()):
+        return False
+    try:
+        return int(parts[1], 16) == 0
+    except ValueError:
+        return False
+
+
+class MonitoredProcess:
+    """
+    Handle for a process registered with MonitorService.
+
+    Mirrors ProcessMonitor's polling API (record_activity / analyze), but
+    analyze() returns the latest diagnosis computed by the service thread
+    instead of sampling on the caller's thread.
+    """
+
+    def __init__(self, service: "MonitorService", monitor: ProcessMonitor):
+        self._service = service
+        self.monitor = monitor
+        self.pid = monitor.proc.pid
+        self.diagnosis: dict[str, any] = {
+            "state": "HEALTHY",
+            "confidence": "low",
+            "reason": "No samples yet",
+            "safe_to_kill": False,
+        }
+        self.lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self.diagnosis["state"]
+
+    def record_activity(self) -> None:
+        """Record activity (e.g. stdout event). Thread-safe."""
+        with self.lock:
+            self.monitor.record_activity()
+
+    def analyze(self) -> dict[str, any]:
+        """Latest diagnosis from the service thread."""
+        return self.diagnosis
+
+    def close(self) -> None:
+        """Stop monitoring this process."""
+        self._service.unregister(self.pid)
+
+    def __enter__(self) -> "MonitoredProcess":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+StateCallback = Callable[[int, str, str, dict], None]
+
+
+class MonitorService:
+    """
+    Single background thread that samples every registered process.
+
+    Each tick calls ProcessMonitor.analyze() once per process (one /proc pass,
+    history in MetricsRing), escalates to CONFIRMED_STUCK when a process is
+    blocked reading stdin, stores the diagnosis on the handle and invokes
+    callbacks on state changes. Exited processes are dropped automatically.
+    The thread starts on first register() and exits when nothing is left.
+
+    Args:
+        interval: Seconds between ticks (shared cadence for all processes)
+    """
+
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self._entries: dict[int, tuple[MonitoredProcess, StateCallback | None]] = {}
+        self._listeners: list[StateCallback] = []
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self.ticks = 0
+
+    def register(
+        self,
+        proc: subprocess.Popen,
+        warn_threshold: int = 300,
+        history_window: int = 60,
+        on_state_change: StateCallback | None = None,
+        backend: str = "auto",
+    ) -> MonitoredProcess:
+        """Start monitoring proc. Returns a handle (record_activity/analyze/close)."""
+        check_interval = max(1, int(self.interval))
+        monitor = ProcessMonitor(
+            proc,
+            warn_threshold=warn_threshold,
+            check_interval=check_interval,
+            # analyze() needs at least two samples to compare
+            history_window=max(history_window, 2 * check_interval),
+            backend=backend,
+        )
+        handle = MonitoredProcess(self, monitor)
+        with self._lock:
+            self._entries[handle.pid] = (handle, on_state_change)
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="process-monitor", daemon=True
+                )
+                self._thread.start()
+        return handle
+
+    def unregister(self, pid: int) -> None:
+        with self._lock:
+            self._entries.pop(pid, None)
+
+    def add_listener(self, callback: StateCallback) -> None:
+        """Call callback(pid, old_state, new_state, diagnosis) on every state change."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: StateCallback) -> None:
+        with self._lock:
+            with contextlib.suppress(ValueError):
+                self._listeners.remove(callback)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def tick(self) -> None:
+        """Sample every registered process once (called by the service thread)."""
+        with self._lock:
+            entries = list(self._entries.values())
+            listeners = list(self._listeners)
+
+        for handle, on_change in entries:
+            with handle.lock:
+                diagnosis = handle.monitor.analyze()
+                if diagnosis["state"] != "HEALTHY" and is_waiting_for_stdin(handle.pid):
+                    diagnosis = {
+                        "state": "CONFIRMED_STUCK",
+                        "confidence": "certain",
+                        "reason": "Blocked reading stdin (fd 0)",
+                        "safe_to_kill": False,
+                        "recommendation": "Run with stdin=DEVNULL or provide input",
+                    }
+            old_state = handle.state
+            handle.diagnosis = diagnosis
+
+            if diagnosis["state"] != old_state:
+                for callback in [on_change, *listeners]:
+                    if callback is None:
+                        continue
+                    try:
+                        callback(handle.pid, old_state, diagnosis["state"], diagnosis)
+                    except Exception as e:
+                        print(f"MonitorService callback error: {e}", file=sys.stderr)
+
+            if not handle.monitor.is_process_alive():
+                self.unregister(handle.pid)
+        self.ticks += 1
+
+    def snapshot(self) -> dict[int, dict[str, any]]:
+        """Current state of every registered process (safe to call from any thread)."""
+        with self._lock:
+            handles = [handle for handle, _cb in self._entries.values()]
+
+        result = {}
+        for handle in handles:
+            history = handle.monitor.metrics_history
+            latest = history[-1] if len(history) else None
+            result[handle.pid] = {
+                "state": handle.state,
+                "reason": handle.diagnosis.get("reason", ""),
+                "samples": len(history),
+                "cpu_percent": latest.cpu_percent if latest else 0.0,
+                "memory_mb": latest.memory_mb if latest else 0.0,
+                "process_status": latest.process_status if latest else "unknown",
+                "seconds_since_activity": time.time() - handle.monitor.last_activity_time,
+            }
+        return result
+
+    def stop(self) -> None:
+        """Stop the service thread (registrations are kept)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"MonitorService tick error: {e}", file=sys.stderr)
+            with self._lock:
+                if not self._entries:
+                    self._thread = None
+                    return
+
+
+_monitor_service: MonitorService | None = None
+_monitor_service_lock = threading.Lock()
+
+
+def get_monitor_service() -> MonitorService:
+    """Process-wide MonitorService (created on first use)."""
+    global _monitor_service
+    with _monitor_service_lock:
+        if _monitor_service is None:
+            _monitor_service = MonitorService()
+        return _monitor_service
+
+
+def benchmark(num_processes: int = 50, duration: float = 3.0) -> dict[str, float]:
+    """Measure samples/second for each backend while monitoring N processes.
+
+    Spawns num_processes idle `sleep` processes, then repeatedly calls
+    collect_metrics() on every monitor for `duration` seconds per backend.
+
+    Returns:
+        {backend: samples_per_second}
+    """
+    procs = [
+        subprocess.Popen(["sleep", "600"], stdin=subprocess.DEVNULL) for _ in range(num_processes)
+    ]
+    results: dict[str, float] = {}
+    try:
+        backends = ["psutil"] + (["proc"] if proc_available(procs[0].pid) else [])
+        for backend in backends:
+            monitors = [ProcessMonitor(p, backend=backend) for p in procs]
+            samples = 0
+            start = time.perf_counter()
+            while time.perf_counter() - start < duration:
+                for monitor in monitors:
+                    monitor.collect_metrics()
+                samples += len(monitors)
+            results[backend] = samples / (time.perf_counter() - start)
+    finally:
+        for p in procs:
+            p.terminate()
+        for p in procs:
+            p.wait()
+    return results
+
+
+def benchmark_history(history_size: int = 720, iterations: int = 2000) -> dict[str, dict]:
+    """Compare the old deque-of-dataclasses history with MetricsRing.
+
+    For a full history of history_size samples, reports the memory held per
+    monitored process (tracemalloc) and the cost of one activity-score
+    computation: a scan of the deque vs MetricsRing's O(1) aggregates.
+
+    Returns:
+        {"deque" | "ring": {"bytes": ..., "us_per_analyze": ...}}
+    """
+
+    def sample(i: int) -> ProcessMetrics:
+        return ProcessMetrics(
+            timestamp=float(i),
+            cpu_percent=(i % 7) * 0.1,
+            io_read_bytes=i * 512,
+            io_write_bytes=i * 256,
+            has_active_network=i % 11 == 0,
+            num_network_connections=i % 11 == 0,
+            process_status="sleeping",
+            num_threads=4,
+            num_fds=12,
+            memory_mb=42.5 + i % 3,
+        )
+
+    def scan_score(history: deque) -> tuple:
+        oldest, newest = history[0], history[-1]
+        avg_cpu = sum(m.cpu_percent for m in history) / len(history)
+        io_delta = (newest.io_read_bytes - oldest.io_read_bytes) + (
+            newest.io_write_bytes - oldest.io_write_bytes
+        )
+        return avg_cpu, io_delta, any(m.has_active_network for m in history)
+
+    def ring_score(history: MetricsRing) -> tuple:
+        return history.avg_cpu, history.io_delta, history.any_network
+
+    results: dict[str, dict] = {}
+    for name, factory, score in (
+        ("deque", lambda: deque(maxlen=history_size), scan_score),
+        ("ring", lambda: MetricsRing(history_size), ring_score),
+    ):
+        tracemalloc.start()
+        history = factory()
+        for i in range(history_size * 2):  # Wrap once so eviction is exercised
+            history.append(sample(i))
+        used, _peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            score(history)
+        elapsed = time.perf_counter() - start
+        results[name] = {"bytes": used, "us_per_analyze": elapsed / iterations * 1e6}
+    return results
+
+
 def demo():
     """Demo usage of ProcessMonitor."""
     import sys
 
     if len(sys.argv) < 2:
         print("Usage: python process_monitor.py <command> [args...]")
+        print("       python process_monitor.py --benchmark [num_processes]")
+        print("       python process_monitor.py --benchmark-history [history_size]")
         print("Example: python process_monitor.py sleep 600")
         sys.exit(1)
 
+    if sys.argv[1] == "--benchmark":
+        count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+        print(f"Benchmarking collect_metrics() across {count} monitored processes...")
+        results = benchmark(count)
+        for backend, rate in results.items():
+            print(f"  {backend:7} {rate:10.0f} samples/s  ({1e6 / rate:.0f}µs per sample)")
+        if "proc" in results:
+            print(f"  speedup {results['proc'] / results['psutil']:.1f}x")
+        return
+
+    if sys.argv[1] == "--benchmark-history":
+        size = int(sys.argv[2]) if len(sys.argv) > 2 else 720
+        print(f"Benchmarking metrics history with {size} samples per process...")
+        results = benchmark_history(size)
+        for name, r in results.items():
+            print(
+                f"  {name:6} {r['bytes'] / 1024:8.1f} KiB/process"
+                f"  {r['us_per_analyze']:8.2f}µs per activity score"
+            )
+        return
+
     # Start subprocess
     cmd = sys.argv[1:]
     print(f"Starting: {' '.join(cmd)}")
@@ -56,6 +56,18 @@ except Exception:
     ProcessMonitor = None
     PROCESS_MONITOR_AVAILABLE = False
 
+# Shared models.yaml loader (parsed once per process, re-read when the file changes)
+try:
+    from scripts.droid_models import load_models_config
+except ModuleNotFoundError:
+    from droid_models import load_models_config
+
+# Import metrics exporter (no-op unless FABRIK_METRICS_* is set)
+try:
+    from scripts import droid_metrics
+except ModuleNotFoundError:
+    import droid_metrics
+
 # Paths - configurable via env vars (Fabrik convention)
 FABRIK_ROOT = Path(os.getenv("FABRIK_ROOT", "/opt/fabrik"))
 QUEUE_DIR = Path(os.getenv("FABRIK_REVIEW_QUEUE", str(FABRIK_ROOT / ".droid/review_queue")))
@@ -146,6 +158,7 @@ def run_command_with_monitor(
     last_activity = start_time
     last_warning = 0.0
     timed_out = False
+    stuck_reported = False
 
     try:
         while True:
@@ -191,6 +204,9 @@ def run_command_with_monitor(
                     state = diagnosis.get("state", "UNKNOWN")
                     reason = diagnosis.get("reason", "")
                     metrics = diagnosis.get("metrics", {})
+                    if state in ("LIKELY_STUCK", "CONFIRMED_STUCK") and not stuck_reported:
+                        droid_metrics.inc("fabrik_droid_stuck_total", source="review")
+                        stuck_reported = True
 
                     metric_str = ""
                     if metrics:
@@ -237,11 +253,9 @@ def get_review_models() -> list[str]:
     """
     fallback = ["gpt-5.1-codex-max", "gemini-3-flash-preview"]
     try:
-        import yaml  # type: ignore[import-untyped]
-
-        with open(CONFIG_FILE) as f:
-            config: dict[str, Any] = yaml.safe_load(f)
-
+        config = load_models_config(CONFIG_FILE)
+        if "error" in config:
+            raise ValueError(config["error"])
         code_review = config.get("scenarios", {}).get("code_review", {})
 
         # Check for 'models' list (dual-model) or fall back to primary/alternatives
@@ -297,6 +311,7 @@ def get_pending_tasks() -> list[dict[str, Any]]:
 
     # Sort by queued time
     tasks.sort(key=lambda t: t.get("queued_at", ""))
+    droid_metrics.set_gauge("fabrik_queue_depth", len(tasks), queue="review")
     return tasks
 
 
@@ -335,6 +350,7 @@ def mark_task_status(task: dict[str, Any], status: str, result: str | None = Non
             shutil.move(str(task_file), str(dest))  # Cross-filesystem safe
         else:
             # Increment retry count and reset to pending
+            droid_metrics.inc("fabrik_droid_retries_total", source="review")
             task["retries"] = retries + 1
             task["status"] = "pending"
             save_task = {k: v for k, v in task.items() if not k.startswith("_")}
@@ -377,12 +393,17 @@ Be concise. Only report actual issues, not style suggestions."""
                 review_prompt,
             ]
 
-            result = run_command_with_monitor(
-                command,
-                timeout_seconds=600,
-                warn_after_seconds=300,
-                cwd=str(os.getenv("FABRIK_ROOT", "/opt/fabrik")),
-            )
+            with droid_metrics.track_run(model, "review") as run:
+                result = run_command_with_monitor(
+                    command,
+                    timeout_seconds=600,
+                    warn_after_seconds=300,
+                    cwd=str(os.getenv("FABRIK_ROOT", "/opt/fabrik")),
+                )
+                if result["timed_out"]:
+                    run.status = "timeout"
+                else:
+                    run.status = "success" if result["returncode"] == 0 else "error"
 
             if result["timed_out"]:
                 results[model] = {
@@ -402,6 +423,7 @@ Be concise. Only report actual issues, not style suggestions."""
                     continue
                 try:
                     output = json.loads(stdout)
+                    droid_metrics.record_tokens(model, output.get("usage"))
                     results[model] = {
                         "status": "success",
                         "review": output.get("finalText", stdout[:2000]),
@@ -785,10 +807,7 @@ def run_custom_review(prompt: str, files: list[str] | None = None) -> dict[str,
     """Run a custom review with droid exec, optionally referencing files."""
     # Get model from config
     try:
-        import yaml
-
-        with open(CONFIG_FILE) as f:
-            config = yaml.safe_load(f)
+        config = load_models_config(CONFIG_FILE)
         models = config.get("scenarios", {}).get("code_review", {}).get("models", [])
         model = models[0] if models else "gpt-5.1-codex-max"
     except Exception:
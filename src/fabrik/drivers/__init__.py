@@ -4,17 +4,22 @@ Fabrik drivers for external services.
 - dns: DNS management (Namecheap API wrapper)
 - coolify: Coolify deployment API
 - uptime_kuma: Status monitoring (Uptime Kuma API)
+- transport: Shared pooled, retrying HTTP transport
+
+Async* clients have the same methods as their sync twins, as coroutines.
 """
 
-from fabrik.drivers.coolify import CoolifyClient
-from fabrik.drivers.dns import DNSClient
+from fabrik.drivers.coolify import AsyncCoolifyClient, CoolifyClient
+from fabrik.drivers.dns import AsyncDNSClient, DNSClient
 from fabrik.drivers.r2 import R2Client
 from fabrik.drivers.supabase import SupabaseClient
 from fabrik.drivers.uptime_kuma import UptimeKumaClient, add_fabrik_service_to_monitoring
 
 __all__ = [
     "DNSClient",
+    "AsyncDNSClient",
     "CoolifyClient",
+    "AsyncCoolifyClient",
     "UptimeKumaClient",
     "SupabaseClient",
     "R2Client",
@@ -26,6 +26,8 @@ Usage:
 
     # Delete record
     cf.delete_record(zone_id, record_id)
+
+AsyncCloudflareClient has the same methods as coroutines.
 """
 
 import os
@@ -33,33 +35,73 @@ from typing import Any
 
 import httpx
 
-
-class CloudflareClient:
-    """Cloudflare API client for DNS management."""
+from fabrik.drivers.transport import RetryPolicy, create_async_client, create_client
+
+
+def _full_name(domain: str, name: str) -> str:
+    """Full record name for name relative to domain (empty name = apex)."""
+    return (f"{name}.{domain}" if name else domain) if not name.endswith(domain) else name
+
+
+def _record_data(
+    record_type: str,
+    name: str,
+    content: str,
+    ttl: int,
+    proxied: bool,
+    priority: int | None,
+    comment: str | None,
+) -> dict[str, Any]:
+    """Request body for creating or updating a DNS record."""
+    data = {
+        "type": record_type,
+        "name": name,
+        "content": content,
+        "ttl": ttl,
+        "proxied": proxied,
+    }
+    if priority is not None:
+        data["priority"] = priority
+    if comment:
+        data["comment"] = comment
+    return data
+
+
+def _is_current(record: dict[str, Any], content: str, ttl: int, proxied: bool) -> bool:
+    """True if an existing record already has the wanted values."""
+    return (
+        record["content"] == content
+        and record["proxied"] == proxied
+        and (ttl == 1 or record["ttl"] == ttl)
+    )
+
+
+class _CloudflareSettings:
+    """Configuration and response handling shared by the sync and async clients."""
 
     def __init__(
-        self, api_token: str | None = None, account_id: str | None = None, timeout: int = 30
+        self,
+        api_token: str | None = None,
+        account_id: str | None = None,
+        timeout: int = 30,
+        base_url: str | None = None,
     ):
         self.api_token = api_token or os.environ.get("CLOUDFLARE_API_TOKEN")
         self.account_id = account_id or os.environ.get("CLOUDFLARE_ACCOUNT_ID")
-        self.base_url = "https://api.cloudflare.com/client/v4"
+        self.base_url = base_url or "https://api.cloudflare.com/client/v4"
         self.timeout = timeout
 
         if not self.api_token:
             raise ValueError("CLOUDFLARE_API_TOKEN is required")
 
-        self._client = httpx.Client(
-            base_url=self.base_url,
-            headers={
-                "Authorization": f"Bearer {self.api_token}",
-                "Content-Type": "application/json",
-            },
-            timeout=timeout,
-        )
+        self.headers = {
+            "Authorization": f"Bearer {self.api_token}",
+            "Content-Type": "application/json",
+        }
 
-    def _request(self, method: str, path: str, **kwargs) -> Any:
-        """Make API request and return result."""
-        response = self._client.request(method, path, **kwargs)
+    @staticmethod
+    def _parse(response: httpx.Response) -> Any:
+        """Return the result of an API response, raising on API errors."""
         data = response.json()
 
         if not data.get("success", False):
@@ -69,6 +111,24 @@ class CloudflareClient:
 
         return data.get("result", data)
 
+
+class CloudflareClient(_CloudflareSettings):
+    """Cloudflare API client for DNS management."""
+
+    def __init__(
+        self,
+        api_token: str | None = None,
+        account_id: str | None = None,
+        timeout: int = 30,
+        base_url: str | None = None,
+    ):
+        super().__init__(api_token, account_id, timeout, base_url)
+        self._client = create_client(base_url=self.base_url, headers=self.headers, timeout=timeout)
+
+    def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Make API request and return result."""
+        return self._parse(self._client.request(method, path, **kwargs))
+
     def close(self):
         """Close the HTTP client."""
         self._client.close()
@@ -217,18 +277,7 @@ class CloudflareClient:
         comment: str | None = None,
     ) -> dict[str, Any]:
         """Create a new DNS record."""
-        data = {
-            "type": record_type,
-            "name": name,
-            "content": content,
-            "ttl": ttl,
-            "proxied": proxied,
-        }
-        if priority is not None:
-            data["priority"] = priority
-        if comment:
-            data["comment"] = comment
-
+        data = _record_data(record_type, name, content, ttl, proxied, priority, comment)
         return self._request("POST", f"/zones/{zone_id}/dns_records", json=data)
 
     def update_record(
@@ -244,18 +293,7 @@ class CloudflareClient:
         comment: str | None = None,
     ) -> dict[str, Any]:
         """Update an existing DNS record."""
-        data = {
-            "type": record_type,
-            "name": name,
-            "content": content,
-            "ttl": ttl,
-            "proxied": proxied,
-        }
-        if priority is not None:
-            data["priority"] = priority
-        if comment:
-            data["comment"] = comment
-
+        data = _record_data(record_type, name, content, ttl, proxied, priority, comment)
         return self._request("PUT", f"/zones/{zone_id}/dns_records/{record_id}", json=data)
 
     def delete_record(self, zone_id: str, record_id: str) -> dict[str, Any]:
@@ -292,8 +330,7 @@ class CloudflareClient:
         """
         zone_id = self.get_zone_id(domain)
 
-        # Build full record name
-        full_name = (f"{name}.{domain}" if name else domain) if not name.endswith(domain) else name
+        full_name = _full_name(domain, name)
 
         # Check if record exists
         existing = self.list_records(zone_id, record_type=record_type, name=full_name)
@@ -301,11 +338,7 @@ class CloudflareClient:
         if existing:
             record = existing[0]
             # Check if update needed
-            if (
-                record["content"] == content
-                and record["proxied"] == proxied
-                and (ttl == 1 or record["ttl"] == ttl)
-            ):
+            if _is_current(record, content, ttl, proxied):
                 return {"action": "unchanged", "record": record}
 
             # Update existing record
@@ -331,8 +364,7 @@ class CloudflareClient:
         """Delete a DNS record by name."""
         zone_id = self.get_zone_id(domain)
 
-        # Build full record name
-        full_name = (f"{name}.{domain}" if name else domain) if not name.endswith(domain) else name
+        full_name = _full_name(domain, name)
 
         existing = self.list_records(zone_id, record_type=record_type, name=full_name)
 
@@ -366,3 +398,260 @@ class CloudflareClient:
             proxied=proxied,
             comment="Created by Fabrik",
         )
+
+
+class AsyncCloudflareClient(_CloudflareSettings):
+    """
+    Async Cloudflare API client with the same methods as CloudflareClient.
+
+    Usage:
+        async with AsyncCloudflareClient() as cf:
+            results = await asyncio.gather(
+                *(cf.add_subdomain("ocoron.com", sub, ip) for sub in subdomains)
+            )
+    """
+
+    def __init__(
+        self,
+        api_token: str | None = None,
+        account_id: str | None = None,
+        timeout: int = 30,
+        base_url: str | None = None,
+        retry: RetryPolicy | None = None,
+    ):
+        super().__init__(api_token, account_id, timeout, base_url)
+        self._client = create_async_client(
+            base_url=self.base_url, headers=self.headers, timeout=timeout, retry=retry
+        )
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Make API request and return result."""
+        return self._parse(await self._client.request(method, path, **kwargs))
+
+    async def close(self):
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    # === Account & Token ===
+
+    async def verify_token(self) -> dict[str, Any]:
+        """Verify the API token is valid."""
+        # Use account-level verification if account_id available
+        if self.account_id:
+            return await self._request("GET", f"/accounts/{self.account_id}/tokens/verify")
+        return await self._request("GET", "/user/tokens/verify")
+
+    async def health(self) -> dict[str, Any]:
+        """Health check - verify token and return status."""
+        try:
+            result = await self.verify_token()
+            return {
+                "status": "healthy",
+                "token_status": result.get("status"),
+                "token_id": result.get("id"),
+            }
+        except Exception as e:
+            return {"status": "unhealthy", "error": str(e)}
+
+    # === Zones ===
+
+    async def list_zones(self, name: str | None = None) -> list[dict[str, Any]]:
+        """List all zones, optionally filtered by name."""
+        params = {}
+        if name:
+            params["name"] = name
+        return await self._request("GET", "/zones", params=params)
+
+    async def create_zone(self, domain: str) -> dict[str, Any]:
+        """Create a new Cloudflare zone for a domain."""
+        if not self.account_id:
+            raise ValueError("CLOUDFLARE_ACCOUNT_ID required for zone creation")
+
+        data = {
+            "name": domain,
+            "account": {"id": self.account_id},
+            "type": "full",  # Full zone (Cloudflare as DNS authority)
+        }
+
+        return await self._request("POST", "/zones", json=data)
+
+    async def get_zone_status(self, zone_id: str) -> dict[str, Any]:
+        """Get zone status and nameservers."""
+        zone = await self.get_zone(zone_id)
+        return {
+            "status": zone.get("status"),
+            "name_servers": zone.get("name_servers", []),
+            "paused": zone.get("paused", False),
+        }
+
+    async def ensure_zone(self, domain: str) -> dict[str, Any]:
+        """Ensure zone exists. Create if missing, return existing if found."""
+        # Check if zone exists
+        zones = await self.list_zones(name=domain)
+
+        if zones:
+            zone = zones[0]
+            return {
+                "zone_id": zone["id"],
+                "status": zone.get("status"),
+                "name_servers": zone.get("name_servers", []),
+                "created": False,
+            }
+
+        # Create new zone
+        zone = await self.create_zone(domain)
+        return {
+            "zone_id": zone["id"],
+            "status": zone.get("status"),
+            "name_servers": zone.get("name_servers", []),
+            "created": True,
+        }
+
+    async def get_zone_id(self, domain: str) -> str:
+        """Get zone ID for a domain name."""
+        # Handle subdomains - find root domain
+        parts = domain.split(".")
+        for i in range(len(parts) - 1):
+            check_domain = ".".join(parts[i:])
+            zones = await self.list_zones(name=check_domain)
+            if zones:
+                return zones[0]["id"]
+
+        raise ValueError(f"Zone not found for domain: {domain}")
+
+    async def get_zone(self, zone_id: str) -> dict[str, Any]:
+        """Get zone details by ID."""
+        return await self._request("GET", f"/zones/{zone_id}")
+
+    # === DNS Records ===
+
+    async def list_records(
+        self, zone_id: str, record_type: str | None = None, name: str | None = None
+    ) -> list[dict[str, Any]]:
+        """List DNS records for a zone."""
+        params = {}
+        if record_type:
+            params["type"] = record_type
+        if name:
+            params["name"] = name
+        return await self._request("GET", f"/zones/{zone_id}/dns_records", params=params)
+
+    async def get_record(self, zone_id: str, record_id: str) -> dict[str, Any]:
+        """Get a specific DNS record."""
+        return await self._request("GET", f"/zones/{zone_id}/dns_records/{record_id}")
+
+    async def create_record(
+        self,
+        zone_id: str,
+        record_type: str,
+        name: str,
+        content: str,
+        ttl: int = 1,  # 1 = auto
+        proxied: bool = False,
+        priority: int | None = None,
+        comment: str | None = None,
+    ) -> dict[str, Any]:
+        """Create a new DNS record."""
+        data = _record_data(record_type, name, content, ttl, proxied, priority, comment)
+        return await self._request("POST", f"/zones/{zone_id}/dns_records", json=data)
+
+    async def update_record(
+        self,
+        zone_id: str,
+        record_id: str,
+        record_type: str,
+        name: str,
+        content: str,
+        ttl: int = 1,
+        proxied: bool = False,
+        priority: int | None = None,
+        comment: str | None = None,
+    ) -> dict[str, Any]:
+        """Update an existing DNS record."""
+        data = _record_data(record_type, name, content, ttl, proxied, priority, comment)
+        return await self._request("PUT", f"/zones/{zone_id}/dns_records/{record_id}", json=data)
+
+    async def delete_record(self, zone_id: str, record_id: str) -> dict[str, Any]:
+        """Delete a DNS record."""
+        return await self._request("DELETE", f"/zones/{zone_id}/dns_records/{record_id}")
+
+    # === High-level helpers ===
+
+    async def ensure_record(
+        self,
+        domain: str,
+        record_type: str,
+        name: str,
+        content: str,
+        ttl: int = 1,
+        proxied: bool = False,
+        comment: str | None = None,
+    ) -> dict[str, Any]:
+        """Ensure a DNS record exists with the given values."""
+        zone_id = await self.get_zone_id(domain)
+
+        full_name = _full_name(domain, name)
+
+        # Check if record exists
+        existing = await self.list_records(zone_id, record_type=record_type, name=full_name)
+
+        if existing:
+            record = existing[0]
+            # Check if update needed
+            if _is_current(record, content, ttl, proxied):
+                return {"action": "unchanged", "record": record}
+
+            # Update existing record
+            updated = await self.update_record(
+                zone_id,
+                record["id"],
+                record_type,
+                full_name,
+                content,
+                ttl=ttl,
+                proxied=proxied,
+                comment=comment,
+            )
+            return {"action": "updated", "record": updated}
+
+        # Create new record
+        created = await self.create_record(
+            zone_id, record_type, full_name, content, ttl=ttl, proxied=proxied, comment=comment
+        )
+        return {"action": "created", "record": created}
+
+    async def delete_record_by_name(
+        self, domain: str, record_type: str, name: str
+    ) -> dict[str, Any]:
+        """Delete a DNS record by name."""
+        zone_id = await self.get_zone_id(domain)
+
+        full_name = _full_name(domain, name)
+
+        existing = await self.list_records(zone_id, record_type=record_type, name=full_name)
+
+        if not existing:
+            return {"action": "not_found", "name": full_name}
+
+        record = existing[0]
+        await self.delete_record(zone_id, record["id"])
+        return {"action": "deleted", "record_id": record["id"], "name": full_name}
+
+    async def add_subdomain(
+        self, domain: str, subdomain: str, ip: str, proxied: bool = False
+    ) -> dict[str, Any]:
+        """Add a subdomain A record (Fabrik-compatible interface)."""
+        return await self.ensure_record(
+            domain=domain,
+            record_type="A",
+            name=subdomain,
+            content=ip,
+            proxied=proxied,
+            comment="Created by Fabrik",
+        )
@@ -3,6 +3,8 @@ Coolify API Client - Driver for Coolify deployment platform.
 
 Coolify API v4 documentation: https://coolify.io/docs/api-reference
 API Base: http://<ip>:8000/api/v1
+
+AsyncCoolifyClient has the same methods as coroutines.
 """
 
 import os
@@ -11,6 +13,8 @@ from typing import Any, Literal
 
 import httpx
 
+from fabrik.drivers.transport import RetryPolicy, create_async_client, create_client
+
 
 @dataclass
 class Application:
@@ -35,7 +39,121 @@ class Service:
     status: str
 
 
-class CoolifyClient:
+def _application_payload(
+    project_uuid: str,
+    server_uuid: str,
+    environment_name: str,
+    type: str,
+    name: str | None,
+    description: str,
+    fqdn: str | None,
+    git_repository: str | None,
+    git_branch: str,
+    build_pack: str,
+    dockerfile_location: str,
+    docker_compose_location: str,
+) -> dict[str, Any]:
+    """Request body for POST /applications (see CoolifyClient.create_application)."""
+    payload = {
+        "project_uuid": project_uuid,
+        "server_uuid": server_uuid,
+        "environment_name": environment_name,
+        "type": type,
+        "build_pack": build_pack,
+    }
+
+    if name:
+        payload["name"] = name
+    if description:
+        payload["description"] = description
+    if fqdn:
+        payload["fqdn"] = fqdn
+    if git_repository:
+        payload["git_repository"] = git_repository
+        payload["git_branch"] = git_branch
+    if build_pack == "dockerfile":
+        payload["dockerfile_location"] = dockerfile_location
+    if build_pack == "dockercompose":
+        payload["docker_compose_location"] = docker_compose_location
+
+    return payload
+
+
+def _dockercompose_payload(
+    project_uuid: str,
+    server_uuid: str,
+    docker_compose_raw: str,
+    name: str,
+    environment_name: str,
+    description: str,
+    instant_deploy: bool,
+    destination_uuid: str | None,
+) -> dict[str, Any]:
+    """Request body for POST /applications/dockercompose."""
+    payload = {
+        "project_uuid": project_uuid,
+        "server_uuid": server_uuid,
+        "environment_name": environment_name,
+        "docker_compose_raw": docker_compose_raw,
+        "name": name,
+        "instant_deploy": instant_deploy,
+    }
+
+    if description:
+        payload["description"] = description
+    if destination_uuid:
+        payload["destination_uuid"] = destination_uuid
+
+    return payload
+
+
+class _CoolifySettings:
+    """Configuration and response handling shared by the sync and async clients."""
+
+    def __init__(
+        self, base_url: str | None = None, token: str | None = None, timeout: float = 60.0
+    ):
+        """Resolve the API URL and token from arguments or COOLIFY_API_* env vars."""
+        env_base_url = os.getenv("COOLIFY_API_URL")  # No default - must be configured
+        self.base_url: str = base_url if base_url is not None else (env_base_url or "")
+
+        if not self.base_url:
+            raise ValueError(
+                "Coolify API URL required. Set COOLIFY_API_URL env var or pass base_url parameter."
+            )
+
+        token_value = token if token is not None else os.getenv("COOLIFY_API_TOKEN")
+        if not token_value:
+            raise ValueError(
+                "Coolify API token required. Set COOLIFY_API_TOKEN env var "
+                "or pass token parameter. Generate at: Coolify UI > Keys & Tokens > API tokens"
+            )
+        self.token: str = token_value
+
+        # Ensure base URL has /api/v1
+        if not self.base_url.endswith("/api/v1"):
+            self.base_url = f"{self.base_url.rstrip('/')}/api/v1"
+
+        self.timeout = timeout
+        self.headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+
+    @staticmethod
+    def _parse(response: httpx.Response) -> Any:
+        """Raise on HTTP errors and decode the JSON body."""
+        response.raise_for_status()
+
+        # Some endpoints return empty response
+        if response.status_code == 204 or not response.content:
+            return {"success": True}
+
+        return response.json()
+
+
+class CoolifyClient(_CoolifySettings):
     """
     Coolify API client for deployment management.
 
@@ -69,47 +187,13 @@ class CoolifyClient:
             token: API token. Defaults to COOLIFY_API_TOKEN env var
             timeout: Request timeout in seconds
         """
-        env_base_url = os.getenv("COOLIFY_API_URL")  # No default - must be configured
-        self.base_url: str = base_url if base_url is not None else (env_base_url or "")
-
-        if not self.base_url:
-            raise ValueError(
-                "Coolify API URL required. Set COOLIFY_API_URL env var or pass base_url parameter."
-            )
-
-        token_value = token if token is not None else os.getenv("COOLIFY_API_TOKEN")
-        if not token_value:
-            raise ValueError(
-                "Coolify API token required. Set COOLIFY_API_TOKEN env var "
-                "or pass token parameter. Generate at: Coolify UI > Keys & Tokens > API tokens"
-            )
-        self.token: str = token_value
-
-        # Ensure base URL has /api/v1
-        if not self.base_url.endswith("/api/v1"):
-            self.base_url = f"{self.base_url.rstrip('/')}/api/v1"
-
-        self.timeout = timeout
-        self._client = httpx.Client(
-            timeout=timeout,
-            headers={
-                "Authorization": f"Bearer {self.token}",
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            },
-        )
+        super().__init__(base_url, token, timeout)
+        self._client = create_client(timeout=timeout, headers=self.headers)
 
     def _request(self, method: str, endpoint: str, **kwargs) -> Any:
         """Make HTTP request to Coolify API."""
         url = f"{self.base_url}{endpoint}"
-        response = self._client.request(method, url, **kwargs)
-        response.raise_for_status()
-
-        # Some endpoints return empty response
-        if response.status_code == 204 or not response.content:
-            return {"success": True}
-
-        return response.json()
+        return self._parse(self._client.request(method, url, **kwargs))
 
     # =========================================================================
     # Health & Version
@@ -230,28 +314,20 @@ class CoolifyClient:
         Returns:
             Created application dict with uuid
         """
-        payload = {
-            "project_uuid": project_uuid,
-            "server_uuid": server_uuid,
-            "environment_name": environment_name,
-            "type": type,
-            "build_pack": build_pack,
-        }
-
-        if name:
-            payload["name"] = name
-        if description:
-            payload["description"] = description
-        if fqdn:
-            payload["fqdn"] = fqdn
-        if git_repository:
-            payload["git_repository"] = git_repository
-            payload["git_branch"] = git_branch
-        if build_pack == "dockerfile":
-            payload["dockerfile_location"] = dockerfile_location
-        if build_pack == "dockercompose":
-            payload["docker_compose_location"] = docker_compose_location
-
+        payload = _application_payload(
+            project_uuid,
+            server_uuid,
+            environment_name,
+            type,
+            name,
+            description,
+            fqdn,
+            git_repository,
+            git_branch,
+            build_pack,
+            dockerfile_location,
+            docker_compose_location,
+        )
         return self._request("POST", "/applications", json=payload)
 
     def create_dockercompose_application(
@@ -286,20 +362,16 @@ class CoolifyClient:
         Raises:
             HTTPStatusError: 409 if app already exists (handle as idempotent)
         """
-        payload = {
-            "project_uuid": project_uuid,
-            "server_uuid": server_uuid,
-            "environment_name": environment_name,
-            "docker_compose_raw": docker_compose_raw,
-            "name": name,
-            "instant_deploy": instant_deploy,
-        }
-
-        if description:
-            payload["description"] = description
-        if destination_uuid:
-            payload["destination_uuid"] = destination_uuid
-
+        payload = _dockercompose_payload(
+            project_uuid,
+            server_uuid,
+            docker_compose_raw,
+            name,
+            environment_name,
+            description,
+            instant_deploy,
+            destination_uuid,
+        )
         return self._request("POST", "/applications/dockercompose", json=payload)
 
     def update_application(self, uuid: str, **kwargs) -> dict[str, Any]:
@@ -537,3 +609,354 @@ class CoolifyClient:
     def close(self):
         """Close HTTP client."""
         self._client.close()
+
+
+class AsyncCoolifyClient(_CoolifySettings):
+    """
+    Async Coolify API client with the same methods as CoolifyClient.
+
+    Lets independent calls overlap, e.g. deploying several sites at once.
+
+    Usage:
+        async with AsyncCoolifyClient() as coolify:
+            apps, servers = await asyncio.gather(
+                coolify.list_applications(), coolify.list_servers()
+            )
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        token: str | None = None,
+        timeout: float = 60.0,
+        retry: RetryPolicy | None = None,
+    ):
+        """
+        Initialize async Coolify client.
+
+        Args:
+            base_url: Coolify API URL. Defaults to COOLIFY_API_URL env var
+            token: API token. Defaults to COOLIFY_API_TOKEN env var
+            timeout: Request timeout in seconds
+            retry: Retry policy for requests (default: DEFAULT_RETRY)
+        """
+        super().__init__(base_url, token, timeout)
+        self._client = create_async_client(timeout=timeout, headers=self.headers, retry=retry)
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Make HTTP request to Coolify API."""
+        url = f"{self.base_url}{endpoint}"
+        return self._parse(await self._client.request(method, url, **kwargs))
+
+    # =========================================================================
+    # Health & Version
+    # =========================================================================
+
+    async def health(self) -> dict[str, Any]:
+        """Check Coolify health (no auth required)."""
+        # Health endpoint is at /api/health, not /api/v1/health
+        url = self.base_url.replace("/api/v1", "/api/health")
+        response = await self._client.get(url)
+        return response.json() if response.status_code == 200 else {"status": "error"}
+
+    async def version(self) -> str:
+        """Get Coolify version."""
+        url = f"{self.base_url}/version"
+        response = await self._client.get(url)
+        return response.text.strip()
+
+    # =========================================================================
+    # Servers
+    # =========================================================================
+
+    async def list_servers(self) -> list[dict[str, Any]]:
+        """List all servers."""
+        return await self._request("GET", "/servers")
+
+    async def get_server(self, uuid: str) -> dict[str, Any]:
+        """Get server details by UUID."""
+        return await self._request("GET", f"/servers/{uuid}")
+
+    async def get_server_resources(self, uuid: str) -> list[dict[str, Any]]:
+        """Get all resources (apps, services, databases) on a server."""
+        return await self._request("GET", f"/servers/{uuid}/resources")
+
+    async def get_server_domains(self, uuid: str) -> list[dict[str, Any]]:
+        """Get all domains configured on a server."""
+        return await self._request("GET", f"/servers/{uuid}/domains")
+
+    # =========================================================================
+    # Projects
+    # =========================================================================
+
+    async def list_projects(self) -> list[dict[str, Any]]:
+        """List all projects."""
+        return await self._request("GET", "/projects")
+
+    async def get_project(self, uuid: str) -> dict[str, Any]:
+        """Get project details by UUID."""
+        return await self._request("GET", f"/projects/{uuid}")
+
+    async def create_project(self, name: str, description: str = "") -> dict[str, Any]:
+        """Create a new project."""
+        return await self._request(
+            "POST", "/projects", json={"name": name, "description": description}
+        )
+
+    # =========================================================================
+    # Applications
+    # =========================================================================
+
+    async def list_applications(self) -> list[dict[str, Any]]:
+        """List all applications."""
+        return await self._request("GET", "/applications")
+
+    async def get_application(self, uuid: str) -> dict[str, Any]:
+        """Get application details by UUID."""
+        return await self._request("GET", f"/applications/{uuid}")
+
+    async def create_application(
+        self,
+        project_uuid: str,
+        server_uuid: str,
+        environment_name: str = "production",
+        type: Literal["public", "private"] = "public",
+        name: str | None = None,
+        description: str = "",
+        fqdn: str | None = None,
+        git_repository: str | None = None,
+        git_branch: str = "main",
+        build_pack: Literal["nixpacks", "dockerfile", "dockercompose"] = "dockerfile",
+        dockerfile_location: str = "/Dockerfile",
+        docker_compose_location: str = "/docker-compose.yml",
+    ) -> dict[str, Any]:
+        """Create a new application."""
+        payload = _application_payload(
+            project_uuid,
+            server_uuid,
+            environment_name,
+            type,
+            name,
+            description,
+            fqdn,
+            git_repository,
+            git_branch,
+            build_pack,
+            dockerfile_location,
+            docker_compose_location,
+        )
+        return await self._request("POST", "/applications", json=payload)
+
+    async def create_dockercompose_application(
+        self,
+        project_uuid: str,
+        server_uuid: str,
+        docker_compose_raw: str,
+        name: str,
+        environment_name: str = "production",
+        description: str = "",
+        instant_deploy: bool = True,
+        destination_uuid: str | None = None,
+    ) -> dict[str, Any]:
+        """Create a Docker Compose application with inline YAML (no git required)."""
+        payload = _dockercompose_payload(
+            project_uuid,
+            server_uuid,
+            docker_compose_raw,
+            name,
+            environment_name,
+            description,
+            instant_deploy,
+            destination_uuid,
+        )
+        return await self._request("POST", "/applications/dockercompose", json=payload)
+
+    async def update_application(self, uuid: str, **kwargs) -> dict[str, Any]:
+        """Update application settings."""
+        return await self._request("PATCH", f"/applications/{uuid}", json=kwargs)
+
+    async def delete_application(self, uuid: str, delete_volumes: bool = False) -> dict[str, Any]:
+        """Delete application."""
+        params = {"delete_volumes": str(delete_volumes).lower()}
+        return await self._request("DELETE", f"/applications/{uuid}", params=params)
+
+    # =========================================================================
+    # Deployments
+    # =========================================================================
+
+    async def deploy(self, uuid: str, force: bool = False) -> dict[str, Any]:
+        """Deploy/redeploy an application."""
+        params = {"force": str(force).lower()} if force else {}
+        return await self._request("POST", f"/applications/{uuid}/deploy", params=params)
+
+    async def get_deployments(self, uuid: str) -> list[dict[str, Any]]:
+        """Get deployment history for application."""
+        return await self._request("GET", f"/applications/{uuid}/deployments")
+
+    async def get_deployment(self, app_uuid: str, deployment_uuid: str) -> dict[str, Any]:
+        """Get specific deployment details."""
+        return await self._request("GET", f"/applications/{app_uuid}/deployments/{deployment_uuid}")
+
+    async def stop_application(self, uuid: str) -> dict[str, Any]:
+        """Stop a running application."""
+        return await self._request("POST", f"/applications/{uuid}/stop")
+
+    async def start_application(self, uuid: str) -> dict[str, Any]:
+        """Start a stopped application."""
+        return await self._request("POST", f"/applications/{uuid}/start")
+
+    async def restart_application(self, uuid: str) -> dict[str, Any]:
+        """Restart an application."""
+        return await self._request("POST", f"/applications/{uuid}/restart")
+
+    # =========================================================================
+    # Environment Variables
+    # =========================================================================
+
+    async def get_env_vars(self, uuid: str) -> list[dict[str, Any]]:
+        """Get environment variables for application."""
+        return await self._request("GET", f"/applications/{uuid}/envs")
+
+    async def create_env_var(
+        self, uuid: str, key: str, value: str, is_secret: bool = True, is_build_time: bool = False
+    ) -> dict[str, Any]:
+        """Create environment variable for application."""
+        return await self._request(
+            "POST",
+            f"/applications/{uuid}/envs",
+            json={
+                "key": key,
+                "value": value,
+                "is_preview": False,
+                "is_build_time": is_build_time,
+                "is_literal": True,
+            },
+        )
+
+    async def update_env_var(self, uuid: str, env_uuid: str, **kwargs) -> dict[str, Any]:
+        """Update an environment variable."""
+        return await self._request("PATCH", f"/applications/{uuid}/envs/{env_uuid}", json=kwargs)
+
+    async def delete_env_var(self, uuid: str, env_uuid: str) -> dict[str, Any]:
+        """Delete an environment variable."""
+        return await self._request("DELETE", f"/applications/{uuid}/envs/{env_uuid}")
+
+    async def bulk_update_env_vars(self, uuid: str, env_vars: dict[str, str]) -> dict[str, Any]:
+        """Bulk update environment variables."""
+        return await self._request(
+            "PATCH",
+            f"/applications/{uuid}/envs/bulk",
+            json={"data": [{"key": k, "value": v} for k, v in env_vars.items()]},
+        )
+
+    # =========================================================================
+    # Services (One-click services like databases)
+    # =========================================================================
+
+    async def list_services(self) -> list[dict[str, Any]]:
+        """List all services."""
+        return await self._request("GET", "/services")
+
+    async def get_service(self, uuid: str) -> dict[str, Any]:
+        """Get service details by UUID."""
+        return await self._request("GET", f"/services/{uuid}")
+
+    async def start_service(self, uuid: str) -> dict[str, Any]:
+        """Start a service."""
+        return await self._request("POST", f"/services/{uuid}/start")
+
+    async def stop_service(self, uuid: str) -> dict[str, Any]:
+        """Stop a service."""
+        return await self._request("POST", f"/services/{uuid}/stop")
+
+    async def restart_service(self, uuid: str) -> dict[str, Any]:
+        """Restart a service."""
+        return await self._request("POST", f"/services/{uuid}/restart")
+
+    async def delete_service(self, uuid: str) -> dict[str, Any]:
+        """Delete a service."""
+        return await self._request("DELETE", f"/services/{uuid}")
+
+    async def update_service_env_vars(self, uuid: str, env_vars: dict[str, str]) -> dict[str, Any]:
+        """Update environment variables for a docker-compose service."""
+        # Services use different endpoint than applications
+        return await self._request(
+            "PATCH",
+            f"/services/{uuid}",
+            json={
+                "docker_compose_raw": None,  # Keep existing compose
+                "environment_variables": env_vars,
+            },
+        )
+
+    # =========================================================================
+    # Databases
+    # =========================================================================
+
+    async def list_databases(self) -> list[dict[str, Any]]:
+        """List all databases."""
+        return await self._request("GET", "/databases")
+
+    async def get_database(self, uuid: str) -> dict[str, Any]:
+        """Get database details by UUID."""
+        return await self._request("GET", f"/databases/{uuid}")
+
+    async def create_database(
+        self,
+        project_uuid: str,
+        server_uuid: str,
+        environment_name: str = "production",
+        type: Literal["postgresql", "mysql", "mariadb", "mongodb", "redis"] = "postgresql",
+        name: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Create a new database."""
+        payload = {
+            "project_uuid": project_uuid,
+            "server_uuid": server_uuid,
+            "environment_name": environment_name,
+            "type": type,
+            **kwargs,
+        }
+        if name:
+            payload["name"] = name
+
+        return await self._request("POST", "/databases", json=payload)
+
+    async def start_database(self, uuid: str) -> dict[str, Any]:
+        """Start a database."""
+        return await self._request("POST", f"/databases/{uuid}/start")
+
+    async def stop_database(self, uuid: str) -> dict[str, Any]:
+        """Stop a database."""
+        return await self._request("POST", f"/databases/{uuid}/stop")
+
+    async def restart_database(self, uuid: str) -> dict[str, Any]:
+        """Restart a database."""
+        return await self._request("POST", f"/databases/{uuid}/restart")
+
+    # =========================================================================
+    # Teams
+    # =========================================================================
+
+    async def list_teams(self) -> list[dict[str, Any]]:
+        """List all teams."""
+        return await self._request("GET", "/teams")
+
+    async def get_current_team(self) -> dict[str, Any]:
+        """Get current team (based on API token scope)."""
+        return await self._request("GET", "/teams/current")
+
+    # =========================================================================
+    # Context Manager
+    # =========================================================================
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self._client.aclose()
+
+    async def close(self):
+        """Close HTTP client."""
+        await self._client.aclose()
@@ -3,6 +3,8 @@ DNS Client - Wrapper for DNS Manager service.
 
 This client calls the dns-manager service at VPS (dns.vps1.ocoron.com),
 which provides unified access to both Namecheap and Cloudflare DNS.
+
+AsyncDNSClient has the same methods as coroutines.
 """
 
 import os
@@ -11,6 +13,8 @@ from typing import Any
 
 import httpx
 
+from fabrik.drivers.transport import RetryPolicy, create_async_client, create_client
+
 
 @dataclass
 class DNSRecord:
@@ -22,7 +26,23 @@ class DNSRecord:
     ttl: int = 1800
 
 
-class DNSClient:
+class _DNSSettings:
+    """Configuration and response handling shared by the sync and async clients."""
+
+    def __init__(self, base_url: str | None = None, timeout: float = 30.0):
+        self.base_url = base_url or os.getenv(
+            "DNS_MANAGER_URL", os.getenv("NAMECHEAP_API_URL", "https://dns.vps1.ocoron.com")
+        )
+        self.timeout = timeout
+
+    @staticmethod
+    def _parse(response: httpx.Response) -> dict[str, Any]:
+        """Raise on HTTP errors and decode the JSON body."""
+        response.raise_for_status()
+        return response.json()
+
+
+class DNSClient(_DNSSettings):
     """
     DNS management client that wraps the namecheap API service.
 
@@ -53,18 +73,13 @@ class DNSClient:
                      or https://dns.vps1.ocoron.com
             timeout: Request timeout in seconds
         """
-        self.base_url = base_url or os.getenv(
-            "DNS_MANAGER_URL", os.getenv("NAMECHEAP_API_URL", "https://dns.vps1.ocoron.com")
-        )
-        self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
+        super().__init__(base_url, timeout)
+        self._client = create_client(timeout=timeout)
 
     def _request(self, method: str, endpoint: str, **kwargs) -> dict[str, Any]:
         """Make HTTP request to namecheap service."""
         url = f"{self.base_url}{endpoint}"
-        response = self._client.request(method, url, **kwargs)
-        response.raise_for_status()
-        return response.json()
+        return self._parse(self._client.request(method, url, **kwargs))
 
     # =========================================================================
     # Health & Status
@@ -218,6 +233,129 @@ class DNSClient:
         self._client.close()
 
 
+class AsyncDNSClient(_DNSSettings):
+    """
+    Async DNS management client with the same methods as DNSClient.
+
+    Usage:
+        async with AsyncDNSClient() as dns:
+            records = await asyncio.gather(*(dns.get_records(d) for d in domains))
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float = 30.0,
+        retry: RetryPolicy | None = None,
+    ):
+        """
+        Initialize async DNS client.
+
+        Args:
+            base_url: DNS Manager service URL. Defaults to DNS_MANAGER_URL env var
+                     or https://dns.vps1.ocoron.com
+            timeout: Request timeout in seconds
+            retry: Retry policy for requests (default: DEFAULT_RETRY)
+        """
+        super().__init__(base_url, timeout)
+        self._client = create_async_client(timeout=timeout, retry=retry)
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> dict[str, Any]:
+        """Make HTTP request to namecheap service."""
+        url = f"{self.base_url}{endpoint}"
+        return self._parse(await self._client.request(method, url, **kwargs))
+
+    # =========================================================================
+    # Health & Status
+    # =========================================================================
+
+    async def health(self) -> dict[str, Any]:
+        """Check namecheap service health."""
+        return await self._request("GET", "/health")
+
+    async def get_rate_limit(self) -> dict[str, Any]:
+        """Get current rate limit status."""
+        return await self._request("GET", "/ratelimit")
+
+    # =========================================================================
+    # Domain Management
+    # =========================================================================
+
+    async def list_domains(self) -> list[dict[str, Any]]:
+        """List all domains in account."""
+        result = await self._request("GET", "/api/domains")
+        return result.get("domains", [])
+
+    async def get_domain(self, domain: str) -> dict[str, Any]:
+        """Get details for specific domain."""
+        return await self._request("GET", f"/api/domains/{domain}")
+
+    async def check_availability(self, domains: list[str]) -> dict[str, bool]:
+        """Check domain availability for registration."""
+        result = await self._request("POST", "/api/domains/check", json={"domains": domains})
+        return result.get("availability", {})
+
+    # =========================================================================
+    # DNS Records
+    # =========================================================================
+
+    async def get_records(self, domain: str) -> list[dict[str, Any]]:
+        """Get all DNS records for domain."""
+        result = await self._request("GET", f"/api/dns/{domain}")
+        return result.get("records", [])
+
+    async def add_subdomain(self, domain: str, subdomain: str, ip: str) -> dict[str, Any]:
+        """Add A record for subdomain."""
+        return await self._request(
+            "POST", f"/api/dns/{domain}/subdomain", json={"subdomain": subdomain, "ip": ip}
+        )
+
+    async def set_records(self, domain: str, records: list[dict[str, Any]]) -> dict[str, Any]:
+        """Set DNS records for domain (replaces all records)."""
+        return await self._request("PUT", f"/api/dns/{domain}", json={"records": records})
+
+    async def delete_records(self, domain: str) -> dict[str, Any]:
+        """Delete all DNS records for domain. USE WITH CAUTION."""
+        return await self._request("DELETE", f"/api/dns/{domain}")
+
+    # =========================================================================
+    # Nameservers
+    # =========================================================================
+
+    async def get_nameservers(self, domain: str) -> list[str]:
+        """Get nameservers for domain."""
+        result = await self._request("GET", f"/api/dns/{domain}/nameservers")
+        return result.get("nameservers", [])
+
+    async def set_nameservers(self, domain: str, nameservers: list[str]) -> dict[str, Any]:
+        """Set custom nameservers for domain."""
+        return await self._request(
+            "PUT", f"/api/dns/{domain}/nameservers", json={"nameservers": nameservers}
+        )
+
+    # =========================================================================
+    # Account
+    # =========================================================================
+
+    async def get_balance(self) -> dict[str, Any]:
+        """Get account balance."""
+        return await self._request("GET", "/api/account/balance")
+
+    # =========================================================================
+    # Context Manager
+    # =========================================================================
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self._client.aclose()
+
+    async def close(self):
+        """Close HTTP client."""
+        await self._client.aclose()
+
+
 # Convenience function for quick operations
 def add_dns_record(domain: str, subdomain: str, ip: str) -> dict[str, Any]:
     """
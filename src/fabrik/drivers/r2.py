@@ -12,9 +12,9 @@ import hmac
 import os
 from datetime import UTC, datetime
 from typing import Literal
-from urllib.parse import quote, urlencode
+from urllib.parse import quote, urlencode, urlparse
 
-import httpx
+from fabrik.drivers.transport import create_client
 
 
 class R2Client:
@@ -32,6 +32,7 @@ class R2Client:
         bucket: str | None = None,
         public_url: str | None = None,
         timeout: float = 30.0,
+        endpoint: str | None = None,
     ):
         """
         Initialize R2 client.
@@ -43,6 +44,7 @@ class R2Client:
             bucket: Default bucket name
             public_url: Public URL for the bucket (if configured)
             timeout: Request timeout in seconds
+            endpoint: S3 API endpoint. Defaults to the account's R2 endpoint
         """
         self.account_id = account_id or os.getenv("R2_ACCOUNT_ID", "")
         self.access_key_id = access_key_id or os.getenv("R2_ACCESS_KEY_ID", "")
@@ -55,10 +57,12 @@ class R2Client:
             raise ValueError("R2_ACCOUNT_ID, R2_ACCESS_KEY_ID, R2_SECRET_ACCESS_KEY required")
 
         # R2 endpoint
-        self.endpoint = f"https://{self.account_id}.r2.cloudflarestorage.com"
+        self.endpoint = endpoint or f"https://{self.account_id}.r2.cloudflarestorage.com"
+        # Signed Host header; must match the endpoint the request is sent to
+        self.host = urlparse(self.endpoint).netloc
         self.region = "auto"  # R2 uses 'auto' region
 
-        self._client = httpx.Client(timeout=timeout)
+        self._client = create_client(timeout=timeout)
 
     def _sign(
         self,
@@ -138,7 +142,7 @@ class R2Client:
         """Check R2 connection by listing buckets."""
         try:
             path = "/"
-            headers = {"Host": f"{self.account_id}.r2.cloudflarestorage.com"}
+            headers = {"Host": self.host}
             headers = self._sign("GET", path, headers)
 
             response = self._client.get(self.endpoint, headers=headers)
@@ -195,13 +199,12 @@ class R2Client:
 
         # Canonical request
         path = f"/{bucket}/{key}"
-        host = f"{self.account_id}.r2.cloudflarestorage.com"
 
         signed_headers = query_params["X-Amz-SignedHeaders"]
         if content_type and method == "PUT":
-            canonical_headers = f"content-type:{content_type}\nhost:{host}\n"
+            canonical_headers = f"content-type:{content_type}\nhost:{self.host}\n"
         else:
-            canonical_headers = f"host:{host}\n"
+            canonical_headers = f"host:{self.host}\n"
 
         query_string = "&".join(
             f"{quote(k, safe='')}={quote(str(v), safe='')}" for k, v in sorted(query_params.items())
@@ -285,7 +288,7 @@ class R2Client:
 
         payload_hash = hashlib.sha256(data).hexdigest()
         headers = {
-            "Host": f"{self.account_id}.r2.cloudflarestorage.com",
+            "Host": self.host,
             "Content-Type": content_type,
             "Content-Length": str(len(data)),
         }
@@ -319,7 +322,7 @@ class R2Client:
         bucket = bucket or self.bucket
         path = f"/{bucket}/{key}"
 
-        headers = {"Host": f"{self.account_id}.r2.cloudflarestorage.com"}
+        headers = {"Host": self.host}
         headers = self._sign("GET", path, headers)
 
         response = self._client.get(f"{self.endpoint}{path}", headers=headers)
@@ -341,7 +344,7 @@ class R2Client:
         bucket = bucket or self.bucket
         path = f"/{bucket}/{key}"
 
-        headers = {"Host": f"{self.account_id}.r2.cloudflarestorage.com"}
+        headers = {"Host": self.host}
         headers = self._sign("DELETE", path, headers)
 
         response = self._client.delete(f"{self.endpoint}{path}", headers=headers)
@@ -371,7 +374,7 @@ class R2Client:
         if prefix:
             query_params["prefix"] = prefix
 
-        headers = {"Host": f"{self.account_id}.r2.cloudflarestorage.com"}
+        headers = {"Host": self.host}
         headers = self._sign("GET", path, headers, query_params=query_params)
 
         query_string = urlencode(query_params)
@@ -13,7 +13,7 @@ import os
 from dataclasses import dataclass
 from typing import Any
 
-import httpx
+from fabrik.drivers.transport import create_client
 
 
 @dataclass
@@ -72,7 +72,7 @@ class SupabaseClient:
         self.rest_url = f"{self.url}/rest/v1"
         self.auth_url = f"{self.url}/auth/v1"
 
-        self._client = httpx.Client(timeout=timeout)
+        self._client = create_client(timeout=timeout)
 
     def _headers(self, use_service_role: bool = False) -> dict[str, str]:
         """Get headers for API requests."""
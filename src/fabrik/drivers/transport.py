@@ -0,0 +1,505 @@
+"""
+Shared HTTP transport for Fabrik drivers.
+
+Every driver builds its httpx.Client with create_client(). Those clients
+share one process-wide connection pool, so keep-alive connections to a
+host are reused across driver instances and calls. The shared transport:
+- caps concurrent connections per host (MAX_CONNECTIONS_PER_HOST)
+- retries 429 and 5xx responses and connection failures with jittered
+  exponential backoff, honouring Retry-After
+- reports every attempt to the timing hooks (add_timing_hook())
+- speaks HTTP/2 when FABRIK_HTTP2=1 and the h2 package is installed
+
+create_async_client() gives async drivers the same retries, limits and
+hooks on a pool owned by the client.
+
+Usage:
+    from fabrik.drivers.transport import create_client
+
+    client = create_client(base_url="https://api.example.com", timeout=30.0)
+    client.get("/status")  # Retried on 429/5xx
+    client.close()  # Leaves the shared pool open
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import email.utils
+import importlib.util
+import logging
+import os
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def _env_max_per_host(default: int = 10) -> int:
+    """FABRIK_HTTP_MAX_PER_HOST, or default (with a warning) unless it is an integer >= 1.
+
+    Read at import, so a bad value must not make every driver import fail,
+    and 0 would block every request on its host's semaphore.
+    """
+    value = os.getenv("FABRIK_HTTP_MAX_PER_HOST")
+    if value is None:
+        return default
+    try:
+        limit = int(value)
+        if limit < 1:
+            raise ValueError(value)
+    except ValueError:
+        logger.warning("Invalid FABRIK_HTTP_MAX_PER_HOST %r, using %d", value, default)
+        return default
+    return limit
+
+
+DEFAULT_TIMEOUT = 30.0
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+MAX_CONNECTIONS_PER_HOST = _env_max_per_host()
+KEEPALIVE_EXPIRY = 30.0
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Methods that are safe to repeat after the server may have acted on them
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Errors raised before the request reached the server (safe to retry for any method)
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before repeating a request.
+
+    429 responses and connection failures are retried for every method;
+    5xx responses and other transport errors only for idempotent methods.
+    """
+
+    attempts: int = 3  # Total attempts, including the first
+    backoff: float = 0.5  # Base delay in seconds, doubled per attempt
+    max_delay: float = 30.0  # Longer Retry-After values are not waited for
+    statuses: frozenset[int] = RETRY_STATUSES
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Seconds to wait before attempt + 1: Retry-After if given, else full jitter."""
+        if response is not None:
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                return retry_after
+        return random.uniform(0, min(self.max_delay, self.backoff * 2**attempt))
+
+
+DEFAULT_RETRY = RetryPolicy()
+NO_RETRY = RetryPolicy(attempts=1)
+
+
+@dataclass(frozen=True)
+class RequestTiming:
+    """One attempt at a request, as passed to timing hooks."""
+
+    method: str
+    url: str
+    attempt: int  # 1-based
+    elapsed: float  # Seconds until the response headers (or the error)
+    status_code: int | None = None
+    error: str | None = None
+
+
+_timing_hooks: list[Callable[[RequestTiming], None]] = []
+
+
+def add_timing_hook(hook: Callable[[RequestTiming], None]) -> None:
+    """Call hook after every request attempt made through the shared transport."""
+    _timing_hooks.append(hook)
+
+
+def remove_timing_hook(hook: Callable[[RequestTiming], None]) -> None:
+    """Stop calling a hook registered with add_timing_hook()."""
+    if hook in _timing_hooks:
+        _timing_hooks.remove(hook)
+
+
+def _report(timing: RequestTiming) -> None:
+    for hook in list(_timing_hooks):
+        try:
+            hook(timing)
+        except Exception as e:
+            logger.warning("HTTP timing hook failed: %s", e)
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Retry-After in seconds (delta-seconds or HTTP-date form), if present."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delay(
+    policy: RetryPolicy,
+    request: httpx.Request,
+    attempt: int,
+    response: httpx.Response | None = None,
+    error: Exception | None = None,
+) -> float | None:
+    """Seconds to wait before repeating request after attempt, or None to stop."""
+    # Streamed uploads cannot be replayed
+    if attempt >= policy.attempts or not isinstance(request.stream, httpx.ByteStream):
+        return None
+    idempotent = request.method in IDEMPOTENT_METHODS
+    if response is None:
+        return policy.delay(attempt) if idempotent or isinstance(error, CONNECT_ERRORS) else None
+    status = response.status_code
+    if status not in policy.statuses or not (idempotent or status == 429):
+        return None
+    delay = policy.delay(attempt, response)
+    # Retry-After longer than we are willing to wait
+    return delay if delay <= policy.max_delay else None
+
+
+def _timing(
+    request: httpx.Request,
+    attempt: int,
+    started: float,
+    response: httpx.Response | None = None,
+    error: Exception | None = None,
+) -> RequestTiming:
+    return RequestTiming(
+        request.method,
+        str(request.url),
+        attempt,
+        time.perf_counter() - started,
+        status_code=response.status_code if response is not None else None,
+        error=type(error).__name__ if error is not None else None,
+    )
+
+
+def _log_retry(request: httpx.Request, delay: float, attempt: int, policy: RetryPolicy) -> None:
+    logger.debug(
+        "Retrying %s %s in %.2fs (attempt %d/%d)",
+        request.method,
+        request.url,
+        delay,
+        attempt + 1,
+        policy.attempts,
+    )
+
+
+def _host(request: httpx.Request) -> tuple[bytes, int | None]:
+    return (request.url.raw_host, request.url.port)
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Response body that frees its per-host connection slot when closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """Async response body that frees its per-host connection slot when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Transport adding per-host limits, retries and timing hooks to another transport."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        retry: RetryPolicy = DEFAULT_RETRY,
+        max_per_host: int = MAX_CONNECTIONS_PER_HOST,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._transport = transport
+        self.retry = retry
+        self.max_per_host = max_per_host
+        self._sleep = sleep
+        self._host_slots: dict[tuple[bytes, int | None], threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, request: httpx.Request) -> threading.BoundedSemaphore:
+        key = _host(request)
+        with self._lock:
+            if key not in self._host_slots:
+                self._host_slots[key] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_slots[key]
+
+    def _send_once(self, request: httpx.Request) -> httpx.Response:
+        slot = self._slot(request)
+        slot.acquire()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        if response.is_closed:  # Body already read (e.g. MockTransport)
+            slot.release()
+            return response
+        response.stream = _ReleasingStream(response.stream, slot.release)  # type: ignore[arg-type]
+        return response
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        policy = request.extensions.get("fabrik_retry", self.retry)
+        attempt = 1
+        while True:
+            started = time.perf_counter()
+            try:
+                response = self._send_once(request)
+            except httpx.TransportError as e:
+                _report(_timing(request, attempt, started, error=e))
+                delay = _retry_delay(policy, request, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                _report(_timing(request, attempt, started, response=response))
+                delay = _retry_delay(policy, request, attempt, response=response)
+                if delay is None:
+                    return response
+                response.close()
+
+            _log_retry(request, delay, attempt, policy)
+            self._sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async twin of RetryTransport for httpx.AsyncClient."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        retry: RetryPolicy = DEFAULT_RETRY,
+        max_per_host: int = MAX_CONNECTIONS_PER_HOST,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self._transport = transport
+        self.retry = retry
+        self.max_per_host = max_per_host
+        self._sleep = sleep
+        self._host_slots: dict[tuple[bytes, int | None], asyncio.BoundedSemaphore] = {}
+
+    async def _send_once(self, request: httpx.Request) -> httpx.Response:
+        key = _host(request)
+        if key not in self._host_slots:
+            self._host_slots[key] = asyncio.BoundedSemaphore(self.max_per_host)
+        slot = self._host_slots[key]
+        await slot.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        if response.is_closed:  # Body already read (e.g. MockTransport)
+            slot.release()
+            return response
+        response.stream = _AsyncReleasingStream(response.stream, slot.release)  # type: ignore[arg-type]
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        policy = request.extensions.get("fabrik_retry", self.retry)
+        attempt = 1
+        while True:
+            started = time.perf_counter()
+            try:
+                response = await self._send_once(request)
+            except httpx.TransportError as e:
+                _report(_timing(request, attempt, started, error=e))
+                delay = _retry_delay(policy, request, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                _report(_timing(request, attempt, started, response=response))
+                delay = _retry_delay(policy, request, attempt, response=response)
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            _log_retry(request, delay, attempt, policy)
+            await self._sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """The process-wide RetryTransport; clients closing it leave the pool open."""
+
+    def __init__(self, transport: RetryTransport):
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass  # Closed at exit by close_shared_transport()
+
+
+_shared: _SharedTransport | None = None
+_shared_lock = threading.Lock()
+
+
+def http2_available() -> bool:
+    """True if httpx can speak HTTP/2 (the optional h2 package is installed)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _http2_enabled() -> bool:
+    http2 = os.getenv("FABRIK_HTTP2", "").lower() in ("1", "true", "yes")
+    if http2 and not http2_available():
+        logger.info("FABRIK_HTTP2 is set but h2 is not installed; using HTTP/1.1")
+        return False
+    return http2
+
+
+POOL_LIMITS = httpx.Limits(
+    max_connections=MAX_CONNECTIONS,
+    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=KEEPALIVE_EXPIRY,
+)
+
+
+def shared_transport() -> _SharedTransport:
+    """The process-wide pooled transport, created on first use."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            pool = httpx.HTTPTransport(http2=_http2_enabled(), limits=POOL_LIMITS)
+            _shared = _SharedTransport(RetryTransport(pool))
+            atexit.register(close_shared_transport)
+        return _shared
+
+
+def close_shared_transport() -> None:
+    """Close the pooled connections; the next client starts a new pool."""
+    global _shared
+    with _shared_lock:
+        if _shared is not None:
+            _shared.transport.close()
+            _shared = None
+
+
+class _RetryClient(httpx.Client):
+    """httpx.Client whose requests carry its retry policy to the shared transport."""
+
+    def __init__(self, retry: RetryPolicy, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._retry = retry
+
+    def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        request.extensions.setdefault("fabrik_retry", self._retry)
+        return super().send(request, **kwargs)
+
+
+def create_client(
+    base_url: str = "",
+    headers: dict[str, str] | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    retry: RetryPolicy | None = None,
+    follow_redirects: bool = False,
+    transport: httpx.BaseTransport | None = None,
+) -> httpx.Client:
+    """
+    Create an httpx.Client on the shared transport.
+
+    Args:
+        base_url: Prefix for relative request URLs
+        headers: Headers sent with every request
+        timeout: Request timeout in seconds
+        retry: Retry policy for this client's requests (default: DEFAULT_RETRY)
+        follow_redirects: Follow 3xx responses
+        transport: Transport to use instead of the shared one (e.g. for tests)
+
+    Returns:
+        Client whose close() leaves the shared connection pool open
+    """
+    return _RetryClient(
+        retry or DEFAULT_RETRY,
+        base_url=base_url,
+        headers=headers,
+        timeout=timeout,
+        follow_redirects=follow_redirects,
+        transport=transport or shared_transport(),
+    )
+
+
+def create_async_client(
+    base_url: str = "",
+    headers: dict[str, str] | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    retry: RetryPolicy | None = None,
+    follow_redirects: bool = False,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """
+    Create an httpx.AsyncClient with its own pooled AsyncRetryTransport.
+
+    Async connections belong to one event loop, so unlike create_client()
+    each async client owns its pool; keep the client open across calls
+    and close it with aclose() (or ``async with``).
+
+    Args:
+        base_url: Prefix for relative request URLs
+        headers: Headers sent with every request
+        timeout: Request timeout in seconds
+        retry: Retry policy for this client's requests (default: DEFAULT_RETRY)
+        follow_redirects: Follow 3xx responses
+        transport: Transport to use instead of a new pool (e.g. for tests)
+
+    Returns:
+        Async client with retries, per-host limits and timing hooks
+    """
+    if transport is None:
+        pool = httpx.AsyncHTTPTransport(http2=_http2_enabled(), limits=POOL_LIMITS)
+        transport = AsyncRetryTransport(pool, retry=retry or DEFAULT_RETRY)
+    return httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        timeout=timeout,
+        follow_redirects=follow_redirects,
+        transport=transport,
+    )
@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from fabrik.drivers.transport import create_client
+
 if TYPE_CHECKING:
     pass
 
@@ -77,7 +79,7 @@ class WordPressAPIClient:
     def client(self) -> httpx.Client:
         """Get or create HTTP client."""
         if self._client is None:
-            self._client = httpx.Client(
+            self._client = create_client(
                 base_url=self.credentials.base_url,
                 headers={
                     "Authorization": self.credentials.auth_header,
@@ -234,12 +236,11 @@ class WordPressAPIClient:
         path = Path(file_path)
         content_type = mimetypes.guess_type(str(path))[0] or "application/octet-stream"
 
-        # Need to use different client for file upload
+        # Per-request headers replace the client's JSON Content-Type
         with open(file_path, "rb") as f:
-            response = httpx.post(
-                f"{self.credentials.base_url}/media",
+            response = self.client.post(
+                "/media",
                 headers={
-                    "Authorization": self.credentials.auth_header,
                     "Content-Disposition": f'attachment; filename="{path.name}"',
                     "Content-Type": content_type,
                 },
@@ -6,6 +6,7 @@ so Coolify healthchecks and Uptime Kuma can detect upstream outages.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -13,11 +14,16 @@ from fastapi import FastAPI, status
 from fastapi.responses import JSONResponse
 
 from fabrik.config import ensure_directories
-from fabrik.drivers.coolify import CoolifyClient
-from fabrik.drivers.dns import DNSClient
+from fabrik.drivers.coolify import AsyncCoolifyClient
+from fabrik.drivers.dns import AsyncDNSClient
+from fabrik.drivers.transport import NO_RETRY
 
 logger = logging.getLogger(__name__)
 
+# Probes report failures instead of retrying them, and give up well inside
+# typical healthcheck timeouts (Coolify/Docker default to 10s+)
+PROBE_TIMEOUT = 5.0
+
 app = FastAPI(title="Fabrik", version="0.1.0")
 
 
@@ -41,15 +47,15 @@ def _normalize_status(payload: Any) -> tuple[str, dict[str, Any]]:
     return ("healthy" if healthy else "unhealthy"), details
 
 
-def check_coolify() -> dict[str, Any]:
+async def check_coolify() -> dict[str, Any]:
     """Ping Coolify's health endpoint.
 
     Returns a dict with `status` (healthy/unhealthy) and details/error.
     """
 
     try:
-        client = CoolifyClient()
-        response = client.health()
+        async with AsyncCoolifyClient(timeout=PROBE_TIMEOUT, retry=NO_RETRY) as client:
+            response = await client.health()
         normalized, details = _normalize_status(response)
         return {"status": normalized, "details": details}
     except Exception as exc:  # noqa: BLE001 - health must surface issues
@@ -57,12 +63,12 @@ def check_coolify() -> dict[str, Any]:
         return {"status": "unhealthy", "error": str(exc)}
 
 
-def check_dns() -> dict[str, Any]:
+async def check_dns() -> dict[str, Any]:
     """Ping DNS manager health endpoint."""
 
     try:
-        client = DNSClient()
-        response = client.health()
+        async with AsyncDNSClient(timeout=PROBE_TIMEOUT, retry=NO_RETRY) as client:
+            response = await client.health()
         normalized, details = _normalize_status(response)
         return {"status": normalized, "details": details}
     except Exception as exc:  # noqa: BLE001 - health must surface issues
@@ -81,8 +87,8 @@ async def _startup() -> None:
 async def health() -> JSONResponse:
     """Aggregate health across Coolify and DNS dependencies."""
 
-    coolify_status = check_coolify()
-    dns_status = check_dns()
+    # Both checks run concurrently; the endpoint waits for the slower one only
+    coolify_status, dns_status = await asyncio.gather(check_coolify(), check_dns())
 
     checks = {"coolify": coolify_status, "dns": dns_status}
     all_healthy = all(entry.get("status") == "healthy" for entry in checks.values())
@@ -1,6 +1,7 @@
 import logging
 import os
 import time
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 
@@ -21,7 +22,7 @@ class ProcessState(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessMetrics:
     cpu_percent: float
     memory_percent: float
@@ -56,7 +57,7 @@ class ProcessMonitor:
         self.history_size = history_size
         self._last_io = None
         self._last_check_time = time.time()
-        self._metrics_history: list[ProcessMetrics] = []
+        self._metrics_history: deque[ProcessMetrics] = deque(maxlen=history_size)
 
         # Calibration
         self.process.cpu_percent()  # Init call
@@ -109,9 +110,7 @@ class ProcessMonitor:
                 syscall=syscall,
                 wchan=wchan,
             )
-            self._metrics_history.append(metrics)
-            if len(self._metrics_history) > self.history_size:
-                self._metrics_history.pop(0)
+            self._metrics_history.append(metrics)  # deque evicts the oldest in O(1)
 
             # 2. Diagnose State
 
@@ -2,9 +2,8 @@
 
 import logging
 import time
-from urllib.error import URLError
-from urllib.request import urlopen
 
+from fabrik.drivers.transport import NO_RETRY, create_client
 from fabrik.orchestrator.context import DeploymentContext
 from fabrik.orchestrator.exceptions import VerificationError
 
@@ -81,45 +80,39 @@ class DeploymentVerifier:
         """
         last_error: str | None = None
 
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                # Only allow https:// URLs for security
-                if not url.startswith("https://"):
-                    raise ValueError(f"Only HTTPS URLs allowed: {url}")
-                response = urlopen(url, timeout=self.timeout)  # nosec B310
-                status = response.getcode()
-
-                if status == 200:
-                    logger.info("Health check passed: %s (attempt %d)", url, attempt)
-                    return True
-
-                last_error = f"Unexpected status code: {status}"
-                logger.warning(
-                    "Health check failed (attempt %d/%d): %s",
-                    attempt,
-                    self.max_retries,
-                    last_error,
-                )
-
-            except URLError as e:
-                last_error = str(e.reason)
-                logger.warning(
-                    "Health check failed (attempt %d/%d): %s",
-                    attempt,
-                    self.max_retries,
-                    last_error,
-                )
-            except Exception as e:
-                last_error = str(e)
-                logger.warning(
-                    "Health check failed (attempt %d/%d): %s",
-                    attempt,
-                    self.max_retries,
-                    last_error,
-                )
-
-            if attempt < self.max_retries:
-                time.sleep(self.retry_interval)
+        # Redirects are followed as urlopen() did; this loop owns the retries
+        with create_client(timeout=self.timeout, retry=NO_RETRY, follow_redirects=True) as client:
+            for attempt in range(1, self.max_retries + 1):
+                try:
+                    # Only allow https:// URLs for security
+                    if not url.startswith("https://"):
+                        raise ValueError(f"Only HTTPS URLs allowed: {url}")
+                    response = client.get(url)
+                    status = response.status_code
+
+                    if status == 200:
+                        logger.info("Health check passed: %s (attempt %d)", url, attempt)
+                        return True
+
+                    last_error = f"Unexpected status code: {status}"
+                    logger.warning(
+                        "Health check failed (attempt %d/%d): %s",
+                        attempt,
+                        self.max_retries,
+                        last_error,
+                    )
+
+                except Exception as e:
+                    last_error = str(e)
+                    logger.warning(
+                        "Health check failed (attempt %d/%d): %s",
+                        attempt,
+                        self.max_retries,
+                        last_error,
+                    )
+
+                if attempt < self.max_retries:
+                    time.sleep(self.retry_interval)
 
         raise VerificationError(
             f"Health check failed after {self.max_retries} attempts: {last_error}",
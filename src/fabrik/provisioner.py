@@ -26,6 +26,7 @@ from jinja2 import Environment, FileSystemLoader
 
 from fabrik.compose_linter import ComposeLinter
 from fabrik.drivers.coolify import CoolifyClient
+from fabrik.drivers.transport import create_client
 
 
 class ProvisionState(str, Enum):
@@ -180,7 +181,7 @@ class SiteProvisioner:
     def __init__(self):
         """Initialize provisioner."""
         self.JOBS_DIR.mkdir(parents=True, exist_ok=True)
-        self._http = httpx.Client(timeout=60.0)
+        self._http = create_client(timeout=60.0)
         self._coolify: CoolifyClient | None = None
 
     @property
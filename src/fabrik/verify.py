@@ -20,9 +20,10 @@ from functools import wraps
 from pathlib import Path
 from typing import Any
 
-import httpx
 import yaml
 
+from fabrik.drivers.transport import NO_RETRY, create_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,9 +92,10 @@ class PostconditionChecker:
         if not url:
             return PostconditionResult(name, CheckResult.SKIP, "No URL configured")
 
-        for attempt in range(retries):
-            try:
-                with httpx.Client(timeout=timeout) as client:  # SSL verification enabled
+        # One pooled client for all attempts; this loop owns the retries
+        with create_client(timeout=timeout, retry=NO_RETRY) as client:
+            for attempt in range(retries):
+                try:
                     response = client.get(url)
                     if response.status_code == expected:
                         return PostconditionResult(
@@ -112,13 +114,13 @@ class PostconditionChecker:
                             f"Expected {expected}, got {response.status_code}",
                             {"status_code": response.status_code, "url": url},
                         )
-            except Exception as e:
-                if attempt < retries - 1:
-                    time.sleep(2**attempt)
-                    continue
-                return PostconditionResult(
-                    name, CheckResult.FAIL, f"HTTP error: {e}", {"error": str(e), "url": url}
-                )
+                except Exception as e:
+                    if attempt < retries - 1:
+                        time.sleep(2**attempt)
+                        continue
+                    return PostconditionResult(
+                        name, CheckResult.FAIL, f"HTTP error: {e}", {"error": str(e), "url": url}
+                    )
 
         return PostconditionResult(name, CheckResult.FAIL, "Max retries exceeded")
 
@@ -27,7 +27,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Literal
 
-import httpx
+from fabrik.drivers.transport import create_client
 
 
 class ProvisionState(str, Enum):
@@ -98,7 +98,7 @@ class DomainProvisioner:
             "DNS_MANAGER_URL", "https://dns.vps1.ocoron.com"
         )
 
-        self._http = httpx.Client(timeout=30)
+        self._http = create_client(timeout=30)
 
     def provision(self, domain: str) -> ProvisionResult:
         """
@@ -46,7 +46,7 @@ class TestPostconditionChecker:
 
         checker = PostconditionChecker(deploy_spec_path, mock_context)
 
-        with patch("fabrik.verify.httpx.Client") as mock_client:
+        with patch("fabrik.verify.create_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_client.return_value.__enter__.return_value.get.return_value = mock_response
@@ -61,7 +61,7 @@ class TestPostconditionChecker:
 
         checker = PostconditionChecker(deploy_spec_path, mock_context)
 
-        with patch("fabrik.verify.httpx.Client") as mock_client:
+        with patch("fabrik.verify.create_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 500
             mock_client.return_value.__enter__.return_value.get.return_value = mock_response
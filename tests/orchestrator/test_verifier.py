@@ -37,16 +37,17 @@ class TestDeploymentVerifier:
             },
         )
 
-        with patch("fabrik.orchestrator.verifier.urlopen") as mock_urlopen:
+        with patch("fabrik.orchestrator.verifier.create_client") as mock_client:
+            mock_get = mock_client.return_value.__enter__.return_value.get
             mock_response = MagicMock()
-            mock_response.getcode.return_value = 200
-            mock_urlopen.return_value = mock_response
+            mock_response.status_code = 200
+            mock_get.return_value = mock_response
 
             result = verifier.verify(ctx)
 
             assert result is True
-            mock_urlopen.assert_called_once()
-            call_url = mock_urlopen.call_args[0][0]
+            mock_get.assert_called_once()
+            call_url = mock_get.call_args[0][0]
             assert "/api/health" in call_url
 
     def test_verify_sets_deployed_url(self):
@@ -57,10 +58,11 @@ class TestDeploymentVerifier:
             spec={"name": "test", "domain": "example.com"},
         )
 
-        with patch("fabrik.orchestrator.verifier.urlopen") as mock_urlopen:
+        with patch("fabrik.orchestrator.verifier.create_client") as mock_client:
+            mock_get = mock_client.return_value.__enter__.return_value.get
             mock_response = MagicMock()
-            mock_response.getcode.return_value = 200
-            mock_urlopen.return_value = mock_response
+            mock_response.status_code = 200
+            mock_get.return_value = mock_response
 
             verifier.verify(ctx)
 
@@ -70,12 +72,13 @@ class TestDeploymentVerifier:
         """Should retry on failure."""
         verifier = DeploymentVerifier(max_retries=3, retry_interval=0)
 
-        with patch("fabrik.orchestrator.verifier.urlopen") as mock_urlopen:
+        with patch("fabrik.orchestrator.verifier.create_client") as mock_client:
+            mock_get = mock_client.return_value.__enter__.return_value.get
             mock_response = MagicMock()
-            mock_response.getcode.return_value = 200
+            mock_response.status_code = 200
 
             # Fail twice, succeed on third
-            mock_urlopen.side_effect = [
+            mock_get.side_effect = [
                 Exception("Connection refused"),
                 Exception("Timeout"),
                 mock_response,
@@ -83,14 +86,15 @@ class TestDeploymentVerifier:
 
             result = verifier._check_health("https://test.com/health")
             assert result is True
-            assert mock_urlopen.call_count == 3
+            assert mock_get.call_count == 3
 
     def test_health_check_fails_after_max_retries(self):
         """Should raise VerificationError after max retries."""
         verifier = DeploymentVerifier(max_retries=2, retry_interval=0)
 
-        with patch("fabrik.orchestrator.verifier.urlopen") as mock_urlopen:
-            mock_urlopen.side_effect = Exception("Connection refused")
+        with patch("fabrik.orchestrator.verifier.create_client") as mock_client:
+            mock_get = mock_client.return_value.__enter__.return_value.get
+            mock_get.side_effect = Exception("Connection refused")
 
             with pytest.raises(VerificationError) as exc:
                 verifier._check_health("https://test.com/health")
@@ -106,8 +110,9 @@ class TestDeploymentVerifier:
             spec={"name": "test", "domain": "test.example.com"},
         )
 
-        with patch("fabrik.orchestrator.verifier.urlopen") as mock_urlopen:
-            mock_urlopen.side_effect = Exception("Connection refused")
+        with patch("fabrik.orchestrator.verifier.create_client") as mock_client:
+            mock_get = mock_client.return_value.__enter__.return_value.get
+            mock_get.side_effect = Exception("Connection refused")
 
             with pytest.raises(VerificationError):
                 verifier.verify(ctx)
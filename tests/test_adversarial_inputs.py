@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+ReDoS regression tests for the convention checks and the conventions hook.
+
+Each input in scripts.enforcement.benchmark.ADVERSARIAL_INPUTS used to make
+a pattern backtrack super-linearly. The checks now run on 1 MiB of each in
+a forked child that must finish within a time budget far above linear cost.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from pathlib import Path
+
+import pytest
+from scripts.enforcement.benchmark import (
+    ADVERSARIAL_INPUTS,
+    HOOK_FILE,
+    REPO_ROOT,
+    adversarial_input,
+    load_hook,
+)
+
+SIZE = 1 << 20
+BUDGET_SECONDS = 15.0
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork"
+)
+
+
+def run_within(seconds: float, target, *args) -> None:
+    """Run target(*args) in a forked child and fail if it outlives seconds."""
+    child = multiprocessing.get_context("fork").Process(target=target, args=args)
+    child.start()
+    child.join(seconds)
+    if child.is_alive():
+        child.kill()
+        child.join()
+        pytest.fail(f"still running after {seconds:g}s")
+    assert child.exitcode == 0
+
+
+def _run_checks(path: Path) -> None:
+    from scripts.enforcement.validate_conventions import run_all_checks
+
+    run_all_checks(path)
+
+
+def _run_hook(file_path: str, content: str) -> None:
+    load_hook(REPO_ROOT / HOOK_FILE).check_file(file_path, content)
+
+
+@pytest.mark.parametrize("name", ADVERSARIAL_INPUTS)
+class TestAdversarialInputs:
+    """Every adversarial input is checked in (roughly) linear time."""
+
+    def test_checks(self, name, tmp_path):
+        """run_all_checks() finishes on 1 MiB of the input."""
+        file_name, content = adversarial_input(name, SIZE)
+        path = tmp_path / file_name
+        path.write_text(content)
+        run_within(BUDGET_SECONDS, _run_checks, path)
+
+    def test_hook(self, name):
+        """The hook's check_file() finishes on 1 MiB of the input."""
+        file_name, content = adversarial_input(name, SIZE)
+        run_within(BUDGET_SECONDS, _run_hook, f"/app/{file_name}", content)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tests for scripts/enforcement/ai_quick_review.py
+
+Covers:
+- Hunk parsing and digests that ignore line-number shifts
+- Skipping hunks that already passed a review
+- Queueing reviews that exceed the latency budget
+- Coalescing concurrent invocations into one request
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import time
+
+import pytest
+from scripts.enforcement import ai_quick_review as review
+
+DIFF = """diff --git a/app/db.py b/app/db.py
+index 1111111..2222222 100644
+--- a/app/db.py
++++ b/app/db.py
+@@ -1,2 +1,3 @@ import os
+ import os
++HOST = os.getenv("DB_HOST")
+ PORT = 5432
+@@ -10,1 +11,2 @@ def connect():
++    return None
+diff --git a/app/api.py b/app/api.py
+new file mode 100644
+--- /dev/null
++++ b/app/api.py
+@@ -0,0 +1 @@
++app = None
+"""
+
+
+@pytest.fixture(autouse=True)
+def state(tmp_path, monkeypatch):
+    """Review cache, spool and queue in tmp_path."""
+    monkeypatch.setattr(review, "STATE_DIR", tmp_path / "state")
+    monkeypatch.setattr(review, "QUEUE_DIR", tmp_path / "queue")
+    monkeypatch.setattr(review, "BATCH_WINDOW_SECONDS", 0.3)
+    return tmp_path
+
+
+class TestQuickReview:
+    """Tests for batching, the hunk cache and the latency budget."""
+
+    def test_parse_hunks(self):
+        """Each hunk keeps its file; digests ignore the @@ line numbers."""
+        hunks = review.parse_hunks(DIFF)
+
+        assert [(h.file, h.header.split(" @@")[0]) for h in hunks] == [
+            ("app/db.py", "@@ -1,2 +1,3"),
+            ("app/db.py", "@@ -10,1 +11,2"),
+            ("app/api.py", "@@ -0,0 +1"),
+        ]
+        moved = review.Hunk(hunks[0].file, "@@ -5,2 +5,3 @@", hunks[0].body)
+        assert moved.digest == hunks[0].digest
+
+    def test_reviewed_hunks_skip_the_model(self, monkeypatch):
+        """Hunks that passed before are not sent again."""
+        hunks = review.parse_hunks(DIFF)
+        review.record_reviewed(hunks)
+        monkeypatch.setattr(review, "get_staged_hunks", lambda files: hunks)
+        monkeypatch.setattr(review, "review_coalesced", lambda hunks: pytest.fail("reviewed"))
+
+        passed, message = review.run_quick_review(["app/db.py", "app/api.py"])
+
+        assert passed is True
+        assert "reviewed before" in message
+
+    def test_slow_review_is_queued(self, monkeypatch, state):
+        """A review over budget is killed and its files go to the review queue."""
+
+        def slow_review(prompt, conn):
+            os.setpgrp()
+            time.sleep(30)
+
+        monkeypatch.setattr(review, "_review_child", slow_review)
+        hunks = review.parse_hunks(DIFF)
+
+        started = time.monotonic()
+        passed, message = review.review_batch(hunks, time.monotonic() + 0.5)
+
+        assert passed is None
+        assert message.startswith("Deferred")
+        assert time.monotonic() - started < 5
+        queued = [json.loads(p.read_text()) for p in (state / "queue").glob("*.json")]
+        assert sorted(os.path.basename(t["file_path"]) for t in queued) == ["api.py", "db.py"]
+        assert {t["status"] for t in queued} == {"pending"}
+        assert review.load_reviewed() == {}
+
+    def test_review_killed_before_setpgrp(self, monkeypatch):
+        """The budget holds even if the child has not made its own process group yet."""
+
+        def slow_review(prompt, conn):
+            time.sleep(30)
+
+        monkeypatch.setattr(review, "_review_child", slow_review)
+        hunks = review.parse_hunks(DIFF)
+
+        started = time.monotonic()
+        assert review.review_within(hunks, 0.2) is None
+        assert review.review_within(hunks, 0) is None
+        assert time.monotonic() - started < 5
+
+    def test_spent_budget_queues_without_review(self, monkeypatch, state):
+        """A leader that gets the lock after the deadline queues instead of reviewing."""
+        # Starting a review process would fail
+        monkeypatch.setattr(multiprocessing.get_context("fork"), "Process", None)
+        hunks = review.parse_hunks(DIFF)
+
+        passed, message = review.review_batch(hunks, time.monotonic() - 1)
+
+        assert passed is None
+        assert message.startswith("Deferred")
+        assert len(list((state / "queue").glob("*.json"))) == 2
+
+    def test_bad_env_seconds_fall_back(self, monkeypatch, capsys):
+        """Malformed or out-of-range timing env vars warn instead of failing the hook."""
+        for value in ("soon", "-1", "0", "nan", "inf"):
+            monkeypatch.setenv("FABRIK_QUICK_REVIEW_BUDGET", value)
+            assert review._env_seconds("FABRIK_QUICK_REVIEW_BUDGET", 20) == 20
+        assert capsys.readouterr().err.count("Invalid FABRIK_QUICK_REVIEW_BUDGET") == 5
+
+        monkeypatch.setenv("FABRIK_QUICK_REVIEW_WINDOW", "0")
+        assert review._env_seconds("FABRIK_QUICK_REVIEW_WINDOW", 0.5, allow_zero=True) == 0
+        monkeypatch.delenv("FABRIK_QUICK_REVIEW_WINDOW")
+        assert review._env_seconds("FABRIK_QUICK_REVIEW_WINDOW", 0.5) == 0.5
+
+    def test_concurrent_invocations_share_a_request(self, monkeypatch, state):
+        """Invocations within the batch window are reviewed in one request."""
+        requests = state / "requests"
+
+        def fake_review(hunks, timeout):
+            with requests.open("a") as f:
+                f.write(",".join(sorted({h.file for h in hunks})) + "\n")
+            return True, "Quick review passed"
+
+        monkeypatch.setattr(review, "review_within", fake_review)
+        db, api = review.parse_hunks(DIFF)[::2]
+        ctx = multiprocessing.get_context("fork")
+        results = ctx.Queue()
+        invocations = [
+            ctx.Process(target=lambda h=h: results.put(review.review_coalesced([h])))
+            for h in (db, api)
+        ]
+        for invocation in invocations:
+            invocation.start()
+        for invocation in invocations:
+            invocation.join(10)
+
+        assert [results.get(timeout=1) for _ in invocations] == [(True, "Quick review passed")] * 2
+        assert requests.read_text() == "app/api.py,app/db.py\n"
+        assert sorted(review.load_reviewed()) == sorted([db.digest, api.digest])
+
+    def test_oversized_hunk_is_queued_not_truncated(self, monkeypatch, state):
+        """A hunk over the size limit on its own is queued whole and never cached."""
+        small = review.parse_hunks(DIFF)[2]
+        big = review.Hunk("app/big.py", "@@ -0,0 +1,900 @@", "+x = 1\n" * 2000)
+        seen = []
+
+        def fake_review(hunks, timeout):
+            seen.append(review.build_prompt(hunks))
+            return True, "Quick review passed"
+
+        monkeypatch.setattr(review, "review_within", fake_review)
+
+        passed, _ = review.review_batch([big, small], time.monotonic() + 5)
+
+        assert passed is True
+        assert len(seen) == 1 and "app/big.py" not in seen[0] and "app = None" in seen[0]
+        assert list(review.load_reviewed()) == [small.digest]
+        queued = [json.loads(p.read_text()) for p in (state / "queue").glob("*.json")]
+        assert [os.path.basename(t["file_path"]) for t in queued] == ["big.py"]
+
+        monkeypatch.setattr(review, "review_within", lambda h, t: pytest.fail("sent"))
+        passed, message = review.review_batch([big], time.monotonic() + 5)
+
+        assert passed is None
+        assert message.startswith("Deferred")
+        assert big.digest not in review.load_reviewed()
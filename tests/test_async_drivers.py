@@ -0,0 +1,263 @@
+"""Tests for the async driver twins against local stand-in servers."""
+
+import asyncio
+import functools
+import inspect
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, Response
+
+from fabrik.drivers import cloudflare, coolify, dns, transport
+from fabrik.drivers.cloudflare import AsyncCloudflareClient, CloudflareClient
+from fabrik.drivers.coolify import AsyncCoolifyClient, CoolifyClient
+from fabrik.drivers.dns import AsyncDNSClient, DNSClient
+
+DELAY = 0.2
+
+
+async def no_sleep(seconds):
+    pass
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Route a driver module's async clients to an in-process FastAPI app."""
+
+    def route(module, app):
+        stand_in = transport.AsyncRetryTransport(httpx.ASGITransport(app=app), sleep=no_sleep)
+        monkeypatch.setattr(
+            module,
+            "create_async_client",
+            functools.partial(transport.create_async_client, transport=stand_in),
+        )
+
+    return route
+
+
+def fake_coolify() -> FastAPI:
+    """Coolify stand-in: a few applications, slow enough to show overlap."""
+    app = FastAPI()
+    app.state.received = []
+
+    @app.get("/api/health")
+    async def health():
+        return "OK"
+
+    @app.get("/api/v1/applications")
+    async def applications():
+        return [{"uuid": "a1", "name": "web"}]
+
+    @app.get("/api/v1/applications/{uuid}")
+    async def application(uuid: str):
+        await asyncio.sleep(DELAY)
+        return {"uuid": uuid, "status": "running"}
+
+    @app.post("/api/v1/applications/dockercompose")
+    async def create(request: Request):
+        app.state.received.append(await request.json())
+        return {"uuid": "new"}
+
+    @app.post("/api/v1/applications/{uuid}/deploy")
+    async def deploy(uuid: str, request: Request):
+        return {"deployment_uuid": f"d-{uuid}", "force": request.query_params.get("force")}
+
+    @app.delete("/api/v1/applications/{uuid}")
+    async def delete(uuid: str):
+        return Response(status_code=204)
+
+    return app
+
+
+def fake_cloudflare() -> FastAPI:
+    """Cloudflare stand-in holding DNS records for one zone."""
+    app = FastAPI()
+    records: dict[str, dict] = {}
+    app.state.records = records
+
+    def ok(result):
+        return {"success": True, "errors": [], "result": result}
+
+    @app.get("/client/v4/zones")
+    async def zones(name: str = ""):
+        return ok([{"id": "z1", "name": name}] if name == "example.com" else [])
+
+    @app.get("/client/v4/zones/{zone_id}/dns_records")
+    async def list_records(zone_id: str, name: str = "", type: str = ""):
+        return ok([r for r in records.values() if r["name"] == name and r["type"] == type])
+
+    @app.post("/client/v4/zones/{zone_id}/dns_records")
+    async def create(zone_id: str, request: Request):
+        record = {**await request.json(), "id": f"r{len(records)}"}
+        records[record["id"]] = record
+        return ok(record)
+
+    @app.put("/client/v4/zones/{zone_id}/dns_records/{record_id}")
+    async def update(zone_id: str, record_id: str, request: Request):
+        records[record_id] = {**await request.json(), "id": record_id}
+        return ok(records[record_id])
+
+    @app.get("/client/v4/user/tokens/verify")
+    async def verify():
+        return {"success": False, "errors": [{"message": "Invalid API Token"}]}
+
+    return app
+
+
+def fake_dns_manager() -> FastAPI:
+    """DNS manager stand-in with a rate limit that clears after one retry."""
+    app = FastAPI()
+    app.state.calls = 0
+
+    @app.get("/api/dns/{domain}")
+    async def records(domain: str):
+        app.state.calls += 1
+        if app.state.calls == 1:
+            return Response(status_code=429, headers={"Retry-After": "0"})
+        return {"records": [{"type": "A", "name": "@", "value": "1.2.3.4"}]}
+
+    @app.get("/api/dns/{domain}/nameservers")
+    async def nameservers(domain: str):
+        return Response(status_code=404)
+
+    return app
+
+
+class TestMethodSurface:
+    """Each async client mirrors its sync twin."""
+
+    @pytest.mark.parametrize(
+        ("sync_cls", "async_cls"),
+        [
+            (CoolifyClient, AsyncCoolifyClient),
+            (CloudflareClient, AsyncCloudflareClient),
+            (DNSClient, AsyncDNSClient),
+        ],
+    )
+    def test_same_methods(self, sync_cls, async_cls):
+        """Every public sync method has an async twin with the same signature."""
+        for name, method in inspect.getmembers(sync_cls, inspect.isfunction):
+            if name.startswith("_"):
+                continue
+            twin = getattr(async_cls, name)
+            assert inspect.iscoroutinefunction(twin), name
+            assert inspect.signature(twin) == inspect.signature(method), name
+
+
+class TestAsyncCoolifyClient:
+    """Test AsyncCoolifyClient against a Coolify stand-in."""
+
+    def test_requests_and_responses(self, serve):
+        """Payloads, query parameters and empty responses match the sync client."""
+        app = fake_coolify()
+        serve(coolify, app)
+
+        async def run():
+            async with AsyncCoolifyClient("http://coolify.test", token="t") as client:
+                return (
+                    await client.health(),
+                    await client.list_applications(),
+                    await client.create_dockercompose_application(
+                        "p1", "s1", "services: {}", "web", instant_deploy=False
+                    ),
+                    await client.deploy("a1", force=True),
+                    await client.delete_application("a1"),
+                )
+
+        health, apps, created, deployed, deleted = asyncio.run(run())
+
+        assert health == "OK"
+        assert apps == [{"uuid": "a1", "name": "web"}]
+        assert created == {"uuid": "new"}
+        assert app.state.received == [
+            {
+                "project_uuid": "p1",
+                "server_uuid": "s1",
+                "environment_name": "production",
+                "docker_compose_raw": "services: {}",
+                "name": "web",
+                "instant_deploy": False,
+            }
+        ]
+        assert deployed == {"deployment_uuid": "d-a1", "force": "true"}
+        assert deleted == {"success": True}
+
+    def test_calls_overlap(self, serve):
+        """Concurrent calls wait for the slowest response, not the sum."""
+        serve(coolify, fake_coolify())
+
+        async def run():
+            async with AsyncCoolifyClient("http://coolify.test", token="t") as client:
+                return await asyncio.gather(*(client.get_application(f"a{i}") for i in range(5)))
+
+        started = time.perf_counter()
+        apps = asyncio.run(run())
+
+        assert [a["uuid"] for a in apps] == ["a0", "a1", "a2", "a3", "a4"]
+        assert time.perf_counter() - started < 5 * DELAY
+
+
+class TestAsyncCloudflareClient:
+    """Test AsyncCloudflareClient against a Cloudflare stand-in."""
+
+    def test_ensure_record(self, serve):
+        """ensure_record creates, leaves unchanged, then updates a record."""
+        app = fake_cloudflare()
+        serve(cloudflare, app)
+
+        async def run():
+            async with AsyncCloudflareClient(api_token="t") as cf:
+                return [
+                    (await cf.ensure_record("example.com", "A", "www", ip))["action"]
+                    for ip in ("1.1.1.1", "1.1.1.1", "2.2.2.2")
+                ]
+
+        assert asyncio.run(run()) == ["created", "unchanged", "updated"]
+        assert [(r["name"], r["content"]) for r in app.state.records.values()] == [
+            ("www.example.com", "2.2.2.2")
+        ]
+
+    def test_api_errors(self, serve):
+        """API errors raise, and health() reports them."""
+        serve(cloudflare, fake_cloudflare())
+
+        async def run():
+            async with AsyncCloudflareClient(api_token="t") as cf:
+                with pytest.raises(ValueError, match="Zone not found"):
+                    await cf.get_zone_id("missing.org")
+                return await cf.health()
+
+        health = asyncio.run(run())
+
+        assert health == {
+            "status": "unhealthy",
+            "error": "Cloudflare API error: Invalid API Token",
+        }
+
+
+class TestAsyncDNSClient:
+    """Test AsyncDNSClient against a DNS manager stand-in."""
+
+    def test_retries_rate_limit(self, serve):
+        """A 429 is retried through the shared retry policy."""
+        app = fake_dns_manager()
+        serve(dns, app)
+
+        async def run():
+            async with AsyncDNSClient("http://dns.test") as client:
+                return await client.get_records("example.com")
+
+        assert asyncio.run(run()) == [{"type": "A", "name": "@", "value": "1.2.3.4"}]
+        assert app.state.calls == 2
+
+    def test_http_errors_raise(self, serve):
+        """HTTP errors surface as httpx.HTTPStatusError, as in DNSClient."""
+        serve(dns, fake_dns_manager())
+
+        async def run():
+            async with AsyncDNSClient("http://dns.test") as client:
+                await client.get_nameservers("example.com")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
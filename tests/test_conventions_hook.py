@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for .factory/hooks/fabrik-conventions.py
+
+Covers:
+- In-process fallback when no validation server is running
+- Server round trip, result memoization and exit on rule changes
+- Syntax-tree rules (class-level config, static health endpoints)
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+HOOK = Path(__file__).parent.parent / ".factory" / "hooks" / "fabrik-conventions.py"
+BAD_CODE = 'HOST = "localhost"\n'
+
+
+@pytest.fixture
+def hook():
+    """The hook script loaded as a module."""
+    spec = importlib.util.spec_from_file_location("fabrik_conventions_hook", HOOK)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def server(hook, tmp_path):
+    """A validation server on a socket in tmp_path, running in a thread."""
+    socket_path = str(tmp_path / "hook.sock")
+    thread = threading.Thread(target=hook.serve, args=(socket_path, 10.0), daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not os.path.exists(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    yield socket_path, thread
+    if thread.is_alive():
+        hook._script_stamp = lambda: (0, 0)  # Stop at the next request
+        hook.request_check("x.py", "", socket_path)
+        thread.join(5)
+
+
+class TestConventionsHook:
+    """Tests for the hook's client/server split."""
+
+    def test_no_server_falls_back(self, hook, tmp_path):
+        """Without a server the client returns None and check_file runs in-process."""
+        assert hook.request_check("/app/db.py", BAD_CODE, str(tmp_path / "none.sock")) is None
+        assert [i[0] for i in hook.check_file("/app/db.py", BAD_CODE)] == ["hardcoded_localhost"]
+
+    def test_server_answers_and_memoizes(self, hook, server, monkeypatch):
+        """The server returns check_file's issues and reuses them for unchanged content."""
+        socket_path, _ = server
+        calls = []
+        original = hook.check_file
+        monkeypatch.setattr(hook, "check_file", lambda p, c: calls.append(p) or original(p, c))
+
+        first = hook.request_check("/app/db.py", BAD_CODE, socket_path)
+        second = hook.request_check("/app/db.py", BAD_CODE, socket_path)
+
+        assert first == second == original("/app/db.py", BAD_CODE)
+        assert calls == ["/app/db.py"]
+        assert hook.request_check("/app/ok.py", "x = 1\n", socket_path) == []
+
+    def test_server_exits_when_rules_change(self, hook, server, monkeypatch):
+        """A changed hook script makes the server refuse the request and stop."""
+        socket_path, thread = server
+        assert hook.request_check("/app/db.py", BAD_CODE, socket_path) is not None
+
+        monkeypatch.setattr(hook, "_script_stamp", lambda: (0, 0))
+
+        assert hook.request_check("/app/db.py", BAD_CODE, socket_path) is None
+        thread.join(5)
+        assert not thread.is_alive()
+        assert not os.path.exists(socket_path)
+
+
+class TestSyntaxTreeRules:
+    """Tests for the rules detected on the parsed file."""
+
+    def test_class_config(self, hook):
+        """Class attributes evaluating os.getenv() are flagged; deferred calls are not."""
+        eager = "class AppConfig:\n    host = os.getenv('HOST', 'db')\n"
+        deferred = (
+            "class AppConfig:\n"
+            "    host = lambda: os.getenv('HOST')\n"
+            "    def port(self):\n"
+            "        return os.getenv('PORT')\n"
+        )
+
+        assert hook.detect(eager) == {"class_config"}
+        assert hook.detect(deferred) == set()
+
+    def test_fake_health(self, hook):
+        """Health routes returning a status without a prior call are flagged."""
+        static = "@app.get('/health')\ndef h():\n    return {'status': 'ok', 't': now()}\n"
+        checked = (
+            "@app.get('/health')\nasync def h():\n    await ping()\n    return {'status': 'ok'}\n"
+        )
+
+        assert hook.detect(static) == {"fake_health"}
+        assert hook.detect(checked) == set()
+        assert hook.detect("@app.get('/health')\ndef h(:\n") == set()
+
+    def test_fake_health_probe_kinds(self, hook):
+        """Awaits in the response count as checks; logging calls do not."""
+        inline = (
+            "@app.get('/health')\nasync def h():\n"
+            "    return {'status': 'ok', 'db': await db.execute('SELECT 1')}\n"
+        )
+        logged = "@app.get('/health')\ndef h():\n    log.info('hi')\n    return {'status': 'ok'}\n"
+
+        assert hook.detect(inline) == set()
+        assert hook.detect(logged) == {"fake_health"}
+
+    def test_password_with_getenv_on_line(self, hook):
+        """A password literal is allowed when getenv follows on the same line."""
+        fallback = "password = 'abcd' if DEBUG else os.getenv('PASSWORD')\n"
+        literal = "password = 'abcd'\nuser = os.getenv('USER')\n"
+
+        assert hook.check_file("/app/db.py", fallback) == []
+        assert [i[0] for i in hook.check_file("/app/db.py", literal)] == ["hardcoded_password"]
@@ -166,3 +166,285 @@ class TestStubCreation:
 
         assert result is False
         assert "DO NOT OVERWRITE" in existing.read_text()
+
+
+class TestDocsManifest:
+    """Tests for the incremental docs manifest used by --check."""
+
+    def test_refresh_only_reparses_changed_docs(self, tmp_path):
+        """Unchanged docs are reused from the persisted manifest."""
+        from docs_manifest import DocsManifest
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("# A\n\nSee [B](b.md)\n")
+        (docs / "b.md").write_text("# B\n")
+
+        manifest = DocsManifest(tmp_path)
+        assert manifest.refresh(["docs"])["reparsed"] == 2
+        manifest.save()
+
+        (docs / "b.md").write_text("# B changed\n")
+        reloaded = DocsManifest(tmp_path)
+        stats = reloaded.refresh(["docs"])
+
+        assert stats["reparsed"] == 1
+        assert reloaded.get("docs/a.md")["links"] == [["B", "b.md", 3]]
+        assert reloaded.get("docs/b.md")["headings"] == [[1, "B changed"]]
+
+    def test_refresh_drops_deleted_docs(self, tmp_path):
+        """Deleted docs disappear from the manifest and the path set."""
+        from docs_manifest import DocsManifest
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "gone.md").write_text("# Gone\n")
+        manifest = DocsManifest(tmp_path)
+        manifest.refresh(["docs"])
+
+        (docs / "gone.md").unlink()
+        stats = manifest.refresh(["docs"])
+
+        assert stats["removed"] == 1
+        assert manifest.get("docs/gone.md") is None
+        assert manifest.path_exists("docs/gone.md") is False
+
+    def test_check_link_integrity_uses_manifest(self, tmp_path, monkeypatch):
+        """Broken links are reported from manifest data."""
+        import docs_updater
+
+        docs = tmp_path / "docs"
+        (docs / "guides").mkdir(parents=True)
+        (docs / "INDEX.md").write_text("[Guide](guides/ok.md)\n[Missing](guides/nope.md#x)\n")
+        (docs / "guides" / "ok.md").write_text("# OK\n[Up](../INDEX.md)\n")
+        monkeypatch.setattr(docs_updater, "FABRIK_ROOT", tmp_path)
+
+        docs_updater.get_docs_manifest(refresh=True)
+        issues = docs_updater.check_link_integrity()
+
+        assert issues == ["Broken link in docs/INDEX.md: [Missing](guides/nope.md#x)"]
+
+    def test_link_check_workers_reach_first_refresh(self, tmp_path, monkeypatch):
+        """--workers sizes the cold refresh instead of a second, no-op refresh."""
+        import docs_updater
+
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "INDEX.md").write_text("# Index\n")
+        monkeypatch.setattr(docs_updater, "FABRIK_ROOT", tmp_path)
+        monkeypatch.setattr(docs_updater, "_docs_manifest", None)
+        calls = []
+        refresh = docs_updater.DocsManifest.refresh
+
+        def spy(self, *args, **kwargs):
+            calls.append(kwargs.get("workers"))
+            return refresh(self, *args, **kwargs)
+
+        monkeypatch.setattr(docs_updater.DocsManifest, "refresh", spy)
+
+        assert docs_updater.run_link_check(workers=0) == 0
+        assert calls == [0]
+
+
+class TestLinkGraph:
+    """Tests for the cached link graph with anchor validation."""
+
+    def _manifest(self, root):
+        from docs_manifest import DocsManifest
+
+        manifest = DocsManifest(root)
+        manifest.refresh(["docs"], workers=0)
+        return manifest
+
+    def test_heading_anchors_follow_github_slugs(self):
+        """Headings slugify like GitHub, duplicates get numeric suffixes."""
+        from docs_manifest import heading_anchors
+
+        headings = [
+            [2, "2. Execution Modes"],
+            [2, "`droid exec` Flags!"],
+            [3, "Usage"],
+            [3, "Usage"],
+        ]
+
+        assert heading_anchors(headings) == [
+            "2-execution-modes",
+            "droid-exec-flags",
+            "usage",
+            "usage-1",
+        ]
+
+    def test_headings_in_code_fences_are_ignored(self):
+        """Shell comments inside fenced blocks are not headings."""
+        from docs_manifest import extract_headings
+
+        content = "# Title\n\n```bash\n# not a heading\n```\n## Real\n"
+
+        assert extract_headings(content) == [[1, "Title"], [2, "Real"]]
+
+    def test_broken_anchor_reported(self, tmp_path):
+        """Links to missing anchors are reported; valid ones are not."""
+        from docs_links import build_link_graph
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("# A\n[ok](b.md#setup)\n[bad](b.md#nope)\n[self](#a)\n")
+        (docs / "b.md").write_text("# B\n## Setup\n")
+
+        graph = build_link_graph(self._manifest(tmp_path))
+
+        assert [str(i) for i in graph.issues] == ["Broken anchor in docs/a.md: [bad](b.md#nope)"]
+        assert graph.issues[0].line == 3
+
+    def test_orphans_detected(self, tmp_path):
+        """Docs without inbound links are orphans; INDEX.md is a root."""
+        from docs_links import build_link_graph
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "INDEX.md").write_text("[A](a.md)\n")
+        (docs / "a.md").write_text("# A\n[self](#a)\n")
+        (docs / "lonely.md").write_text("# Lonely\n")
+
+        graph = build_link_graph(self._manifest(tmp_path))
+
+        assert graph.orphans() == ["docs/lonely.md"]
+
+    def test_graph_cache_reused_until_docs_change(self, tmp_path):
+        """Cached graph is reused for an unchanged tree and rebuilt after edits."""
+        from docs_links import load_link_graph
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("[B](b.md)\n")
+
+        assert load_link_graph(self._manifest(tmp_path)).from_cache is False
+        cached = load_link_graph(self._manifest(tmp_path))
+        assert cached.from_cache is True
+        assert len(cached.issues) == 1
+
+        (docs / "b.md").write_text("# B\n")
+        rebuilt = load_link_graph(self._manifest(tmp_path))
+        assert rebuilt.from_cache is False
+        assert rebuilt.issues == []
+
+    def test_parallel_parse_matches_inline(self, tmp_path, monkeypatch):
+        """Process-pool parsing produces the same entries as inline parsing."""
+        import docs_manifest
+        from docs_manifest import DocsManifest
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        for i in range(6):
+            (docs / f"d{i}.md").write_text(f"# Doc {i}\n[next](d{i + 1}.md)\n")
+        monkeypatch.setattr(docs_manifest, "PARALLEL_THRESHOLD", 2)
+
+        pooled = DocsManifest(tmp_path, manifest_file=tmp_path / "p.json")
+        pooled.refresh(["docs"], workers=2)
+        inline = DocsManifest(tmp_path, manifest_file=tmp_path / "i.json")
+        inline.refresh(["docs"], workers=0)
+
+        assert pooled.entries == inline.entries
+
+
+class TestTaskCoalescing:
+    """Tests for coalescing queued docs tasks into module clusters."""
+
+    def _task(self, path, queued_at):
+        return {"file_path": path, "queued_at": queued_at, "status": "pending"}
+
+    def _setup(self, tmp_path, monkeypatch):
+        import docs_updater
+
+        log_dir = tmp_path / "log"
+        log_dir.mkdir()
+        monkeypatch.setattr(docs_updater, "FABRIK_ROOT", tmp_path)
+        monkeypatch.setattr(docs_updater, "DOCS_LOG_DIR", log_dir)
+        (tmp_path / "src" / "api").mkdir(parents=True)
+        (tmp_path / "scripts").mkdir()
+        for f in ("src/api/a.py", "src/api/b.py", "scripts/c.py"):
+            (tmp_path / f).write_text(f"# {f}\n")
+        return docs_updater
+
+    def test_same_file_tasks_collapse_to_newest(self, tmp_path, monkeypatch):
+        """Repeated saves of one file produce one task; older ones are superseded."""
+        docs_updater = self._setup(tmp_path, monkeypatch)
+        tasks = [self._task("src/api/a.py", f"2026-01-01T10:00:0{i}") for i in range(5)]
+
+        clusters, dropped, stats = docs_updater.coalesce_tasks(tasks)
+
+        assert [c["files"] for c in clusters] == [["src/api/a.py"]]
+        assert clusters[0]["tasks"] == [tasks[-1]]
+        assert len(dropped) == 4
+        assert stats["superseded"] == 4
+        assert stats["ratio"] == 5.0
+
+    def test_tasks_cluster_by_module_within_window(self, tmp_path, monkeypatch):
+        """One prompt per module; tasks outside the window start a new cluster."""
+        docs_updater = self._setup(tmp_path, monkeypatch)
+        tasks = [
+            self._task("src/api/a.py", "2026-01-01T10:00:00"),
+            self._task("scripts/c.py", "2026-01-01T10:00:05"),
+            self._task("src/api/b.py", "2026-01-01T10:00:10"),
+        ]
+
+        clusters, _dropped, stats = docs_updater.coalesce_tasks(tasks, window_seconds=60)
+
+        assert [(c["module"], c["files"]) for c in clusters] == [
+            ("src/api", ["src/api/a.py", "src/api/b.py"]),
+            ("scripts", ["scripts/c.py"]),
+        ]
+        assert stats["prompts"] == 2
+
+        tasks[2]["queued_at"] = "2026-01-01T11:00:00"
+        clusters, _dropped, _stats = docs_updater.coalesce_tasks(tasks, window_seconds=60)
+
+        assert [c["files"] for c in clusters] == [
+            ["src/api/a.py"],
+            ["scripts/c.py"],
+            ["src/api/b.py"],
+        ]
+
+    def test_unchanged_files_dropped_after_successful_update(self, tmp_path, monkeypatch):
+        """Files whose hash matches the last successful update are skipped."""
+        docs_updater = self._setup(tmp_path, monkeypatch)
+        docs_updater.record_docs_hashes(["src/api/a.py", "scripts/c.py"])
+        (tmp_path / "scripts" / "c.py").write_text("# changed\n")
+        tasks = [
+            self._task("src/api/a.py", "2026-01-01T10:00:00"),
+            self._task("scripts/c.py", "2026-01-01T10:00:01"),
+        ]
+
+        clusters, dropped, stats = docs_updater.coalesce_tasks(tasks)
+
+        assert [c["files"] for c in clusters] == [["scripts/c.py"]]
+        assert dropped[0][0] is tasks[0]
+        assert stats["unchanged"] == 1
+
+    def test_process_batch_runs_one_prompt_per_cluster(self, tmp_path, monkeypatch):
+        """process_batch invokes the model once per cluster and logs superseded tasks."""
+        import json
+
+        docs_updater = self._setup(tmp_path, monkeypatch)
+        queue_dir = tmp_path / "queue"
+        queue_dir.mkdir()
+        tasks = []
+        for i, path in enumerate(["src/api/a.py", "src/api/a.py", "src/api/b.py"]):
+            task = self._task(path, f"2026-01-01T10:00:0{i}")
+            task_file = queue_dir / f"task{i}.json"
+            task_file.write_text(json.dumps(task))
+            tasks.append({**task, "_file": task_file})
+
+        calls = []
+        monkeypatch.setattr(
+            docs_updater,
+            "run_docs_update",
+            lambda files, module="": calls.append((files, module)) or {"success": True},
+        )
+        monkeypatch.setattr(docs_updater, "send_notification", lambda msg: None)
+
+        docs_updater.process_batch(tasks)
+
+        assert calls == [(["src/api/a.py", "src/api/b.py"], "src/api")]
+        assert list(queue_dir.iterdir()) == []
+        superseded = json.loads((tmp_path / "log" / "task0.json").read_text())
+        assert superseded["status"] == "superseded"
@@ -0,0 +1,110 @@
+"""Tests for the driver benchmark harness and its recorded HTTP fixtures."""
+
+import time
+
+import httpx
+import pytest
+from scripts.driver_benchmark import (
+    FIXTURES_DIR,
+    WORKFLOWS,
+    ReplayServer,
+    _compile_path,
+    _page_tree,
+    load_fixtures,
+    measure,
+)
+
+# Requests each workflow should issue per item against the fixtures
+REQUESTS_PER_ITEM = {
+    "coolify_deploy": 4,  # servers, projects, applications, create
+    "cloudflare_ensure_record": 3,  # zone, existing records, create
+    "cloudflare_ensure_record_async": 3,
+    "wordpress_create_all": 2,  # find by slug, create
+    "dns_add_subdomain": 2,
+    "r2_put_get": 2,
+    "supabase_insert_query": 2,
+}
+
+
+@pytest.fixture(scope="module")
+def server():
+    """One zero-latency replay server for the module."""
+    with ReplayServer() as replay:
+        yield replay
+
+
+class TestFixtures:
+    """Test fixture loading and path templates."""
+
+    def test_every_service_loads(self):
+        """Each fixture file loads with at least one route."""
+        services = load_fixtures()
+
+        assert set(services) == {p.stem for p in FIXTURES_DIR.glob("*.json")}
+        assert all(services.values())
+
+    def test_path_template(self):
+        """{field} matches exactly one path segment."""
+        pattern = _compile_path("/zones/{zone_id}/dns_records")
+
+        assert pattern.fullmatch("/zones/abc/dns_records")
+        assert not pattern.fullmatch("/zones/a/b/dns_records")
+        assert not pattern.fullmatch("/zones/abc/dns_records/r1")
+
+    def test_page_tree_size(self):
+        """The generated site spec has exactly count pages."""
+        tree = _page_tree(25)
+
+        assert len(tree) + sum(len(p["children"]) for p in tree) == 25
+
+
+class TestReplayServer:
+    """Test the replay server."""
+
+    def test_replays_by_service_prefix(self, server):
+        """Responses come from the fixture for the service named by the first segment."""
+        server.reset()
+        response = httpx.get(server.url("cloudflare") + "/client/v4/zones/z1/dns_records")
+
+        assert response.status_code == 200
+        assert response.json()["result"] == []
+        assert server.stats() == {"requests": 1, "unmatched": []}
+
+    def test_unmatched_request_recorded(self, server):
+        """A request with no fixture gets a 404 and is listed as unmatched."""
+        server.reset()
+        response = httpx.delete(server.url("coolify") + "/api/v1/projects")
+
+        assert response.status_code == 404
+        assert server.stats()["unmatched"] == ["DELETE /coolify/api/v1/projects"]
+
+    def test_latency_applied(self):
+        """Every response waits at least latency - jitter."""
+        with ReplayServer(latency=0.05, jitter=0.01) as slow:
+            with httpx.Client() as client:
+                started = time.perf_counter()
+                for _ in range(3):
+                    client.get(slow.url("dns") + "/health")
+                elapsed = time.perf_counter() - started
+
+        assert elapsed >= 3 * 0.04
+
+
+class TestWorkflows:
+    """Each workflow runs the real drivers against the fixtures."""
+
+    @pytest.mark.parametrize("name", sorted(WORKFLOWS))
+    def test_request_count(self, server, name):
+        """A workflow issues the expected requests, all answered by fixtures."""
+        result = measure(WORKFLOWS[name], server, count=3, trace=False)
+
+        assert result.unmatched == []
+        assert result.requests == 3 * REQUESTS_PER_ITEM[name]
+        assert result.peak_kib is None
+
+    def test_allocation_pass(self, server):
+        """With trace, peak allocations are reported."""
+        result = measure(WORKFLOWS["dns_add_subdomain"], server, count=2)
+
+        assert result.peak_kib is not None and result.peak_kib > 0
+        assert result.requests == 4
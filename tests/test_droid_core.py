@@ -4,14 +4,17 @@ Tests for droid_core.py
 
 Covers:
 - Session ID propagation (Pattern 2 continuity)
-- Streaming failure handling
+- Streaming failure handling and token metrics
 - Task ID sanitization
 - JSON parse fallback behavior
+- Import-time budget and background model refresh
 """
 
 from __future__ import annotations
 
+import subprocess
 import sys
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -62,7 +65,7 @@ class TestSessionIdPropagation:
     """Tests for session ID propagation (Pattern 2)."""
 
     @patch("droid_core.subprocess.Popen")
-    @patch("droid_core.refresh_models_from_docs")
+    @patch("droid_core.refresh_models_in_background")
     def test_session_id_passed_to_subprocess(self, mock_refresh, mock_popen):
         """Session ID should be passed to subprocess when provided."""
         # Setup mock process
@@ -85,7 +88,7 @@ class TestSessionIdPropagation:
         assert "existing-session-456" in call_args
 
     @patch("droid_core.subprocess.run")
-    @patch("droid_core.refresh_models_from_docs")
+    @patch("droid_core.refresh_models_in_background")
     def test_session_id_returned_in_result(self, mock_refresh, mock_run):
         """Session ID from response should be in TaskResult."""
         mock_run.return_value = MagicMock(
@@ -149,7 +152,7 @@ class TestStreamingFailureHandling:
     """Tests for streaming mode failure handling."""
 
     @patch("droid_core.subprocess.Popen")
-    @patch("droid_core.refresh_models_from_docs")
+    @patch("droid_core.refresh_models_in_background")
     def test_timeout_returns_failure(self, mock_refresh, mock_popen):
         """Timeout should return TaskResult with success=False."""
         # This is tested implicitly via the timeout logic
@@ -170,6 +173,36 @@ class TestStreamingFailureHandling:
         assert "Exit code" in result.error
 
 
+class TestStreamingMetrics:
+    """Tests for token metrics of streaming runs."""
+
+    def test_streaming_usage_is_recorded(self, monkeypatch):
+        """Usage of completion events counts, in the read loop and the final buffer."""
+        import droid_core
+
+        metrics = droid_core.droid_metrics
+        monkeypatch.setattr(metrics, "_enabled", True)
+        metrics.reset()
+        # A completion line while running, then a result line left in the buffer at exit
+        script = (
+            "import sys, time\n"
+            'print(\'{"type": "completion", "finalText": "a", "usage": {"input_tokens": 5}}\','
+            " flush=True)\n"
+            "time.sleep(0.3)\n"
+            'sys.stdout.write(\'{"type": "result", "result": "b", "usage": {"output_tokens": 2}}\')\n'
+        )
+
+        result = droid_core._run_streaming(
+            [sys.executable, "-c", script], "", TaskType.ANALYZE, "", time.time(), model="m1"
+        )
+        text = metrics.render()
+        metrics.reset()
+
+        assert result.success
+        assert 'fabrik_droid_tokens_total{model="m1",kind="input"} 5' in text
+        assert 'fabrik_droid_tokens_total{model="m1",kind="output"} 2' in text
+
+
 class TestJsonParseFallback:
     """Tests for JSON parse fallback behavior."""
 
@@ -195,7 +228,7 @@ class TestJsonParseFallback:
         assert has_error_indicator  # Should detect "error"
 
     @patch("droid_core.subprocess.run")
-    @patch("droid_core.refresh_models_from_docs")
+    @patch("droid_core.refresh_models_in_background")
     def test_is_error_true_is_failure(self, mock_refresh, mock_run):
         """is_error: true in JSON should result in failure."""
         mock_run.return_value = MagicMock(
@@ -246,5 +279,73 @@ class TestTaskResultDataclass:
         assert result.session_id == "sess-123"
 
 
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+# Cumulative `import droid_core` time, including compiling without cached .pyc
+STARTUP_BUDGET_MS = 300
+# What scripts/enforcement/ai_quick_review.py imports
+PRECOMMIT_IMPORT = "from droid_core import TaskType, run_droid_exec"
+# Heavy modules the pre-commit path (import + run_droid_exec) must not load
+LAZY_MODULES = (
+    "psutil",
+    "process_monitor",
+    "droid_model_updater",
+    "concurrent.futures",
+    "urllib.request",
+    "http.server",
+)
+
+
+class TestStartup:
+    """Tests for droid_core import cost on the pre-commit hook path."""
+
+    def test_precommit_import_budget(self):
+        """Importing what ai_quick_review needs stays lazy and within budget."""
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", PRECOMMIT_IMPORT],
+            cwd=SCRIPTS_DIR,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert proc.returncode == 0, proc.stderr
+
+        cumulative = {}
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, total, name = line.split("|")
+            if total.strip().isdigit():
+                cumulative[name.strip()] = int(total) / 1000
+
+        assert [m for m in LAZY_MODULES if m in cumulative] == []
+        assert cumulative["droid_core"] < STARTUP_BUDGET_MS
+
+    def test_model_refresh_runs_in_background(self, monkeypatch):
+        """A stale docs list starts the detached refresher once per process."""
+        import droid_core
+        import droid_model_updater
+
+        calls = []
+        monkeypatch.setattr(droid_core, "_models_refresh_started", False)
+        monkeypatch.setattr(droid_core, "get_cached_models", lambda: None)
+        monkeypatch.setattr(droid_model_updater, "refresh_in_background", lambda: calls.append(1))
+
+        droid_core.refresh_models_in_background()
+        droid_core.refresh_models_in_background()
+
+        assert calls == [1]
+
+    def test_fresh_model_list_starts_no_refresher(self, monkeypatch):
+        """No refresher process is started while the docs list is fresh."""
+        import droid_core
+        import droid_model_updater
+
+        monkeypatch.setattr(droid_core, "_models_refresh_started", False)
+        monkeypatch.setattr(droid_core, "get_cached_models", lambda: {"models_found": []})
+        monkeypatch.setattr(droid_model_updater, "refresh_in_background", pytest.fail)
+
+        droid_core.refresh_models_in_background()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
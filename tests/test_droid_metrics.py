@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for droid_metrics.py
+
+Covers:
+- No-op behaviour when disabled
+- Counters, gauges, histograms and run tracking
+- Text exposition, textfile output and the HTTP endpoint
+"""
+
+from __future__ import annotations
+
+import sys
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import droid_metrics
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Enabled metrics with an empty registry."""
+    monkeypatch.setattr(droid_metrics, "_enabled", True)
+    droid_metrics.reset()
+    yield droid_metrics
+    droid_metrics.reset()
+
+
+def _sample(text: str, prefix: str) -> str:
+    """Value of the first exposition line starting with prefix."""
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return line.rsplit(" ", 1)[1]
+    raise AssertionError(f"{prefix} not in output")
+
+
+class TestDisabled:
+    """Tests for the disabled (default) state."""
+
+    def test_calls_are_noops(self, monkeypatch):
+        """Nothing is recorded and track_run returns the shared no-op."""
+        monkeypatch.setattr(droid_metrics, "_enabled", False)
+        droid_metrics.reset()
+
+        droid_metrics.inc("fabrik_droid_retries_total", source="review")
+        droid_metrics.record_tokens("m", {"input_tokens": 10})
+        with droid_metrics.track_run("m", "analyze") as run:
+            run.status = "success"
+
+        assert run is droid_metrics._NOOP_RUN
+        assert droid_metrics._values == {}
+        assert droid_metrics._histograms == {}
+
+
+class TestRecording:
+    """Tests for recording and rendering metrics."""
+
+    def test_track_run_updates_gauges_and_histogram(self, metrics):
+        """Gauges go up during a run and back down after; duration is observed."""
+        with metrics.track_run("gpt-5", "review") as run:
+            during = metrics.render()
+            run.status = "success"
+        after = metrics.render()
+
+        assert _sample(during, "fabrik_droid_active_processes ") == "1"
+        assert _sample(during, 'fabrik_droid_inflight{model="gpt-5"}') == "1"
+        assert _sample(after, "fabrik_droid_active_processes ") == "0"
+        count = 'fabrik_droid_task_duration_seconds_count{task_type="review",status="success"}'
+        assert _sample(after, count) == "1"
+
+    def test_histogram_buckets_are_cumulative(self, metrics):
+        """An observation counts in every bucket at or above its value."""
+        metrics.observe("fabrik_droid_task_duration_seconds", 20, task_type="t", status="ok")
+        text = metrics.render()
+
+        prefix = 'fabrik_droid_task_duration_seconds_bucket{task_type="t",status="ok",le='
+        assert _sample(text, prefix + '"15"}') == "0"
+        assert _sample(text, prefix + '"30"}') == "1"
+        assert _sample(text, prefix + '"+Inf"}') == "1"
+        assert _sample(text, 'fabrik_droid_task_duration_seconds_sum{task_type="t"') == "20"
+
+    def test_exception_status(self, metrics):
+        """Runs that raise are recorded with status="exception"."""
+        with pytest.raises(RuntimeError), metrics.track_run("m", "code"):
+            raise RuntimeError("boom")
+
+        text = metrics.render()
+        assert 'task_type="code",status="exception"' in text
+        assert _sample(text, "fabrik_droid_active_processes ") == "0"
+
+    def test_tokens_and_label_escaping(self, metrics):
+        """Token usage is split by kind; label values are escaped."""
+        metrics.record_tokens('we"ird', {"input_tokens": 40, "output_tokens": 2})
+        metrics.record_tokens('we"ird', {"input_tokens": 10, "cache_read_input_tokens": 0})
+        text = metrics.render()
+
+        assert _sample(text, 'fabrik_droid_tokens_total{model="we\\"ird",kind="input"}') == "50"
+        assert _sample(text, 'fabrik_droid_tokens_total{model="we\\"ird",kind="output"}') == "2"
+        assert "cache_read" not in text
+
+    def test_render_declares_every_metric(self, metrics):
+        """Every metric has HELP and TYPE lines even before it is recorded."""
+        text = metrics.render()
+
+        for name, (kind, _help, _labels) in metrics.METRICS.items():
+            assert f"# TYPE {name} {kind}" in text
+
+
+class TestExporters:
+    """Tests for the textfile and HTTP exporters."""
+
+    def test_write_textfile(self, metrics, tmp_path):
+        """The textfile is written atomically with the current exposition."""
+        metrics.set_gauge("fabrik_queue_depth", 7, queue="docs")
+        target = tmp_path / "textfile" / "fabrik.prom"
+
+        metrics.write_textfile(target)
+
+        assert 'fabrik_queue_depth{queue="docs"} 7' in target.read_text()
+        assert [p.name for p in target.parent.iterdir()] == ["fabrik.prom"]
+
+    def test_http_endpoint(self, metrics, monkeypatch):
+        """configure(port=...) serves /metrics."""
+        monkeypatch.setattr(droid_metrics, "_server", None)
+        metrics.configure(port=0, host="127.0.0.1")
+        server = droid_metrics._server
+        try:
+            metrics.inc("fabrik_droid_stuck_total", source="droid_core")
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as resp:
+                body = resp.read().decode()
+                content_type = resp.headers["Content-Type"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert content_type.startswith("text/plain")
+        assert 'fabrik_droid_stuck_total{source="droid_core"} 1' in body
+
+    def test_invalid_port_disables_endpoint(self, monkeypatch, capsys):
+        """A malformed FABRIK_METRICS_PORT warns instead of failing the import."""
+        configured = []
+        monkeypatch.setenv("FABRIK_METRICS_PORT", "metrics")
+        monkeypatch.delenv("FABRIK_METRICS_TEXTFILE", raising=False)
+        monkeypatch.setattr(droid_metrics, "configure", lambda **kw: configured.append(kw))
+
+        droid_metrics._configure_from_env()
+
+        assert configured == []
+        assert "FABRIK_METRICS_PORT" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("interval", ["0", "-5", "nan", "soon"])
+    def test_invalid_interval_falls_back(self, monkeypatch, capsys, interval):
+        """A zero, negative or malformed FABRIK_METRICS_INTERVAL warns and uses 15s."""
+        configured = []
+        monkeypatch.setenv("FABRIK_METRICS_TEXTFILE", "/tmp/metrics.prom")
+        monkeypatch.setenv("FABRIK_METRICS_INTERVAL", interval)
+        monkeypatch.delenv("FABRIK_METRICS_PORT", raising=False)
+        monkeypatch.setattr(droid_metrics, "configure", lambda **kw: configured.append(kw))
+
+        droid_metrics._configure_from_env()
+
+        assert configured[0]["interval"] == 15.0
+        assert "FABRIK_METRICS_INTERVAL" in capsys.readouterr().err
+
+    def test_endpoint_binds_locally_by_default(self, monkeypatch):
+        """Without FABRIK_METRICS_HOST the endpoint listens on 127.0.0.1 only."""
+        configured = []
+        monkeypatch.setenv("FABRIK_METRICS_PORT", "9464")
+        monkeypatch.delenv("FABRIK_METRICS_HOST", raising=False)
+        monkeypatch.setattr(droid_metrics, "configure", lambda **kw: configured.append(kw))
+
+        droid_metrics._configure_from_env()
+
+        assert configured[0]["port"] == 9464
+        assert configured[0]["host"] == "127.0.0.1"
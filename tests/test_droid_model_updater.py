@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for droid_model_updater.py
+
+Covers:
+- Stale-while-revalidate reads of the model cache
+- The host-wide refresh lock
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import droid_model_updater as updater
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Cache files in tmp_path; CLI, network and process spawning recorded, not run."""
+    monkeypatch.setattr(updater, "CACHE_FILE", tmp_path / "cache.json")
+    monkeypatch.setattr(updater, "REFRESH_LOCK_FILE", tmp_path / "cache.lock")
+    monkeypatch.setattr(updater, "DEPRECATION_FILE", tmp_path / "deprecations.json")
+    monkeypatch.setattr(updater, "_AVAILABLE_MODELS_CACHE", None)
+    monkeypatch.setattr(updater, "_refresh_started", False)
+    monkeypatch.setattr(updater, "get_models_in_use", lambda: ["old-model"])
+    monkeypatch.setattr(updater, "fetch_model_prices", lambda: {"new-model": 1.0})
+
+    calls = {"fetch": 0, "spawn": 0}
+
+    def fetch():
+        calls["fetch"] += 1
+        return ["new-model"]
+
+    def popen(*args, **kwargs):
+        calls["spawn"] += 1
+
+    monkeypatch.setattr(updater, "fetch_models_from_droid_cli", fetch)
+    monkeypatch.setattr("subprocess.Popen", popen)
+    return calls
+
+
+def _write_cache(models: list[str], age_hours: float) -> None:
+    timestamp = datetime.now() - timedelta(hours=age_hours)
+    data = {"status": "up_to_date", "available_models": models, "timestamp": timestamp.isoformat()}
+    updater.CACHE_FILE.write_text(json.dumps(data))
+
+
+class TestEnsureModelsFresh:
+    """Tests for the non-blocking cache read."""
+
+    def test_fresh_cache(self, cache):
+        """A fresh cache is returned as-is without refreshing."""
+        _write_cache(["old-model"], age_hours=1)
+
+        result = updater.ensure_models_fresh()
+
+        assert result["status"] == "ok"
+        assert result["available_models"] == ["old-model"]
+        assert result["deprecations"] == []
+        assert cache == {"fetch": 0, "spawn": 0}
+
+    def test_stale_cache_served_while_refreshing(self, cache):
+        """A stale cache is returned immediately; one background refresher is started."""
+        _write_cache(["gone-model"], age_hours=48)
+
+        first = updater.ensure_models_fresh()
+        updater.ensure_models_fresh()
+
+        assert first["status"] == "using_stale_cache"
+        assert first["available_models"] == ["gone-model"]
+        # Deprecations are checked against the cached list
+        assert [d["model"] for d in first["deprecations"]] == ["old-model"]
+        assert cache == {"fetch": 0, "spawn": 1}
+
+    def test_cold_cache(self, cache):
+        """With no cache at all, callers get an empty list instead of waiting."""
+        result = updater.ensure_models_fresh()
+
+        assert result["status"] == "refreshing"
+        assert result["available_models"] == []
+        assert updater.get_available_models() == []
+        assert cache == {"fetch": 0, "spawn": 1}
+
+    def test_wait_refreshes_in_foreground(self, cache):
+        """wait=True (CLI use) refreshes a stale cache before returning."""
+        _write_cache(["gone-model"], age_hours=48)
+
+        result = updater.ensure_models_fresh(wait=True)
+
+        assert result["status"] == "ok"
+        assert result["from_cache"] is False
+        assert result["available_models"] == ["new-model"]
+        assert updater.read_cache()["model_prices"] == {"new-model": 1.0}
+        assert cache == {"fetch": 1, "spawn": 0}
+
+
+class TestRefreshModels:
+    """Tests for the locked refresher."""
+
+    def test_skips_while_another_refresher_holds_the_lock(self, cache):
+        """Only one refresher per host fetches; the others exit at once."""
+        _write_cache(["gone-model"], age_hours=48)
+        fd = os.open(str(updater.REFRESH_LOCK_FILE), os.O_CREAT | os.O_RDWR)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            assert updater.refresh_models() is None
+        finally:
+            os.close(fd)
+
+        assert cache["fetch"] == 0
+        assert updater.refresh_models()["available_models"] == ["new-model"]
+        assert cache["fetch"] == 1
+
+    def test_skips_when_already_fresh(self, cache):
+        """A refresher that finds a fresh cache (another one just ran) does not fetch."""
+        _write_cache(["old-model"], age_hours=1)
+
+        assert updater.refresh_models()["available_models"] == ["old-model"]
+        assert updater.refresh_models(force=True)["available_models"] == ["new-model"]
+        assert cache["fetch"] == 1
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Tests for droid_models.py
+
+Covers:
+- Memoized, mtime-invalidated models.yaml loading
+- The compiled routing table: recommendations, serialisation and session pairing
+- Single-pass model sync across files
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import droid_models
+
+pytestmark = pytest.mark.skipif(not droid_models.YAML_AVAILABLE, reason="requires PyYAML")
+
+
+def _write_config(path: Path, default_model: str) -> None:
+    path.write_text(f"version: '1'\ndefault_model: {default_model}\nmodels: {{}}\n")
+
+
+class TestLoadModelsConfig:
+    """Tests for the cached config loader."""
+
+    def test_parsed_once_while_unchanged(self, tmp_path, monkeypatch):
+        """Repeated loads return the same object without re-parsing."""
+        config_file = tmp_path / "models.yaml"
+        _write_config(config_file, "a")
+        parses = []
+        original = droid_models._parse_models_config
+        monkeypatch.setattr(
+            droid_models, "_parse_models_config", lambda p: parses.append(p) or original(p)
+        )
+
+        first = droid_models.load_models_config(config_file)
+        second = droid_models.load_models_config(config_file)
+
+        assert first is second
+        assert first["default_model"] == "a"
+        assert len(parses) == 1
+
+    def test_reparsed_when_file_changes(self, tmp_path):
+        """A new mtime invalidates the cached config."""
+        config_file = tmp_path / "models.yaml"
+        _write_config(config_file, "a")
+        droid_models.load_models_config(config_file)
+
+        _write_config(config_file, "b")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert droid_models.load_models_config(config_file)["default_model"] == "b"
+
+    def test_missing_file_returns_builtin(self, tmp_path):
+        """A missing config returns the builtin marker instead of raising."""
+        config = droid_models.load_models_config(tmp_path / "missing.yaml")
+
+        assert config["version"] == "builtin"
+        assert "error" in config
+
+
+ROUTING_CONFIG = """
+version: '1'
+default_model: claude-sonnet-4-5-20250929
+models:
+  claude-sonnet-4-5-20250929: {provider: anthropic}
+  gpt-5.1-codex: {provider: openai}
+  gemini-3-pro-preview: {provider: google}
+scenarios:
+  explore: {primary: gemini-3-pro-preview}
+compatibility:
+  openai_only_pairs_with_openai: true
+  anthropic_reasoning_on_pairs_with_anthropic: true
+  anthropic_reasoning_off_pairs_with_non_openai: true
+"""
+
+
+@pytest.fixture
+def routing(tmp_path, monkeypatch):
+    """Routing table built from ROUTING_CONFIG and serialised in tmp_path."""
+    config_file = tmp_path / "models.yaml"
+    config_file.write_text(ROUTING_CONFIG)
+    monkeypatch.setattr(droid_models, "CONFIG_FILE", config_file)
+    monkeypatch.setattr(droid_models, "ROUTING_FILE", tmp_path / "routing.json")
+    monkeypatch.setattr(droid_models, "_routing_table", None)
+    return config_file
+
+
+class TestRoutingTable:
+    """Tests for the compiled routing table."""
+
+    def test_recommendations(self, routing):
+        """Candidates keep their rank; provider preference picks the first match."""
+        standard = droid_models.TaskCategory.STANDARD
+
+        assert droid_models.recommend_model(standard) == "claude-sonnet-4-5-20250929"
+        assert droid_models.recommend_model(standard, prefer_provider="openai") == "gpt-5.1-codex"
+        assert droid_models.recommend_model(standard, prefer_provider="xai") == (
+            "claude-sonnet-4-5-20250929"
+        )
+        assert droid_models.get_fabrik_task_models()["ANALYZE"] == "gemini-3-pro-preview"
+
+    def test_serialised_table_is_reused(self, routing, monkeypatch):
+        """A new process loads the table from disk without parsing models.yaml."""
+        droid_models.routing_table()
+        assert droid_models.ROUTING_FILE.exists()
+
+        monkeypatch.setattr(droid_models, "_routing_table", None)
+        monkeypatch.setattr(droid_models, "_config_cache", {})
+        monkeypatch.setattr(droid_models, "_parse_models_config", pytest.fail)
+
+        assert droid_models.routing_table()["default_model"] == "claude-sonnet-4-5-20250929"
+
+    def test_rebuilt_when_config_changes(self, routing):
+        """Editing models.yaml invalidates both the in-process and serialised table."""
+        droid_models.routing_table()
+        routing.write_text(
+            ROUTING_CONFIG.replace("default_model: claude", "default_model: x-claude")
+        )
+        stat = routing.stat()
+        os.utime(routing, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert droid_models.routing_table()["default_model"] == "x-claude-sonnet-4-5-20250929"
+
+    def test_session_pairing(self, routing):
+        """Compatibility rules are precomputed per provider and reasoning mode."""
+        claude, gpt, gemini = "claude-sonnet-4-5-20250929", "gpt-5.1-codex", "gemini-3-pro-preview"
+
+        assert droid_models.can_continue_session(gpt, gpt)
+        assert not droid_models.can_continue_session(gpt, claude)
+        assert droid_models.can_continue_session(claude, gemini)
+        assert not droid_models.can_continue_session(claude, gemini, reasoning=True)
+        assert not droid_models.can_continue_session(claude, gpt)
+        assert not droid_models.can_continue_session(claude, "unknown-model")
+        assert "cannot be continued" in droid_models.check_model_change_warning(gpt, claude)
+        assert "converted" in droid_models.check_model_change_warning(claude, gemini)
+
+    def test_session_pairing_is_symmetric(self, routing):
+        """A rule on either provider's side forbids the pairing."""
+        claude, gpt, gemini = "claude-sonnet-4-5-20250929", "gpt-5.1-codex", "gemini-3-pro-preview"
+
+        assert not droid_models.can_continue_session(gemini, gpt)
+        assert not droid_models.can_continue_session(gemini, claude, reasoning=True)
+        assert droid_models.can_continue_session(gemini, claude)
+        assert "cannot be continued" in droid_models.check_model_change_warning(gemini, gpt)
+
+
+class TestSyncAllModels:
+    """Tests for the concurrent, write-if-changed sync."""
+
+    @pytest.fixture
+    def targets(self, tmp_path, monkeypatch):
+        """AGENTS.md with a stale table, droid_tasks.py already in sync, one missing file."""
+        agents = tmp_path / "AGENTS.md"
+        agents.write_text(
+            "# Agents\n\n"
+            "| Mode | Task Type | Model | Reasoning | Autonomy |\n"
+            "|------|-----------|-------|-----------|----------|\n"
+            "| Explore | `analyze` | old-model | off | low |\n"
+            "\nFooter\n"
+        )
+        tasks = tmp_path / "droid_tasks.py"
+        tasks.write_text('TaskType.ANALYZE: {\n    "model": "m",\n}\n')
+        monkeypatch.setattr(droid_models, "get_fabrik_task_models", lambda: {"ANALYZE": "m"})
+        monkeypatch.setattr(
+            droid_models,
+            "SYNC_TARGETS",
+            {
+                "droid_tasks.py": (tasks, droid_models._render_droid_tasks),
+                "AGENTS.md": (agents, droid_models._render_agents_md),
+                "missing.md": (tmp_path / "missing.md", droid_models._render_droid_exec_usage),
+            },
+        )
+        return tmp_path
+
+    def test_only_changed_files_are_written(self, targets):
+        """Unchanged files keep their inode and mtime; changed ones are replaced."""
+        tasks_stat = (targets / "droid_tasks.py").stat()
+
+        results = droid_models.sync_all_models()
+
+        assert results["AGENTS.md"]["status"] == "updated"
+        assert results["droid_tasks.py"]["status"] == "no_changes"
+        assert results["missing.md"]["status"] == "error"
+        agents = (targets / "AGENTS.md").read_text()
+        assert "| Explore | `analyze` | gemini-3-flash-preview |" in agents
+        assert agents.endswith("\nFooter\n")
+        after = (targets / "droid_tasks.py").stat()
+        assert (after.st_ino, after.st_mtime_ns) == (tasks_stat.st_ino, tasks_stat.st_mtime_ns)
+        assert sorted(p.name for p in targets.iterdir()) == ["AGENTS.md", "droid_tasks.py"]
+
+        summary = droid_models.format_sync_summary(results, 0.012)
+        assert summary == "Checked 3 files in 12ms: 1 changed (AGENTS.md)"
+
+    def test_second_run_is_a_no_op(self, targets):
+        """Once in sync, nothing is rewritten."""
+        droid_models.sync_all_models()
+
+        results = droid_models.sync_all_models()
+
+        assert results["AGENTS.md"]["status"] == "no_changes"
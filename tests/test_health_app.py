@@ -3,40 +3,43 @@
 from fastapi.testclient import TestClient
 
 from fabrik import health_app
+from fabrik.drivers.transport import NO_RETRY
 
 
-class _HealthyCoolify:
+class _FakeClient:
     def __init__(self, *args, **kwargs):
         pass
 
-    def health(self):
-        return {"status": "ok"}
-
+    async def __aenter__(self):
+        return self
 
-class _HealthyDNS:
-    def __init__(self, *args, **kwargs):
+    async def __aexit__(self, *args):
         pass
 
-    def health(self):
+
+class _HealthyCoolify(_FakeClient):
+    async def health(self):
+        return {"status": "ok"}
+
+
+class _HealthyDNS(_FakeClient):
+    async def health(self):
         return {"status": "healthy"}
 
 
-class _FailingCoolify:
+class _FailingCoolify(_FakeClient):
     def __init__(self, *args, **kwargs):
         raise ValueError("missing COOLIFY_API_TOKEN")
 
 
-class _FailingDNS:
-    def __init__(self, *args, **kwargs):
-        pass
-
-    def health(self):
+class _FailingDNS(_FakeClient):
+    async def health(self):
         raise RuntimeError("dns service down")
 
 
 def test_health_reports_ok_when_dependencies_healthy(monkeypatch):
-    monkeypatch.setattr(health_app, "CoolifyClient", _HealthyCoolify)
-    monkeypatch.setattr(health_app, "DNSClient", _HealthyDNS)
+    monkeypatch.setattr(health_app, "AsyncCoolifyClient", _HealthyCoolify)
+    monkeypatch.setattr(health_app, "AsyncDNSClient", _HealthyDNS)
 
     client = TestClient(health_app.app)
     response = client.get("/health")
@@ -49,8 +52,8 @@ def test_health_reports_ok_when_dependencies_healthy(monkeypatch):
 
 
 def test_health_degrades_when_dependencies_fail(monkeypatch):
-    monkeypatch.setattr(health_app, "CoolifyClient", _FailingCoolify)
-    monkeypatch.setattr(health_app, "DNSClient", _FailingDNS)
+    monkeypatch.setattr(health_app, "AsyncCoolifyClient", _FailingCoolify)
+    monkeypatch.setattr(health_app, "AsyncDNSClient", _FailingDNS)
 
     client = TestClient(health_app.app)
     response = client.get("/health")
@@ -60,3 +63,20 @@ def test_health_degrades_when_dependencies_fail(monkeypatch):
     assert body["status"] == "degraded"
     assert body["checks"]["coolify"]["status"] == "unhealthy"
     assert body["checks"]["dns"]["status"] == "unhealthy"
+
+
+def test_health_probes_do_not_retry(monkeypatch):
+    """Each probe client is built with NO_RETRY and the short probe timeout."""
+    seen = []
+
+    class _Recording(_HealthyDNS):
+        def __init__(self, *args, **kwargs):
+            seen.append(kwargs)
+
+    monkeypatch.setattr(health_app, "AsyncCoolifyClient", _Recording)
+    monkeypatch.setattr(health_app, "AsyncDNSClient", _Recording)
+
+    response = TestClient(health_app.app).get("/health")
+
+    assert response.status_code == 200
+    assert seen == [{"timeout": health_app.PROBE_TIMEOUT, "retry": NO_RETRY}] * 2
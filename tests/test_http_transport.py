@@ -0,0 +1,244 @@
+"""Tests for the shared HTTP transport."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from fabrik.drivers import transport
+from fabrik.drivers.transport import (
+    NO_RETRY,
+    AsyncRetryTransport,
+    RetryPolicy,
+    RetryTransport,
+    create_async_client,
+    create_client,
+)
+
+
+def make_client(handler, retry=None, **kwargs):
+    """Client on a RetryTransport over handler; returns (client, recorded sleeps)."""
+    sleeps: list[float] = []
+    wrapped = RetryTransport(httpx.MockTransport(handler), sleep=sleeps.append, **kwargs)
+    return create_client(retry=retry, transport=wrapped), sleeps
+
+
+def replies(*statuses, headers=None):
+    """Handler answering with statuses in order; records the requests it saw."""
+    seen: list[httpx.Request] = []
+
+    def handler(request):
+        seen.append(request)
+        # An unread stream, like a real connection's, holds the host slot until closed
+        return httpx.Response(
+            statuses[len(seen) - 1], headers=headers, stream=httpx.ByteStream(b"")
+        )
+
+    handler.seen = seen
+    return handler
+
+
+class TestRetryTransport:
+    """Test retries, Retry-After and per-host limits."""
+
+    def test_get_retried_on_503(self):
+        """Idempotent requests are retried on 5xx with backoff."""
+        handler = replies(503, 502, 200)
+        client, sleeps = make_client(handler, RetryPolicy(attempts=3, backoff=0.1))
+
+        assert client.get("https://api.test/items").status_code == 200
+        assert len(handler.seen) == 3
+        assert len(sleeps) == 2
+        assert all(0 <= s <= 0.4 for s in sleeps)
+
+    def test_last_response_returned_when_attempts_exhausted(self):
+        """After the last attempt the failing response is returned, not raised."""
+        client, sleeps = make_client(replies(500, 500), RetryPolicy(attempts=2))
+
+        assert client.get("https://api.test/").status_code == 500
+        assert len(sleeps) == 1
+
+    def test_post_not_retried_on_5xx(self):
+        """Non-idempotent requests are not repeated after a server error."""
+        handler = replies(503, 200)
+        client, sleeps = make_client(handler)
+
+        assert client.post("https://api.test/items", json={"a": 1}).status_code == 503
+        assert len(handler.seen) == 1
+        assert sleeps == []
+
+    def test_post_retried_on_429_after_retry_after(self):
+        """429 is retried for any method, waiting as long as Retry-After says."""
+        handler = replies(429, 201, headers={"Retry-After": "2"})
+        client, sleeps = make_client(handler)
+
+        response = client.post("https://api.test/items", json={"a": 1})
+
+        assert response.status_code == 201
+        assert sleeps == [2.0]
+        assert handler.seen[1].content == b'{"a":1}'
+
+    def test_long_retry_after_not_waited_for(self):
+        """A Retry-After above max_delay returns the 429 immediately."""
+        client, sleeps = make_client(
+            replies(429, 200, headers={"Retry-After": "120"}), RetryPolicy(max_delay=10)
+        )
+
+        assert client.get("https://api.test/").status_code == 429
+        assert sleeps == []
+
+    def test_connect_error_retried(self):
+        """Connection failures are retried, then raised."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            raise httpx.ConnectError("refused", request=request)
+
+        client, sleeps = make_client(handler, RetryPolicy(attempts=2))
+
+        with pytest.raises(httpx.ConnectError):
+            client.post("https://api.test/")
+        assert len(attempts) == 2
+
+    def test_no_retry_policy(self):
+        """NO_RETRY sends exactly once."""
+        handler = replies(503, 200)
+        client, _ = make_client(handler, NO_RETRY)
+
+        assert client.get("https://api.test/").status_code == 503
+        assert len(handler.seen) == 1
+
+    def test_per_host_limit(self):
+        """Open responses hold their host's slot until closed."""
+        client, _ = make_client(replies(200, 200, 200), max_per_host=1)
+        first = client.send(client.build_request("GET", "https://a.test/"), stream=True)
+
+        # Another host is not blocked
+        assert client.get("https://b.test/").status_code == 200
+
+        second: list[int] = []
+        waiter = threading.Thread(
+            target=lambda: second.append(client.get("https://a.test/").status_code), daemon=True
+        )
+        waiter.start()
+        waiter.join(0.2)
+        assert waiter.is_alive()
+
+        first.close()
+        waiter.join(5)
+        assert second == [200]
+
+
+class TestAsyncRetryTransport:
+    """Test the async transport."""
+
+    def test_retry_after_honoured(self):
+        """429 is retried after Retry-After, as in the sync transport."""
+        handler = replies(429, 200, headers={"Retry-After": "1.5"})
+        sleeps: list[float] = []
+
+        async def sleep(seconds):
+            sleeps.append(seconds)
+
+        async def run():
+            wrapped = AsyncRetryTransport(httpx.MockTransport(handler), sleep=sleep)
+            async with create_async_client(transport=wrapped) as client:
+                return (await client.post("https://api.test/", json={})).status_code
+
+        assert asyncio.run(run()) == 200
+        assert sleeps == [1.5]
+        assert len(handler.seen) == 2
+
+    def test_per_host_limit(self):
+        """At most max_per_host requests to one host are in flight."""
+        in_flight = peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, stream=httpx.ByteStream(b""))
+
+        async def run():
+            wrapped = AsyncRetryTransport(httpx.MockTransport(handler), max_per_host=2)
+            async with create_async_client(transport=wrapped) as client:
+                await asyncio.gather(*(client.get("https://api.test/") for _ in range(6)))
+
+        asyncio.run(run())
+        assert peak == 2
+
+
+class TestTimingHooks:
+    """Test request timing hooks."""
+
+    def test_hook_sees_every_attempt(self):
+        """Each attempt is reported with its status."""
+        timings = []
+        transport.add_timing_hook(timings.append)
+        try:
+            client, _ = make_client(replies(503, 200))
+            client.get("https://api.test/x")
+        finally:
+            transport.remove_timing_hook(timings.append)
+
+        assert [(t.method, t.attempt, t.status_code) for t in timings] == [
+            ("GET", 1, 503),
+            ("GET", 2, 200),
+        ]
+        assert timings[0].url == "https://api.test/x"
+        assert all(t.elapsed >= 0 for t in timings)
+
+    def test_failing_hook_does_not_fail_request(self):
+        """Exceptions in hooks are logged, not raised."""
+
+        def broken(timing):
+            raise RuntimeError("boom")
+
+        transport.add_timing_hook(broken)
+        try:
+            client, _ = make_client(replies(200))
+            assert client.get("https://api.test/").status_code == 200
+        finally:
+            transport.remove_timing_hook(broken)
+
+
+class TestSharedTransport:
+    """Test the process-wide transport."""
+
+    def test_clients_share_one_pool(self):
+        """Closing a client leaves the shared pool usable by the next."""
+        first = create_client()
+        second = create_client()
+        first.close()
+
+        assert first._transport is second._transport
+        assert not second.is_closed
+        assert transport.shared_transport() is second._transport
+
+    def test_http2_falls_back_without_h2(self, monkeypatch):
+        """FABRIK_HTTP2 without h2 installed still builds an HTTP/1.1 pool."""
+        monkeypatch.setenv("FABRIK_HTTP2", "1")
+        monkeypatch.setattr(transport, "http2_available", lambda: False)
+        transport.close_shared_transport()
+        try:
+            assert create_client().headers is not None
+        finally:
+            transport.close_shared_transport()
+
+    @pytest.mark.parametrize("value", ["ten", "0", "-3"])
+    def test_bad_max_per_host_falls_back(self, monkeypatch, caplog, value):
+        """A malformed or non-positive FABRIK_HTTP_MAX_PER_HOST logs and uses 10."""
+        monkeypatch.setenv("FABRIK_HTTP_MAX_PER_HOST", value)
+
+        assert transport._env_max_per_host() == 10
+        assert "FABRIK_HTTP_MAX_PER_HOST" in caplog.text
+
+    def test_max_per_host_from_env(self, monkeypatch):
+        """A valid FABRIK_HTTP_MAX_PER_HOST is used as is."""
+        monkeypatch.setenv("FABRIK_HTTP_MAX_PER_HOST", "4")
+
+        assert transport._env_max_per_host() == 4
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for pipeline_index.py
+
+Covers:
+- Indexing reports on save and rebuilding from report.json files
+- Per-stage latency percentiles, pass rates, tokens and cache hits
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from pipeline_index import compute_stats, format_stats, index_report, percentile, rebuild_index
+
+
+def _report(
+    run_id: str,
+    stage_seconds: dict[str, float],
+    days_ago: int = 0,
+    status: str = "success",
+    cached: bool = False,
+) -> dict:
+    start = datetime.now(UTC) - timedelta(days=days_ago)
+    stages = []
+    for stage, seconds in stage_seconds.items():
+        stages.append(
+            {
+                "stage": stage,
+                "step": "",
+                "status": "pass",
+                "started_at": start.isoformat(),
+                "ended_at": (start + timedelta(seconds=seconds)).isoformat(),
+                "duration_seconds": seconds,
+                "model": "m",
+                "iteration": 1,
+                "tokens_used": 100,
+                "cached": cached,
+            }
+        )
+    return {
+        "run_id": run_id,
+        "task": "t",
+        "risk_level": "MEDIUM",
+        "status": status,
+        "stages": stages,
+        "timestamps": {"started_at": start.isoformat(), "duration_seconds": 1.0},
+        "metrics": {"total_tokens": 100 * len(stages), "verification_iterations": 1},
+        "dry_run": False,
+        "exit_code": 0,
+    }
+
+
+class TestPercentile:
+    """Tests for the nearest-rank percentile."""
+
+    def test_nearest_rank(self):
+        """p50/p90 pick the nearest-rank element; empty input is 0.0."""
+        values = [float(v) for v in range(1, 11)]
+
+        assert percentile(values, 50) == 5.0
+        assert percentile(values, 90) == 9.0
+        assert percentile(values, 99) == 10.0
+        assert percentile([], 50) == 0.0
+
+
+class TestStats:
+    """Tests for aggregation over the index."""
+
+    def test_stage_latency_and_rates(self, tmp_path):
+        """Latency percentiles are per run; cached steps only affect hit rates."""
+        for i in range(10):
+            index_report(tmp_path, _report(f"run-{i}", {"planning": float(i + 1)}))
+        index_report(tmp_path, _report("cached", {"planning": 999.0}, cached=True))
+        index_report(tmp_path, _report("failed", {"execution": 5.0}, status="failed"))
+
+        stats = compute_stats(tmp_path, days=30)
+
+        planning = stats["stages"]["planning"]
+        assert planning["latency_seconds"]["p50"] == pytest.approx(5.0, abs=0.01)
+        assert planning["latency_seconds"]["p90"] == pytest.approx(9.0, abs=0.01)
+        assert planning["cache_hit_rate"] == pytest.approx(1 / 11, abs=0.001)
+        assert planning["tokens"] == 1000
+        assert stats["runs"]["count"] == 12
+        assert stats["runs"]["success_rate"] == pytest.approx(11 / 12, abs=0.001)
+        assert "planning" in format_stats(stats)
+
+    def test_days_and_stage_filters(self, tmp_path):
+        """Old runs fall outside the window; --stage limits the stage table."""
+        index_report(tmp_path, _report("old", {"planning": 1.0, "ship": 1.0}, days_ago=60))
+        index_report(tmp_path, _report("new", {"planning": 2.0, "ship": 1.0}))
+
+        recent = compute_stats(tmp_path, days=30, stage="planning")
+        everything = compute_stats(tmp_path, days=None)
+
+        assert recent["runs"]["count"] == 1
+        assert list(recent["stages"]) == ["planning"]
+        assert everything["stages"]["planning"]["runs"] == 2
+
+    def test_reindexing_a_run_replaces_rows(self, tmp_path):
+        """Saving the same run twice does not double count its stages."""
+        index_report(tmp_path, _report("r", {"planning": 1.0}))
+        index_report(tmp_path, _report("r", {"planning": 1.0}))
+
+        assert compute_stats(tmp_path)["stages"]["planning"]["steps"] == 1
+
+    def test_rebuild_from_report_files(self, tmp_path):
+        """rebuild_index() re-reads every run directory, skipping dry runs."""
+        for run_id, dry_run in (("a", False), ("b", False), ("c", True)):
+            report = _report(run_id, {"execution": 1.0}) | {"dry_run": dry_run}
+            (tmp_path / run_id).mkdir()
+            (tmp_path / run_id / "report.json").write_text(json.dumps(report))
+
+        assert rebuild_index(tmp_path) == 2
+        assert compute_stats(tmp_path)["runs"]["count"] == 2
@@ -1,21 +1,78 @@
 """Tests for GAP-09 Pipeline Runner."""
 
 import json
+import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from scripts.droid_core import MultiModelResult, TaskResult, TaskType, run_with_preflight_gates
 from scripts.pipeline_runner import (
     ExitCode,
     PipelineConfig,
     PipelineRunner,
     RiskLevel,
+    StageNode,
+    StageResult,
     create_parser,
     main,
+    run_dag,
 )
 
 
+class FakeDroid:
+    """Stand-in for droid exec: records prompts, approves reviews by default."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[TaskType, str]] = []
+        self.approve = [True]  # Per verification call; last value repeats
+        self.preflight_passes = True
+        self.lock = threading.Lock()
+
+    def run_droid_exec(self, prompt: str, task_type: TaskType, **kwargs) -> TaskResult:
+        with self.lock:
+            self.calls.append((task_type, prompt))
+            reviews = sum(
+                1 for t, p in self.calls if t == TaskType.REVIEW and p.startswith("Review")
+            )
+        output = f"{task_type.value} output"
+        if task_type == TaskType.REVIEW and prompt.startswith("Review"):
+            approved = self.approve[min(reviews, len(self.approve)) - 1]
+            output = json.dumps({"approved": approved, "issues": [] if approved else ["bug"]})
+        return TaskResult(
+            success=True,
+            task_type=task_type,
+            prompt=prompt,
+            result=output,
+            session_id="sess",
+            model=kwargs.get("model", ""),
+            tokens_used=10,
+        )
+
+    def run_discovery_dual_model(self, prompt: str, task_type: TaskType, cwd=None):
+        return MultiModelResult(
+            primary_result=self.run_droid_exec(prompt, task_type), secondary_results=[]
+        )
+
+    def run_with_preflight_gates(self, prompt: str, task_type: TaskType, cwd=None, paths=None):
+        return self.preflight_passes, "ruff check: PASS"
+
+
+@pytest.fixture(autouse=True)
+def fake_droid():
+    """Never launch real droid exec processes from the pipeline tests."""
+    fake = FakeDroid()
+    with (
+        patch("scripts.droid_core.run_droid_exec", fake.run_droid_exec),
+        patch("scripts.droid_core.run_discovery_dual_model", fake.run_discovery_dual_model),
+        patch("scripts.droid_core.run_with_preflight_gates", fake.run_with_preflight_gates),
+    ):
+        yield fake
+
+
 class TestRiskAssessment:
     """Tests for risk assessment logic."""
 
@@ -697,3 +754,295 @@ class TestStageResultToReportStage:
         report = stage_result_to_report_stage(sr)
 
         assert report["output_summary"] == ""
+
+
+def _node(name: str, deps: tuple[str, ...] = (), status: str = "pass", delay: float = 0.0):
+    def run(dep_results: dict[str, StageResult]) -> StageResult:
+        time.sleep(delay)
+        return StageResult(name, status, "", "", "", "m", name)
+
+    return StageNode(name, name, run, deps)
+
+
+class TestRunDag:
+    """Tests for the stage DAG scheduler."""
+
+    def test_independent_nodes_run_concurrently(self) -> None:
+        """Nodes without mutual dependencies overlap in time."""
+        nodes = [_node("a"), _node("b", delay=0.2), _node("c", delay=0.2), _node("d", ("b", "c"))]
+        start = time.monotonic()
+        results, skipped = run_dag(nodes, lambda node, deps: node.run(deps), max_workers=4)
+
+        assert time.monotonic() - start < 0.35
+        assert list(results)[-1] == "d"
+        assert skipped == []
+
+    def test_failed_dependency_skips_downstream(self) -> None:
+        """Dependants of a failed node are skipped transitively."""
+        nodes = [_node("a", status="fail"), _node("b", ("a",)), _node("c", ("b",)), _node("x")]
+        results, skipped = run_dag(nodes, lambda node, deps: node.run(deps))
+
+        assert set(results) == {"a", "x"}
+        assert sorted(skipped) == ["b", "c"]
+
+    def test_unknown_dependency_and_cycle_rejected(self) -> None:
+        """Unknown dependencies and cycles raise ValueError."""
+        with pytest.raises(ValueError, match="unknown"):
+            run_dag([_node("a", ("missing",))], lambda node, deps: node.run(deps))
+        with pytest.raises(ValueError, match="cycle"):
+            run_dag([_node("a", ("b",)), _node("b", ("a",))], lambda node, deps: node.run(deps))
+
+    def test_done_results_satisfy_dependencies(self) -> None:
+        """Results from an earlier graph feed dependants without running again."""
+        done = {"a": StageResult("a", "pass", "", "", "", "m", "plan")}
+        seen = {}
+
+        def execute(node, deps):
+            seen.update(deps)
+            return node.run(deps)
+
+        results, skipped = run_dag([_node("b", ("a",))], execute, done=done)
+
+        assert list(results) == ["b"]
+        assert seen == done
+        assert skipped == []
+
+
+class TestStageExecution:
+    """Tests for real stage execution through the DAG."""
+
+    def test_high_risk_runs_all_stages(self, tmp_path: Path, fake_droid: FakeDroid) -> None:
+        """HIGH risk runs discovery through ship and reports tokens and latency."""
+        runner = PipelineRunner(PipelineConfig(cwd=str(tmp_path)))
+        result = runner.run_pipeline("Add auth")
+
+        stages = [(s["stage"], s["step"]) for s in result.stages]
+        assert stages[0] == ("discovery", "")
+        assert {("planning", "plan"), ("planning", "edge_cases")} <= set(stages[1:3])
+        assert stages[-1] == ("ship", "")
+        assert result.status == "success"
+        assert result.metrics["stages_executed"] == len(result.stages) == 8
+        assert result.metrics["total_tokens"] == 70  # 7 droid calls; preflight uses none
+        assert result.metrics["verification_iterations"] == 1
+        assert all("duration_seconds" in s for s in result.stages)
+
+    def test_ship_updates_documentation(self, tmp_path: Path, fake_droid: FakeDroid) -> None:
+        """The ship step is a documentation edit, not another read-only review."""
+        PipelineRunner(PipelineConfig(cwd=str(tmp_path))).run_pipeline("Fix typo")
+
+        task_type, prompt = fake_droid.calls[-1]
+        assert task_type == TaskType.CODE
+        assert "CHANGELOG.md" in prompt and "do not modify files" not in prompt
+
+    def test_modules_execute_in_parallel_chains(
+        self, tmp_path: Path, fake_droid: FakeDroid
+    ) -> None:
+        """Each module gets its own execution and verification step."""
+        config = PipelineConfig(cwd=str(tmp_path), modules=["src/a", "src/b"])
+        result = PipelineRunner(config).run_pipeline("Fix typo")
+
+        steps = {(s["stage"], s["step"]) for s in result.stages}
+        assert {("execution", "src/a"), ("execution", "src/b")} <= steps
+        assert {("verification", "src/a"), ("verification", "src/b")} <= steps
+        prompts = [p for t, p in fake_droid.calls if t == TaskType.CODE]
+        assert any("only the src/a module" in p for p in prompts)
+
+    def test_rejection_reruns_module_with_feedback(
+        self, tmp_path: Path, fake_droid: FakeDroid
+    ) -> None:
+        """A rejected module is re-executed with the review feedback, then ships."""
+        fake_droid.approve = [False, True]
+        result = PipelineRunner(PipelineConfig(cwd=str(tmp_path))).run_pipeline("Fix typo")
+
+        assert result.status == "success"
+        assert result.metrics["verification_iterations"] == 2
+        code_prompts = [p for t, p in fake_droid.calls if p.startswith("Implement")]
+        assert "Verification feedback" in code_prompts[-1]
+
+    def test_rerun_keeps_plan(self, tmp_path: Path, fake_droid: FakeDroid) -> None:
+        """A re-executed module still gets the plan of the first iteration."""
+        fake_droid.approve = [False, True]
+        runner = PipelineRunner(PipelineConfig(cwd=str(tmp_path)))
+        result = runner.run_pipeline("Fix typo", start_stage=2)
+
+        assert result.status == "success"
+        code_prompts = [p for t, p in fake_droid.calls if p.startswith("Implement")]
+        assert len(code_prompts) == 2
+        assert all("Plan:" in p for p in code_prompts)
+        assert sum(s["step"] == "review" for s in result.stages) == 1
+
+    def test_rejected_twice_escalates(self, tmp_path: Path, fake_droid: FakeDroid) -> None:
+        """Verification rejecting every iteration escalates with exit code 2."""
+        fake_droid.approve = [False]
+        result = PipelineRunner(PipelineConfig(cwd=str(tmp_path))).run_pipeline("Fix typo")
+
+        assert result.status == "escalated"
+        assert result.exit_code == ExitCode.VERIFICATION_REJECTED_TWICE.value
+        assert all(s["stage"] != "ship" for s in result.stages)
+
+    def test_preflight_failure_exit_code(self, tmp_path: Path, fake_droid: FakeDroid) -> None:
+        """Failing pre-flight gates stop the run before AI verification."""
+        fake_droid.preflight_passes = False
+        result = PipelineRunner(PipelineConfig(cwd=str(tmp_path))).run_pipeline("Fix typo")
+
+        assert result.status == "failed"
+        assert result.exit_code == ExitCode.PREFLIGHT_GATE_FAILED.value
+        assert result.stages[-1]["step"] == "preflight"
+
+
+class TestResume:
+    """Tests for resuming from saved stage outputs."""
+
+    def test_resume_reuses_unchanged_steps(self, tmp_path: Path, fake_droid: FakeDroid) -> None:
+        """A resumed run reuses every step whose inputs did not change."""
+        config = PipelineConfig(cwd=str(tmp_path))
+        first = PipelineRunner(config)
+        first_result = first.run_pipeline("Fix typo")
+        first.save_report(first_result)
+        calls = len(fake_droid.calls)
+
+        resumed = PipelineRunner(config).run_pipeline("Fix typo", resume="latest")
+
+        assert len(fake_droid.calls) == calls
+        assert resumed.metrics["stages_cached"] == len(resumed.stages)
+        assert resumed.metrics["stages_executed"] == 0
+        assert all(s["cached"] for s in resumed.stages)
+
+    def test_resume_reruns_from_first_failure(self, tmp_path: Path, fake_droid: FakeDroid) -> None:
+        """Steps that failed last time are executed again, earlier ones are reused."""
+        config = PipelineConfig(cwd=str(tmp_path))
+        fake_droid.preflight_passes = False
+        first = PipelineRunner(config)
+        first_result = first.run_pipeline("Fix typo")
+        fake_droid.preflight_passes = True
+
+        resumed = PipelineRunner(config).run_pipeline("Fix typo", resume=first_result.run_id)
+
+        cached = {s["stage"]: s["cached"] for s in resumed.stages if not s["step"]}
+        assert cached["execution"] is True
+        assert cached["ship"] is False
+        assert resumed.status == "success"
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """A committed git repository with one module."""
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("x = 1\n")
+    git("init", "-q")
+    git("add", "src")
+    git("-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+class TestStepCache:
+    """Tests for the persistent, repository-state keyed step cache."""
+
+    def test_same_commit_reuses_every_step(self, git_repo: Path, fake_droid: FakeDroid) -> None:
+        """A second run on an unchanged tree executes nothing."""
+        config = PipelineConfig(cwd=str(git_repo))
+        PipelineRunner(config).run_pipeline("Add auth")
+        calls = len(fake_droid.calls)
+
+        again = PipelineRunner(config).run_pipeline("Add auth")
+
+        assert len(fake_droid.calls) == calls
+        assert again.metrics["stages_cached"] == len(again.stages)
+        assert all(s["cached"] for s in again.stages)
+
+    def test_worktree_change_keeps_planning(self, git_repo: Path, fake_droid: FakeDroid) -> None:
+        """An uncommitted fix re-runs execution onwards but reuses discovery and planning."""
+        config = PipelineConfig(cwd=str(git_repo))
+        PipelineRunner(config).run_pipeline("Add auth")
+        (git_repo / "src" / "app.py").write_text("x = 2\n")
+
+        again = PipelineRunner(config).run_pipeline("Add auth")
+
+        cached = {(s["stage"], s["step"]): s["cached"] for s in again.stages}
+        assert cached[("discovery", "")] and cached[("planning", "review")]
+        assert not cached[("execution", "")] and not cached[("verification", "")]
+
+    def test_execution_reused_after_it_changed_the_tree(
+        self, git_repo: Path, fake_droid: FakeDroid
+    ) -> None:
+        """Execution output is keyed by the tree it produced, so it is not repeated."""
+        original = fake_droid.run_droid_exec
+
+        def editing_droid(prompt: str, task_type: TaskType, **kwargs) -> TaskResult:
+            if task_type == TaskType.CODE:
+                (git_repo / "src" / "app.py").write_text("x = 3\n")
+            return original(prompt, task_type, **kwargs)
+
+        config = PipelineConfig(cwd=str(git_repo))
+        with patch("scripts.droid_core.run_droid_exec", editing_droid):
+            PipelineRunner(config).run_pipeline("Fix typo")
+            again = PipelineRunner(config).run_pipeline("Fix typo")
+
+        assert all(s["cached"] for s in again.stages)
+
+    def test_no_cache_executes_everything(self, git_repo: Path, fake_droid: FakeDroid) -> None:
+        """use_cache=False ignores stored results."""
+        PipelineRunner(PipelineConfig(cwd=str(git_repo))).run_pipeline("Fix typo")
+
+        again = PipelineRunner(PipelineConfig(cwd=str(git_repo), use_cache=False)).run_pipeline(
+            "Fix typo"
+        )
+
+        assert again.metrics["stages_cached"] == 0
+
+
+class TestPreflightScope:
+    """Tests for pre-flight gates scoped to the files a run changed."""
+
+    def test_preflight_checks_only_changed_module_files(self, git_repo: Path) -> None:
+        """Lint errors outside the module or committed before the run do not fail its gates."""
+        (git_repo / "legacy.py").write_text("import os\n")
+        (git_repo / "src" / "legacy.py").write_text("import os\n")
+        for args in (["add", "."], ["-c", "user.name=t", "commit", "-qm", "legacy"]):
+            subprocess.run(
+                ["git", "-c", "user.email=t@example.com", *args], cwd=git_repo, check=True
+            )
+        (git_repo / "src" / "app.py").write_text("x: int = 2\n")
+        runner = PipelineRunner(PipelineConfig(cwd=str(git_repo), modules=["src"]))
+
+        with patch("scripts.droid_core.run_with_preflight_gates", run_with_preflight_gates):
+            clean = runner._preflight_step("src")
+            (git_repo / "src" / "new.py").write_text("import sys\n")
+            broken = runner._preflight_step("src")
+
+        assert clean.status == "pass", clean.output
+        assert broken.status == "fail"
+        assert "new.py" in broken.output and "legacy.py" not in broken.output
+
+    def test_preflight_without_changes_passes(self, git_repo: Path) -> None:
+        """A module the run did not touch has nothing to check."""
+        runner = PipelineRunner(PipelineConfig(cwd=str(git_repo), modules=["src"]))
+
+        result = runner._preflight_step("src")
+
+        assert result.status == "pass"
+        assert result.output == "No changed Python files to check"
+
+
+class TestStatsCommand:
+    """Tests for the stats subcommand over the report index."""
+
+    def test_saved_reports_feed_stats(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """save_report() indexes the run and `stats --json` aggregates it."""
+        runner = PipelineRunner(PipelineConfig(cwd=str(tmp_path)))
+        runner.save_report(runner.run_pipeline("Fix typo"))
+
+        argv = ["prog", "stats", "--cwd", str(tmp_path), "--json"]
+        with patch.object(sys, "argv", argv):
+            assert main() == 0
+        stats = json.loads(capsys.readouterr().out)
+
+        assert stats["runs"]["count"] == 1
+        assert stats["stages"]["execution"]["pass_rate"] == 1.0
+        assert set(stats["stages"]) == {"execution", "verification", "ship"}
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Tests for process_monitor.py
+
+Covers:
+- /proc sampler backend (stat/io/fd parsing, child PID cache)
+- Backend selection and on-demand network sampling
+- MetricsRing history buffer and the shared MonitorService thread
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from process_monitor import (
+    MetricsRing,
+    MonitorService,
+    ProcessMetrics,
+    ProcessMonitor,
+    ProcSampler,
+    proc_available,
+)
+
+pytestmark = pytest.mark.skipif(not Path("/proc/self/stat").exists(), reason="requires /proc")
+
+
+@pytest.fixture
+def sleeper():
+    """A shell that spawns one child and then sleeps."""
+    proc = subprocess.Popen(
+        ["sh", "-c", "sleep 30 & wait"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+    )
+    # Wait until the shell has forked and is blocked in `wait`
+    for _ in range(100):
+        sample = ProcSampler(proc.pid).sample()
+        if sample and sample["process_status"] == "sleeping":
+            break
+        time.sleep(0.01)
+    yield proc
+    subprocess.run(["pkill", "-P", str(proc.pid)], check=False)
+    proc.terminate()
+    proc.wait()
+
+
+class TestProcSampler:
+    """Tests for the /proc sampling backend."""
+
+    def test_sample_reads_process_fields(self, sleeper):
+        """A sample reports status, threads, fds and memory for the root PID."""
+        sample = ProcSampler(sleeper.pid).sample()
+
+        assert sample["process_status"] in ("sleeping", "running")
+        assert sample["num_threads"] >= 1
+        assert sample["num_fds"] >= 1
+        assert sample["memory_mb"] > 0
+        assert sample["cpu_percent"] == 0.0  # First sample has no delta
+
+    def test_sample_returns_none_for_missing_process(self):
+        """Sampling a PID that no longer exists returns None."""
+        proc = subprocess.Popen(["true"])
+        proc.wait()
+
+        assert ProcSampler(proc.pid).sample() is None
+
+    def test_children_cached_between_samples(self, sleeper, monkeypatch):
+        """Child PIDs are discovered once and reused until the refresh interval."""
+        sampler = ProcSampler(sleeper.pid, children_refresh=3)
+        for _ in range(50):
+            if sampler._discover_children():
+                break
+            time.sleep(0.02)
+
+        calls = []
+        original = sampler._discover_children
+        monkeypatch.setattr(sampler, "_discover_children", lambda: calls.append(1) or original())
+        for _ in range(3):
+            sampler.sample()
+
+        assert len(calls) == 1
+        assert len(sampler._children) == 1
+
+    def test_network_connections_zero_without_sockets(self, sleeper):
+        """A process without sockets has no active connections."""
+        assert ProcSampler(sleeper.pid).network_connections() == 0
+
+
+class TestProcessMonitorBackend:
+    """Tests for backend selection in ProcessMonitor."""
+
+    def test_auto_prefers_proc(self, sleeper):
+        """auto selects the /proc backend on Linux."""
+        monitor = ProcessMonitor(sleeper)
+
+        assert proc_available(sleeper.pid)
+        assert monitor.backend == "proc"
+
+    def test_invalid_backend_rejected(self, sleeper):
+        """Unknown backends raise ValueError."""
+        with pytest.raises(ValueError):
+            ProcessMonitor(sleeper, backend="ebpf")
+
+    def test_backends_agree_on_static_fields(self, sleeper):
+        """proc and psutil backends report the same process facts."""
+        via_proc = ProcessMonitor(sleeper, backend="proc").collect_metrics()
+        via_psutil = ProcessMonitor(sleeper, backend="psutil").collect_metrics()
+
+        assert via_proc.process_status == via_psutil.process_status
+        assert via_proc.num_threads == via_psutil.num_threads
+        assert via_proc.num_fds == via_psutil.num_fds
+        assert via_proc.has_active_network is via_psutil.has_active_network is False
+
+    def test_network_skipped_while_cpu_busy(self, sleeper, monkeypatch):
+        """Sockets are not inspected when the sample already shows CPU activity."""
+        monitor = ProcessMonitor(sleeper, backend="proc")
+        real_sample = monitor._sampler.sample
+
+        def busy_sample():
+            sample = real_sample()
+            sample["cpu_percent"] = 50.0
+            return sample
+
+        monkeypatch.setattr(monitor._sampler, "sample", busy_sample)
+        monkeypatch.setattr(
+            monitor._sampler,
+            "network_connections",
+            lambda: pytest.fail("network sampled while busy"),
+        )
+
+        assert monitor.collect_metrics().cpu_percent == 50.0
+
+
+def _metrics(ts: float, cpu: float = 0.0, status: str = "sleeping") -> ProcessMetrics:
+    return ProcessMetrics(
+        timestamp=ts,
+        cpu_percent=cpu,
+        io_read_bytes=0,
+        io_write_bytes=0,
+        has_active_network=False,
+        num_network_connections=0,
+        process_status=status,
+        num_threads=1,
+        num_fds=3,
+        memory_mb=1.5,
+    )
+
+
+class TestMetricsRing:
+    """Tests for the array-backed metrics history."""
+
+    def test_keeps_latest_samples_in_order(self):
+        """Once full, the oldest samples are overwritten."""
+        ring = MetricsRing(3)
+        for ts in range(5):
+            ring.append(_metrics(float(ts), cpu=ts * 10.0))
+
+        assert len(ring) == 3
+        assert [m.timestamp for m in ring] == [2.0, 3.0, 4.0]
+        assert ring.column("cpu_percent") == [20.0, 30.0, 40.0]
+        assert ring[-1].timestamp == 4.0
+        assert ring[0].process_status == "sleeping"
+
+    def test_aggregates_match_rescan(self):
+        """Incremental aggregates equal a full rescan of the window after wrapping."""
+        import random
+
+        rng = random.Random(7)
+        ring = MetricsRing(5)
+        ts = 0.0
+        for i in range(40):
+            ts += rng.choice([1.0, 2.0, 5.0])
+            m = _metrics(ts, cpu=rng.choice([0.0, 0.3, 12.5]))
+            m.has_active_network = i % 9 == 0
+            m.io_read_bytes = i * 100
+            ring.append(m)
+
+            window = list(ring)
+            assert ring.avg_cpu == pytest.approx(sum(w.cpu_percent for w in window) / len(window))
+            assert ring.any_network == any(w.has_active_network for w in window)
+            assert ring.io_delta == window[-1].io_read_bytes - window[0].io_read_bytes
+            gaps = [b.timestamp - a.timestamp for a, b in zip(window, window[1:], strict=False)]
+            assert ring.max_gap == max(gaps, default=0.0)
+
+    def test_activity_score_uses_aggregates(self, sleeper):
+        """The activity score reports the window aggregates including max_gap."""
+        monitor = ProcessMonitor(sleeper, backend="proc")
+        for ts in (1.0, 2.0, 6.0):
+            monitor.metrics_history.append(_metrics(ts, cpu=0.2))
+
+        score = monitor._calculate_activity_score()
+
+        assert score["avg_cpu"] == pytest.approx(0.2)
+        assert score["max_gap"] == 4.0
+        assert score["has_activity"] is False
+
+    def test_index_out_of_range(self):
+        """Indexing past the stored samples raises IndexError."""
+        ring = MetricsRing(2)
+        ring.append(_metrics(1.0))
+
+        with pytest.raises(IndexError):
+            ring[1]
+
+
+class TestMonitorService:
+    """Tests for the shared monitoring thread."""
+
+    def test_tick_updates_all_registered(self, sleeper):
+        """One tick samples every registered process."""
+        service = MonitorService(interval=60)
+        other = subprocess.Popen(["sleep", "30"], stdin=subprocess.DEVNULL)
+        try:
+            handles = [service.register(sleeper), service.register(other)]
+            service.tick()
+
+            snapshot = service.snapshot()
+            assert set(snapshot) == {sleeper.pid, other.pid}
+            assert all(s["samples"] == 1 for s in snapshot.values())
+            assert all(h.analyze()["state"] == "HEALTHY" for h in handles)
+        finally:
+            service.stop()
+            other.kill()
+            other.wait()
+
+    def test_exited_process_unregistered(self):
+        """Processes that exit are dropped from the registry."""
+        service = MonitorService(interval=60)
+        proc = subprocess.Popen(["sleep", "30"])
+        service.register(proc)
+        proc.kill()
+        proc.wait()
+
+        service.tick()
+        service.stop()
+
+        assert len(service) == 0
+
+    def test_state_change_callbacks(self, sleeper, monkeypatch):
+        """Per-process and global callbacks fire on state transitions only."""
+        service = MonitorService(interval=60)
+        seen = []
+        handle = service.register(
+            sleeper, warn_threshold=1, on_state_change=lambda *args: seen.append(args[1:3])
+        )
+        service.add_listener(lambda *args: seen.append(("listener", args[2])))
+        service.add_listener(lambda *args: 1 / 0)  # Errors must not break the tick
+        monkeypatch.setattr(handle.monitor, "last_activity_time", time.time() - 10)
+
+        for _ in range(2):  # analyze() needs two samples
+            service.tick()
+        service.stop()
+
+        assert handle.state == "SUSPICIOUS"
+        assert seen == [("HEALTHY", "SUSPICIOUS"), ("listener", "SUSPICIOUS")]
+
+    def test_stdin_wait_confirms_stuck(self, sleeper, monkeypatch):
+        """A silent process blocked reading stdin is escalated to CONFIRMED_STUCK."""
+        import process_monitor
+
+        service = MonitorService(interval=60)
+        handle = service.register(sleeper, warn_threshold=1)
+        monkeypatch.setattr(handle.monitor, "last_activity_time", time.time() - 10)
+        monkeypatch.setattr(process_monitor, "is_waiting_for_stdin", lambda pid: True)
+
+        for _ in range(2):
+            service.tick()
+        service.stop()
+
+        assert handle.state == "CONFIRMED_STUCK"
+
+    def test_thread_exits_when_empty(self):
+        """The service thread stops by itself once nothing is registered."""
+        service = MonitorService(interval=0.01)
+        proc = subprocess.Popen(["sleep", "0.1"])
+        service.register(proc)
+        thread = service._thread
+        proc.wait()
+
+        thread.join(timeout=2)
+
+        assert not thread.is_alive()
+        assert len(service) == 0
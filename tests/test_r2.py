@@ -0,0 +1,64 @@
+"""Tests for R2 request signing against custom endpoints."""
+
+from datetime import UTC, datetime
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from fabrik.drivers import r2
+from fabrik.drivers.r2 import R2Client
+
+CUSTOM_ENDPOINT = "http://127.0.0.1:9000"
+
+
+class _FixedClock:
+    @staticmethod
+    def now(tz=None):
+        return datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """Build R2 clients with fixed credentials and a fixed signing time."""
+    monkeypatch.setattr(r2, "datetime", _FixedClock)
+
+    def make(endpoint=None):
+        return R2Client("acct", "key-id", "secret", bucket="media", endpoint=endpoint)
+
+    return make
+
+
+class TestEndpointHost:
+    """The signed host follows the configured endpoint."""
+
+    def test_host_from_endpoint(self, make_client):
+        """The default endpoint and a custom one each sign their own host."""
+        assert make_client().host == "acct.r2.cloudflarestorage.com"
+        assert make_client(CUSTOM_ENDPOINT).host == "127.0.0.1:9000"
+
+    def test_presigned_url_signs_endpoint_host(self, make_client):
+        """A presigned URL for a custom endpoint is not signed for the R2 host."""
+        default_url = make_client().generate_presigned_url("a.txt")
+        custom_url = make_client(CUSTOM_ENDPOINT).generate_presigned_url("a.txt")
+
+        def signature(url):
+            return parse_qs(urlparse(url).query)["X-Amz-Signature"]
+
+        assert custom_url.startswith(f"{CUSTOM_ENDPOINT}/media/a.txt?")
+        assert signature(custom_url) != signature(default_url)
+
+    def test_request_host_header(self, make_client):
+        """Requests to a custom endpoint send its host, not the R2 host."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers["host"])
+            return httpx.Response(200, content=b"data")
+
+        client = make_client(CUSTOM_ENDPOINT)
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        client.put_object("a.txt", b"data")
+        client.get_object("a.txt")
+
+        assert seen == ["127.0.0.1:9000"] * 2